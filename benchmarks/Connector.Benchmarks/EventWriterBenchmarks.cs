@@ -0,0 +1,59 @@
+using BenchmarkDotNet.Attributes;
+using Connector.Core.Contracts;
+using Connector.Core.Output;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// Output cost per event: JSONL versus length-prefixed MessagePack, both writing a batch
+/// of translated events to a null stream.
+/// </summary>
+[MemoryDiagnoser]
+public class EventWriterBenchmarks
+{
+    private const int Events = 1_000;
+    private UnifiedWsEvent[] _events = [];
+
+    [Params("trades", "l2Book")]
+    public string Channel { get; set; } = "trades";
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        var at = DateTimeOffset.UtcNow;
+        _events = Enumerable.Range(0, Events).Select(i => Channel switch
+        {
+            "trades" => (UnifiedWsEvent)new TradesEvent
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Trades, Symbol = "BTC",
+                ReceivedAt = at, Sequence = i,
+                Trades = Enumerable.Range(0, 5).Select(t => new TradeEntry
+                {
+                    TradeId = (i * 5 + t).ToString(), Price = 65_000.5m + t, Size = 0.0123m, Side = "B", Timestamp = at
+                }).ToArray()
+            },
+            "l2Book" => new OrderBookL2Event
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL2, Symbol = "BTC",
+                ReceivedAt = at, Sequence = i, IsSnapshot = true,
+                Bids = Enumerable.Range(0, 20).Select(l => new PriceLevel { Price = 65_000m - l * 0.5m, Size = 1.25m + l }).ToArray(),
+                Asks = Enumerable.Range(0, 20).Select(l => new PriceLevel { Price = 65_000.5m + l * 0.5m, Size = 0.75m + l }).ToArray()
+            },
+            _ => throw new ArgumentOutOfRangeException(nameof(Channel))
+        }).ToArray();
+    }
+
+    [Benchmark(Baseline = true, OperationsPerInvoke = Events)]
+    public Task Jsonl() => WriteAllAsync(EventOutputFormat.Jsonl);
+
+    [Benchmark(OperationsPerInvoke = Events)]
+    public Task Binary() => WriteAllAsync(EventOutputFormat.Binary);
+
+    private async Task WriteAllAsync(EventOutputFormat format)
+    {
+        await using var writer = EventStreamWriter.Create(Stream.Null, format);
+        foreach (var evt in _events)
+            await writer.WriteAsync(evt);
+        await writer.FlushAsync();
+    }
+}
@@ -0,0 +1,81 @@
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+using Connector.Core.Contracts;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// The pre-Utf8JsonReader inbound path, kept as the benchmark baseline:
+/// decode frame to string, JsonDocument.Parse, then GetString() + decimal.Parse per value.
+/// </summary>
+public static class LegacyPipeline
+{
+    public static UnifiedWsEvent? Parse(byte[] frame)
+    {
+        var payload = Encoding.UTF8.GetString(frame);
+        using var doc = JsonDocument.Parse(payload);
+        var root = doc.RootElement;
+        var data = root.GetProperty("data");
+        var receivedAt = DateTimeOffset.UtcNow;
+
+        return root.GetProperty("channel").GetString() switch
+        {
+            "trades" => ParseTrades(data, receivedAt),
+            "l2Book" => new OrderBookL2Event
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL2,
+                Symbol = data.GetProperty("coin").GetString()!, ReceivedAt = receivedAt, IsSnapshot = true,
+                Bids = ParseLevels(data.GetProperty("levels")[0]), Asks = ParseLevels(data.GetProperty("levels")[1])
+            },
+            "allMids" => new AllMidsEvent
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.AllMids,
+                Symbol = "*", ReceivedAt = receivedAt,
+                Mids = data.GetProperty("mids").EnumerateObject().Select(p => new AllMidsEntry
+                {
+                    Symbol = p.Name,
+                    Mid = decimal.Parse(p.Value.GetString()!, CultureInfo.InvariantCulture)
+                }).ToArray()
+            },
+            _ => null
+        };
+    }
+
+    private static TradesEvent ParseTrades(JsonElement data, DateTimeOffset receivedAt)
+    {
+        var trades = new List<TradeEntry>();
+        string? coin = null;
+        foreach (var t in data.EnumerateArray())
+        {
+            coin ??= t.GetProperty("coin").GetString();
+            trades.Add(new TradeEntry
+            {
+                TradeId = t.GetProperty("tid").GetInt64().ToString(),
+                Price = decimal.Parse(t.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
+                Size = decimal.Parse(t.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture),
+                Side = t.GetProperty("side").GetString()!.ToLowerInvariant(),
+                Timestamp = DateTimeOffset.FromUnixTimeMilliseconds(t.GetProperty("time").GetInt64())
+            });
+        }
+        return new TradesEvent
+        {
+            Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Trades,
+            Symbol = coin!, ReceivedAt = receivedAt, Trades = trades.ToArray()
+        };
+    }
+
+    private static PriceLevel[] ParseLevels(JsonElement arr)
+    {
+        var result = new List<PriceLevel>();
+        foreach (var level in arr.EnumerateArray())
+        {
+            result.Add(new PriceLevel
+            {
+                Price = decimal.Parse(level.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
+                Size = decimal.Parse(level.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture)
+            });
+        }
+        return result.ToArray();
+    }
+}
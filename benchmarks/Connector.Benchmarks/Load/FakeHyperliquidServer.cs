@@ -0,0 +1,453 @@
+using System.Buffers;
+using System.Diagnostics;
+using System.Globalization;
+using System.Net;
+using System.Net.Sockets;
+using System.Net.WebSockets;
+using System.Text;
+using System.Text.Json;
+using Connector.Core.Recording;
+
+namespace Connector.Benchmarks.Load;
+
+public sealed class FakeServerOptions
+{
+    /// <summary>WS frames per second per connection; 0 sends as fast as the socket takes them.</summary>
+    public double MessagesPerSecond { get; init; } = 1_000;
+
+    /// <summary>Generated channel: trades, l2Book, allMids or bbo.</summary>
+    public string Channel { get; init; } = "trades";
+
+    /// <summary>Generated frames rotate over this many coins (SYN0, SYN1, ...).</summary>
+    public int Coins { get; init; } = 10;
+
+    /// <summary>Trades frames carry 1..N trades, picked at random, to mimic bursty prints.</summary>
+    public int MaxTradesPerMessage { get; init; } = 8;
+
+    /// <summary>Frames are released in groups of this size, back to back.</summary>
+    public int Burst { get; init; } = 1;
+
+    /// <summary>Levels per side for generated l2Book frames.</summary>
+    public int BookDepth { get; init; } = 20;
+
+    /// <summary>
+    /// For channels other than trades and for replays, every Nth frame is a one-trade
+    /// latency probe on <see cref="FakeHyperliquidServer.ProbeSymbol"/>. 0 disables probes.
+    /// </summary>
+    public int ProbeEvery { get; init; } = 10;
+
+    /// <summary>Replay a <see cref="FrameRecorder"/> directory instead of generating frames.</summary>
+    public string? ReplayDirectory { get; init; }
+
+    /// <summary>Start the replay over when it runs out.</summary>
+    public bool Loop { get; init; } = true;
+
+    /// <summary>Listen port; 0 picks a free one.</summary>
+    public int Port { get; init; }
+}
+
+/// <summary>
+/// In-process stand-in for the Hyperliquid API on loopback. <c>/ws</c> acknowledges
+/// subscriptions and then streams generated or replayed frames at a fixed rate; <c>/info</c>
+/// answers allMids, l2Book and meta. Generated trades carry the send time
+/// (<see cref="Stopwatch.GetTimestamp"/>) in <c>tid</c>, so an in-process consumer can measure
+/// latency from the server's send to its own read. Frames are built into a reused buffer so
+/// the server adds no per-frame allocations to the process.
+/// </summary>
+public sealed class FakeHyperliquidServer : IAsyncDisposable
+{
+    /// <summary>Symbol prefix of generated trades; their trade id is a send timestamp.</summary>
+    public const string StampedPrefix = "SYN";
+
+    public const string ProbeSymbol = "SYNPROBE";
+
+    private readonly FakeServerOptions _options;
+    private readonly HttpListener _listener = new();
+    private readonly CancellationTokenSource _cts = new();
+    private readonly List<Task> _connections = [];
+    private readonly byte[] _allMidsResponse;
+    private readonly byte[] _l2BookResponse;
+    private readonly byte[] _metaResponse;
+    private Task? _acceptLoop;
+    private long _framesSent;
+    private long _bytesSent;
+
+    public FakeHyperliquidServer(FakeServerOptions? options = null)
+    {
+        _options = options ?? new FakeServerOptions();
+        var port = _options.Port > 0 ? _options.Port : FreePort();
+        BaseUri = new Uri($"http://127.0.0.1:{port}/");
+        _listener.Prefixes.Add(BaseUri.ToString());
+
+        _allMidsResponse = DataOf(Payloads.AllMids(_options.Coins), "mids");
+        _l2BookResponse = DataOf(Payloads.L2Book(_options.BookDepth, StampedPrefix + "0"));
+        _metaResponse = Encoding.UTF8.GetBytes("{\"universe\":[" + string.Join(",",
+            Enumerable.Range(0, _options.Coins).Select(i => $"{{\"name\":\"{StampedPrefix}{i}\",\"szDecimals\":4,\"maxLeverage\":20}}")) + "]}");
+    }
+
+    public Uri BaseUri { get; }
+
+    public Uri WsUri => new($"ws://{BaseUri.Authority}/ws");
+
+    public long FramesSent => Interlocked.Read(ref _framesSent);
+
+    public long BytesSent => Interlocked.Read(ref _bytesSent);
+
+    public static bool IsStamped(string symbol) => symbol.StartsWith(StampedPrefix, StringComparison.Ordinal);
+
+    public void Start()
+    {
+        _listener.Start();
+        _acceptLoop = Task.Run(AcceptLoopAsync);
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        _cts.Cancel();
+        _listener.Close();
+        if (_acceptLoop is not null)
+            await _acceptLoop.ConfigureAwait(false);
+
+        Task[] connections;
+        lock (_connections) connections = _connections.ToArray();
+        try { await Task.WhenAll(connections).ConfigureAwait(false); }
+        catch (Exception) { }
+        _cts.Dispose();
+    }
+
+    private async Task AcceptLoopAsync()
+    {
+        while (!_cts.IsCancellationRequested)
+        {
+            HttpListenerContext context;
+            try
+            {
+                context = await _listener.GetContextAsync().ConfigureAwait(false);
+            }
+            catch (Exception) when (_cts.IsCancellationRequested)
+            {
+                return;
+            }
+            catch (HttpListenerException)
+            {
+                return;
+            }
+
+            var task = context.Request.IsWebSocketRequest
+                ? Task.Run(() => ServeWebSocketAsync(context))
+                : Task.Run(() => ServeInfoAsync(context));
+            lock (_connections)
+            {
+                _connections.RemoveAll(t => t.IsCompleted);
+                _connections.Add(task);
+            }
+        }
+    }
+
+    // ─── REST ───
+
+    private async Task ServeInfoAsync(HttpListenerContext context)
+    {
+        using var body = new MemoryStream();
+        await context.Request.InputStream.CopyToAsync(body).ConfigureAwait(false);
+
+        var type = "";
+        try
+        {
+            using var doc = JsonDocument.Parse(body.ToArray());
+            type = doc.RootElement.TryGetProperty("type", out var t) ? t.GetString() ?? "" : "";
+        }
+        catch (JsonException) { }
+
+        var response = type switch
+        {
+            "allMids" => _allMidsResponse,
+            "l2Book" => _l2BookResponse,
+            "meta" => _metaResponse,
+            _ => null
+        };
+
+        context.Response.StatusCode = response is null ? 400 : 200;
+        context.Response.ContentType = "application/json";
+        response ??= Encoding.UTF8.GetBytes($"{{\"error\":\"unsupported info type '{type}'\"}}");
+        context.Response.ContentLength64 = response.Length;
+        await context.Response.OutputStream.WriteAsync(response).ConfigureAwait(false);
+        context.Response.Close();
+    }
+
+    // ─── WebSocket ───
+
+    private async Task ServeWebSocketAsync(HttpListenerContext context)
+    {
+        var ws = (await context.AcceptWebSocketAsync(subProtocol: null).ConfigureAwait(false)).WebSocket;
+        using var connection = CancellationTokenSource.CreateLinkedTokenSource(_cts.Token);
+        var sendLock = new SemaphoreSlim(1, 1);
+        Task? stream = null;
+
+        try
+        {
+            var buffer = new byte[16 * 1024];
+            while (ws.State == WebSocketState.Open)
+            {
+                var result = await ws.ReceiveAsync(buffer, connection.Token).ConfigureAwait(false);
+                if (result.MessageType == WebSocketMessageType.Close)
+                    break;
+
+                var ack = SubscriptionAck(buffer.AsSpan(0, result.Count));
+                if (ack is null) continue;
+
+                await sendLock.WaitAsync(connection.Token).ConfigureAwait(false);
+                try { await ws.SendAsync(ack, WebSocketMessageType.Text, true, connection.Token).ConfigureAwait(false); }
+                finally { sendLock.Release(); }
+
+                // Stream from the first subscription on; later ones only get their ack
+                stream ??= Task.Run(() => StreamAsync(ws, sendLock, connection.Token));
+            }
+        }
+        catch (Exception) when (connection.IsCancellationRequested || ws.State != WebSocketState.Open)
+        {
+        }
+        catch (WebSocketException)
+        {
+        }
+        finally
+        {
+            connection.Cancel();
+            if (stream is not null)
+            {
+                try { await stream.ConfigureAwait(false); }
+                catch (Exception) { }
+            }
+
+            // Complete the client's close handshake, or its CloseAsync waits forever
+            if (ws.State == WebSocketState.CloseReceived)
+            {
+                try { await ws.CloseOutputAsync(WebSocketCloseStatus.NormalClosure, null, CancellationToken.None).ConfigureAwait(false); }
+                catch (Exception) { }
+            }
+            ws.Dispose();
+        }
+    }
+
+    private static byte[]? SubscriptionAck(ReadOnlySpan<byte> message)
+    {
+        using var doc = JsonDocument.Parse(message.ToArray());
+        var root = doc.RootElement;
+        if (!root.TryGetProperty("method", out var method) || method.GetString() != "subscribe")
+            return null;
+
+        var subscription = root.TryGetProperty("subscription", out var s) ? s.GetRawText() : "{}";
+        return Encoding.UTF8.GetBytes(
+            $"{{\"channel\":\"subscriptionResponse\",\"data\":{{\"method\":\"subscribe\",\"subscription\":{subscription}}}}}");
+    }
+
+    private async Task StreamAsync(WebSocket ws, SemaphoreSlim sendLock, CancellationToken ct)
+    {
+        using var source = _options.ReplayDirectory is { } directory
+            ? FrameSource.Replay(directory, _options)
+            : FrameSource.Generate(_options);
+
+        var rate = _options.MessagesPerSecond;
+        var burst = Math.Max(1, _options.Burst);
+        var started = Stopwatch.GetTimestamp();
+        long sent = 0;
+
+        while (!ct.IsCancellationRequested)
+        {
+            if (rate > 0)
+            {
+                var due = (long)(Stopwatch.GetElapsedTime(started).TotalSeconds * rate) / burst * burst;
+                if (sent >= due)
+                {
+                    await Task.Delay(1, ct).ConfigureAwait(false);
+                    continue;
+                }
+            }
+
+            await sendLock.WaitAsync(ct).ConfigureAwait(false);
+            try
+            {
+                for (var i = 0; i < burst; i++)
+                {
+                    if (!source.TryNext(out var frame, out var binary))
+                        return;
+
+                    await ws.SendAsync(frame, binary ? WebSocketMessageType.Binary : WebSocketMessageType.Text, true, ct)
+                        .ConfigureAwait(false);
+                    Interlocked.Increment(ref _framesSent);
+                    Interlocked.Add(ref _bytesSent, frame.Length);
+                    sent++;
+                }
+            }
+            finally
+            {
+                sendLock.Release();
+            }
+        }
+    }
+
+    private static byte[] DataOf(byte[] frame, string? property = null)
+    {
+        using var doc = JsonDocument.Parse(frame);
+        var data = doc.RootElement.GetProperty("data");
+        if (property is not null)
+            data = data.GetProperty(property);
+        return Encoding.UTF8.GetBytes(data.GetRawText());
+    }
+
+    private static int FreePort()
+    {
+        using var probe = new TcpListener(IPAddress.Loopback, 0);
+        probe.Start();
+        return ((IPEndPoint)probe.LocalEndpoint).Port;
+    }
+
+    // ─── Frame sources ───
+
+    /// <summary>
+    /// Produces the next frame into a buffer it owns; the frame is valid until the next call.
+    /// </summary>
+    private abstract class FrameSource : IDisposable
+    {
+        private readonly ArrayBufferWriter<byte> _buffer = new(16 * 1024);
+        private readonly Utf8JsonWriter _writer;
+        private readonly int _probeEvery;
+        private long _count;
+
+        protected FrameSource(int probeEvery)
+        {
+            _writer = new Utf8JsonWriter(_buffer);
+            _probeEvery = probeEvery;
+        }
+
+        public static FrameSource Generate(FakeServerOptions options) => options.Channel switch
+        {
+            "trades" => new TradesSource(options),
+            "l2Book" or "allMids" or "bbo" => new StaticSource(options),
+            _ => throw new ArgumentOutOfRangeException(nameof(options), options.Channel, "unsupported generated channel")
+        };
+
+        public static FrameSource Replay(string directory, FakeServerOptions options) => new ReplaySource(directory, options);
+
+        public bool TryNext(out ReadOnlyMemory<byte> frame, out bool binary)
+        {
+            binary = false;
+            if (_probeEvery > 0 && ++_count % _probeEvery == 0)
+            {
+                frame = WriteTrades(ProbeSymbol, 1, 0);
+                return true;
+            }
+            return TryNextCore(out frame, out binary);
+        }
+
+        protected abstract bool TryNextCore(out ReadOnlyMemory<byte> frame, out bool binary);
+
+        /// <summary>A trades frame whose <c>tid</c>s hold the current Stopwatch timestamp.</summary>
+        protected ReadOnlyMemory<byte> WriteTrades(string coin, int trades, int seed)
+        {
+            _buffer.ResetWrittenCount();
+            _writer.Reset(_buffer);
+
+            var stamp = Stopwatch.GetTimestamp();
+            var time = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
+            _writer.WriteStartObject();
+            _writer.WriteString("channel", "trades");
+            _writer.WriteStartArray("data");
+            for (var i = 0; i < trades; i++)
+            {
+                _writer.WriteStartObject();
+                _writer.WriteString("coin", coin);
+                _writer.WriteString("side", (seed + i) % 2 == 0 ? "B" : "A");
+                _writer.WriteString("px", Prices[(seed + i) % Prices.Length]);
+                _writer.WriteString("sz", Sizes[(seed + i) % Sizes.Length]);
+                _writer.WriteNumber("time", time);
+                _writer.WriteNumber("tid", stamp);
+                _writer.WriteEndObject();
+            }
+            _writer.WriteEndArray();
+            _writer.WriteEndObject();
+            _writer.Flush();
+            return _buffer.WrittenMemory;
+        }
+
+        public virtual void Dispose() => _writer.Dispose();
+
+        private static readonly string[] Prices = Enumerable.Range(0, 64)
+            .Select(i => (50_000m + i * 0.5m).ToString(CultureInfo.InvariantCulture)).ToArray();
+
+        private static readonly string[] Sizes = Enumerable.Range(1, 9)
+            .Select(i => (i * 0.125m).ToString(CultureInfo.InvariantCulture)).ToArray();
+    }
+
+    private sealed class TradesSource(FakeServerOptions options) : FrameSource(probeEvery: 0)
+    {
+        private readonly string[] _coins = Enumerable.Range(0, Math.Max(1, options.Coins)).Select(i => StampedPrefix + i).ToArray();
+        private readonly Random _random = new(42);
+        private int _next;
+
+        protected override bool TryNextCore(out ReadOnlyMemory<byte> frame, out bool binary)
+        {
+            binary = false;
+            var n = _next++;
+            frame = WriteTrades(_coins[n % _coins.Length], _random.Next(1, Math.Max(1, options.MaxTradesPerMessage) + 1), n);
+            return true;
+        }
+    }
+
+    /// <summary>Book, mids and BBO frames are precomputed per coin and sent as-is.</summary>
+    private sealed class StaticSource(FakeServerOptions options) : FrameSource(options.ProbeEvery)
+    {
+        private readonly byte[][] _frames = Enumerable.Range(0, Math.Max(1, options.Coins))
+            .Select(i => options.Channel switch
+            {
+                "l2Book" => Payloads.L2Book(options.BookDepth, StampedPrefix + i),
+                "bbo" => Payloads.Bbo(StampedPrefix + i),
+                _ => Payloads.AllMids(options.Coins)
+            })
+            .ToArray();
+        private int _next;
+
+        protected override bool TryNextCore(out ReadOnlyMemory<byte> frame, out bool binary)
+        {
+            binary = false;
+            frame = _frames[_next++ % _frames.Length];
+            return true;
+        }
+    }
+
+    private sealed class ReplaySource(string directory, FakeServerOptions options) : FrameSource(options.ProbeEvery)
+    {
+        private RecordingReader _reader = new(directory);
+        private bool _any;
+
+        protected override bool TryNextCore(out ReadOnlyMemory<byte> frame, out bool binary)
+        {
+            while (true)
+            {
+                if (_reader.TryRead(out var recorded))
+                {
+                    _any = true;
+                    frame = recorded.Payload;
+                    binary = recorded.IsBinary;
+                    return true;
+                }
+
+                if (!options.Loop || !_any)
+                {
+                    frame = default;
+                    binary = false;
+                    return false;
+                }
+
+                _reader.Dispose();
+                _reader = new RecordingReader(directory);
+            }
+        }
+
+        public override void Dispose()
+        {
+            _reader.Dispose();
+            base.Dispose();
+        }
+    }
+}
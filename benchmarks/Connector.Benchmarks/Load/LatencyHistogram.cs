@@ -0,0 +1,56 @@
+using System.Diagnostics;
+
+namespace Connector.Benchmarks.Load;
+
+/// <summary>
+/// Fixed-size latency histogram with one-microsecond buckets up to <see cref="MaxMicros"/>;
+/// slower samples land in the last bucket but still count toward <see cref="Max"/>.
+/// Recording never allocates. Single writer.
+/// </summary>
+public sealed class LatencyHistogram
+{
+    public const int MaxMicros = 1_000_000;
+
+    private readonly long[] _counts = new long[MaxMicros + 1];
+    private long _total;
+    private long _maxTicks;
+    private double _sumMicros;
+
+    public long Count => _total;
+
+    public TimeSpan Max => Stopwatch.GetElapsedTime(0, _maxTicks);
+
+    public double MeanMicros => _total == 0 ? 0 : _sumMicros / _total;
+
+    public void RecordTicks(long ticks)
+    {
+        if (ticks < 0) ticks = 0;
+        var micros = ticks * 1_000_000.0 / Stopwatch.Frequency;
+        _counts[(int)Math.Min(micros, MaxMicros)]++;
+        _total++;
+        _sumMicros += micros;
+        if (ticks > _maxTicks) _maxTicks = ticks;
+    }
+
+    public void Reset()
+    {
+        Array.Clear(_counts);
+        _total = 0;
+        _maxTicks = 0;
+        _sumMicros = 0;
+    }
+
+    /// <summary>Upper bound in microseconds of the bucket holding quantile <paramref name="q"/>.</summary>
+    public double PercentileMicros(double q)
+    {
+        if (_total == 0) return 0;
+        var rank = (long)Math.Ceiling(q * _total);
+        long seen = 0;
+        for (var i = 0; i < _counts.Length; i++)
+        {
+            seen += _counts[i];
+            if (seen >= rank) return i + 1;
+        }
+        return MaxMicros;
+    }
+}
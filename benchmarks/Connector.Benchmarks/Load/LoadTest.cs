@@ -0,0 +1,315 @@
+using System.Diagnostics;
+using System.Globalization;
+using System.Runtime.InteropServices;
+using System.Text.Json;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Managers;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Benchmarks.Load;
+
+public sealed class LoadTestOptions
+{
+    public FakeServerOptions Server { get; init; } = new();
+
+    /// <summary>Connect to an already running server (see <c>serve</c>) instead of starting one.</summary>
+    public Uri? Url { get; init; }
+
+    public TimeSpan Warmup { get; init; } = TimeSpan.FromSeconds(3);
+    public TimeSpan Duration { get; init; } = TimeSpan.FromSeconds(10);
+
+    /// <summary>Result file; the JSON goes to stdout when unset.</summary>
+    public string? Output { get; init; }
+
+    /// <summary>
+    /// Parses <c>--rate --duration --warmup --channel --coins --trades --burst --depth
+    /// --probe-every --replay --no-loop --port --url --out</c>.
+    /// </summary>
+    public static LoadTestOptions Parse(IReadOnlyList<string> args)
+    {
+        var values = new Dictionary<string, string>(StringComparer.Ordinal);
+        for (var i = 0; i < args.Count; i++)
+        {
+            if (!args[i].StartsWith("--", StringComparison.Ordinal))
+                throw new ArgumentException($"Unexpected argument '{args[i]}'");
+            var key = args[i][2..];
+            values[key] = i + 1 < args.Count && !args[i + 1].StartsWith("--", StringComparison.Ordinal) ? args[++i] : "true";
+        }
+
+        var defaults = new FakeServerOptions();
+        double Number(string key, double fallback) =>
+            values.TryGetValue(key, out var v) ? double.Parse(v, CultureInfo.InvariantCulture) : fallback;
+
+        return new LoadTestOptions
+        {
+            Server = new FakeServerOptions
+            {
+                MessagesPerSecond = Number("rate", defaults.MessagesPerSecond),
+                Channel = values.GetValueOrDefault("channel", defaults.Channel),
+                Coins = (int)Number("coins", defaults.Coins),
+                MaxTradesPerMessage = (int)Number("trades", defaults.MaxTradesPerMessage),
+                Burst = (int)Number("burst", defaults.Burst),
+                BookDepth = (int)Number("depth", defaults.BookDepth),
+                ProbeEvery = (int)Number("probe-every", defaults.ProbeEvery),
+                ReplayDirectory = values.GetValueOrDefault("replay"),
+                Loop = !values.ContainsKey("no-loop"),
+                Port = (int)Number("port", 0)
+            },
+            Url = values.TryGetValue("url", out var url) ? new Uri(url) : null,
+            Warmup = TimeSpan.FromSeconds(Number("warmup", 3)),
+            Duration = TimeSpan.FromSeconds(Number("duration", 10)),
+            Output = values.GetValueOrDefault("out")
+        };
+    }
+}
+
+/// <summary>
+/// Machine-readable result of one load run. Latency is from the server writing a stamped
+/// frame to the consumer reading the translated event, so it covers the socket, the WS
+/// transport, translation and fan-out. Allocations are process-wide: they include the
+/// in-process server unless <see cref="LoadTestOptions.Url"/> points elsewhere.
+/// </summary>
+public sealed class LoadTestResult
+{
+    public string Kind => "load";
+    public required DateTimeOffset TimestampUtc { get; init; }
+    public required string? Commit { get; init; }
+    public required string Machine { get; init; }
+    public required string Runtime { get; init; }
+    public required FakeServerOptions Config { get; init; }
+    public required bool InProcessServer { get; init; }
+    public required double DurationSeconds { get; init; }
+    public required double TargetMessagesPerSecond { get; init; }
+    public required double MessagesPerSecond { get; init; }
+    public required long? FramesSent { get; init; }
+    public required long EventsConsumed { get; init; }
+    public required double? MegabytesPerSecond { get; init; }
+    public required long Dropped { get; init; }
+
+    /// <summary>Updates replaced by a newer one on conflated channels (l2Book, bbo, allMids) before delivery.</summary>
+    public required long Conflated { get; init; }
+    public required LatencySummary LatencyMicros { get; init; }
+    public required double AllocatedBytesPerMessage { get; init; }
+    public required int Gen0Collections { get; init; }
+    public required int Gen1Collections { get; init; }
+    public required int Gen2Collections { get; init; }
+}
+
+public sealed class LatencySummary
+{
+    public required long Samples { get; init; }
+    public required double Mean { get; init; }
+    public required double P50 { get; init; }
+    public required double P90 { get; init; }
+    public required double P99 { get; init; }
+    public required double P999 { get; init; }
+    public required double Max { get; init; }
+}
+
+/// <summary>
+/// Sustained-load run: the real <see cref="WsTransport"/> and <see cref="WebSocketManager"/>
+/// against <see cref="FakeHyperliquidServer"/>, with a consumer draining the shared reader.
+/// </summary>
+public static class LoadTest
+{
+    private static readonly JsonSerializerOptions ResultJson = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        WriteIndented = true
+    };
+
+    public static async Task<LoadTestResult> RunAsync(LoadTestOptions options, CancellationToken ct)
+    {
+        await using var server = options.Url is null ? new FakeHyperliquidServer(options.Server) : null;
+        server?.Start();
+
+        var translator = new HyperliquidWsTranslator(NullLogger.Instance);
+        await using var manager = new WebSocketManager(
+            new WsTransport(NullLogger<WsTransport>.Instance), translator, new NoAuthProvider(),
+            NullLogger<WebSocketManager>.Instance, channelCapacity: 100_000);
+        await manager.StartAsync(options.Url ?? server!.WsUri, ct);
+        await manager.SubscribeAsync(new UnifiedWsSubscribeRequest
+        {
+            CorrelationId = "load",
+            Exchange = UnifiedExchange.Hyperliquid,
+            Channel = ChannelOf(options.Server.Channel),
+            Symbols = [FakeHyperliquidServer.StampedPrefix + "0"]
+        }, ct);
+
+        var consumer = new Consumer(manager);
+        var consuming = Task.Run(() => consumer.RunAsync(ct), ct);
+
+        await Task.Delay(options.Warmup, ct);
+
+        // ─── Measured window ───
+        var framesBefore = server?.FramesSent ?? 0;
+        var bytesBefore = server?.BytesSent ?? 0;
+        var eventsBefore = consumer.Events;
+        var (droppedBefore, conflatedBefore) = Lost(manager);
+        var allocatedBefore = GC.GetTotalAllocatedBytes();
+        var (gen0, gen1, gen2) = (GC.CollectionCount(0), GC.CollectionCount(1), GC.CollectionCount(2));
+        var started = Stopwatch.GetTimestamp();
+        consumer.Measuring = true;
+
+        await Task.Delay(options.Duration, ct);
+
+        consumer.Measuring = false;
+        var elapsed = Stopwatch.GetElapsedTime(started).TotalSeconds;
+        var allocated = GC.GetTotalAllocatedBytes() - allocatedBefore;
+        var events = consumer.Events - eventsBefore;
+        var histogram = consumer.Latency;
+        var (dropped, conflated) = Lost(manager);
+
+        var result = new LoadTestResult
+        {
+            TimestampUtc = DateTimeOffset.UtcNow,
+            Commit = GitCommit(),
+            Machine = $"{RuntimeInformation.OSDescription}, {Environment.ProcessorCount} cpus",
+            Runtime = RuntimeInformation.FrameworkDescription,
+            Config = options.Server,
+            InProcessServer = server is not null,
+            DurationSeconds = elapsed,
+            TargetMessagesPerSecond = options.Server.MessagesPerSecond,
+            MessagesPerSecond = events / elapsed,
+            FramesSent = server is null ? null : server.FramesSent - framesBefore,
+            EventsConsumed = events,
+            MegabytesPerSecond = server is null ? null : (server.BytesSent - bytesBefore) / elapsed / (1 << 20),
+            Dropped = dropped - droppedBefore,
+            Conflated = conflated - conflatedBefore,
+            LatencyMicros = new LatencySummary
+            {
+                Samples = histogram.Count,
+                Mean = histogram.MeanMicros,
+                P50 = histogram.PercentileMicros(0.50),
+                P90 = histogram.PercentileMicros(0.90),
+                P99 = histogram.PercentileMicros(0.99),
+                P999 = histogram.PercentileMicros(0.999),
+                Max = histogram.Max.TotalMicroseconds
+            },
+            AllocatedBytesPerMessage = events == 0 ? 0 : (double)allocated / events,
+            Gen0Collections = GC.CollectionCount(0) - gen0,
+            Gen1Collections = GC.CollectionCount(1) - gen1,
+            Gen2Collections = GC.CollectionCount(2) - gen2
+        };
+
+        await manager.StopAsync();
+        await consuming;
+        return result;
+    }
+
+    public static async Task<int> RunCommandAsync(IReadOnlyList<string> args)
+    {
+        var options = LoadTestOptions.Parse(args);
+        var result = await RunAsync(options, CancellationToken.None);
+        var json = JsonSerializer.Serialize(result, ResultJson);
+
+        if (options.Output is { } path)
+        {
+            await File.WriteAllTextAsync(path, json);
+            Console.Error.WriteLine($"Wrote {path}");
+        }
+        else
+        {
+            Console.WriteLine(json);
+        }
+
+        Console.Error.WriteLine(
+            $"{result.MessagesPerSecond:F0} msgs/s (target {result.TargetMessagesPerSecond:F0}), " +
+            $"p50 {result.LatencyMicros.P50:F0}us p99 {result.LatencyMicros.P99:F0}us p999 {result.LatencyMicros.P999:F0}us, " +
+            $"{result.AllocatedBytesPerMessage:F0} B/msg, {result.Dropped} dropped, {result.Conflated} conflated");
+        return 0;
+    }
+
+    /// <summary>Runs the fake server alone until Ctrl+C, for load runs from another process.</summary>
+    public static async Task<int> ServeCommandAsync(IReadOnlyList<string> args)
+    {
+        var options = LoadTestOptions.Parse(args);
+        await using var server = new FakeHyperliquidServer(options.Server);
+        server.Start();
+        Console.Error.WriteLine($"Serving {server.WsUri} and {server.BaseUri}info, Ctrl+C to stop");
+
+        var stop = new TaskCompletionSource();
+        Console.CancelKeyPress += (_, e) =>
+        {
+            e.Cancel = true;
+            stop.TrySetResult();
+        };
+        await stop.Task;
+        return 0;
+    }
+
+    private static UnifiedWsChannel ChannelOf(string channel) => channel switch
+    {
+        "l2Book" => UnifiedWsChannel.OrderBookL2,
+        "allMids" => UnifiedWsChannel.AllMids,
+        "bbo" => UnifiedWsChannel.OrderBookL1,
+        _ => UnifiedWsChannel.Trades
+    };
+
+    private static (long Dropped, long Conflated) Lost(WebSocketManager manager)
+    {
+        var stats = manager.GetRouteStats();
+        return (stats.Sum(s => s.Dropped), stats.Sum(s => s.Conflated));
+    }
+
+    private static string? GitCommit()
+    {
+        try
+        {
+            using var git = Process.Start(new ProcessStartInfo("git", "rev-parse --short HEAD")
+            {
+                RedirectStandardOutput = true,
+                RedirectStandardError = true
+            });
+            var sha = git?.StandardOutput.ReadToEnd().Trim();
+            git?.WaitForExit();
+            return git?.ExitCode == 0 ? sha : null;
+        }
+        catch (Exception)
+        {
+            return null;
+        }
+    }
+
+    /// <summary>Drains the shared reader; latency is sampled from stamped trades only.</summary>
+    private sealed class Consumer(WebSocketManager manager)
+    {
+        private long _events;
+        private volatile bool _measuring;
+
+        public LatencyHistogram Latency { get; } = new();
+
+        public long Events => Interlocked.Read(ref _events);
+
+        public bool Measuring
+        {
+            get => _measuring;
+            set => _measuring = value;
+        }
+
+        public async Task RunAsync(CancellationToken ct)
+        {
+            var reader = manager.GetEventReader();
+            try
+            {
+                while (await reader.WaitToReadAsync(ct))
+                {
+                    while (reader.TryRead(out var evt))
+                    {
+                        Interlocked.Increment(ref _events);
+                        if (_measuring
+                            && evt is TradesEvent { Trades: [var first, ..] } trades
+                            && FakeHyperliquidServer.IsStamped(trades.Symbol)
+                            && long.TryParse(first.TradeId, NumberStyles.None, CultureInfo.InvariantCulture, out var stamp))
+                        {
+                            Latency.RecordTicks(Stopwatch.GetTimestamp() - stamp);
+                        }
+                    }
+                }
+            }
+            catch (OperationCanceledException) { }
+        }
+    }
+}
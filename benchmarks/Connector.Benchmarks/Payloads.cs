@@ -0,0 +1,131 @@
+using System.Globalization;
+using System.Text;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// Synthetic Hyperliquid WS payloads shaped like production captures.
+/// </summary>
+public static class Payloads
+{
+    /// <summary>Representative frame for each channel, sized like a busy production capture.</summary>
+    public static byte[] ForChannel(string channel) => channel switch
+    {
+        "trades" => Trades(count: 50),
+        "l2Book" => L2Book(levelsPerSide: 20),
+        "allMids" => AllMids(coins: 200),
+        "bbo" => Bbo(),
+        "candle" => Candle(),
+        "activeAssetCtx" => ActiveAssetCtx(),
+        "orderUpdates" => OrderUpdates(count: 20),
+        "userFills" => UserFills(count: 50),
+        "clearinghouseState" => ClearinghouseState(positions: 30),
+        "userFundings" => UserFundings(count: 50),
+        "ledger" => Ledger(count: 50),
+        "openOrders" => OpenOrders(count: 100),
+        "twapStates" => TwapStates(count: 10),
+        "activeAssetData" => ActiveAssetData(),
+        "notification" => Notification(),
+        _ => throw new ArgumentOutOfRangeException(nameof(channel), channel, "no payload for channel")
+    };
+
+    public static byte[] Trades(int count, string coin = "BTC")
+    {
+        var sb = new StringBuilder("{\"channel\":\"trades\",\"data\":[");
+        for (var i = 0; i < count; i++)
+        {
+            if (i > 0) sb.Append(',');
+            var px = (50_000m + i * 0.5m).ToString(CultureInfo.InvariantCulture);
+            sb.Append($$"""{"coin":"{{coin}}","side":"{{(i % 2 == 0 ? "B" : "A")}}","px":"{{px}}","sz":"0.{{i % 9 + 1}}25","hash":"0x{{i:x16}}","time":{{1704067200000 + i}},"tid":{{100_000 + i}},"users":["0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa","0xbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"]}""");
+        }
+        sb.Append("]}");
+        return Encoding.UTF8.GetBytes(sb.ToString());
+    }
+
+    public static byte[] L2Book(int levelsPerSide, string coin = "BTC")
+    {
+        var sb = new StringBuilder($$"""{"channel":"l2Book","data":{"coin":"{{coin}}","time":1704067200000,"levels":[""");
+        AppendSide(sb, levelsPerSide, 50_000m, -1m);
+        sb.Append(',');
+        AppendSide(sb, levelsPerSide, 50_001m, 1m);
+        sb.Append("]}}");
+        return Encoding.UTF8.GetBytes(sb.ToString());
+
+        static void AppendSide(StringBuilder sb, int n, decimal start, decimal step)
+        {
+            sb.Append('[');
+            for (var i = 0; i < n; i++)
+            {
+                if (i > 0) sb.Append(',');
+                var px = (start + step * i).ToString(CultureInfo.InvariantCulture);
+                sb.Append($$"""{"px":"{{px}}","sz":"{{(i + 1) * 0.137m}}","n":{{i % 7 + 1}}}""");
+            }
+            sb.Append(']');
+        }
+    }
+
+    public static byte[] AllMids(int coins)
+    {
+        var sb = new StringBuilder("{\"channel\":\"allMids\",\"data\":{\"mids\":{");
+        for (var i = 0; i < coins; i++)
+        {
+            if (i > 0) sb.Append(',');
+            sb.Append($"\"COIN{i}\":\"{(1.2345m + i * 17.5m).ToString(CultureInfo.InvariantCulture)}\"");
+        }
+        sb.Append("}}}");
+        return Encoding.UTF8.GetBytes(sb.ToString());
+    }
+
+    public static byte[] Bbo(string coin = "BTC") => Encoding.UTF8.GetBytes(
+        $$$$"""{"channel":"bbo","data":{"coin":"{{{{coin}}}}","time":1704067200000,"bid":{"px":"50000.0","sz":"1.234","n":3},"ask":{"px":"50001.0","sz":"0.567","n":2}}}""");
+
+    public static byte[] Candle(string coin = "BTC") => Encoding.UTF8.GetBytes(
+        $$$"""{"channel":"candle","data":{"t":1704067200000,"T":1704067259999,"s":"{{{coin}}}","i":"1m","o":"50000.0","c":"50012.5","h":"50020.0","l":"49990.5","v":"12.345","n":187}}""");
+
+    public static byte[] ActiveAssetCtx(string coin = "BTC") => Encoding.UTF8.GetBytes(
+        $$$$"""{"channel":"activeAssetCtx","data":{"coin":"{{{{coin}}}}","ctx":{"dayNtlVlm":"1234567890.12","prevDayPx":"49500.0","markPx":"50001.0","midPx":"50000.5","funding":"0.0000125","openInterest":"12345.678","oraclePx":"50000.2","premium":"0.0001","impactPxs":["50000.0","50002.0"]}}}""");
+
+    public static byte[] OrderUpdates(int count) => Items("orderUpdates", count, i =>
+        $$$"""{"order":{"coin":"COIN{{{i % 20}}}","side":"{{{Side(i)}}}","limitPx":"{{{Px(i)}}}","sz":"0.5","oid":{{{9_000_000 + i}}},"timestamp":1704067200000,"origSz":"1.0","cloid":"0x{{{i:x32}}}"},"status":"open","statusTimestamp":{{{1704067200000 + i}}}}""");
+
+    public static byte[] UserFills(int count) => Data("userFills",
+        """{"isSnapshot":false,"user":"0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa","fills":""" + Array(count, i =>
+            $$$"""{"coin":"COIN{{{i % 20}}}","px":"{{{Px(i)}}}","sz":"0.25","side":"B","time":{{{1704067200000 + i}}},"startPosition":"1.5","dir":"Open Long","closedPnl":"0.0","hash":"0x{{{i:x64}}}","oid":{{{9_000_000 + i}}},"crossed":true,"fee":"0.0123","tid":{{{100_000 + i}}},"feeToken":"USDC"}""") + "}");
+
+    public static byte[] ClearinghouseState(int positions) => Data("clearinghouseState",
+        """{"assetPositions":""" + Array(positions, i =>
+            $$$"""{"type":"oneWay","position":{"coin":"COIN{{{i}}}","szi":"{{{(i % 2 == 0 ? "" : "-")}}}1.5","leverage":{"type":"cross","value":10},"entryPx":"{{{Px(i)}}}","positionValue":"1500.0","unrealizedPnl":"12.5","returnOnEquity":"0.05","liquidationPx":"{{{Px(i / 2)}}}","marginUsed":"150.0"}}""")
+        + ""","marginSummary":{"accountValue":"100000.0","totalNtlPos":"50000.0","totalRawUsd":"100000.0","totalMarginUsed":"5000.0"},"withdrawable":"95000.0","time":1704067200000}""");
+
+    public static byte[] UserFundings(int count) => Data("userFundings",
+        """{"isSnapshot":false,"fundings":""" + Array(count, i =>
+            $$$"""{"time":{{{1704067200000 + i * 3_600_000L}}},"hash":"0x{{{i:x64}}}","delta":{"type":"funding","coin":"COIN{{{i % 20}}}","usdc":"-0.123","szi":"1.5","fundingRate":"0.0000125"}}""") + "}");
+
+    public static byte[] Ledger(int count) => Data("userNonFundingLedgerUpdates",
+        """{"isSnapshot":false,"ledgerUpdates":""" + Array(count, i =>
+            $$$"""{"time":{{{1704067200000 + i}}},"hash":"0x{{{i:x64}}}","delta":{"type":"deposit","usdc":"{{{100 + i}}}.0"}}""") + "}");
+
+    public static byte[] OpenOrders(int count) => Items("openOrders", count, i =>
+        $$$"""{"coin":"COIN{{{i % 20}}}","side":"{{{Side(i)}}}","limitPx":"{{{Px(i)}}}","sz":"0.5","oid":{{{9_000_000 + i}}},"timestamp":{{{1704067200000 + i}}},"origSz":"1.0"}""");
+
+    public static byte[] TwapStates(int count) => Items("twapStates", count, i =>
+        $$$"""{"twapId":{{{i}}},"coin":"COIN{{{i % 20}}}","isBuy":true,"sz":"10.0","executedSz":"2.5","executedNtl":"125000.0","minutes":30,"reduceOnly":false,"randomize":false,"createdTime":1704067200000}""");
+
+    public static byte[] ActiveAssetData(string coin = "BTC") => Encoding.UTF8.GetBytes(
+        $$$"""{"channel":"activeAssetData","data":{"user":"0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa","coin":"{{{coin}}}","leverage":20,"maxTradeSzs":["12.5","11.0"],"availableToTrade":["625000.0","550000.0"],"markPx":"50001.0"}}""");
+
+    public static byte[] Notification() => Encoding.UTF8.GetBytes(
+        """{"channel":"notification","data":{"notification":"Order filled: buy 0.25 BTC at 50000.0"}}""");
+
+    private static string Px(int i) => (100m + i * 1.25m).ToString(CultureInfo.InvariantCulture);
+
+    private static string Side(int i) => i % 2 == 0 ? "B" : "A";
+
+    private static string Array(int count, Func<int, string> item) =>
+        "[" + string.Join(",", Enumerable.Range(0, count).Select(item)) + "]";
+
+    private static byte[] Data(string channel, string data) =>
+        Encoding.UTF8.GetBytes($$$"""{"channel":"{{{channel}}}","data":{{{data}}}}""");
+
+    private static byte[] Items(string channel, int count, Func<int, string> item) => Data(channel, Array(count, item));
+}
@@ -0,0 +1,24 @@
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Exporters.Json;
+using BenchmarkDotNet.Running;
+using Connector.Benchmarks.Load;
+
+// Run all:      dotnet run -c Release --project benchmarks/Connector.Benchmarks -- --filter '*'
+// Run a subset: dotnet run -c Release --project benchmarks/Connector.Benchmarks -- --filter '*WsParse*'
+// Load test:    dotnet run -c Release --project benchmarks/Connector.Benchmarks -- load --rate 50000 --duration 30 --channel trades --out load.json
+// Fake server:  dotnet run -c Release --project benchmarks/Connector.Benchmarks -- serve --port 9000 --rate 20000 --channel l2Book
+//
+// BenchmarkDotNet writes *-report-full.json next to its other reports under
+// BenchmarkDotNet.Artifacts/results; compare two runs with benchmarks/compare.py.
+return args switch
+{
+    ["load", .. var rest] => await LoadTest.RunCommandAsync(rest),
+    ["serve", .. var rest] => await LoadTest.ServeCommandAsync(rest),
+    _ => Run(args)
+};
+
+static int Run(string[] args)
+{
+    BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args, DefaultConfig.Instance.AddExporter(JsonExporter.Full));
+    return 0;
+}
@@ -0,0 +1,60 @@
+using BenchmarkDotNet.Attributes;
+using Connector.Benchmarks.Load;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Managers;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// REST round trips against <see cref="FakeHyperliquidServer"/> on loopback: the bare
+/// transport, RestManager on top of it, and a burst of identical reads that single-flight
+/// coalesces into one send.
+/// </summary>
+[MemoryDiagnoser]
+public class RestManagerBenchmarks
+{
+    private const int BurstSize = 64;
+
+    private FakeHyperliquidServer _server = null!;
+    private RestTransport _transport = null!;
+    private RestManager _manager = null!;
+    private TransportRestRequest _allMids = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _server = new FakeHyperliquidServer(new FakeServerOptions { Coins = 200 });
+        _server.Start();
+
+        _transport = new RestTransport(_server.BaseUri, NullLogger<RestTransport>.Instance);
+        var translator = new HyperliquidRestTranslator();
+        _manager = new RestManager(_transport, translator, new NoAuthProvider(), NullLogger<RestManager>.Instance);
+        _allMids = translator.ToExchangeRequest(new GetAllMidsRequest { Exchange = UnifiedExchange.Hyperliquid });
+    }
+
+    [GlobalCleanup]
+    public void Cleanup() => _server.DisposeAsync().AsTask().GetAwaiter().GetResult();
+
+    [Benchmark(Baseline = true)]
+    public Task<TransportRestResponse> Transport_AllMids() => _transport.SendAsync(_allMids, CancellationToken.None);
+
+    [Benchmark]
+    public Task<GetAllMidsResponse> Manager_AllMids() =>
+        _manager.ExecuteAsync(new GetAllMidsRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+
+    [Benchmark]
+    public Task<GetL2BookResponse> Manager_L2Book() =>
+        _manager.ExecuteAsync(new GetL2BookRequest { Exchange = UnifiedExchange.Hyperliquid, Symbol = "SYN0" }, CancellationToken.None);
+
+    [Benchmark(OperationsPerInvoke = BurstSize)]
+    public Task Manager_CoalescedBurst()
+    {
+        var calls = new Task[BurstSize];
+        for (var i = 0; i < calls.Length; i++)
+            calls[i] = _manager.ExecuteAsync(new GetAllMidsRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+        return Task.WhenAll(calls);
+    }
+}
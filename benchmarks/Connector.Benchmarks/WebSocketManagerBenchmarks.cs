@@ -0,0 +1,74 @@
+using System.Runtime.CompilerServices;
+using BenchmarkDotNet.Attributes;
+using Connector.Core.Abstractions;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Managers;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// End-to-end WebSocketManager throughput: frames from an in-memory transport through
+/// translation and fan-out until the consumer has read every event. Reported per frame.
+/// </summary>
+[MemoryDiagnoser]
+public class WebSocketManagerBenchmarks
+{
+    private const int Frames = 20_000;
+
+    private readonly HyperliquidWsTranslator _translator = new(NullLogger.Instance);
+    private ReadOnlyMemory<byte>[] _frames = [];
+
+    [Params("trades", "l2Book", "allMids", "mixed")]
+    public string Channel { get; set; } = "trades";
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _frames = Channel == "mixed"
+            ? [Payloads.Trades(count: 5), Payloads.L2Book(levelsPerSide: 20), Payloads.Bbo(), Payloads.Trades(count: 1, coin: "ETH")]
+            : [Payloads.ForChannel(Channel)];
+    }
+
+    [Benchmark(OperationsPerInvoke = Frames)]
+    public async Task<int> ReceiveTranslateConsume()
+    {
+        var transport = new InMemoryWsTransport(_frames, Frames);
+        await using var manager = new WebSocketManager(
+            transport, _translator, new NoAuthProvider(), NullLogger<WebSocketManager>.Instance,
+            channelCapacity: Frames * 2);
+        await manager.StartAsync(new Uri("wss://bench.local"), CancellationToken.None);
+
+        // The reader completes once the transport runs dry and the receive loop exits
+        var reader = manager.GetEventReader();
+        var events = 0;
+        while (await reader.WaitToReadAsync())
+        {
+            while (reader.TryRead(out _))
+                events++;
+        }
+        return events;
+    }
+
+    /// <summary>Yields a fixed number of frames, cycling through the given payloads, then ends.</summary>
+    private sealed class InMemoryWsTransport(ReadOnlyMemory<byte>[] frames, int count) : IWsTransport
+    {
+        public bool IsConnected => true;
+
+        public Task ConnectAsync(Uri uri, CancellationToken ct) => Task.CompletedTask;
+
+        public Task DisconnectAsync(CancellationToken ct) => Task.CompletedTask;
+
+        public Task SendAsync(TransportWsMessage message, CancellationToken ct) => Task.CompletedTask;
+
+        public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync([EnumeratorCancellation] CancellationToken ct)
+        {
+            await Task.Yield();
+            for (var i = 0; i < count && !ct.IsCancellationRequested; i++)
+                yield return new TransportWsInbound { Utf8Payload = frames[i % frames.Length], ReceivedAt = DateTimeOffset.UtcNow };
+        }
+
+        public ValueTask DisposeAsync() => ValueTask.CompletedTask;
+    }
+}
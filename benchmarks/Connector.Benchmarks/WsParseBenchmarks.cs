@@ -0,0 +1,44 @@
+using BenchmarkDotNet.Attributes;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// One benchmark per HyperliquidWsTranslator parser, on payloads sized like production
+/// captures: a deep l2Book, 200-coin allMids, a bursty trades frame and full account snapshots.
+/// </summary>
+[MemoryDiagnoser]
+public class WsParseBenchmarks
+{
+    private readonly HyperliquidWsTranslator _translator = new(NullLogger.Instance);
+    private byte[] _frame = [];
+
+    [Params(
+        "trades", "l2Book", "allMids", "bbo", "candle", "activeAssetCtx", "orderUpdates",
+        "userFills", "clearinghouseState", "userFundings", "ledger", "openOrders",
+        "twapStates", "activeAssetData", "notification")]
+    public string Channel { get; set; } = "trades";
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _frame = Payloads.ForChannel(Channel);
+
+        // A payload the parser rejects would benchmark the error path instead
+        if (Parse() == 0)
+            throw new InvalidOperationException($"{Channel} payload produced no events");
+    }
+
+    [Benchmark]
+    public int Parse()
+    {
+        var inbound = new TransportWsInbound { Utf8Payload = _frame, ReceivedAt = DateTimeOffset.UtcNow };
+        var count = 0;
+        foreach (var _ in _translator.FromExchangeMessage(inbound))
+            count++;
+        return count;
+    }
+}
@@ -0,0 +1,45 @@
+using BenchmarkDotNet.Attributes;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Benchmarks;
+
+/// <summary>
+/// Before/after for the inbound WS path: the legacy string + JsonDocument pipeline
+/// versus HyperliquidWsTranslator reading the pooled UTF-8 frame directly.
+/// </summary>
+[MemoryDiagnoser]
+public class WsTranslatorBenchmarks
+{
+    private readonly HyperliquidWsTranslator _translator = new(NullLogger.Instance);
+    private byte[] _frame = [];
+
+    [Params("trades", "l2Book", "allMids")]
+    public string Channel { get; set; } = "trades";
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _frame = Channel switch
+        {
+            "trades" => Payloads.Trades(count: 50),
+            "l2Book" => Payloads.L2Book(levelsPerSide: 20),
+            "allMids" => Payloads.AllMids(coins: 200),
+            _ => throw new ArgumentOutOfRangeException(nameof(Channel))
+        };
+    }
+
+    [Benchmark(Baseline = true)]
+    public UnifiedWsEvent? Legacy() => LegacyPipeline.Parse(_frame);
+
+    [Benchmark]
+    public UnifiedWsEvent? Utf8Reader()
+    {
+        var inbound = new TransportWsInbound { Utf8Payload = _frame, ReceivedAt = DateTimeOffset.UtcNow };
+        foreach (var evt in _translator.FromExchangeMessage(inbound))
+            return evt;
+        return null;
+    }
+}
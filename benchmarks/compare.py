@@ -0,0 +1,101 @@
+"""Compare two benchmark result files and flag regressions.
+
+Accepts either two BenchmarkDotNet full JSON reports (*-report-full.json under
+BenchmarkDotNet.Artifacts/results) or two `load` results from Connector.Benchmarks.
+Exits 1 when any metric regressed by more than the threshold, so it can gate CI.
+
+Usage:
+
+    python benchmarks/compare.py base.json head.json
+    python benchmarks/compare.py base-load.json head-load.json --threshold 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+# metric -> True when higher is better
+LOAD_METRICS = {
+    "messagesPerSecond": True,
+    "latencyMicros.p50": False,
+    "latencyMicros.p99": False,
+    "latencyMicros.p999": False,
+    "allocatedBytesPerMessage": False,
+    "dropped": False,
+    "conflated": False,
+}
+
+
+def bdn_metrics(report: dict) -> dict[str, float]:
+    metrics = {}
+    for bench in report.get("Benchmarks", []):
+        name = bench["FullName"]
+        stats = bench.get("Statistics") or {}
+        if "Mean" in stats:
+            metrics[f"{name} mean_ns"] = stats["Mean"]
+        memory = bench.get("Memory") or {}
+        if "BytesAllocatedPerOperation" in memory:
+            metrics[f"{name} alloc_bytes"] = memory["BytesAllocatedPerOperation"]
+    return metrics
+
+
+def load_metrics(result: dict) -> dict[str, float]:
+    metrics = {}
+    for path in LOAD_METRICS:
+        value = result
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            metrics[path] = value
+    return metrics
+
+
+def higher_is_better(metric: str) -> bool:
+    return LOAD_METRICS.get(metric, False)
+
+
+def compare(base: dict, head: dict, threshold: float) -> int:
+    kind = "load" if base.get("kind") == "load" else "bdn"
+    extract = load_metrics if kind == "load" else bdn_metrics
+    before, after = extract(base), extract(head)
+
+    regressions = 0
+    width = max((len(m) for m in before), default=10)
+    print(f"{'metric':<{width}}  {'base':>14}  {'head':>14}  {'change':>8}")
+    for metric in sorted(before.keys() & after.keys()):
+        old, new = before[metric], after[metric]
+        change = (new - old) / old * 100 if old else (0.0 if new == old else float("inf"))
+        worse = -change if higher_is_better(metric) else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif worse < -threshold:
+            flag = "  improved"
+        print(f"{metric:<{width}}  {old:>14.1f}  {new:>14.1f}  {change:>+7.1f}%{flag}")
+
+    for metric in sorted(before.keys() - after.keys()):
+        print(f"{metric:<{width}}  missing from head")
+
+    print(f"\n{regressions} regression(s) over {threshold:g}%")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change that counts as a regression")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+    return compare(base, head, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Columnar bulk reads from WebSocketManager for NumPy / pandas consumers.
+
+WebSocketManager.DrainTrades / DrainBooks write rows straight into caller-owned
+buffers. This module preallocates those buffers as NumPy arrays and hands .NET
+their data pointers, so one drain is a single CLR call and no per-event or
+per-property crossings.
+
+Usage (after loading Connector.Core, see python_example.py):
+
+    drain = ColumnarDrain(ws_manager, capacity=65536)
+    cols = drain.trades(timeout=0.1)          # dict of NumPy arrays
+    df = drain.books(timeout=0.1, frame=True)  # pandas DataFrame
+
+Arrays returned with copy=False are views into the drain buffers and are
+overwritten by the next call of the same kind.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+TRADE_COLUMNS = (
+    ("timestamp_ms", np.int64),
+    ("symbol_id", np.int32),
+    ("side", np.int8),  # +1 buy, -1 sell
+    ("price", np.float64),
+    ("size", np.float64),
+)
+
+BOOK_COLUMNS = (
+    ("sequence", np.int64),
+    ("received_at_ms", np.int64),
+    ("symbol_id", np.int32),
+    ("kind", np.int8),  # see BOOK_KINDS
+    ("side", np.int8),  # +1 bid, -1 ask
+    ("price", np.float64),
+    ("size", np.float64),  # 0 in a delta row = level removed
+)
+
+BOOK_KINDS = {0: "top", 1: "snapshot", 2: "delta"}
+
+
+class ColumnarDrain:
+    """Reusable NumPy buffers bound to one WebSocketManager."""
+
+    def __init__(self, ws_manager, capacity: int = 65536):
+        from System import Int32, IntPtr, TimeSpan
+
+        self._manager = ws_manager
+        self._capacity = capacity
+        self._int32 = Int32
+        self._timespan = TimeSpan
+        self._symbols: list[str] = []
+
+        assembly = ws_manager.GetType().Assembly
+        self._trade_arrays = {name: np.zeros(capacity, dtype) for name, dtype in TRADE_COLUMNS}
+        self._book_arrays = {name: np.zeros(capacity, dtype) for name, dtype in BOOK_COLUMNS}
+
+        def bind(type_name: str, arrays: dict[str, np.ndarray]):
+            # Arrays must stay alive (they are owned by self) and C-contiguous.
+            pointers = [IntPtr(a.ctypes.data) for a in arrays.values()]
+            factory = assembly.GetType(type_name).GetMethod("FromPointers")
+            return factory.Invoke(None, pointers + [Int32(capacity)])
+
+        self._trade_columns = bind("Connector.Core.Managers.TradeColumns", self._trade_arrays)
+        self._book_columns = bind("Connector.Core.Managers.BookColumns", self._book_arrays)
+
+    def trades(self, max_rows: int | None = None, timeout: float = 0.1, copy: bool = False, frame: bool = False):
+        """Drain pending trades; waits up to `timeout` seconds for the first one."""
+        n = self._manager.DrainTrades(self._trade_columns, self._rows(max_rows), self._timespan.FromSeconds(timeout))
+        return self._result(self._trade_arrays, n, copy, frame)
+
+    def books(self, max_rows: int | None = None, timeout: float = 0.1, copy: bool = False, frame: bool = False):
+        """Drain pending L1/L2 book rows (one row per price level)."""
+        n = self._manager.DrainBooks(self._book_columns, self._rows(max_rows), self._timespan.FromSeconds(timeout))
+        return self._result(self._book_arrays, n, copy, frame)
+
+    def symbol_names(self) -> list[str]:
+        """Symbol names indexed by symbol_id."""
+        if len(self._symbols) < self._manager.Symbols.Count:
+            self._symbols = list(self._manager.Symbols.GetNames())
+        return self._symbols
+
+    def _rows(self, max_rows: int | None):
+        return self._int32(self._capacity if max_rows is None else min(max_rows, self._capacity))
+
+    def _result(self, arrays: dict[str, np.ndarray], n: int, copy: bool, frame: bool):
+        columns = {name: (a[:n].copy() if copy else a[:n]) for name, a in arrays.items()}
+        if not frame:
+            return columns
+
+        import pandas as pd
+
+        df = pd.DataFrame(columns, copy=False)
+        df["symbol"] = pd.Categorical.from_codes(df["symbol_id"], categories=self.symbol_names())
+        for ts in ("timestamp_ms", "received_at_ms"):
+            if ts in df:
+                df[ts[: -len("_ms")]] = pd.to_datetime(df[ts], unit="ms", utc=True)
+        if "kind" in df:
+            df["kind"] = df["kind"].map(BOOK_KINDS)
+        return df
@@ -0,0 +1,79 @@
+"""Read `connector record` directories from Python without loading .NET.
+
+A recording is a directory of NNNNNN.seg segment files (raw WebSocket frames) with a
+sparse NNNNNN.idx time index beside each one. See Connector.Core/Recording/RecordingFormat.cs
+for the layout. Segments are memory-mapped and each frame payload is copied out as bytes.
+
+Usage:
+
+    rec = Recording("./rec")
+    for ts_ns, is_binary, payload in rec.frames(start=pd.Timestamp("2026-01-05T14:00Z").value):
+        msg = json.loads(payload)
+
+Use Connector.Core.Transport.ReplayWsTransport through pythonnet instead when you want
+the frames translated into unified events.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+
+MAGIC = 0x3153454D41524643  # "CFRAMES1"
+HEADER = struct.Struct("<QII4q")  # magic, version, header size, first ts, last ts, count, end offset
+HEADER_SIZE = 64
+RECORD = struct.Struct("<IB3xq")  # payload length, flags, ts
+INDEX_ENTRY = struct.Struct("<qq")  # ts, offset
+BINARY_FLAG = 1
+
+
+class Recording:
+    def __init__(self, directory: str | Path):
+        self.segments = sorted(
+            (p for p in Path(directory).glob("*.seg") if p.stem.isdigit()), key=lambda p: int(p.stem)
+        )
+
+    def frames(self, start: int | None = None, end: int | None = None):
+        """Yield (timestamp_ns, is_binary, payload) for frames in [start, end] (Unix ns)."""
+        segments = self.segments
+        if start is not None:
+            # Last segment that starts at or before `start`
+            firsts = [_header(p)[3] for p in segments]
+            i = max((i for i, first in enumerate(firsts) if first <= start), default=0)
+            segments = segments[i:]
+
+        for n, path in enumerate(segments):
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                magic, _, _, _, _, _, end_offset = HEADER.unpack_from(m)
+                if magic != MAGIC:
+                    raise ValueError(f"{path} is not a recording segment")
+
+                pos = _indexed_offset(path, start) if n == 0 and start is not None else HEADER_SIZE
+                while pos + RECORD.size <= end_offset:
+                    length, flags, ts = RECORD.unpack_from(m, pos)
+                    body = pos + RECORD.size
+                    pos = body + ((length + 7) & ~7)
+                    if start is not None and ts < start:
+                        continue
+                    if end is not None and ts > end:
+                        return
+                    # Copy out: the view would pin the mmap past the `with` block
+                    yield ts, bool(flags & BINARY_FLAG), bytes(m[body : body + length])
+
+
+def _header(path: Path):
+    with open(path, "rb") as f:
+        return HEADER.unpack(f.read(HEADER.size))
+
+
+def _indexed_offset(segment: Path, ts: int) -> int:
+    index = segment.with_suffix(".idx")
+    if not index.exists():
+        return HEADER_SIZE
+    offset = HEADER_SIZE
+    for entry_ts, entry_offset in INDEX_ENTRY.iter_unpack(index.read_bytes()[: index.stat().st_size // 16 * 16]):
+        if entry_ts > ts:
+            break
+        offset = entry_offset
+    return offset
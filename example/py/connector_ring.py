@@ -0,0 +1,269 @@
+"""Read `connector publish` shared-memory rings from Python without loading .NET.
+
+The publisher writes one <channel>.ring file per channel (e.g. /dev/shm/hl/trades.ring):
+a header, a symbol table and a ring of fixed-size slots, one row per trade, price level,
+mid, fill or order. See Connector.Core/SharedMemory/RingFormat.cs for the layout. Each
+reader maps the file read-only and keeps its own position, so any number of processes can
+attach, detach and read at their own pace without slowing the publisher.
+
+Usage:
+
+    ring = Ring("/dev/shm/hl/trades.ring")
+    names = ring.symbols()
+    while True:
+        rows = ring.poll(timeout=1.0)        # NumPy structured view into the mmap
+        for sym, px, sz in zip(rows["symbol_id"], rows["price"], rows["size"]):
+            ...
+        if ring.lost:
+            ...                              # fell more than a ring behind
+
+Rows returned by poll() are views, not copies: they stay valid until the publisher laps
+them (one ring's worth of later rows). Check ring.intact() after processing a batch, or
+copy it, if a slow consumer could be lapped. Without NumPy, rows() yields dicts through
+`struct` instead.
+
+Readers rely on the publisher's store ordering (slot sequence written last); this holds
+on x86-64 and arm64 hosts.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+
+MAGIC = 0x3130474E49525843  # "CXRING01"
+HEADER = struct.Struct("<QIIIIIIqIII")
+# magic, version, data offset, slot size, slot count, channel, layout, created ns, pid, state, symbol capacity
+WRITE_SEQUENCE_OFFSET = 64
+SYMBOL_COUNT_OFFSET = 128
+HEADER_SIZE = 4096
+SYMBOL_ENTRY_SIZE = 32
+STATE_CLOSED = 2
+
+# Slot flags
+LAST = 1  # last row of its event
+SNAPSHOT = 2
+REDUCE_ONLY = 4
+TRIGGER = 8
+
+BOOK_KINDS = {0: "top", 1: "snapshot", 2: "delta"}
+ORDER_STATUS = {0: "other", 1: "open", 2: "filled", 3: "canceled", 4: "triggered", 5: "rejected"}
+
+_COMMON = [
+    ("seq", "<i8", 0),  # record sequence + 1
+    ("received_ns", "<i8", 8),
+    ("symbol_id", "<i4", 16),  # index into symbols(); -1 for an empty open-orders snapshot
+    ("side", "i1", 20),  # +1 buy/bid, -1 sell/ask
+    ("flags", "u1", 21),
+    ("code", "u1", 22),  # BOOK_KINDS for book rows, ORDER_STATUS for order rows
+]
+
+# layout id -> (slot size, fields); offsets match the C# records
+LAYOUTS = {
+    1: ("trade", 64, [("timestamp_ns", "<i8", 24), ("price", "<f8", 32), ("size", "<f8", 40), ("trade_id", "<i8", 48)]),
+    2: ("book_level", 64, [("event_seq", "<i8", 24), ("price", "<f8", 32), ("size", "<f8", 40), ("level", "<i4", 48)]),
+    3: (
+        "candle",
+        80,
+        [("open_time_ns", "<i8", 24), ("open", "<f8", 32), ("high", "<f8", 40), ("low", "<f8", 48),
+         ("close", "<f8", 56), ("volume", "<f8", 64)],
+    ),
+    4: ("mid", 32, [("mid", "<f8", 24)]),
+    5: (
+        "asset_ctx",
+        80,
+        [("mark_price", "<f8", 24), ("funding_rate", "<f8", 32), ("open_interest", "<f8", 40),
+         ("oracle_price", "<f8", 48), ("prev_day_price", "<f8", 56), ("day_base_volume", "<f8", 64),
+         ("day_notional_volume", "<f8", 72)],
+    ),
+    6: (
+        "fill",
+        96,
+        [("timestamp_ns", "<i8", 24), ("price", "<f8", 32), ("size", "<f8", 40), ("fee", "<f8", 48),
+         ("closed_pnl", "<f8", 56), ("start_position", "<f8", 64), ("order_id", "<i8", 72), ("trade_id", "<i8", 80)],
+    ),
+    7: (
+        "order",
+        96,
+        [("timestamp_ns", "<i8", 24), ("price", "<f8", 32), ("size", "<f8", 40), ("filled_size", "<f8", 48),
+         ("original_size", "<f8", 56), ("trigger_price", "<f8", 64), ("order_id", "<i8", 72), ("cloid", "16s", 80)],
+    ),
+}
+
+
+def dtype_for(layout: int):
+    """NumPy structured dtype of one slot of `layout`."""
+    import numpy as np
+
+    _, size, fields = LAYOUTS[layout]
+    fields = _COMMON + fields
+    return np.dtype(
+        {
+            "names": [f[0] for f in fields],
+            "formats": [f[1].replace("16s", "V16") for f in fields],
+            "offsets": [f[2] for f in fields],
+            "itemsize": size,
+        }
+    )
+
+
+class Ring:
+    """One reader attached to one channel ring."""
+
+    def __init__(self, path: str | Path, from_start: bool = False):
+        """Attach to `path`; read from the oldest safe row with from_start, else from now."""
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._ino = os.fstat(f.fileno()).st_ino
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.data_offset, self.slot_size, self.slot_count, self.channel, self.layout,
+         self.created_ns, self.writer_pid, _, self.symbol_capacity) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a connector ring")
+        if version != 1:
+            raise ValueError(f"{self.path} has unsupported ring version {version}")
+
+        self.name, size, fields = LAYOUTS[self.layout]
+        if size != self.slot_size:
+            raise ValueError(f"{self.path}: slot size {self.slot_size} does not match layout {self.name}")
+        self._row = struct.Struct("<qqibBB1x" + "".join(_pack_code(f[1]) for f in fields))
+        self._fields = [f[0] for f in _COMMON] + [f[0] for f in fields]
+        self._names: list[str] = []
+
+        try:
+            import numpy as np
+
+            self.records = np.ndarray((self.slot_count,), dtype_for(self.layout), buffer=self._map, offset=self.data_offset)
+        except ImportError:
+            self.records = None
+
+        head = self.write_sequence()
+        self.position = self._oldest_safe(head) if from_start else head
+        self.lost = 0
+        self._last_start = self.position
+
+    # ─── State ──────────────────────────────────────
+
+    def write_sequence(self) -> int:
+        """Rows published so far."""
+        return struct.unpack_from("<q", self._map, WRITE_SEQUENCE_OFFSET)[0]
+
+    @property
+    def pending(self) -> int:
+        return self.write_sequence() - self.position
+
+    @property
+    def stale(self) -> bool:
+        """The publisher stopped or was restarted with a new file; open a new Ring."""
+        if struct.unpack_from("<I", self._map, 44)[0] == STATE_CLOSED:
+            return True
+        try:
+            return os.stat(self.path).st_ino != self._ino
+        except FileNotFoundError:
+            return True
+
+    def symbols(self) -> list[str]:
+        """Symbol names indexed by symbol_id; refreshed when the publisher adds one."""
+        count = struct.unpack_from("<I", self._map, SYMBOL_COUNT_OFFSET)[0]
+        for i in range(len(self._names), count):
+            entry = HEADER_SIZE + i * SYMBOL_ENTRY_SIZE
+            length = self._map[entry]
+            self._names.append(self._map[entry + 1 : entry + 1 + length].decode())
+        return self._names
+
+    # ─── Reading ────────────────────────────────────
+
+    def poll(self, max_rows: int | None = None, timeout: float = 0.0):
+        """
+        Next rows as a NumPy view, waiting up to `timeout` seconds for the first. A batch
+        never wraps the ring, so a full catch-up may take two calls. Rows the publisher
+        overwrote before they were read are skipped and counted in `lost`.
+        """
+        if self.records is None:
+            raise RuntimeError("poll() needs NumPy; use rows() instead")
+
+        start, count = self._claim(max_rows, timeout)
+        batch = self.records[start % self.slot_count : start % self.slot_count + count]
+        if count:
+            # Rows lapped while we were claiming them carry a newer sequence; they are the oldest
+            expected = start + 1 + _arange(count)
+            bad = (batch["seq"] != expected).nonzero()[0]
+            if len(bad):
+                skip = int(bad[-1]) + 1
+                self.lost += skip
+                batch = batch[skip:]
+                start += skip
+        self._last_start = start
+        return batch
+
+    def rows(self, max_rows: int | None = None, timeout: float = 0.0):
+        """Like poll() but yields one dict per row through `struct`; no NumPy needed."""
+        start, count = self._claim(max_rows, timeout)
+        for i in range(count):
+            offset = self.data_offset + ((start + i) % self.slot_count) * self.slot_size
+            values = self._row.unpack_from(self._map, offset)
+            # Re-check after unpacking: the row is gone once the publisher starts writing a ring ahead
+            if values[0] != start + i + 1 or self.write_sequence() - self.slot_count >= start + i:
+                self.lost += 1
+                continue
+            yield dict(zip(self._fields, values))
+
+    def intact(self) -> bool:
+        """Whether the last poll() batch is still unmodified, i.e. the publisher has not lapped it."""
+        return self.write_sequence() - self.slot_count < self._last_start
+
+    def _claim(self, max_rows: int | None, timeout: float):
+        head = self.write_sequence()
+        if head == self.position and timeout > 0:
+            deadline = time.monotonic() + timeout
+            backoff = 50e-6
+            while head == self.position and time.monotonic() < deadline:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 1e-3)
+                head = self.write_sequence()
+
+        oldest = self._oldest_safe(head)
+        if self.position < oldest:
+            self.lost += oldest - self.position
+            self.position = oldest
+
+        start = self.position
+        count = min(head - start, self.slot_count - start % self.slot_count)
+        if max_rows is not None:
+            count = min(count, max_rows)
+        self.position = start + count
+        return start, count
+
+    def _oldest_safe(self, head: int) -> int:
+        # Row head - slot_count shares its slot with the row the publisher writes next
+        return max(0, head - self.slot_count + 1)
+
+    def close(self):
+        """Unmap the ring; fails while poll() views are still referenced."""
+        self.records = None
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_rings(directory: str | Path, from_start: bool = False) -> dict[str, Ring]:
+    """Attach to every ring in a publish directory, keyed by channel file name."""
+    return {p.stem: Ring(p, from_start) for p in sorted(Path(directory).glob("*.ring"))}
+
+
+def _pack_code(fmt: str) -> str:
+    return {"<i8": "q", "<f8": "d", "<i4": "i", "16s": "16s"}[fmt]
+
+
+def _arange(n: int):
+    import numpy as np
+
+    return np.arange(n, dtype=np.int64)
@@ -144,7 +144,6 @@ def main():
 
     # 2) Import .NET types and the connector library types.
     from System import Array, Guid, String, Uri, Activator, Enum, TimeSpan, Int32, Decimal
-    from System.Net.Http import HttpClient
     from System.Threading import CancellationTokenSource
 
     # Resolve Connector.Core types via reflection (pythonnet namespace import can be flaky).
@@ -180,7 +179,7 @@ def main():
 
     ws_transport = Activator.CreateInstance(
         WsTransport,
-        [_get_null_logger(WsTransport)],
+        [_get_null_logger(WsTransport), None],  # metrics: None reports to ConnectorMetrics.Shared
     )
     ws_manager = Activator.CreateInstance(
         WebSocketManager,
@@ -191,6 +190,9 @@ def main():
             _get_null_logger(WebSocketManager),
             rate_limiter,
             Int32(10000),
+            None,  # orderBooks: pass an OrderBookStore to get L2 deltas
+            None,  # fanout: per-(channel, symbol) queue policies
+            None,  # metrics: None reports to ConnectorMetrics.Shared
         ],
     )
 
@@ -272,20 +274,29 @@ def main():
         return f"{channel} {symbol}"
 
     # Read until we see at least one event per stream (or timeout).
+    # For high-rate consumers, connector_columns.ColumnarDrain reads trades and
+    # book levels in bulk into NumPy arrays instead of one event per call.
     while len(seen) < len(streams) and (time := __import__("time").time() - start) * 1000 < deadline_ms:
         evt = reader.ReadAsync(cts.Token).AsTask().Result
         seen.add(str(evt.Channel))
         print(_fmt_event(evt))
 
+    # Per-stage latency (microseconds) and per-key counters. The same figures are on the
+    # "Connector.Core" meter for dotnet-counters / OpenTelemetry.
+    snapshot = ws_manager.Metrics.GetSnapshot()
+    for lat in snapshot.Latencies:
+        print(f"latency {lat.Stage} {lat.Channel or '-'}: n={lat.Count} p50={lat.P50Micros}us p99={lat.P99Micros}us")
+    for route in snapshot.Routes:
+        print(f"route {route.Key}: msgs={route.Messages} bytes={route.Bytes} dropped={route.Dropped} depth={route.Depth}")
+
     # --- REST: place a market buy and a limit sell ---
-    # NOTE: Trading endpoints and EIP-712 signing are not yet implemented in
-    # HyperliquidRestTranslator / HyperliquidAuthProvider.
+    # NOTE: EIP-712 signing is not yet implemented in HyperliquidAuthProvider.
     # The calls below demonstrate how to construct the requests and will fail
-    # until signing and exchange endpoints are wired up.
+    # until signing is wired up. Orders also need the asset index list from a
+    # GetMetaRequest and a price (HL market orders are IOC limits).
 
-    # REST client setup (base address points to HL REST endpoint).
-    http_client = HttpClient()
-    http_client.BaseAddress = Uri(config.HttpUrl)
+    # REST client setup: pooled HTTP/2 client pointed at the HL REST endpoint.
+    http_client = RestTransport.GetMethod("CreateHttpClient").Invoke(None, [Uri(config.HttpUrl), None])
 
     # REST manager wires up transport + translator + auth provider.
     rest_manager = Activator.CreateInstance(
@@ -299,6 +310,7 @@ def main():
             Activator.CreateInstance(HyperliquidAuthProvider, [config]),
             _get_null_logger(RestManager),
             rate_limiter,
+            None,  # RestBatchingOptions: pass one to batch orders/cancels per window
         ],
     )
 
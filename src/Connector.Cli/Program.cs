@@ -1,11 +1,14 @@
 using System.Reflection;
-using System.Text.Json;
 using Connector.Core;
 using Connector.Core.Abstractions;
+using Connector.Core.Books;
 using Connector.Core.Contracts;
 using Connector.Core.Exchanges;
 using Connector.Core.Exchanges.Hyperliquid;
 using Connector.Core.Managers;
+using Connector.Core.Output;
+using Connector.Core.Recording;
+using Connector.Core.SharedMemory;
 using Connector.Core.Transport;
 using Microsoft.Extensions.Logging;
 
@@ -57,14 +60,42 @@ IAuthProvider authProvider = config.NoAuth
     : new NoAuthProvider(); // TODO: real auth provider in S10
 
 // Set up transport
-var wsTransport = new WsTransport(loggerFactory.CreateLogger<WsTransport>());
+IWsTransport wsTransport;
+try
+{
+    wsTransport = CreateTransport(config, loggerFactory);
+}
+catch (IOException ex)
+{
+    Console.Error.WriteLine($"Error: {ex.Message}");
+    return 1;
+}
 var wsTranslator = adapter.CreateWsTranslator();
-var rateLimiter = new TokenBucketRateLimiter(10, TimeSpan.FromSeconds(1));
+var rateLimiter = HyperliquidRateLimits.CreateLimiter(hlConfig.UserAddress);
+using var orderBooks = config.BookDeltas ? new OrderBookStore(config.SnapshotInterval) : null;
 
 await using var wsManager = new WebSocketManager(
     wsTransport, wsTranslator, authProvider,
     loggerFactory.CreateLogger<WebSocketManager>(),
-    rateLimiter);
+    rateLimiter,
+    orderBooks: orderBooks,
+    // A replay runs faster than live; conflating or dropping would change what strategies see
+    fanout: config.ReplayDirectory is null ? null : WsFanoutOptions.Lossless());
+
+// Set up shared-memory rings (publish mode)
+SharedRingPublisher? publisher = null;
+try
+{
+    publisher = config.PublishDirectory is null
+        ? null
+        : new SharedRingPublisher(config.PublishDirectory, config.Channels, config.RingSlots);
+}
+catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+{
+    Console.Error.WriteLine($"Error: {ex.Message}");
+    return 1;
+}
+using var _ = publisher;
 
 // Handle Ctrl+C
 using var cts = new CancellationTokenSource();
@@ -82,8 +113,8 @@ try
     logger.LogInformation("Starting connector for {Exchange} ({Network})", config.Exchange, hlConfig.Network);
     await wsManager.StartAsync(wsUri, cts.Token);
 
-    // Subscribe
-    foreach (var channel in config.Channels)
+    // Subscribe (a replay plays back whatever was recorded)
+    foreach (var channel in config.ReplayDirectory is null ? config.Channels : [])
     {
         var subReq = new UnifiedWsSubscribeRequest
         {
@@ -96,15 +127,22 @@ try
         logger.LogInformation("Subscribed to {Channel} for {Symbols}", channel, string.Join(",", config.Symbols));
     }
 
-    // Read events → JSONL to stdout
+    // Read events → stdout, or → shared-memory rings in publish mode (record mode only
+    // keeps the frames). Writes are buffered and flushed when the buffer fills or the queue
+    // runs dry.
     var reader = wsManager.GetEventReader();
+    await using var output = EventStreamWriter.Create(Console.OpenStandardOutput(), config.Format);
+    var writeEvents = config.RecordDirectory is null;
     while (await reader.WaitToReadAsync(cts.Token))
     {
         while (reader.TryRead(out var evt))
         {
-            var json = JsonSerializer.Serialize(evt, evt.GetType(), JsonOptions.Default);
-            Console.Out.WriteLine(json);
+            if (publisher is not null)
+                publisher.Publish(evt);
+            else if (writeEvents)
+                await output.WriteAsync(evt, cts.Token);
         }
+        await output.FlushAsync(cts.Token);
     }
 }
 catch (OperationCanceledException)
@@ -117,17 +155,73 @@ catch (Exception ex)
     return 2;
 }
 
+if (publisher is not null)
+{
+    logger.LogInformation("Published {Rows} rows to {Directory}", publisher.RowsWritten, publisher.Directory);
+}
+
+if (wsTransport is RecordingWsTransport recording)
+{
+    logger.LogInformation("Recorded {Records} frames ({Bytes} bytes) to {Directory}",
+        recording.Recorder.RecordCount, recording.Recorder.BytesWritten, config.RecordDirectory);
+}
+
 logger.LogInformation("Connector stopped");
 return 0;
 
+static IWsTransport CreateTransport(ConnectorConfig config, ILoggerFactory loggerFactory)
+{
+    if (config.ReplayDirectory is not null)
+    {
+        return new ReplayWsTransport(config.ReplayDirectory, loggerFactory.CreateLogger<ReplayWsTransport>(),
+            new ReplayOptions { Speed = config.ReplaySpeed, From = config.ReplayFrom, To = config.ReplayTo });
+    }
+
+    IWsTransport transport = config.Connections > 1 || config.HotStandby
+        ? new WsConnectionPool(loggerFactory, new WsConnectionPoolOptions
+        {
+            Connections = config.Connections,
+            HotStandby = config.HotStandby
+        })
+        : new WsTransport(loggerFactory.CreateLogger<WsTransport>());
+
+    return config.RecordDirectory is null
+        ? transport
+        : new RecordingWsTransport(transport, new FrameRecorder(config.RecordDirectory));
+}
+
 // --- Arg parsing ---
 
 static ConnectorConfig? ParseArgs(string[] args)
 {
     string? exchange = null, symbols = null, channels = null, configPath = null;
-    bool noAuth = false, raw = false;
+    bool noAuth = false, raw = false, bookDeltas = false, hotStandby = false;
+    var format = EventOutputFormat.Jsonl;
+    TimeSpan? snapshotInterval = null;
+    int connections = 1;
+    string? recordDir = null, replayDir = null, publishDir = null;
+    int ringSlots = SharedRingPublisher.DefaultSlotCount;
+    double replaySpeed = 0;
+    DateTimeOffset? replayFrom = null, replayTo = null;
 
-    for (int i = 0; i < args.Length; i++)
+    var start = 0;
+    if (args[0] is "record" or "replay" or "publish")
+    {
+        if (args.Length < 2 || args[1].StartsWith("--"))
+        {
+            Console.Error.WriteLine($"Error: {args[0]} requires a directory");
+            return null;
+        }
+        switch (args[0])
+        {
+            case "record": recordDir = args[1]; break;
+            case "replay": replayDir = args[1]; break;
+            default: publishDir = args[1]; break;
+        }
+        start = 2;
+    }
+
+    for (int i = start; i < args.Length; i++)
     {
         switch (args[i])
         {
@@ -137,6 +231,57 @@ static ConnectorConfig? ParseArgs(string[] args)
             case "--config" when i + 1 < args.Length: configPath = args[++i]; break;
             case "--no-auth": noAuth = true; break;
             case "--raw": raw = true; break;
+            case "--format" when i + 1 < args.Length:
+                switch (args[++i].ToLowerInvariant())
+                {
+                    case "jsonl": format = EventOutputFormat.Jsonl; break;
+                    case "binary": format = EventOutputFormat.Binary; break;
+                    default:
+                        Console.Error.WriteLine($"Error: Unknown format '{args[i]}'. Supported: jsonl, binary");
+                        return null;
+                }
+                break;
+            case "--book-deltas": bookDeltas = true; break;
+            case "--snapshot-interval" when i + 1 < args.Length:
+                if (!double.TryParse(args[++i], System.Globalization.CultureInfo.InvariantCulture, out var seconds) || seconds <= 0)
+                {
+                    Console.Error.WriteLine($"Error: Invalid --snapshot-interval '{args[i]}'");
+                    return null;
+                }
+                snapshotInterval = TimeSpan.FromSeconds(seconds);
+                break;
+            case "--connections" when i + 1 < args.Length:
+                if (!int.TryParse(args[++i], out connections) || connections < 1)
+                {
+                    Console.Error.WriteLine($"Error: Invalid --connections '{args[i]}'");
+                    return null;
+                }
+                break;
+            case "--hot-standby": hotStandby = true; break;
+            case "--slots" when publishDir is not null && i + 1 < args.Length:
+                if (!int.TryParse(args[++i], out ringSlots) || ringSlots < 2 || !int.IsPow2(ringSlots))
+                {
+                    Console.Error.WriteLine($"Error: Invalid --slots '{args[i]}' (a power of two is required)");
+                    return null;
+                }
+                break;
+            case "--speed" when replayDir is not null && i + 1 < args.Length:
+                if (!double.TryParse(args[++i], System.Globalization.CultureInfo.InvariantCulture, out replaySpeed) || replaySpeed < 0)
+                {
+                    Console.Error.WriteLine($"Error: Invalid --speed '{args[i]}'");
+                    return null;
+                }
+                break;
+            case "--from" or "--to" when replayDir is not null && i + 1 < args.Length:
+                var flag = args[i];
+                if (!DateTimeOffset.TryParse(args[++i], System.Globalization.CultureInfo.InvariantCulture,
+                        System.Globalization.DateTimeStyles.AssumeUniversal, out var at))
+                {
+                    Console.Error.WriteLine($"Error: Invalid {flag} '{args[i]}'");
+                    return null;
+                }
+                if (flag == "--from") replayFrom = at; else replayTo = at;
+                break;
             default:
                 Console.Error.WriteLine($"Unknown argument: {args[i]}");
                 return null;
@@ -144,6 +289,7 @@ static ConnectorConfig? ParseArgs(string[] args)
     }
 
     if (exchange is null) { Console.Error.WriteLine("Error: --exchange required"); return null; }
+    if (replayDir is not null) { symbols ??= ""; channels ??= ""; }
     if (symbols is null) { Console.Error.WriteLine("Error: --symbols required"); return null; }
     if (channels is null) { Console.Error.WriteLine("Error: --channels required"); return null; }
 
@@ -162,6 +308,11 @@ static ConnectorConfig? ParseArgs(string[] args)
             Console.Error.WriteLine($"Error: Unknown channel '{ch}'. Supported: trades, l1, l2, candles, allmids, assetctx, orders, fills, positions, balances, fundings, ledger, notifications, openorders, twapstate, twapfills, twaphistory, assetdata, webdata");
             return null;
         }
+        if (publishDir is not null && !SharedRingPublisher.Supports(wsChannel))
+        {
+            Console.Error.WriteLine($"Error: Channel '{ch}' cannot be published to shared memory. Supported: trades, l1, l2, candles, allmids, assetctx, orders, fills, openorders");
+            return null;
+        }
         parsedChannels.Add(wsChannel);
     }
 
@@ -172,6 +323,18 @@ static ConnectorConfig? ParseArgs(string[] args)
         Channels = parsedChannels.ToArray(),
         NoAuth = noAuth,
         IncludeRaw = raw,
+        Format = format,
+        BookDeltas = bookDeltas,
+        SnapshotInterval = snapshotInterval,
+        Connections = connections,
+        HotStandby = hotStandby,
+        RecordDirectory = recordDir,
+        ReplayDirectory = replayDir,
+        PublishDirectory = publishDir,
+        RingSlots = ringSlots,
+        ReplaySpeed = replaySpeed,
+        ReplayFrom = replayFrom,
+        ReplayTo = replayTo,
         ConfigFilePath = configPath
     };
 }
@@ -224,6 +387,13 @@ static void PrintHelp(string version)
 
         Usage:
           connector [options]
+          connector record <dir> [options]     Record raw frames instead of printing events
+          connector replay <dir> [replay options] [options]
+                                               Print events from a recording
+          connector publish <dir> [--slots <n>] [options]
+                                               Write events to one shared-memory ring per
+                                               channel in <dir> (e.g. /dev/shm/hl) for
+                                               local readers such as connector_ring.py
 
         Options:
           --exchange <name>    Exchange to connect to (hyperliquid, bybit, mexc)
@@ -232,9 +402,25 @@ static void PrintHelp(string version)
           --config <path>      Path to JSON config file (optional)
           --no-auth            Run without authentication (public data only)
           --raw                Include raw exchange payloads in events
+          --format <fmt>       stdout format: jsonl (default) or binary (uint32 LE length +
+                               MessagePack map per event)
+          --book-deltas        Keep local L2 books and emit only changed levels
+          --snapshot-interval <sec>
+                               With --book-deltas, also emit a full book this often
+          --connections <n>    Spread subscriptions over n WebSocket connections
+          --hot-standby        Duplicate each connection and drop repeated messages
           --help, -h           Show this help
           --version, -v        Show version
 
+        Publish options:
+          --slots <n>          Slots per ring, a power of two (default: 65536); readers
+                               may lag by up to this many rows before losing data
+
+        Replay options:
+          --speed <x>          Replay at x times recorded speed (default: as fast as possible)
+          --from <time>        Start at this UTC time (ISO 8601)
+          --to <time>          Stop after this UTC time
+
         Channels (public):
           trades, l1/bbo, l2, candles, allmids, assetctx
 
@@ -247,5 +433,10 @@ static void PrintHelp(string version)
           connector --exchange hl --symbols BTC,ETH --channels trades --no-auth
           connector --exchange hl --symbols SOL --channels trades,candles,l1 --no-auth --raw
           connector --exchange hl --symbols BTC --channels allmids --no-auth
+          connector --exchange hl --symbols BTC,ETH --channels l2 --no-auth --book-deltas --snapshot-interval 30
+          connector --exchange hl --symbols BTC,ETH,SOL,ARB --channels trades,l2 --no-auth --connections 2 --hot-standby
+          connector record ./rec --exchange hl --symbols BTC,ETH --channels trades,l2 --no-auth
+          connector replay ./rec --exchange hl --speed 10 --from 2026-01-05T14:00:00Z
+          connector publish /dev/shm/hl --exchange hl --symbols BTC,ETH --channels trades,l2,allmids --no-auth
         """);
 }
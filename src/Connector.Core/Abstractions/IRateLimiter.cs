@@ -5,5 +5,44 @@ namespace Connector.Core.Abstractions;
 /// </summary>
 public interface IRateLimiter
 {
+    /// <summary>Waits for a single unit of the default cost.</summary>
     Task WaitAsync(CancellationToken ct);
+
+    /// <summary>Waits until <paramref name="cost"/> can be spent.</summary>
+    Task WaitAsync(RateLimitCost cost, CancellationToken ct);
+}
+
+/// <summary>Which exchange limit a request counts against.</summary>
+public enum RateLimitClass
+{
+    Info,
+    Exchange,
+    WebSocket
+}
+
+public enum RateLimitPriority
+{
+    Normal,
+
+    /// <summary>Served before any waiting <see cref="Normal"/> request (e.g. cancels).</summary>
+    High
+}
+
+/// <summary>
+/// What a request costs against the rate limits. Set by translators, which know the
+/// exchange's weighting rules.
+/// </summary>
+public readonly record struct RateLimitCost(
+    int Weight,
+    RateLimitClass Class = RateLimitClass.Info,
+    RateLimitPriority Priority = RateLimitPriority.Normal)
+{
+    public static readonly RateLimitCost Default = new(1);
+    public static readonly RateLimitCost WebSocketMessage = new(1, RateLimitClass.WebSocket);
+
+    /// <summary>Account the request is made for; <c>null</c> uses the limiter's default user.</summary>
+    public string? User { get; init; }
+
+    /// <summary>Actions counted against the per-user budget (orders in a batch).</summary>
+    public int Actions { get; init; } = 1;
 }
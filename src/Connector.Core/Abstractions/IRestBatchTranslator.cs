@@ -0,0 +1,28 @@
+using Connector.Core.Transport;
+
+namespace Connector.Core.Abstractions;
+
+/// <summary>
+/// Optional <see cref="IRestTranslator"/> capability: combine several trading requests into
+/// one exchange request and split the response back out per request. Requests are the
+/// unified request objects; they share no non-generic base type.
+/// </summary>
+public interface IRestBatchTranslator
+{
+    /// <summary>Group the request can be combined with, or <c>null</c> if it must be sent alone.</summary>
+    string? GetBatchKey(object request);
+
+    /// <summary>
+    /// Throws if the request could not be encoded, so one bad item is rejected before it
+    /// joins a batch. Must be cheap: no body is built and no nonce is used.
+    /// </summary>
+    void Validate(object request);
+
+    TransportRestRequest ToExchangeBatchRequest(string batchKey, IReadOnlyList<object> requests);
+
+    /// <summary>
+    /// One entry per request, in order: that request's typed response, or the
+    /// <see cref="Exception"/> the exchange reported for it.
+    /// </summary>
+    object[] FromExchangeBatchResponse(string batchKey, IReadOnlyList<object> requests, TransportRestResponse response);
+}
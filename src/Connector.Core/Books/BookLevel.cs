@@ -0,0 +1,12 @@
+namespace Connector.Core.Books;
+
+/// <summary>
+/// One aggregated price level held by an <see cref="OrderBook"/>.
+/// </summary>
+public readonly record struct BookLevel(decimal Price, decimal Size);
+
+public enum BookSide
+{
+    Bid,
+    Ask
+}
@@ -0,0 +1,340 @@
+using System.Buffers;
+using Connector.Core.Contracts;
+using Connector.Core.Internal;
+
+namespace Connector.Core.Books;
+
+/// <summary>
+/// Local L2 book for one symbol. Levels are kept best-first in pooled arrays together
+/// with running cumulative sizes, so best bid/ask, depth-N and cumulative-size lookups
+/// are O(1) and never copy the book.
+/// <para>
+/// <see cref="Apply"/> has a single writer (the WebSocket receive loop); queries may run
+/// concurrently from any thread.
+/// </para>
+/// </summary>
+public sealed class OrderBook : IDisposable
+{
+    private const int InitialCapacity = 64;
+
+    private readonly object _gate = new();
+    private readonly TimeSpan? _snapshotInterval;
+    private readonly Ladder _bids = new(descending: true);
+    private readonly Ladder _asks = new(descending: false);
+    private DateTimeOffset _lastSnapshotAt;
+    private bool _hasSnapshot;
+    private volatile bool _snapshotRequested;
+    private long _sequence;
+    private bool _disposed;
+
+    public OrderBook(string symbol, TimeSpan? snapshotInterval = null)
+    {
+        Symbol = symbol;
+        _snapshotInterval = snapshotInterval;
+    }
+
+    public string Symbol { get; }
+
+    /// <summary>Sequence of the last event emitted by <see cref="Apply"/>; contiguous per book.</summary>
+    public long Sequence => Interlocked.Read(ref _sequence);
+
+    public DateTimeOffset LastUpdated { get; private set; }
+
+    public int BidDepth { get { lock (_gate) return _bids.Count; } }
+
+    public int AskDepth { get { lock (_gate) return _asks.Count; } }
+
+    /// <summary>
+    /// Forces the next <see cref="Apply"/> to emit a full snapshot instead of a delta.
+    /// </summary>
+    public void RequestSnapshot() => _snapshotRequested = true;
+
+    /// <summary>
+    /// Replaces the book with the full ladder in <paramref name="update"/> and returns the
+    /// event to publish: a full snapshot (first update, on request, or once the snapshot
+    /// interval elapsed), an <see cref="OrderBookL2DeltaEvent"/> with the changed levels,
+    /// or <c>null</c> when nothing changed.
+    /// </summary>
+    public UnifiedWsEvent? Apply(OrderBookL2Event update)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+
+        var bidsInOrder = _bids.Stage(update.Bids);
+        var asksInOrder = _asks.Stage(update.Asks);
+
+        var snapshot = !_hasSnapshot || _snapshotRequested || SnapshotDue(update.ReceivedAt);
+
+        PriceLevel[]? changedBids = null, changedAsks = null;
+        if (!snapshot)
+        {
+            changedBids = _bids.DiffStaged();
+            changedAsks = _asks.DiffStaged();
+        }
+
+        lock (_gate)
+        {
+            _bids.Commit();
+            _asks.Commit();
+            LastUpdated = update.ReceivedAt;
+        }
+
+        if (snapshot)
+        {
+            _hasSnapshot = true;
+            _snapshotRequested = false;
+            _lastSnapshotAt = update.ReceivedAt;
+            return new OrderBookL2Event
+            {
+                Exchange = update.Exchange, Channel = update.Channel, Symbol = update.Symbol,
+                ReceivedAt = update.ReceivedAt, Raw = update.Raw, IsSnapshot = true,
+                Sequence = Interlocked.Increment(ref _sequence),
+                Bids = bidsInOrder ? update.Bids : _bids.ToPriceLevels(),
+                Asks = asksInOrder ? update.Asks : _asks.ToPriceLevels()
+            };
+        }
+
+        if (changedBids!.Length == 0 && changedAsks!.Length == 0)
+            return null;
+
+        return new OrderBookL2DeltaEvent
+        {
+            Exchange = update.Exchange, Channel = update.Channel, Symbol = update.Symbol,
+            ReceivedAt = update.ReceivedAt, Raw = update.Raw,
+            Sequence = Interlocked.Increment(ref _sequence),
+            Bids = changedBids,
+            Asks = changedAsks!
+        };
+    }
+
+    private bool SnapshotDue(DateTimeOffset now) =>
+        _snapshotInterval is { } interval && now - _lastSnapshotAt >= interval;
+
+    // ─── Queries ────────────────────────────────────────
+
+    public bool TryGetBestBid(out BookLevel level)
+    {
+        lock (_gate) return _bids.TryGet(0, out level);
+    }
+
+    public bool TryGetBestAsk(out BookLevel level)
+    {
+        lock (_gate) return _asks.TryGet(0, out level);
+    }
+
+    /// <summary>Level at <paramref name="index"/> from the top of <paramref name="side"/> (0 = best).</summary>
+    public bool TryGetLevel(BookSide side, int index, out BookLevel level)
+    {
+        lock (_gate) return Side(side).TryGet(index, out level);
+    }
+
+    /// <summary>Total size resting in the best <paramref name="depth"/> levels of <paramref name="side"/>.</summary>
+    public decimal CumulativeSize(BookSide side, int depth)
+    {
+        lock (_gate) return Side(side).Cumulative(depth);
+    }
+
+    /// <summary>
+    /// Copies the best <c>destination.Length</c> levels of <paramref name="side"/> into a
+    /// caller-owned buffer and returns how many were written.
+    /// </summary>
+    public int CopyLevels(BookSide side, Span<BookLevel> destination)
+    {
+        lock (_gate)
+        {
+            var levels = Side(side).Levels;
+            var n = Math.Min(levels.Length, destination.Length);
+            levels[..n].CopyTo(destination);
+            return n;
+        }
+    }
+
+    /// <summary>
+    /// Locks the book and exposes its levels as spans for zero-copy reads. Updates wait
+    /// until the scope is disposed, so keep it short.
+    /// </summary>
+    public ReadScope Read() => new(this);
+
+    public readonly ref struct ReadScope
+    {
+        private readonly OrderBook _book;
+
+        internal ReadScope(OrderBook book)
+        {
+            _book = book;
+            Monitor.Enter(book._gate);
+        }
+
+        public ReadOnlySpan<BookLevel> Bids => _book._bids.Levels;
+
+        public ReadOnlySpan<BookLevel> Asks => _book._asks.Levels;
+
+        /// <summary>Best <paramref name="depth"/> levels of <paramref name="side"/>.</summary>
+        public ReadOnlySpan<BookLevel> Depth(BookSide side, int depth)
+        {
+            var levels = _book.Side(side).Levels;
+            return levels[..Math.Clamp(depth, 0, levels.Length)];
+        }
+
+        public decimal CumulativeSize(BookSide side, int depth) => _book.Side(side).Cumulative(depth);
+
+        public void Dispose() => Monitor.Exit(_book._gate);
+    }
+
+    private Ladder Side(BookSide side) => side == BookSide.Bid ? _bids : _asks;
+
+    public void Dispose()
+    {
+        lock (_gate)
+        {
+            if (_disposed) return;
+            _disposed = true;
+            _bids.Dispose();
+            _asks.Dispose();
+        }
+    }
+
+    // ─── Storage ────────────────────────────────────────
+
+    /// <summary>
+    /// One side of the book, double-buffered: the incoming update is staged into spare
+    /// pooled arrays outside the lock and swapped in by <see cref="Commit"/>.
+    /// </summary>
+    private sealed class Ladder : IDisposable
+    {
+        private readonly bool _descending;
+        private BookLevel[] _levels = ArrayPool<BookLevel>.Shared.Rent(InitialCapacity);
+        private decimal[] _cumulative = ArrayPool<decimal>.Shared.Rent(InitialCapacity);
+        private BookLevel[] _stagedLevels = ArrayPool<BookLevel>.Shared.Rent(InitialCapacity);
+        private decimal[] _stagedCumulative = ArrayPool<decimal>.Shared.Rent(InitialCapacity);
+        private int _stagedCount;
+
+        public Ladder(bool descending) => _descending = descending;
+
+        public int Count { get; private set; }
+
+        public ReadOnlySpan<BookLevel> Levels => _levels.AsSpan(0, Count);
+
+        public bool TryGet(int index, out BookLevel level)
+        {
+            if ((uint)index < (uint)Count)
+            {
+                level = _levels[index];
+                return true;
+            }
+            level = default;
+            return false;
+        }
+
+        public decimal Cumulative(int depth)
+        {
+            if (depth <= 0 || Count == 0) return 0m;
+            return _cumulative[Math.Min(depth, Count) - 1];
+        }
+
+        /// <summary>
+        /// Copies <paramref name="update"/> into the staging buffers, sorting best-first if the
+        /// exchange did not. Returns whether the input was already in book order.
+        /// </summary>
+        public bool Stage(PriceLevel[] update)
+        {
+            if (_stagedLevels.Length < update.Length)
+            {
+                Swap(ref _stagedLevels, ArrayPool<BookLevel>.Shared.Rent(update.Length));
+                Swap(ref _stagedCumulative, ArrayPool<decimal>.Shared.Rent(update.Length));
+            }
+
+            var inOrder = true;
+            for (int i = 0; i < update.Length; i++)
+            {
+                _stagedLevels[i] = new BookLevel(update[i].Price, update[i].Size);
+                if (i > 0 && !Before(update[i - 1].Price, update[i].Price))
+                    inOrder = false;
+            }
+            _stagedCount = update.Length;
+
+            var staged = _stagedLevels.AsSpan(0, _stagedCount);
+            if (!inOrder)
+            {
+                if (_descending) staged.Sort(static (a, b) => b.Price.CompareTo(a.Price));
+                else staged.Sort(static (a, b) => a.Price.CompareTo(b.Price));
+            }
+
+            var running = 0m;
+            for (int i = 0; i < staged.Length; i++)
+            {
+                running += staged[i].Size;
+                _stagedCumulative[i] = running;
+            }
+            return inOrder;
+        }
+
+        /// <summary>
+        /// Merge-walks the live and staged ladders. Removed levels are reported with size 0.
+        /// </summary>
+        public PriceLevel[] DiffStaged()
+        {
+            var current = _levels.AsSpan(0, Count);
+            var next = _stagedLevels.AsSpan(0, _stagedCount);
+            using var changes = new ArrayBuilder<PriceLevel>(16);
+
+            int i = 0, j = 0;
+            while (i < current.Length || j < next.Length)
+            {
+                if (j == next.Length || i < current.Length && Before(current[i].Price, next[j].Price))
+                {
+                    changes.Add(new PriceLevel { Price = current[i].Price, Size = 0m });
+                    i++;
+                }
+                else if (i == current.Length || Before(next[j].Price, current[i].Price))
+                {
+                    changes.Add(new PriceLevel { Price = next[j].Price, Size = next[j].Size });
+                    j++;
+                }
+                else
+                {
+                    if (current[i].Size != next[j].Size)
+                        changes.Add(new PriceLevel { Price = next[j].Price, Size = next[j].Size });
+                    i++;
+                    j++;
+                }
+            }
+
+            return changes.ToArray();
+        }
+
+        /// <summary>Swaps staged buffers in as the live ladder. Caller holds the book lock.</summary>
+        public void Commit()
+        {
+            (_levels, _stagedLevels) = (_stagedLevels, _levels);
+            (_cumulative, _stagedCumulative) = (_stagedCumulative, _cumulative);
+            Count = _stagedCount;
+        }
+
+        public PriceLevel[] ToPriceLevels()
+        {
+            var result = new PriceLevel[Count];
+            for (int i = 0; i < result.Length; i++)
+                result[i] = new PriceLevel { Price = _levels[i].Price, Size = _levels[i].Size };
+            return result;
+        }
+
+        private bool Before(decimal a, decimal b) => _descending ? a > b : a < b;
+
+        private static void Swap<T>(ref T[] buffer, T[] replacement)
+        {
+            ArrayPool<T>.Shared.Return(buffer);
+            buffer = replacement;
+        }
+
+        public void Dispose()
+        {
+            ArrayPool<BookLevel>.Shared.Return(_levels);
+            ArrayPool<BookLevel>.Shared.Return(_stagedLevels);
+            ArrayPool<decimal>.Shared.Return(_cumulative);
+            ArrayPool<decimal>.Shared.Return(_stagedCumulative);
+            _levels = _stagedLevels = [];
+            _cumulative = _stagedCumulative = [];
+            Count = _stagedCount = 0;
+        }
+    }
+}
@@ -0,0 +1,60 @@
+using System.Collections.Concurrent;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Books;
+
+/// <summary>
+/// Keeps one <see cref="OrderBook"/> per symbol and turns incoming L2 books into
+/// snapshot or delta events. Hand it to <see cref="Managers.WebSocketManager"/> to have
+/// L2 traffic routed through it.
+/// </summary>
+public sealed class OrderBookStore : IDisposable
+{
+    private readonly ConcurrentDictionary<string, OrderBook> _books = new(StringComparer.Ordinal);
+    private readonly TimeSpan? _snapshotInterval;
+
+    /// <param name="snapshotInterval">
+    /// Emit a full snapshot at least this often per symbol; <c>null</c> sends snapshots only
+    /// for the first update and on <see cref="RequestSnapshot(string)"/>.
+    /// </param>
+    public OrderBookStore(TimeSpan? snapshotInterval = null)
+    {
+        _snapshotInterval = snapshotInterval;
+    }
+
+    public ICollection<string> Symbols => _books.Keys;
+
+    public bool TryGet(string symbol, out OrderBook book) => _books.TryGetValue(symbol, out book!);
+
+    public UnifiedWsEvent? Apply(OrderBookL2Event update) =>
+        _books.GetOrAdd(update.Symbol, static (symbol, interval) => new OrderBook(symbol, interval), _snapshotInterval)
+            .Apply(update);
+
+    public void RequestSnapshot(string symbol)
+    {
+        if (_books.TryGetValue(symbol, out var book))
+            book.RequestSnapshot();
+    }
+
+    public void RequestSnapshot()
+    {
+        foreach (var book in _books.Values)
+            book.RequestSnapshot();
+    }
+
+    /// <summary>
+    /// Drops the local book for <paramref name="symbol"/>, e.g. after unsubscribing. The book
+    /// is not disposed because the receive loop may still be applying an in-flight update.
+    /// </summary>
+    public bool Remove(string symbol) => _books.TryRemove(symbol, out _);
+
+    /// <summary>Returns all pooled level storage. Call once the feeding manager has stopped.</summary>
+    public void Dispose()
+    {
+        foreach (var symbol in _books.Keys)
+        {
+            if (_books.TryRemove(symbol, out var book))
+                book.Dispose();
+        }
+    }
+}
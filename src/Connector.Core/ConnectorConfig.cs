@@ -1,4 +1,5 @@
 using Connector.Core.Contracts;
+using Connector.Core.Output;
 
 namespace Connector.Core;
 
@@ -12,5 +13,34 @@ public sealed class ConnectorConfig
     public required UnifiedWsChannel[] Channels { get; init; }
     public bool NoAuth { get; init; }
     public bool IncludeRaw { get; init; }
+    public EventOutputFormat Format { get; init; }
+    public bool BookDeltas { get; init; }
+    public TimeSpan? SnapshotInterval { get; init; }
+
+    /// <summary>WebSocket connections to shard subscriptions over; 1 uses a single socket.</summary>
+    public int Connections { get; init; } = 1;
+
+    public bool HotStandby { get; init; }
+
+    /// <summary>Record raw inbound frames into this directory (<c>record</c> subcommand).</summary>
+    public string? RecordDirectory { get; init; }
+
+    /// <summary>Replay a recording from this directory instead of connecting (<c>replay</c> subcommand).</summary>
+    public string? ReplayDirectory { get; init; }
+
+    /// <summary>Replay rate relative to recorded time; 0 replays as fast as possible.</summary>
+    public double ReplaySpeed { get; init; }
+
+    /// <summary>
+    /// Write events into one shared-memory ring per channel in this directory instead of
+    /// stdout (<c>publish</c> subcommand).
+    /// </summary>
+    public string? PublishDirectory { get; init; }
+
+    /// <summary>Slots per shared-memory ring; a power of two.</summary>
+    public int RingSlots { get; init; } = SharedMemory.SharedRingPublisher.DefaultSlotCount;
+
+    public DateTimeOffset? ReplayFrom { get; init; }
+    public DateTimeOffset? ReplayTo { get; init; }
     public string? ConfigFilePath { get; init; }
 }
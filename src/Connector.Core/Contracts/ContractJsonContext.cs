@@ -0,0 +1,115 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace Connector.Core.Contracts;
+
+/// <summary>
+/// Source-generated serialization metadata for the unified contracts, with the same
+/// output as <see cref="JsonOptions.Default"/> but no runtime reflection, so it works in
+/// trimmed and NativeAOT builds. Events must be serialized by their concrete type, e.g.
+/// <c>ContractJsonContext.Default.GetTypeInfo(evt.GetType())</c>.
+/// </summary>
+[JsonSourceGenerationOptions(
+    PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+    Converters = new[]
+    {
+        typeof(CamelCaseEnumConverter<UnifiedExchange>),
+        typeof(CamelCaseEnumConverter<UnifiedWsChannel>),
+        typeof(CamelCaseEnumConverter<UnifiedRestOperation>)
+    })]
+// WebSocket events
+[JsonSerializable(typeof(TradesEvent))]
+[JsonSerializable(typeof(OrderBookL1Event))]
+[JsonSerializable(typeof(OrderBookL2Event))]
+[JsonSerializable(typeof(OrderBookL2DeltaEvent))]
+[JsonSerializable(typeof(CandleEvent))]
+[JsonSerializable(typeof(AllMidsEvent))]
+[JsonSerializable(typeof(ActiveAssetCtxEvent))]
+[JsonSerializable(typeof(UserOrderEvent))]
+[JsonSerializable(typeof(FillEvent))]
+[JsonSerializable(typeof(PositionEvent))]
+[JsonSerializable(typeof(BalanceEvent))]
+[JsonSerializable(typeof(UserFundingEvent))]
+[JsonSerializable(typeof(LedgerEvent))]
+[JsonSerializable(typeof(NotificationEvent))]
+[JsonSerializable(typeof(OpenOrdersEvent))]
+[JsonSerializable(typeof(TwapStateEvent))]
+[JsonSerializable(typeof(TwapSliceFillEvent))]
+[JsonSerializable(typeof(TwapHistoryEvent))]
+[JsonSerializable(typeof(ActiveAssetDataEvent))]
+[JsonSerializable(typeof(WebDataEvent))]
+// REST requests
+[JsonSerializable(typeof(PlaceOrderRequest))]
+[JsonSerializable(typeof(CancelOrderRequest))]
+[JsonSerializable(typeof(CancelOrderByClientIdRequest))]
+[JsonSerializable(typeof(ModifyOrderRequest))]
+[JsonSerializable(typeof(BatchModifyOrdersRequest))]
+[JsonSerializable(typeof(PlaceTwapOrderRequest))]
+[JsonSerializable(typeof(CancelTwapOrderRequest))]
+[JsonSerializable(typeof(ScheduleCancelRequest))]
+[JsonSerializable(typeof(UpdateLeverageRequest))]
+[JsonSerializable(typeof(UpdateIsolatedMarginRequest))]
+[JsonSerializable(typeof(TransferRequest))]
+[JsonSerializable(typeof(ApproveAgentRequest))]
+[JsonSerializable(typeof(GetCandlesRequest))]
+[JsonSerializable(typeof(GetL2BookRequest))]
+[JsonSerializable(typeof(GetAllMidsRequest))]
+[JsonSerializable(typeof(GetMetaRequest))]
+[JsonSerializable(typeof(GetFundingHistoryRequest))]
+[JsonSerializable(typeof(GetPredictedFundingsRequest))]
+[JsonSerializable(typeof(GetBalancesRequest))]
+[JsonSerializable(typeof(GetPositionsRequest))]
+[JsonSerializable(typeof(GetOpenOrdersRequest))]
+[JsonSerializable(typeof(GetFrontendOpenOrdersRequest))]
+[JsonSerializable(typeof(GetFillsRequest))]
+[JsonSerializable(typeof(GetFillsByTimeRequest))]
+[JsonSerializable(typeof(GetOrderStatusRequest))]
+[JsonSerializable(typeof(GetHistoricalOrdersRequest))]
+[JsonSerializable(typeof(GetUserFundingRequest))]
+[JsonSerializable(typeof(GetUserRateLimitRequest))]
+[JsonSerializable(typeof(GetUserFeesRequest))]
+[JsonSerializable(typeof(GetSubAccountsRequest))]
+[JsonSerializable(typeof(GetActiveAssetDataRequest))]
+[JsonSerializable(typeof(GetPortfolioRequest))]
+[JsonSerializable(typeof(GetSpotMetaRequest))]
+[JsonSerializable(typeof(GetSpotBalancesRequest))]
+// REST responses
+[JsonSerializable(typeof(PlaceOrderResponse))]
+[JsonSerializable(typeof(CancelOrderResponse))]
+[JsonSerializable(typeof(BatchModifyOrdersResponse))]
+[JsonSerializable(typeof(PlaceTwapOrderResponse))]
+[JsonSerializable(typeof(ScheduleCancelResponse))]
+[JsonSerializable(typeof(UpdateLeverageResponse))]
+[JsonSerializable(typeof(UpdateIsolatedMarginResponse))]
+[JsonSerializable(typeof(TransferResponse))]
+[JsonSerializable(typeof(ApproveAgentResponse))]
+[JsonSerializable(typeof(GetBalancesResponse))]
+[JsonSerializable(typeof(GetPositionsResponse))]
+[JsonSerializable(typeof(GetOpenOrdersResponse))]
+[JsonSerializable(typeof(GetFrontendOpenOrdersResponse))]
+[JsonSerializable(typeof(GetFillsResponse))]
+[JsonSerializable(typeof(GetCandlesResponse))]
+[JsonSerializable(typeof(GetL2BookResponse))]
+[JsonSerializable(typeof(GetAllMidsResponse))]
+[JsonSerializable(typeof(GetMetaResponse))]
+[JsonSerializable(typeof(GetFundingHistoryResponse))]
+[JsonSerializable(typeof(GetPredictedFundingsResponse))]
+[JsonSerializable(typeof(GetOrderStatusResponse))]
+[JsonSerializable(typeof(GetHistoricalOrdersResponse))]
+[JsonSerializable(typeof(GetUserFundingResponse))]
+[JsonSerializable(typeof(GetUserRateLimitResponse))]
+[JsonSerializable(typeof(GetUserFeesResponse))]
+[JsonSerializable(typeof(GetSubAccountsResponse))]
+[JsonSerializable(typeof(GetActiveAssetDataResponse))]
+[JsonSerializable(typeof(GetPortfolioResponse))]
+[JsonSerializable(typeof(GetSpotMetaResponse))]
+[JsonSerializable(typeof(GetSpotBalancesResponse))]
+public sealed partial class ContractJsonContext : JsonSerializerContext;
+
+/// <summary>
+/// AOT-safe string enum converter with camelCase names, matching
+/// <c>JsonStringEnumConverter(JsonNamingPolicy.CamelCase)</c> in <see cref="JsonOptions.Default"/>.
+/// </summary>
+internal sealed class CamelCaseEnumConverter<TEnum>() : JsonStringEnumConverter<TEnum>(JsonNamingPolicy.CamelCase)
+    where TEnum : struct, Enum;
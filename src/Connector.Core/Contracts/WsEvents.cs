@@ -11,6 +11,9 @@ public abstract class UnifiedWsEvent
     public long? Sequence { get; init; }
     public required DateTimeOffset ReceivedAt { get; init; }
     public RawPayload? Raw { get; init; }
+
+    /// <summary><see cref="System.Diagnostics.Stopwatch"/> timestamp at translation; feeds queue latency.</summary>
+    internal long TranslatedTimestamp { get; set; }
 }
 
 // ──────────────────────────────────────────────
@@ -54,6 +57,17 @@ public sealed class OrderBookL2Event : UnifiedWsEvent
     public bool IsSnapshot { get; init; }
 }
 
+/// <summary>
+/// Changed levels since the previous event for the same symbol. A level with
+/// <c>Size == 0</c> was removed. <see cref="UnifiedWsEvent.Sequence"/> is contiguous
+/// per symbol, so a gap means a delta was missed and the next snapshot should be awaited.
+/// </summary>
+public sealed class OrderBookL2DeltaEvent : UnifiedWsEvent
+{
+    public required PriceLevel[] Bids { get; init; }
+    public required PriceLevel[] Asks { get; init; }
+}
+
 // ──────────────────────────────────────────────
 // Candles
 // ──────────────────────────────────────────────
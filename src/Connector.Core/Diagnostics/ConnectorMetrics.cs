@@ -0,0 +1,245 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using Connector.Core.Contracts;
+using Connector.Core.Managers;
+
+namespace Connector.Core.Diagnostics;
+
+/// <summary>
+/// Per-stage latency and throughput of the WebSocket pipeline, published on the
+/// <see cref="MeterName"/> meter for dotnet-counters and OpenTelemetry and readable in-process
+/// through <see cref="GetSnapshot"/>. Stages are measured on <see cref="Stopwatch"/>
+/// timestamps: exchange time to receipt (<c>wire</c>), first to last frame of a message
+/// (<c>assembly</c>), receipt to translated (<c>translate</c>) and translated to dequeued by
+/// the consumer (<c>queue</c>). Message, byte, event, drop and depth figures are read from the
+/// registered managers' routes when collected, so the hot path only pays for the latency stamps.
+/// </summary>
+public sealed class ConnectorMetrics : IDisposable
+{
+    public const string MeterName = "Connector.Core";
+
+    private static readonly UnifiedWsChannel[] Channels = Enum.GetValues<UnifiedWsChannel>();
+    private static readonly string[] ChannelNames = Channels.Select(c => c.ToString()).ToArray();
+    private static readonly string[] StageNames = ["wire", "assembly", "translate", "queue"];
+
+    /// <summary>Instance used by transports and managers that are not given one.</summary>
+    public static ConnectorMetrics Shared { get; } = new();
+
+    private readonly Meter _meter;
+    private readonly bool _ownsMeter;
+    private readonly Histogram<double> _wire;
+    private readonly Histogram<double> _assembly;
+    private readonly Histogram<double> _translate;
+    private readonly Histogram<double> _queue;
+    private readonly Counter<long> _parseFailures;
+    private readonly Counter<long> _reconnects;
+    private readonly Counter<long> _unrouted;
+
+    // [stage, channel]; the extra last column holds measurements without a channel
+    private readonly LatencyRecorder?[,] _latencies = new LatencyRecorder?[StageNames.Length, Channels.Length + 1];
+    private readonly List<Func<IReadOnlyList<WsRouteStats>>> _sources = [];
+    private long _parseFailureCount;
+    private long _reconnectCount;
+    private long _unroutedCount;
+
+    /// <param name="meterFactory">Creates the meter when running under a DI host; otherwise one is owned here.</param>
+    public ConnectorMetrics(IMeterFactory? meterFactory = null)
+    {
+        _ownsMeter = meterFactory is null;
+        _meter = meterFactory?.Create(MeterName) ?? new Meter(MeterName);
+
+        _wire = _meter.CreateHistogram<double>("connector.ws.wire_latency", "s",
+            "Exchange timestamp to local receipt; includes clock skew between exchange and host.");
+        _assembly = _meter.CreateHistogram<double>("connector.ws.frame_assembly", "s",
+            "First to last frame of a WebSocket message.");
+        _translate = _meter.CreateHistogram<double>("connector.ws.translate_latency", "s",
+            "Receipt to translated unified events.");
+        _queue = _meter.CreateHistogram<double>("connector.ws.queue_latency", "s",
+            "Translated event to dequeued by a consumer.");
+
+        _parseFailures = _meter.CreateCounter<long>("connector.ws.parse_failures", "{message}");
+        _reconnects = _meter.CreateCounter<long>("connector.ws.reconnects", "{reconnect}");
+        _unrouted = _meter.CreateCounter<long>("connector.ws.unrouted", "{message}",
+            "Messages that produced no events, such as subscription acks and pongs.");
+
+        _meter.CreateObservableCounter("connector.ws.messages", () => Observe(s => s.Messages), "{message}");
+        _meter.CreateObservableCounter("connector.ws.bytes", () => Observe(s => s.Bytes), "By");
+        _meter.CreateObservableCounter("connector.ws.events", () => Observe(s => s.Published), "{event}");
+        _meter.CreateObservableCounter("connector.ws.dropped", ObserveDropped, "{event}",
+            "Events evicted from a full queue (reason=overflow) or replaced by a newer one (reason=conflated).");
+        _meter.CreateObservableGauge("connector.ws.queue_depth", () => Observe(s => s.Depth), "{event}");
+    }
+
+    // ─── Recording ──────────────────────────────────────
+
+    internal void RecordWire(UnifiedWsChannel channel, TimeSpan latency)
+    {
+        // Exchange and host clocks disagree by a few ms; negative readings are skew, not latency
+        var seconds = Math.Max(0, latency.TotalSeconds);
+        Recorder(0, (int)channel).Record((long)(seconds * 1_000_000));
+        _wire.Record(seconds, new KeyValuePair<string, object?>("channel", ChannelNames[(int)channel]));
+    }
+
+    internal void RecordAssembly(long elapsedTicks)
+    {
+        Recorder(1, Channels.Length).Record(ToMicros(elapsedTicks));
+        _assembly.Record(ToSeconds(elapsedTicks));
+    }
+
+    internal void RecordTranslate(UnifiedWsChannel channel, long elapsedTicks)
+    {
+        Recorder(2, (int)channel).Record(ToMicros(elapsedTicks));
+        _translate.Record(ToSeconds(elapsedTicks), new KeyValuePair<string, object?>("channel", ChannelNames[(int)channel]));
+    }
+
+    internal void RecordDequeued(UnifiedWsEvent evt)
+    {
+        if (evt.TranslatedTimestamp == 0) return;
+        var elapsed = Stopwatch.GetTimestamp() - evt.TranslatedTimestamp;
+        Recorder(3, (int)evt.Channel).Record(ToMicros(elapsed));
+        _queue.Record(ToSeconds(elapsed), new KeyValuePair<string, object?>("channel", ChannelNames[(int)evt.Channel]));
+    }
+
+    internal void RecordParseFailure()
+    {
+        Interlocked.Increment(ref _parseFailureCount);
+        _parseFailures.Add(1);
+    }
+
+    internal void RecordReconnect()
+    {
+        Interlocked.Increment(ref _reconnectCount);
+        _reconnects.Add(1);
+    }
+
+    internal void RecordUnrouted()
+    {
+        Interlocked.Increment(ref _unroutedCount);
+        _unrouted.Add(1);
+    }
+
+    /// <summary>Adds a manager's route counters to the observable instruments and snapshots.</summary>
+    internal void Register(Func<IReadOnlyList<WsRouteStats>> source)
+    {
+        lock (_sources) _sources.Add(source);
+    }
+
+    internal void Unregister(Func<IReadOnlyList<WsRouteStats>> source)
+    {
+        lock (_sources) _sources.Remove(source);
+    }
+
+    // ─── Snapshot ───────────────────────────────────────
+
+    public ConnectorMetricsSnapshot GetSnapshot()
+    {
+        var latencies = new List<StageLatency>();
+        for (var stage = 0; stage < StageNames.Length; stage++)
+        {
+            for (var channel = 0; channel <= Channels.Length; channel++)
+            {
+                if (Volatile.Read(ref _latencies[stage, channel]) is not { } recorder) continue;
+                latencies.Add(recorder.Summarize(StageNames[stage], channel < Channels.Length ? ChannelNames[channel] : null));
+            }
+        }
+
+        return new ConnectorMetricsSnapshot
+        {
+            Timestamp = DateTimeOffset.UtcNow,
+            ParseFailures = Interlocked.Read(ref _parseFailureCount),
+            Reconnects = Interlocked.Read(ref _reconnectCount),
+            UnroutedMessages = Interlocked.Read(ref _unroutedCount),
+            Routes = RouteStats(),
+            Latencies = latencies.ToArray()
+        };
+    }
+
+    public void Dispose()
+    {
+        if (_ownsMeter) _meter.Dispose();
+    }
+
+    // ─── Helpers ────────────────────────────────────────
+
+    private LatencyRecorder Recorder(int stage, int channel) =>
+        Volatile.Read(ref _latencies[stage, channel])
+        ?? Interlocked.CompareExchange(ref _latencies[stage, channel], new LatencyRecorder(), null)
+        ?? _latencies[stage, channel]!;
+
+    private WsRouteStats[] RouteStats()
+    {
+        Func<IReadOnlyList<WsRouteStats>>[] sources;
+        lock (_sources) sources = _sources.ToArray();
+        return sources.SelectMany(s => s()).ToArray();
+    }
+
+    private IEnumerable<Measurement<long>> Observe(Func<WsRouteStats, long> value) =>
+        RouteStats().Select(s => new Measurement<long>(value(s), Tags(s)));
+
+    private IEnumerable<Measurement<long>> ObserveDropped() =>
+        RouteStats().SelectMany(s => new[]
+        {
+            new Measurement<long>(s.Dropped, [.. Tags(s), new("reason", "overflow")]),
+            new Measurement<long>(s.Conflated, [.. Tags(s), new("reason", "conflated")])
+        });
+
+    private static KeyValuePair<string, object?>[] Tags(WsRouteStats stats) =>
+    [
+        new("channel", ChannelNames[(int)stats.Key.Channel]),
+        new("symbol", stats.Key.Symbol)
+    ];
+
+    private static long ToMicros(long ticks) => ticks <= 0 ? 0 : ticks * 1_000_000 / Stopwatch.Frequency;
+
+    private static double ToSeconds(long ticks) => ticks <= 0 ? 0 : (double)ticks / Stopwatch.Frequency;
+
+    /// <summary>
+    /// Latest exchange-side time carried by <paramref name="evt"/>, or <c>null</c> for events
+    /// without one. Snapshots replay history and would only measure its age.
+    /// </summary>
+    internal static DateTimeOffset? ExchangeTime(UnifiedWsEvent evt) => evt switch
+    {
+        TradesEvent { Trades: [.., var last] } => last.Timestamp,
+        FillEvent { IsSnapshot: false, Fills: [.., var last] } => last.Timestamp,
+        UserOrderEvent { Orders: [.., var last] } => last.Timestamp,
+        TwapSliceFillEvent { IsSnapshot: false, Fills: [.., var last] } => last.Timestamp,
+        _ => null
+    };
+}
+
+/// <summary>
+/// Latency distribution of one pipeline stage, in microseconds. Percentiles are bucket upper
+/// bounds, accurate to about 3%.
+/// </summary>
+public sealed class StageLatency
+{
+    /// <summary><c>wire</c>, <c>assembly</c>, <c>translate</c> or <c>queue</c>.</summary>
+    public required string Stage { get; init; }
+
+    /// <summary>Channel name, or <c>null</c> for stages measured before translation.</summary>
+    public required string? Channel { get; init; }
+
+    public required long Count { get; init; }
+    public required double MeanMicros { get; init; }
+    public required long P50Micros { get; init; }
+    public required long P90Micros { get; init; }
+    public required long P99Micros { get; init; }
+    public required long P999Micros { get; init; }
+    public required long MaxMicros { get; init; }
+}
+
+/// <summary>
+/// Point-in-time view of <see cref="ConnectorMetrics"/>. Counters are cumulative since startup.
+/// </summary>
+public sealed class ConnectorMetricsSnapshot
+{
+    public required DateTimeOffset Timestamp { get; init; }
+    public required long ParseFailures { get; init; }
+    public required long Reconnects { get; init; }
+    public required long UnroutedMessages { get; init; }
+
+    /// <summary>Per-key counters and depth of every running manager.</summary>
+    public required WsRouteStats[] Routes { get; init; }
+
+    public required StageLatency[] Latencies { get; init; }
+}
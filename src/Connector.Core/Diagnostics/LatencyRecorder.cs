@@ -0,0 +1,88 @@
+namespace Connector.Core.Diagnostics;
+
+/// <summary>
+/// Lock-free latency histogram in microseconds with log-linear buckets: exact below 64us,
+/// then 32 buckets per power of two (about 3% resolution) beyond that. Safe for
+/// concurrent writers; recording is a few interlocked adds and never allocates.
+/// </summary>
+internal sealed class LatencyRecorder
+{
+    private const int LinearBuckets = 64;
+    private const int SubBuckets = 32;
+    private const int SubBucketBits = 5;
+    private const int Octaves = 32;
+
+    private readonly long[] _counts = new long[LinearBuckets + Octaves * SubBuckets];
+    private long _count;
+    private long _sumMicros;
+    private long _maxMicros;
+
+    public void Record(long micros)
+    {
+        if (micros < 0) micros = 0;
+        Interlocked.Increment(ref _counts[BucketOf(micros)]);
+        Interlocked.Increment(ref _count);
+        Interlocked.Add(ref _sumMicros, micros);
+
+        long max;
+        while (micros > (max = Volatile.Read(ref _maxMicros))
+               && Interlocked.CompareExchange(ref _maxMicros, micros, max) != max)
+        {
+        }
+    }
+
+    public StageLatency Summarize(string stage, string? channel)
+    {
+        var counts = new long[_counts.Length];
+        long total = 0;
+        for (var i = 0; i < counts.Length; i++)
+            total += counts[i] = Interlocked.Read(ref _counts[i]);
+
+        return new StageLatency
+        {
+            Stage = stage,
+            Channel = channel,
+            Count = total,
+            MeanMicros = total == 0 ? 0 : (double)Interlocked.Read(ref _sumMicros) / Interlocked.Read(ref _count),
+            P50Micros = Percentile(counts, total, 0.50),
+            P90Micros = Percentile(counts, total, 0.90),
+            P99Micros = Percentile(counts, total, 0.99),
+            P999Micros = Percentile(counts, total, 0.999),
+            MaxMicros = Interlocked.Read(ref _maxMicros)
+        };
+    }
+
+    private static int BucketOf(long micros)
+    {
+        if (micros < LinearBuckets) return (int)micros;
+
+        // Shift so the value keeps SubBucketBits + 1 significant bits; the top one is implied
+        var shift = 63 - (int)ulong.LeadingZeroCount((ulong)micros) - SubBucketBits;
+        var octave = shift - 1;
+        if (octave >= Octaves) return LinearBuckets + Octaves * SubBuckets - 1;
+        return LinearBuckets + octave * SubBuckets + (int)((micros >> shift) - SubBuckets);
+    }
+
+    /// <summary>Upper bound of the bucket that holds quantile <paramref name="q"/>.</summary>
+    private static long Percentile(long[] counts, long total, double q)
+    {
+        if (total == 0) return 0;
+        var rank = (long)Math.Ceiling(q * total);
+        long seen = 0;
+        for (var i = 0; i < counts.Length; i++)
+        {
+            seen += counts[i];
+            if (seen >= rank) return UpperBound(i);
+        }
+        return UpperBound(counts.Length - 1);
+    }
+
+    private static long UpperBound(int bucket)
+    {
+        if (bucket < LinearBuckets) return bucket;
+        var octave = (bucket - LinearBuckets) / SubBuckets;
+        var sub = (bucket - LinearBuckets) % SubBuckets + SubBuckets;
+        var shift = octave + 1;
+        return ((long)(sub + 1) << shift) - 1;
+    }
+}
@@ -0,0 +1,279 @@
+using System.Buffers;
+using System.Globalization;
+using System.Text.Json;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Exchanges.Hyperliquid;
+
+/// <summary>
+/// Wire format of Hyperliquid /exchange actions. Each action type takes an array, so one
+/// action serves a single request or a whole batch of the same kind.
+/// </summary>
+internal static class HyperliquidExchangeActions
+{
+    public const string Order = "order";
+    public const string Cancel = "cancel";
+    public const string CancelByCloid = "cancelByCloid";
+    public const string BatchModify = "batchModify";
+
+    public static string? BatchKey(object request) => request switch
+    {
+        PlaceOrderRequest => Order,
+        CancelOrderRequest => Cancel,
+        CancelOrderByClientIdRequest => CancelByCloid,
+        ModifyOrderRequest => BatchModify,
+        _ => null
+    };
+
+    public static bool IsCancel(string action) => action is Cancel or CancelByCloid;
+
+    /// <summary>Runs the checks <see cref="Build"/> would, without writing anything.</summary>
+    public static void Validate(object request, Func<string, int> assetIndex)
+    {
+        switch (request)
+        {
+            case PlaceOrderRequest r:
+                assetIndex(r.Symbol);
+                ValidateOrder(r.Side, r.Price, r.OrderType, r.TriggerPrice is null ? r.TimeInForce : null);
+                break;
+            case CancelOrderRequest r:
+                assetIndex(r.Symbol);
+                long.Parse(r.OrderId, CultureInfo.InvariantCulture);
+                break;
+            case CancelOrderByClientIdRequest r:
+                assetIndex(r.Symbol);
+                break;
+            case ModifyOrderRequest r:
+                assetIndex(r.Symbol);
+                if (!r.OrderId.StartsWith("0x", StringComparison.OrdinalIgnoreCase))
+                    long.Parse(r.OrderId, CultureInfo.InvariantCulture);
+                ValidateOrder(r.Side, r.Price, r.OrderType, null);
+                break;
+            default:
+                throw new NotSupportedException($"{request.GetType().Name} is not a Hyperliquid exchange action");
+        }
+    }
+
+    /// <summary>Writes <c>{"action": {...}, "nonce": n}</c>; the auth provider adds the signature.</summary>
+    public static byte[] Build(string action, IReadOnlyList<object> requests, Func<string, int> assetIndex, long nonce)
+    {
+        var buffer = new ArrayBufferWriter<byte>(256 + requests.Count * 128);
+        using (var w = new Utf8JsonWriter(buffer))
+        {
+            w.WriteStartObject();
+            w.WriteStartObject("action");
+            w.WriteString("type", action);
+
+            switch (action)
+            {
+                case Order:
+                    w.WriteStartArray("orders");
+                    foreach (PlaceOrderRequest r in requests)
+                        WriteOrder(w, assetIndex(r.Symbol), r.Side, r.Price, r.Size, r.ReduceOnly,
+                            r.OrderType, r.TimeInForce, r.TriggerPrice, r.TriggerType, r.ClientOrderId);
+                    w.WriteEndArray();
+                    w.WriteString("grouping", "na");
+                    break;
+
+                case Cancel:
+                    w.WriteStartArray("cancels");
+                    foreach (CancelOrderRequest r in requests)
+                    {
+                        w.WriteStartObject();
+                        w.WriteNumber("a", assetIndex(r.Symbol));
+                        w.WriteNumber("o", long.Parse(r.OrderId, CultureInfo.InvariantCulture));
+                        w.WriteEndObject();
+                    }
+                    w.WriteEndArray();
+                    break;
+
+                case CancelByCloid:
+                    w.WriteStartArray("cancels");
+                    foreach (CancelOrderByClientIdRequest r in requests)
+                    {
+                        w.WriteStartObject();
+                        w.WriteNumber("asset", assetIndex(r.Symbol));
+                        w.WriteString("cloid", r.ClientOrderId);
+                        w.WriteEndObject();
+                    }
+                    w.WriteEndArray();
+                    break;
+
+                case BatchModify:
+                    w.WriteStartArray("modifies");
+                    foreach (ModifyOrderRequest r in requests)
+                    {
+                        w.WriteStartObject();
+                        // Orders can be addressed by exchange id or by client id
+                        if (r.OrderId.StartsWith("0x", StringComparison.OrdinalIgnoreCase))
+                            w.WriteString("oid", r.OrderId);
+                        else
+                            w.WriteNumber("oid", long.Parse(r.OrderId, CultureInfo.InvariantCulture));
+                        w.WritePropertyName("order");
+                        WriteOrder(w, assetIndex(r.Symbol), r.Side, r.Price, r.Size, r.ReduceOnly,
+                            r.OrderType, null, null, null, r.ClientOrderId);
+                        w.WriteEndObject();
+                    }
+                    w.WriteEndArray();
+                    break;
+
+                default:
+                    throw new NotSupportedException($"Hyperliquid action {action} not supported");
+            }
+
+            w.WriteEndObject();
+            w.WriteNumber("nonce", nonce);
+            w.WriteEndObject();
+        }
+
+        return buffer.WrittenSpan.ToArray();
+    }
+
+    /// <summary>
+    /// Splits <c>response.data.statuses</c> into one result per request. A rejected action
+    /// throws; a rejected item becomes a <see cref="ConnectorException"/> in its slot.
+    /// </summary>
+    public static object[] ParseStatuses(string action, IReadOnlyList<object> requests, ReadOnlyMemory<byte> body)
+    {
+        using var doc = JsonDocument.Parse(body);
+        var root = doc.RootElement;
+        if (root.GetProperty("status").GetString() != "ok")
+        {
+            var reason = root.TryGetProperty("response", out var r) ? r.ToString() : "unknown error";
+            throw new ConnectorException($"Hyperliquid rejected {action}: {reason}");
+        }
+
+        var statuses = root.GetProperty("response").GetProperty("data").GetProperty("statuses");
+        var results = new object[requests.Count];
+        var i = 0;
+        foreach (var status in statuses.EnumerateArray())
+        {
+            if (i == results.Length) break;
+            results[i] = ParseStatus(requests[i], status);
+            i++;
+        }
+
+        for (; i < results.Length; i++)
+            results[i] = new ConnectorException($"Hyperliquid returned no status for {action} item {i}");
+
+        return results;
+    }
+
+    private static object ParseStatus(object request, JsonElement status)
+    {
+        if (status.ValueKind == JsonValueKind.Object && status.TryGetProperty("error", out var error))
+            return new ConnectorException(error.GetString() ?? "order rejected");
+
+        switch (request)
+        {
+            case CancelOrderRequest r:
+                return new CancelOrderResponse { OrderId = r.OrderId, Status = status.ToString() };
+            case CancelOrderByClientIdRequest r:
+                return new CancelOrderResponse { OrderId = r.ClientOrderId, Status = status.ToString() };
+        }
+
+        var clientOrderId = request switch
+        {
+            PlaceOrderRequest r => r.ClientOrderId,
+            ModifyOrderRequest r => r.ClientOrderId,
+            _ => null
+        };
+
+        if (status.ValueKind == JsonValueKind.Object && status.TryGetProperty("resting", out var resting))
+        {
+            return new PlaceOrderResponse
+            {
+                OrderId = resting.GetProperty("oid").GetInt64().ToString(CultureInfo.InvariantCulture),
+                ClientOrderId = clientOrderId,
+                Status = "resting"
+            };
+        }
+
+        if (status.ValueKind == JsonValueKind.Object && status.TryGetProperty("filled", out var filled))
+        {
+            return new PlaceOrderResponse
+            {
+                OrderId = filled.GetProperty("oid").GetInt64().ToString(CultureInfo.InvariantCulture),
+                ClientOrderId = clientOrderId,
+                Status = "filled",
+                FilledStatus = filled.TryGetProperty("totalSz", out var sz) ? sz.GetString() : null
+            };
+        }
+
+        // Modifies acknowledge with a bare "success"
+        return new PlaceOrderResponse
+        {
+            OrderId = request is ModifyOrderRequest m ? m.OrderId : "",
+            ClientOrderId = clientOrderId,
+            Status = status.ToString()
+        };
+    }
+
+    private static void WriteOrder(
+        Utf8JsonWriter w, int asset, string side, decimal? price, decimal size, bool reduceOnly,
+        string? orderType, string? timeInForce, decimal? triggerPrice, string? triggerType, string? clientOrderId)
+    {
+        var isMarket = IsMarket(orderType);
+        ValidateOrder(side, price, orderType, triggerPrice is null ? timeInForce : null);
+
+        w.WriteStartObject();
+        w.WriteNumber("a", asset);
+        w.WriteBoolean("b", IsBuy(side));
+        w.WriteString("p", Wire(price!.Value));
+        w.WriteString("s", Wire(size));
+        w.WriteBoolean("r", reduceOnly);
+
+        w.WriteStartObject("t");
+        if (triggerPrice is { } trigger)
+        {
+            w.WriteStartObject("trigger");
+            w.WriteBoolean("isMarket", isMarket);
+            w.WriteString("triggerPx", Wire(trigger));
+            w.WriteString("tpsl", triggerType ?? "sl");
+            w.WriteEndObject();
+        }
+        else
+        {
+            w.WriteStartObject("limit");
+            w.WriteString("tif", isMarket ? "Ioc" : TimeInForce(timeInForce));
+            w.WriteEndObject();
+        }
+        w.WriteEndObject();
+
+        if (clientOrderId is not null)
+            w.WriteString("c", clientOrderId);
+        w.WriteEndObject();
+    }
+
+    private static void ValidateOrder(string side, decimal? price, string? orderType, string? timeInForce)
+    {
+        // HL has no true market orders: they are aggressive IOC limits, so a price is required
+        if (price is null)
+            throw new ArgumentException("Hyperliquid orders need a price (market orders are IOC limits at a slippage price)");
+        IsBuy(side);
+        if (!IsMarket(orderType))
+            TimeInForce(timeInForce);
+    }
+
+    private static bool IsMarket(string? orderType) =>
+        string.Equals(orderType, "market", StringComparison.OrdinalIgnoreCase);
+
+    private static bool IsBuy(string side) => side.ToLowerInvariant() switch
+    {
+        "buy" or "b" or "bid" or "long" => true,
+        "sell" or "a" or "ask" or "short" => false,
+        _ => throw new ArgumentException($"Unknown order side '{side}'")
+    };
+
+    private static string TimeInForce(string? tif) => tif?.ToLowerInvariant() switch
+    {
+        null or "gtc" => "Gtc",
+        "ioc" => "Ioc",
+        "alo" or "post_only" or "postonly" => "Alo",
+        _ => throw new ArgumentException($"Unknown time in force '{tif}'")
+    };
+
+    /// <summary>Decimal without trailing zeros, as Hyperliquid hashes the exact string.</summary>
+    private static string Wire(decimal value) =>
+        (value / 1.000000000000000000000000000000000m).ToString(CultureInfo.InvariantCulture);
+}
@@ -0,0 +1,47 @@
+using Connector.Core.Abstractions;
+using Connector.Core.Transport;
+
+namespace Connector.Core.Exchanges.Hyperliquid;
+
+/// <summary>
+/// Hyperliquid's published limits: 1200 REST weight per minute per IP, 2000 WebSocket
+/// messages per minute, and a per-address action budget (10000 to start, then one action
+/// per 10 seconds once used up; cancels get extra allowance).
+/// </summary>
+public static class HyperliquidRateLimits
+{
+    public const int RestWeightPerMinute = 1200;
+    public const int WsMessagesPerMinute = 2000;
+    public const int InitialUserBudget = 10_000;
+    public static readonly TimeSpan UserRefillInterval = TimeSpan.FromSeconds(10);
+
+    /// <summary>/info weight for most request types.</summary>
+    public const int DefaultInfoWeight = 20;
+
+    /// <summary>/info weight for l2Book, allMids, clearinghouseState, orderStatus and spotClearinghouseState.</summary>
+    public const int LightInfoWeight = 2;
+
+    public static HierarchicalRateLimiterOptions DefaultOptions(string? userAddress = null) => new()
+    {
+        Global = new RateLimitBucketOptions { Capacity = RestWeightPerMinute, Period = TimeSpan.FromMinutes(1) },
+        Classes =
+        {
+            [RateLimitClass.WebSocket] = new RateLimitBucketOptions { Capacity = WsMessagesPerMinute, Period = TimeSpan.FromMinutes(1) }
+        },
+        PerUser = new RateLimitBucketOptions { Capacity = InitialUserBudget, Period = UserRefillInterval },
+        DefaultUser = userAddress
+    };
+
+    public static HierarchicalRateLimiter CreateLimiter(string? userAddress = null) => new(DefaultOptions(userAddress));
+
+    /// <summary>
+    /// Cost of an /exchange action carrying <paramref name="batchLength"/> orders or cancels:
+    /// weight 1 + floor(n / 40), one per-address action per element. Cancels are high priority.
+    /// </summary>
+    public static RateLimitCost ExchangeCost(int batchLength = 1, bool isCancel = false, string? user = null) =>
+        new(1 + batchLength / 40, RateLimitClass.Exchange, isCancel ? RateLimitPriority.High : RateLimitPriority.Normal)
+        {
+            User = user,
+            Actions = Math.Max(batchLength, 1)
+        };
+}
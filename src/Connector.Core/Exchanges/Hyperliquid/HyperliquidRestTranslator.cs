@@ -10,39 +10,58 @@ namespace Connector.Core.Exchanges.Hyperliquid;
 /// Translates unified REST requests to Hyperliquid info/exchange API.
 /// Supports all HL info endpoints and exchange endpoints.
 /// </summary>
-public sealed class HyperliquidRestTranslator : IRestTranslator
+public sealed class HyperliquidRestTranslator : IRestTranslator, IRestBatchTranslator
 {
+    /// <summary>
+    /// Reuse window for near-static info (asset universes, fee schedules). Asset contexts
+    /// carry live prices and are never cached.
+    /// </summary>
+    public static readonly TimeSpan StaticInfoTtl = TimeSpan.FromMinutes(1);
+
+    // Perp asset index by coin, learned from meta responses; /exchange actions address assets by index
+    private volatile IReadOnlyDictionary<string, int> _assets = new Dictionary<string, int>();
+    private long _lastNonce;
+
     public TransportRestRequest ToExchangeRequest<TResponse>(UnifiedRestRequest<TResponse> request)
     {
         return request switch
         {
+            // Exchange endpoints (POST /exchange)
+            PlaceOrderRequest or CancelOrderRequest or CancelOrderByClientIdRequest or ModifyOrderRequest
+                => ToExchangeBatchRequest(HyperliquidExchangeActions.BatchKey(request)!, [request]),
+            BatchModifyOrdersRequest r => ToExchangeBatchRequest(HyperliquidExchangeActions.BatchModify, r.Modifications),
+
             // Info endpoints (POST /info)
             GetCandlesRequest r => BuildInfoRequest(new { type = "candleSnapshot", req = new { coin = r.Symbol, interval = r.Interval, startTime = r.StartTime ?? 0, endTime = r.EndTime ?? DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() } }),
             GetL2BookRequest r => BuildL2BookRequest(r),
-            GetAllMidsRequest => BuildInfoRequest(new { type = "allMids" }),
-            GetMetaRequest r => BuildInfoRequest(r.IncludeAssetCtxs ? new { type = "metaAndAssetCtxs" } : (object)new { type = "meta" }),
+            GetAllMidsRequest => BuildInfoRequest(new { type = "allMids" }, HyperliquidRateLimits.LightInfoWeight),
+            GetMetaRequest r => r.IncludeAssetCtxs
+                ? BuildInfoRequest(new { type = "metaAndAssetCtxs" })
+                : BuildInfoRequest(new { type = "meta" }, cacheTtl: StaticInfoTtl),
             GetFundingHistoryRequest r => BuildInfoRequest(r.EndTime.HasValue ? new { type = "fundingHistory", coin = r.Symbol, startTime = r.StartTime, endTime = r.EndTime.Value } : (object)new { type = "fundingHistory", coin = r.Symbol, startTime = r.StartTime }),
             GetPredictedFundingsRequest => BuildInfoRequest(new { type = "predictedFundings" }),
             GetOpenOrdersRequest r => BuildInfoRequest(new { type = "openOrders", user = GetUser(r) }),
             GetFrontendOpenOrdersRequest r => BuildInfoRequest(new { type = "frontendOpenOrders", user = GetUser(r) }),
-            GetPositionsRequest r => BuildInfoRequest(new { type = "clearinghouseState", user = GetUser(r) }),
-            GetBalancesRequest r => BuildInfoRequest(new { type = "clearinghouseState", user = GetUser(r) }),
+            GetPositionsRequest r => BuildInfoRequest(new { type = "clearinghouseState", user = GetUser(r) }, HyperliquidRateLimits.LightInfoWeight),
+            GetBalancesRequest r => BuildInfoRequest(new { type = "clearinghouseState", user = GetUser(r) }, HyperliquidRateLimits.LightInfoWeight),
             GetFillsRequest r => BuildInfoRequest(new { type = "userFills", user = GetUser(r) }),
             GetFillsByTimeRequest r => BuildInfoRequest(r.EndTime.HasValue
                 ? new { type = "userFillsByTime", user = GetUser(r), startTime = r.StartTime, endTime = r.EndTime.Value, aggregateByTime = r.AggregateByTime }
                 : (object)new { type = "userFillsByTime", user = GetUser(r), startTime = r.StartTime, aggregateByTime = r.AggregateByTime }),
-            GetOrderStatusRequest r => BuildInfoRequest(new { type = "orderStatus", user = GetUser(r), oid = long.Parse(r.OrderId) }),
+            GetOrderStatusRequest r => BuildInfoRequest(new { type = "orderStatus", user = GetUser(r), oid = long.Parse(r.OrderId) }, HyperliquidRateLimits.LightInfoWeight),
             GetHistoricalOrdersRequest r => BuildInfoRequest(new { type = "historicalOrders", user = GetUser(r) }),
             GetUserFundingRequest r => BuildInfoRequest(r.EndTime.HasValue
                 ? new { type = "userFunding", user = GetUser(r), startTime = r.StartTime, endTime = r.EndTime.Value }
                 : (object)new { type = "userFunding", user = GetUser(r), startTime = r.StartTime }),
             GetUserRateLimitRequest r => BuildInfoRequest(new { type = "userRateLimit", user = GetUser(r) }),
-            GetUserFeesRequest r => BuildInfoRequest(new { type = "userFees", user = GetUser(r) }),
+            GetUserFeesRequest r => BuildInfoRequest(new { type = "userFees", user = GetUser(r) }, cacheTtl: StaticInfoTtl),
             GetSubAccountsRequest r => BuildInfoRequest(new { type = "subAccounts", user = GetUser(r) }),
             GetActiveAssetDataRequest r => BuildInfoRequest(new { type = "activeAssetData", user = GetUser(r), coin = r.Symbol }),
             GetPortfolioRequest r => BuildInfoRequest(new { type = "portfolio", user = GetUser(r) }),
-            GetSpotMetaRequest r => BuildInfoRequest(r.IncludeAssetCtxs ? new { type = "spotMetaAndAssetCtxs" } : (object)new { type = "spotMeta" }),
-            GetSpotBalancesRequest r => BuildInfoRequest(new { type = "spotClearinghouseState", user = GetUser(r) }),
+            GetSpotMetaRequest r => r.IncludeAssetCtxs
+                ? BuildInfoRequest(new { type = "spotMetaAndAssetCtxs" })
+                : BuildInfoRequest(new { type = "spotMeta" }, cacheTtl: StaticInfoTtl),
+            GetSpotBalancesRequest r => BuildInfoRequest(new { type = "spotClearinghouseState", user = GetUser(r) }, HyperliquidRateLimits.LightInfoWeight),
             _ => throw new NotSupportedException($"Operation {request.Operation} not supported for Hyperliquid REST")
         };
     }
@@ -51,38 +70,108 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
     {
         return request switch
         {
-            GetCandlesRequest => (TResponse)(object)ParseCandlesResponse(response.Body),
-            GetL2BookRequest r => (TResponse)(object)ParseL2BookResponse(response.Body, r.Symbol),
-            GetAllMidsRequest => (TResponse)(object)ParseAllMidsResponse(response.Body),
-            GetMetaRequest r => (TResponse)(object)ParseMetaResponse(response.Body, r.IncludeAssetCtxs),
-            GetFundingHistoryRequest => (TResponse)(object)ParseFundingHistoryResponse(response.Body),
-            GetPredictedFundingsRequest => (TResponse)(object)ParsePredictedFundingsResponse(response.Body),
-            GetOpenOrdersRequest => (TResponse)(object)ParseOpenOrdersResponse(response.Body),
-            GetFrontendOpenOrdersRequest => (TResponse)(object)ParseFrontendOpenOrdersResponse(response.Body),
-            GetPositionsRequest => (TResponse)(object)ParsePositionsResponse(response.Body),
-            GetBalancesRequest => (TResponse)(object)ParseBalancesResponse(response.Body),
-            GetFillsRequest => (TResponse)(object)ParseFillsResponse(response.Body),
-            GetFillsByTimeRequest => (TResponse)(object)ParseFillsResponse(response.Body),
-            GetOrderStatusRequest => (TResponse)(object)ParseOrderStatusResponse(response.Body),
-            GetHistoricalOrdersRequest => (TResponse)(object)ParseHistoricalOrdersResponse(response.Body),
-            GetUserFundingRequest => (TResponse)(object)ParseUserFundingResponse(response.Body),
-            GetUserRateLimitRequest => (TResponse)(object)ParseUserRateLimitResponse(response.Body),
-            GetUserFeesRequest => (TResponse)(object)ParseUserFeesResponse(response.Body),
-            GetSubAccountsRequest => (TResponse)(object)ParseSubAccountsResponse(response.Body),
-            GetActiveAssetDataRequest => (TResponse)(object)ParseActiveAssetDataResponse(response.Body),
-            GetPortfolioRequest => (TResponse)(object)ParsePortfolioResponse(response.Body),
-            GetSpotMetaRequest r => (TResponse)(object)ParseSpotMetaResponse(response.Body, r.IncludeAssetCtxs),
-            GetSpotBalancesRequest => (TResponse)(object)ParseSpotBalancesResponse(response.Body),
+            PlaceOrderRequest or CancelOrderRequest or CancelOrderByClientIdRequest or ModifyOrderRequest
+                => (TResponse)SingleResult(request, response),
+            BatchModifyOrdersRequest r => (TResponse)(object)ParseBatchModifyResponse(r, response),
+            GetCandlesRequest => (TResponse)(object)ParseCandlesResponse(response.Utf8Body),
+            GetL2BookRequest r => (TResponse)(object)ParseL2BookResponse(response.Utf8Body, r.Symbol),
+            GetAllMidsRequest => (TResponse)(object)ParseAllMidsResponse(response.Utf8Body),
+            GetMetaRequest r => (TResponse)(object)RememberAssets(ParseMetaResponse(response.Utf8Body, r.IncludeAssetCtxs)),
+            GetFundingHistoryRequest => (TResponse)(object)ParseFundingHistoryResponse(response.Utf8Body),
+            GetPredictedFundingsRequest => (TResponse)(object)ParsePredictedFundingsResponse(response.Utf8Body),
+            GetOpenOrdersRequest => (TResponse)(object)ParseOpenOrdersResponse(response.Utf8Body),
+            GetFrontendOpenOrdersRequest => (TResponse)(object)ParseFrontendOpenOrdersResponse(response.Utf8Body),
+            GetPositionsRequest => (TResponse)(object)ParsePositionsResponse(response.Utf8Body),
+            GetBalancesRequest => (TResponse)(object)ParseBalancesResponse(response.Utf8Body),
+            GetFillsRequest => (TResponse)(object)ParseFillsResponse(response.Utf8Body),
+            GetFillsByTimeRequest => (TResponse)(object)ParseFillsResponse(response.Utf8Body),
+            GetOrderStatusRequest => (TResponse)(object)ParseOrderStatusResponse(response.Utf8Body),
+            GetHistoricalOrdersRequest => (TResponse)(object)ParseHistoricalOrdersResponse(response.Utf8Body),
+            GetUserFundingRequest => (TResponse)(object)ParseUserFundingResponse(response.Utf8Body),
+            GetUserRateLimitRequest => (TResponse)(object)ParseUserRateLimitResponse(response.Utf8Body),
+            GetUserFeesRequest => (TResponse)(object)ParseUserFeesResponse(response.Utf8Body),
+            GetSubAccountsRequest => (TResponse)(object)ParseSubAccountsResponse(response.Utf8Body),
+            GetActiveAssetDataRequest => (TResponse)(object)ParseActiveAssetDataResponse(response.Utf8Body),
+            GetPortfolioRequest => (TResponse)(object)ParsePortfolioResponse(response.Utf8Body),
+            GetSpotMetaRequest r => (TResponse)(object)ParseSpotMetaResponse(response.Utf8Body, r.IncludeAssetCtxs),
+            GetSpotBalancesRequest => (TResponse)(object)ParseSpotBalancesResponse(response.Utf8Body),
             _ => throw new NotSupportedException($"Response parsing not supported for {request.Operation}")
         };
     }
 
+    // ─── Batching ────────────────────────────────────────────
+
+    public string? GetBatchKey(object request) => HyperliquidExchangeActions.BatchKey(request);
+
+    public void Validate(object request) => HyperliquidExchangeActions.Validate(request, AssetIndex);
+
+    public TransportRestRequest ToExchangeBatchRequest(string batchKey, IReadOnlyList<object> requests) => new()
+    {
+        Method = HttpMethod.Post, Path = "/exchange",
+        Utf8Body = HyperliquidExchangeActions.Build(batchKey, requests, AssetIndex, NextNonce()),
+        ContentType = "application/json",
+        Cost = HyperliquidRateLimits.ExchangeCost(requests.Count, HyperliquidExchangeActions.IsCancel(batchKey))
+    };
+
+    public object[] FromExchangeBatchResponse(string batchKey, IReadOnlyList<object> requests, TransportRestResponse response) =>
+        HyperliquidExchangeActions.ParseStatuses(batchKey, requests, response.Utf8Body);
+
+    private object SingleResult(object request, TransportRestResponse response)
+    {
+        var result = FromExchangeBatchResponse(HyperliquidExchangeActions.BatchKey(request)!, [request], response)[0];
+        return result is Exception ex ? throw ex : result;
+    }
+
+    private BatchModifyOrdersResponse ParseBatchModifyResponse(BatchModifyOrdersRequest request, TransportRestResponse response)
+    {
+        var results = FromExchangeBatchResponse(HyperliquidExchangeActions.BatchModify, request.Modifications, response);
+        return new BatchModifyOrdersResponse
+        {
+            Results = results.Select((result, i) => result as PlaceOrderResponse ?? new PlaceOrderResponse
+            {
+                OrderId = request.Modifications[i].OrderId,
+                ClientOrderId = request.Modifications[i].ClientOrderId,
+                Status = "error: " + ((Exception)result).Message
+            }).ToArray()
+        };
+    }
+
+    private int AssetIndex(string symbol) =>
+        _assets.TryGetValue(symbol, out var index)
+            ? index
+            : throw new InvalidOperationException($"Unknown Hyperliquid asset '{symbol}'; execute a GetMetaRequest first");
+
+    private GetMetaResponse RememberAssets(GetMetaResponse meta)
+    {
+        var assets = new Dictionary<string, int>(meta.Assets.Length, StringComparer.OrdinalIgnoreCase);
+        for (int i = 0; i < meta.Assets.Length; i++)
+            assets[meta.Assets[i].Name] = i;
+        _assets = assets;
+        return meta;
+    }
+
+    /// <summary>Millisecond timestamp, bumped when needed so every action gets a unique nonce.</summary>
+    private long NextNonce()
+    {
+        while (true)
+        {
+            var last = Volatile.Read(ref _lastNonce);
+            var next = Math.Max(DateTimeOffset.UtcNow.ToUnixTimeMilliseconds(), last + 1);
+            if (Interlocked.CompareExchange(ref _lastNonce, next, last) == last)
+                return next;
+        }
+    }
+
     // ─── Request builders ────────────────────────────────────
 
-    private static TransportRestRequest BuildInfoRequest(object body) => new()
+    private static TransportRestRequest BuildInfoRequest(
+        object body, int weight = HyperliquidRateLimits.DefaultInfoWeight, TimeSpan cacheTtl = default) => new()
     {
         Method = HttpMethod.Post, Path = "/info",
-        Body = JsonSerializer.Serialize(body), ContentType = "application/json"
+        Utf8Body = JsonSerializer.SerializeToUtf8Bytes(body), ContentType = "application/json",
+        Cost = new RateLimitCost(weight),
+        IsIdempotent = true,
+        CacheTtl = cacheTtl
     };
 
     private static TransportRestRequest BuildL2BookRequest(GetL2BookRequest r)
@@ -93,7 +182,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
             (not null, _) => new { type = "l2Book", coin = r.Symbol, nSigFigs = r.SignificantFigures },
             _ => new { type = "l2Book", coin = r.Symbol }
         };
-        return BuildInfoRequest(body);
+        return BuildInfoRequest(body, HyperliquidRateLimits.LightInfoWeight);
     }
 
     private static string GetUser<T>(UnifiedRestRequest<T> r) =>
@@ -101,7 +190,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
 
     // ─── Response parsers ────────────────────────────────────
 
-    private static GetCandlesResponse ParseCandlesResponse(string body)
+    private static GetCandlesResponse ParseCandlesResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var candles = doc.RootElement.EnumerateArray().Select(c => new CandleEntry
@@ -116,7 +205,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetCandlesResponse { Candles = candles };
     }
 
-    private static GetL2BookResponse ParseL2BookResponse(string body, string symbol)
+    private static GetL2BookResponse ParseL2BookResponse(ReadOnlyMemory<byte> body, string symbol)
     {
         using var doc = JsonDocument.Parse(body);
         var levels = doc.RootElement.GetProperty("levels");
@@ -128,7 +217,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         };
     }
 
-    private static GetAllMidsResponse ParseAllMidsResponse(string body)
+    private static GetAllMidsResponse ParseAllMidsResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var mids = doc.RootElement.EnumerateObject().Select(p => new MidPrice
@@ -139,7 +228,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetAllMidsResponse { Mids = mids };
     }
 
-    private static GetMetaResponse ParseMetaResponse(string body, bool includeCtx)
+    private static GetMetaResponse ParseMetaResponse(ReadOnlyMemory<byte> body, bool includeCtx)
     {
         using var doc = JsonDocument.Parse(body);
 
@@ -169,7 +258,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetMetaResponse { Assets = assets, AssetContexts = ctxs };
     }
 
-    private static GetFundingHistoryResponse ParseFundingHistoryResponse(string body)
+    private static GetFundingHistoryResponse ParseFundingHistoryResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var history = doc.RootElement.EnumerateArray().Select(e => new FundingHistoryEntry
@@ -182,7 +271,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetFundingHistoryResponse { History = history };
     }
 
-    private static GetPredictedFundingsResponse ParsePredictedFundingsResponse(string body)
+    private static GetPredictedFundingsResponse ParsePredictedFundingsResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var predictions = new List<PredictedFundingEntry>();
@@ -205,14 +294,14 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetPredictedFundingsResponse { Predictions = predictions.ToArray() };
     }
 
-    private static GetOpenOrdersResponse ParseOpenOrdersResponse(string body)
+    private static GetOpenOrdersResponse ParseOpenOrdersResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var orders = doc.RootElement.EnumerateArray().Select(ParseBasicOrder).ToArray();
         return new GetOpenOrdersResponse { Orders = orders };
     }
 
-    private static GetFrontendOpenOrdersResponse ParseFrontendOpenOrdersResponse(string body)
+    private static GetFrontendOpenOrdersResponse ParseFrontendOpenOrdersResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var orders = doc.RootElement.EnumerateArray().Select(o =>
@@ -235,7 +324,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetFrontendOpenOrdersResponse { Orders = orders };
     }
 
-    private static GetPositionsResponse ParsePositionsResponse(string body)
+    private static GetPositionsResponse ParsePositionsResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var assetPositions = doc.RootElement.GetProperty("assetPositions");
@@ -260,7 +349,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetPositionsResponse { Positions = positions };
     }
 
-    private static GetBalancesResponse ParseBalancesResponse(string body)
+    private static GetBalancesResponse ParseBalancesResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var margin = doc.RootElement.TryGetProperty("crossMarginSummary", out var cms) ? cms
@@ -279,7 +368,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         };
     }
 
-    private static GetFillsResponse ParseFillsResponse(string body)
+    private static GetFillsResponse ParseFillsResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var fills = doc.RootElement.EnumerateArray().Select(f => new FillEntry
@@ -299,7 +388,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetFillsResponse { Fills = fills };
     }
 
-    private static GetOrderStatusResponse ParseOrderStatusResponse(string body)
+    private static GetOrderStatusResponse ParseOrderStatusResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var status = doc.RootElement.GetProperty("status").GetString()!;
@@ -324,7 +413,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetOrderStatusResponse { Status = status, Order = order };
     }
 
-    private static GetHistoricalOrdersResponse ParseHistoricalOrdersResponse(string body)
+    private static GetHistoricalOrdersResponse ParseHistoricalOrdersResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var orders = doc.RootElement.EnumerateArray().Select(item =>
@@ -347,7 +436,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetHistoricalOrdersResponse { Orders = orders };
     }
 
-    private static GetUserFundingResponse ParseUserFundingResponse(string body)
+    private static GetUserFundingResponse ParseUserFundingResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var fundings = doc.RootElement.EnumerateArray().Select(f =>
@@ -366,7 +455,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetUserFundingResponse { Fundings = fundings };
     }
 
-    private static GetUserRateLimitResponse ParseUserRateLimitResponse(string body)
+    private static GetUserRateLimitResponse ParseUserRateLimitResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var r = doc.RootElement;
@@ -378,7 +467,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         };
     }
 
-    private static GetUserFeesResponse ParseUserFeesResponse(string body)
+    private static GetUserFeesResponse ParseUserFeesResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var r = doc.RootElement;
@@ -390,7 +479,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         };
     }
 
-    private static GetSubAccountsResponse ParseSubAccountsResponse(string body)
+    private static GetSubAccountsResponse ParseSubAccountsResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var subs = doc.RootElement.EnumerateArray().Select(s => new SubAccountEntry
@@ -401,7 +490,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetSubAccountsResponse { SubAccounts = subs };
     }
 
-    private static GetActiveAssetDataResponse ParseActiveAssetDataResponse(string body)
+    private static GetActiveAssetDataResponse ParseActiveAssetDataResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var r = doc.RootElement;
@@ -416,14 +505,14 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         };
     }
 
-    private static GetPortfolioResponse ParsePortfolioResponse(string body)
+    private static GetPortfolioResponse ParsePortfolioResponse(ReadOnlyMemory<byte> body)
     {
         // Portfolio response is complex; return a simplified version
         using var doc = JsonDocument.Parse(body);
         return new GetPortfolioResponse();
     }
 
-    private static GetSpotMetaResponse ParseSpotMetaResponse(string body, bool includeCtx)
+    private static GetSpotMetaResponse ParseSpotMetaResponse(ReadOnlyMemory<byte> body, bool includeCtx)
     {
         using var doc = JsonDocument.Parse(body);
         var metaRoot = includeCtx ? doc.RootElement[0] : doc.RootElement;
@@ -449,7 +538,7 @@ public sealed class HyperliquidRestTranslator : IRestTranslator
         return new GetSpotMetaResponse { Tokens = tokens, AssetContexts = ctxs };
     }
 
-    private static GetSpotBalancesResponse ParseSpotBalancesResponse(string body)
+    private static GetSpotBalancesResponse ParseSpotBalancesResponse(ReadOnlyMemory<byte> body)
     {
         using var doc = JsonDocument.Parse(body);
         var balances = doc.RootElement.GetProperty("balances").EnumerateArray().Select(b => new SpotBalanceEntry
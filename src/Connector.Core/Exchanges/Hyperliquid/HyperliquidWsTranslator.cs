@@ -1,7 +1,11 @@
+using System.Buffers;
+using System.Buffers.Text;
 using System.Globalization;
+using System.Text;
 using System.Text.Json;
 using Connector.Core.Abstractions;
 using Connector.Core.Contracts;
+using Connector.Core.Internal;
 using Connector.Core.Transport;
 using Microsoft.Extensions.Logging;
 
@@ -16,6 +20,7 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
     private readonly ILogger _logger;
     private readonly bool _includeRaw;
     private readonly string? _userAddress;
+    private readonly Utf8StringCache _strings = new();
 
     public HyperliquidWsTranslator(ILogger logger, bool includeRaw = false, string? userAddress = null)
     {
@@ -33,8 +38,8 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
     {
         foreach (var symbol in request.Symbols)
         {
-            var sub = BuildSubscription("subscribe", request.Channel, symbol, request.Interval, request.Options);
-            yield return new TransportWsMessage { Payload = JsonSerializer.Serialize(sub) };
+            var sub = BuildSubscription(request.Channel, symbol, request.Interval, request.Options);
+            yield return SubscriptionMessage("subscribe", sub);
 
             if (IsUserScoped(request.Channel))
                 yield break;
@@ -45,43 +50,71 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
     {
         foreach (var symbol in request.Symbols)
         {
-            var sub = BuildSubscription("unsubscribe", request.Channel, symbol, null, null);
-            yield return new TransportWsMessage { Payload = JsonSerializer.Serialize(sub) };
+            var sub = BuildSubscription(request.Channel, symbol, null, null);
+            yield return SubscriptionMessage("unsubscribe", sub);
 
             if (IsUserScoped(request.Channel))
                 yield break;
         }
     }
 
-    private object BuildSubscription(string method, UnifiedWsChannel channel, string symbol, string? interval, Dictionary<string, string>? options)
-    {
-        var dex = options?.GetValueOrDefault("dex");
-        object subscription = channel switch
-        {
-            UnifiedWsChannel.Trades => new { type = "trades", coin = symbol },
-            UnifiedWsChannel.OrderBookL1 => new { type = "bbo", coin = symbol },
-            UnifiedWsChannel.OrderBookL2 => new { type = "l2Book", coin = symbol },
-            UnifiedWsChannel.Candles => new { type = "candle", coin = symbol, interval = interval ?? "1m" },
-            UnifiedWsChannel.AllMids => (object)new { type = "allMids" },
-            UnifiedWsChannel.ActiveAssetCtx => new { type = "activeAssetCtx", coin = symbol },
-            UnifiedWsChannel.UserOrders => new { type = "orderUpdates", user = RequireUser("orderUpdates") },
-            UnifiedWsChannel.Fills => new { type = "userFills", user = RequireUser("userFills") },
-            UnifiedWsChannel.Positions => new { type = "clearinghouseState", user = RequireUser("clearinghouseState") },
-            UnifiedWsChannel.Balances => new { type = "clearinghouseState", user = RequireUser("clearinghouseState") },
-            UnifiedWsChannel.UserFundings => new { type = "userFundings", user = RequireUser("userFundings") },
-            UnifiedWsChannel.Ledger => new { type = "userNonFundingLedgerUpdates", user = RequireUser("userNonFundingLedgerUpdates") },
-            UnifiedWsChannel.Notifications => new { type = "notification", user = RequireUser("notification") },
-            UnifiedWsChannel.OpenOrders => new { type = "openOrders", user = RequireUser("openOrders") },
-            UnifiedWsChannel.TwapState => new { type = "twapStates", user = RequireUser("twapStates") },
-            UnifiedWsChannel.TwapSliceFills => new { type = "userTwapSliceFills", user = RequireUser("userTwapSliceFills") },
-            UnifiedWsChannel.TwapHistory => new { type = "userTwapHistory", user = RequireUser("userTwapHistory") },
-            UnifiedWsChannel.ActiveAssetData => new { type = "activeAssetData", user = RequireUser("activeAssetData"), coin = symbol },
-            UnifiedWsChannel.WebData => new { type = "webData3", user = RequireUser("webData3") },
+    private static TransportWsMessage SubscriptionMessage(string method, (string Name, string Value)[] subscription)
+    {
+        // Written by hand rather than serialized from anonymous types so the CLI can be
+        // trimmed / NativeAOT-published without reflection-based JSON.
+        var buffer = new ArrayBufferWriter<byte>(128);
+        using var json = new Utf8JsonWriter(buffer);
+        json.WriteStartObject();
+        json.WriteString("method"u8, method);
+        json.WritePropertyName("subscription"u8);
+        var start = (int)json.BytesPending;
+        json.WriteStartObject();
+        foreach (var (name, value) in subscription)
+            json.WriteString(name, value);
+        json.WriteEndObject();
+        var end = (int)json.BytesPending;
+        json.WriteEndObject();
+        json.Flush();
+
+        // The default encoder escapes all non-ASCII, so byte offsets are char offsets
+        var payload = Encoding.UTF8.GetString(buffer.WrittenSpan);
+        return new TransportWsMessage
+        {
+            Payload = payload,
+            Kind = method == "subscribe" ? TransportWsMessageKind.Subscribe : TransportWsMessageKind.Unsubscribe,
+            SubscriptionKey = payload[start..end]
+        };
+    }
+
+    private (string, string)[] BuildSubscription(UnifiedWsChannel channel, string symbol, string? interval, Dictionary<string, string>? options)
+    {
+        return channel switch
+        {
+            UnifiedWsChannel.Trades => [("type", "trades"), ("coin", symbol)],
+            UnifiedWsChannel.OrderBookL1 => [("type", "bbo"), ("coin", symbol)],
+            UnifiedWsChannel.OrderBookL2 => [("type", "l2Book"), ("coin", symbol)],
+            UnifiedWsChannel.Candles => [("type", "candle"), ("coin", symbol), ("interval", interval ?? "1m")],
+            UnifiedWsChannel.AllMids => [("type", "allMids")],
+            UnifiedWsChannel.ActiveAssetCtx => [("type", "activeAssetCtx"), ("coin", symbol)],
+            UnifiedWsChannel.UserOrders => UserSubscription("orderUpdates"),
+            UnifiedWsChannel.Fills => UserSubscription("userFills"),
+            UnifiedWsChannel.Positions => UserSubscription("clearinghouseState"),
+            UnifiedWsChannel.Balances => UserSubscription("clearinghouseState"),
+            UnifiedWsChannel.UserFundings => UserSubscription("userFundings"),
+            UnifiedWsChannel.Ledger => UserSubscription("userNonFundingLedgerUpdates"),
+            UnifiedWsChannel.Notifications => UserSubscription("notification"),
+            UnifiedWsChannel.OpenOrders => UserSubscription("openOrders"),
+            UnifiedWsChannel.TwapState => UserSubscription("twapStates"),
+            UnifiedWsChannel.TwapSliceFills => UserSubscription("userTwapSliceFills"),
+            UnifiedWsChannel.TwapHistory => UserSubscription("userTwapHistory"),
+            UnifiedWsChannel.ActiveAssetData => [("type", "activeAssetData"), ("user", RequireUser("activeAssetData")), ("coin", symbol)],
+            UnifiedWsChannel.WebData => UserSubscription("webData3"),
             _ => throw new NotSupportedException($"Channel {channel} not supported for Hyperliquid")
         };
-        return new { method, subscription };
     }
 
+    private (string, string)[] UserSubscription(string type) => [("type", type), ("user", RequireUser(type))];
+
     private static bool IsUserScoped(UnifiedWsChannel ch) => ch is
         UnifiedWsChannel.UserOrders or UnifiedWsChannel.Fills or
         UnifiedWsChannel.Positions or UnifiedWsChannel.Balances or
@@ -94,7 +127,95 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
 
     public IEnumerable<UnifiedWsEvent> FromExchangeMessage(TransportWsInbound inbound)
     {
-        using var doc = JsonDocument.Parse(inbound.Payload);
+        // High-volume channels (trades, bbo, l2Book, allMids) are read forward-only straight
+        // from the UTF-8 buffer. Everything else goes through JsonDocument.
+        var utf8 = inbound.Utf8Payload.Span;
+        var reader = new Utf8JsonReader(utf8);
+        if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject)
+        {
+            _logger.LogDebug("Skipping non-object message");
+            return [];
+        }
+
+        var channel = FastChannel.None;
+        var dataStart = -1;
+        var dataEnd = -1;
+
+        while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+        {
+            if (reader.ValueTextEquals("channel"u8))
+            {
+                reader.Read();
+                channel = ClassifyChannel(ref reader);
+                if (channel == FastChannel.Other)
+                    return FromDocument(inbound);
+                if (dataStart >= 0)
+                    break;
+            }
+            else if (reader.ValueTextEquals("data"u8))
+            {
+                reader.Read();
+                if (channel != FastChannel.None)
+                    return ParseFast(channel, ref reader, inbound);
+
+                // "data" arrived before "channel": remember where it is and come back to it
+                dataStart = (int)reader.TokenStartIndex;
+                reader.Skip();
+                dataEnd = (int)reader.BytesConsumed;
+            }
+            else
+            {
+                reader.Read();
+                reader.Skip();
+            }
+        }
+
+        if (channel == FastChannel.None)
+        {
+            _logger.LogDebug("Skipping non-channel message");
+            return [];
+        }
+
+        if (dataStart < 0)
+            return [];
+
+        var dataReader = new Utf8JsonReader(utf8[dataStart..dataEnd]);
+        dataReader.Read();
+        return ParseFast(channel, ref dataReader, inbound);
+    }
+
+    private enum FastChannel { None, Trades, Bbo, L2Book, AllMids, Other }
+
+    private static FastChannel ClassifyChannel(ref Utf8JsonReader reader)
+    {
+        if (reader.TokenType != JsonTokenType.String) return FastChannel.Other;
+        if (reader.ValueTextEquals("trades"u8)) return FastChannel.Trades;
+        if (reader.ValueTextEquals("l2Book"u8)) return FastChannel.L2Book;
+        if (reader.ValueTextEquals("bbo"u8)) return FastChannel.Bbo;
+        if (reader.ValueTextEquals("allMids"u8)) return FastChannel.AllMids;
+        return FastChannel.Other;
+    }
+
+    private IEnumerable<UnifiedWsEvent> ParseFast(FastChannel channel, ref Utf8JsonReader data, TransportWsInbound inbound)
+    {
+        var receivedAt = inbound.ReceivedAt;
+        UnifiedWsEvent? evt = channel switch
+        {
+            FastChannel.Trades => ParseTrades(ref data, receivedAt, Raw(inbound, "trades")),
+            FastChannel.Bbo => ParseBbo(ref data, receivedAt, Raw(inbound, "bbo")),
+            FastChannel.L2Book => ParseL2Book(ref data, receivedAt, Raw(inbound, "l2Book")),
+            FastChannel.AllMids => ParseAllMids(ref data, receivedAt, Raw(inbound, "allMids")),
+            _ => null
+        };
+        return evt is null ? [] : [evt];
+    }
+
+    private RawPayload? Raw(TransportWsInbound inbound, string channel) =>
+        _includeRaw ? new RawPayload { RawJson = inbound.Payload, ExchangeMessageType = channel } : null;
+
+    private IEnumerable<UnifiedWsEvent> FromDocument(TransportWsInbound inbound)
+    {
+        using var doc = JsonDocument.Parse(inbound.Utf8Payload);
         var root = doc.RootElement;
 
         if (!root.TryGetProperty("channel", out var channelProp))
@@ -111,21 +232,9 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
 
         switch (channel)
         {
-            case "trades":
-                foreach (var evt in ParseTrades(data, inbound.ReceivedAt, raw)) yield return evt;
-                break;
-            case "bbo":
-                foreach (var evt in ParseBbo(data, inbound.ReceivedAt, raw)) yield return evt;
-                break;
-            case "l2Book":
-                foreach (var evt in ParseL2Book(data, inbound.ReceivedAt, raw)) yield return evt;
-                break;
             case "candle":
                 foreach (var evt in ParseCandle(data, inbound.ReceivedAt, raw)) yield return evt;
                 break;
-            case "allMids":
-                foreach (var evt in ParseAllMids(data, inbound.ReceivedAt, raw)) yield return evt;
-                break;
             case "activeAssetCtx":
                 foreach (var evt in ParseActiveAssetCtx(data, inbound.ReceivedAt, raw)) yield return evt;
                 break;
@@ -178,72 +287,145 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
         }
     }
 
-    // ─── Parsers ─────────────────────────────────────────────
+    // ─── Fast parsers (Utf8JsonReader) ───────────────────────
 
-    private IEnumerable<TradesEvent> ParseTrades(JsonElement data, DateTimeOffset receivedAt, RawPayload? raw)
+    private TradesEvent? ParseTrades(ref Utf8JsonReader r, DateTimeOffset receivedAt, RawPayload? raw)
     {
-        if (data.ValueKind != JsonValueKind.Array) yield break;
+        if (r.TokenType != JsonTokenType.StartArray)
+        {
+            r.Skip();
+            return null;
+        }
 
-        var trades = new List<TradeEntry>();
+        using var trades = new ArrayBuilder<TradeEntry>(8);
         string? coin = null;
 
-        foreach (var t in data.EnumerateArray())
+        while (r.Read() && r.TokenType == JsonTokenType.StartObject)
         {
-            coin ??= t.GetProperty("coin").GetString();
+            string? tradeCoin = null, side = null, tradeId = null;
+            decimal? px = null, sz = null;
+            long? time = null;
+
+            while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
+            {
+                if (r.ValueTextEquals("coin"u8)) { r.Read(); tradeCoin = ReadCachedString(ref r); }
+                else if (r.ValueTextEquals("side"u8)) { r.Read(); side = ReadSide(ref r); }
+                else if (r.ValueTextEquals("px"u8)) { r.Read(); px = ReadDecimal(ref r); }
+                else if (r.ValueTextEquals("sz"u8)) { r.Read(); sz = ReadDecimal(ref r); }
+                else if (r.ValueTextEquals("time"u8)) { r.Read(); time = r.GetInt64(); }
+                else if (r.ValueTextEquals("tid"u8)) { r.Read(); tradeId = r.GetInt64().ToString(CultureInfo.InvariantCulture); }
+                else { r.Read(); r.Skip(); }
+            }
+
+            coin ??= tradeCoin ?? throw Missing("trades", "coin");
             trades.Add(new TradeEntry
             {
-                TradeId = t.GetProperty("tid").GetInt64().ToString(),
-                Price = decimal.Parse(t.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
-                Size = decimal.Parse(t.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture),
-                Side = t.GetProperty("side").GetString()!.ToLowerInvariant(),
-                Timestamp = DateTimeOffset.FromUnixTimeMilliseconds(t.GetProperty("time").GetInt64())
+                TradeId = tradeId ?? throw Missing("trades", "tid"),
+                Price = px ?? throw Missing("trades", "px"),
+                Size = sz ?? throw Missing("trades", "sz"),
+                Side = side ?? throw Missing("trades", "side"),
+                Timestamp = DateTimeOffset.FromUnixTimeMilliseconds(time ?? throw Missing("trades", "time"))
             });
         }
 
-        if (coin is not null && trades.Count > 0)
+        if (coin is null || trades.Count == 0)
+            return null;
+
+        return new TradesEvent
         {
-            yield return new TradesEvent
-            {
-                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Trades,
-                Symbol = coin, ReceivedAt = receivedAt, Trades = trades.ToArray(), Raw = raw
-            };
-        }
+            Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Trades,
+            Symbol = coin, ReceivedAt = receivedAt, Trades = trades.ToArray(), Raw = raw
+        };
     }
 
-    private IEnumerable<OrderBookL1Event> ParseBbo(JsonElement data, DateTimeOffset receivedAt, RawPayload? raw)
+    private OrderBookL1Event ParseBbo(ref Utf8JsonReader r, DateTimeOffset receivedAt, RawPayload? raw)
     {
-        var coin = data.GetProperty("coin").GetString()!;
-        var bid = data.GetProperty("bid");
-        var ask = data.GetProperty("ask");
+        string? coin = null;
+        PriceLevel? bid = null, ask = null;
+
+        ExpectStartObject(ref r, "bbo");
+        while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
+        {
+            if (r.ValueTextEquals("coin"u8)) { r.Read(); coin = ReadCachedString(ref r); }
+            else if (r.ValueTextEquals("bid"u8)) { r.Read(); bid = ReadLevel(ref r); }
+            else if (r.ValueTextEquals("ask"u8)) { r.Read(); ask = ReadLevel(ref r); }
+            else { r.Read(); r.Skip(); }
+        }
 
-        yield return new OrderBookL1Event
+        return new OrderBookL1Event
         {
             Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL1,
-            Symbol = coin, ReceivedAt = receivedAt,
-            BestBid = new PriceLevel
-            {
-                Price = decimal.Parse(bid.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
-                Size = decimal.Parse(bid.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture)
-            },
-            BestAsk = new PriceLevel
-            {
-                Price = decimal.Parse(ask.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
-                Size = decimal.Parse(ask.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture)
-            },
+            Symbol = coin ?? throw Missing("bbo", "coin"), ReceivedAt = receivedAt,
+            BestBid = bid ?? throw Missing("bbo", "bid"),
+            BestAsk = ask ?? throw Missing("bbo", "ask"),
             Raw = raw
         };
     }
 
-    private IEnumerable<OrderBookL2Event> ParseL2Book(JsonElement data, DateTimeOffset receivedAt, RawPayload? raw)
+    private OrderBookL2Event ParseL2Book(ref Utf8JsonReader r, DateTimeOffset receivedAt, RawPayload? raw)
     {
-        var coin = data.GetProperty("coin").GetString()!;
-        var levels = data.GetProperty("levels");
+        string? coin = null;
+        PriceLevel[]? bids = null, asks = null;
+
+        ExpectStartObject(ref r, "l2Book");
+        while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
+        {
+            if (r.ValueTextEquals("coin"u8)) { r.Read(); coin = ReadCachedString(ref r); }
+            else if (r.ValueTextEquals("levels"u8))
+            {
+                // levels = [[bids...], [asks...]]
+                r.Read();
+                if (r.TokenType != JsonTokenType.StartArray) throw Missing("l2Book", "levels");
+                r.Read();
+                bids = ReadLevels(ref r);
+                r.Read();
+                asks = ReadLevels(ref r);
+                while (r.Read() && r.TokenType != JsonTokenType.EndArray)
+                    r.Skip();
+            }
+            else { r.Read(); r.Skip(); }
+        }
 
-        yield return new OrderBookL2Event
+        return new OrderBookL2Event
         {
             Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL2,
-            Symbol = coin, ReceivedAt = receivedAt, IsSnapshot = true,
-            Bids = ParseLevels(levels[0]), Asks = ParseLevels(levels[1]), Raw = raw
+            Symbol = coin ?? throw Missing("l2Book", "coin"), ReceivedAt = receivedAt, IsSnapshot = true,
+            Bids = bids ?? throw Missing("l2Book", "levels"),
+            Asks = asks ?? throw Missing("l2Book", "levels"),
+            Raw = raw
+        };
+    }
+
+    private AllMidsEvent? ParseAllMids(ref Utf8JsonReader r, DateTimeOffset receivedAt, RawPayload? raw)
+    {
+        // data = { "mids": { "BTC": "50000.0", "ETH": "3000.0", ... } }
+        AllMidsEntry[]? mids = null;
+
+        ExpectStartObject(ref r, "allMids");
+        while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
+        {
+            if (r.ValueTextEquals("mids"u8))
+            {
+                r.Read();
+                ExpectStartObject(ref r, "allMids");
+                using var entries = new ArrayBuilder<AllMidsEntry>(256);
+                while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
+                {
+                    var symbol = ReadCachedString(ref r);
+                    r.Read();
+                    entries.Add(new AllMidsEntry { Symbol = symbol, Mid = ReadDecimal(ref r) });
+                }
+                mids = entries.ToArray();
+            }
+            else { r.Read(); r.Skip(); }
+        }
+
+        if (mids is null) return null;
+
+        return new AllMidsEvent
+        {
+            Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.AllMids,
+            Symbol = "*", ReceivedAt = receivedAt, Mids = mids, Raw = raw
         };
     }
 
@@ -274,28 +456,6 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
         }
     }
 
-    private IEnumerable<AllMidsEvent> ParseAllMids(JsonElement data, DateTimeOffset receivedAt, RawPayload? raw)
-    {
-        // data = { "mids": { "BTC": "50000.0", "ETH": "3000.0", ... } }
-        if (!data.TryGetProperty("mids", out var mids)) yield break;
-
-        var entries = new List<AllMidsEntry>();
-        foreach (var prop in mids.EnumerateObject())
-        {
-            entries.Add(new AllMidsEntry
-            {
-                Symbol = prop.Name,
-                Mid = decimal.Parse(prop.Value.GetString()!, CultureInfo.InvariantCulture)
-            });
-        }
-
-        yield return new AllMidsEvent
-        {
-            Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.AllMids,
-            Symbol = "*", ReceivedAt = receivedAt, Mids = entries.ToArray(), Raw = raw
-        };
-    }
-
     private IEnumerable<ActiveAssetCtxEvent> ParseActiveAssetCtx(JsonElement data, DateTimeOffset receivedAt, RawPayload? raw)
     {
         // data = { "coin": "BTC", "ctx": { "funding": "0.0001", "markPx": "50000", "openInterest": "1000", ... } }
@@ -674,20 +834,74 @@ public sealed class HyperliquidWsTranslator : IWsTranslator
 
     // ─── Helpers ─────────────────────────────────────────────
 
-    private static PriceLevel[] ParseLevels(JsonElement arr)
+    private static PriceLevel[] ReadLevels(ref Utf8JsonReader r)
     {
-        var result = new List<PriceLevel>();
-        foreach (var level in arr.EnumerateArray())
+        if (r.TokenType != JsonTokenType.StartArray) throw Missing("l2Book", "levels");
+
+        using var levels = new ArrayBuilder<PriceLevel>(32);
+        while (r.Read() && r.TokenType == JsonTokenType.StartObject)
+            levels.Add(ReadLevelBody(ref r));
+        return levels.ToArray();
+    }
+
+    private static PriceLevel ReadLevel(ref Utf8JsonReader r)
+    {
+        ExpectStartObject(ref r, "level");
+        return ReadLevelBody(ref r);
+    }
+
+    // Reader is positioned on the level's StartObject; leaves it on the matching EndObject.
+    private static PriceLevel ReadLevelBody(ref Utf8JsonReader r)
+    {
+        decimal? px = null, sz = null;
+        while (r.Read() && r.TokenType == JsonTokenType.PropertyName)
         {
-            result.Add(new PriceLevel
-            {
-                Price = decimal.Parse(level.GetProperty("px").GetString()!, CultureInfo.InvariantCulture),
-                Size = decimal.Parse(level.GetProperty("sz").GetString()!, CultureInfo.InvariantCulture)
-            });
+            if (r.ValueTextEquals("px"u8)) { r.Read(); px = ReadDecimal(ref r); }
+            else if (r.ValueTextEquals("sz"u8)) { r.Read(); sz = ReadDecimal(ref r); }
+            else { r.Read(); r.Skip(); }
         }
-        return result.ToArray();
+        return new PriceLevel
+        {
+            Price = px ?? throw Missing("level", "px"),
+            Size = sz ?? throw Missing("level", "sz")
+        };
+    }
+
+    private static decimal ReadDecimal(ref Utf8JsonReader r)
+    {
+        if (r.TokenType == JsonTokenType.Number)
+            return r.GetDecimal();
+
+        if (r.TokenType == JsonTokenType.String && !r.ValueIsEscaped
+            && Utf8Parser.TryParse(r.ValueSpan, out decimal value, out var consumed)
+            && consumed == r.ValueSpan.Length)
+            return value;
+
+        return decimal.Parse(r.GetString()!, CultureInfo.InvariantCulture);
     }
 
+    // Works for both string values and property names (allMids keys are coin names)
+    private string ReadCachedString(ref Utf8JsonReader r) =>
+        r.TokenType is JsonTokenType.String or JsonTokenType.PropertyName && !r.ValueIsEscaped
+            ? _strings.Get(r.ValueSpan)
+            : r.GetString()!;
+
+    private static string ReadSide(ref Utf8JsonReader r)
+    {
+        if (r.ValueTextEquals("B"u8)) return "b";
+        if (r.ValueTextEquals("A"u8)) return "a";
+        return r.GetString()!.ToLowerInvariant();
+    }
+
+    private static void ExpectStartObject(ref Utf8JsonReader r, string channel)
+    {
+        if (r.TokenType != JsonTokenType.StartObject)
+            throw new JsonException($"Expected object in {channel} message, got {r.TokenType}");
+    }
+
+    private static JsonException Missing(string channel, string property) =>
+        new($"Missing '{property}' in {channel} message");
+
     private static decimal ParseDecimalFlexible(JsonElement el) =>
         el.ValueKind == JsonValueKind.String
             ? decimal.Parse(el.GetString()!, CultureInfo.InvariantCulture)
@@ -0,0 +1,47 @@
+using System.Buffers;
+using System.Runtime.CompilerServices;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Growable scratch list backed by <see cref="ArrayPool{T}"/>. Used by parsers that don't
+/// know the element count up front; only the final <see cref="ToArray"/> allocates.
+/// Must be disposed to return the rented buffer.
+/// </summary>
+internal struct ArrayBuilder<T> : IDisposable
+{
+    private T[] _items;
+    private int _count;
+
+    public ArrayBuilder(int initialCapacity)
+    {
+        _items = ArrayPool<T>.Shared.Rent(initialCapacity);
+        _count = 0;
+    }
+
+    public readonly int Count => _count;
+
+    public readonly ReadOnlySpan<T> AsSpan() => _items.AsSpan(0, _count);
+
+    public void Add(T item)
+    {
+        if (_count == _items.Length)
+        {
+            var larger = ArrayPool<T>.Shared.Rent(_items.Length * 2);
+            Array.Copy(_items, larger, _count);
+            ArrayPool<T>.Shared.Return(_items, clearArray: RuntimeHelpers.IsReferenceOrContainsReferences<T>());
+            _items = larger;
+        }
+        _items[_count++] = item;
+    }
+
+    public readonly T[] ToArray() => _count == 0 ? [] : _items.AsSpan(0, _count).ToArray();
+
+    public void Dispose()
+    {
+        if (_items is null) return;
+        ArrayPool<T>.Shared.Return(_items, clearArray: RuntimeHelpers.IsReferenceOrContainsReferences<T>());
+        _items = null!;
+        _count = 0;
+    }
+}
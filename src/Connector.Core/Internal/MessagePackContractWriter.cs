@@ -0,0 +1,247 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Collections;
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Writes contract objects as MessagePack straight from their source-generated JSON
+/// metadata, so keys, nesting and null handling match the JSON output without producing
+/// JSON first. Decimals are written as exact strings, timestamps as the MessagePack
+/// timestamp extension (UTC) and byte arrays as bin. Reusable; not thread-safe.
+/// </summary>
+internal sealed class MessagePackContractWriter
+{
+    private readonly Dictionary<Type, Member[]> _members = [];
+    private readonly Dictionary<Enum, byte[]> _enumNames = [];
+
+    public void Write(IBufferWriter<byte> output, object value, JsonTypeInfo typeInfo) =>
+        WriteObject(output, value, GetMembers(value.GetType(), typeInfo.Options));
+
+    private void WriteValue(IBufferWriter<byte> output, object? value, JsonSerializerOptions options)
+    {
+        switch (value)
+        {
+            case null: WriteByte(output, 0xc0); break;
+            case string s: WriteString(output, s); break;
+            case decimal d: WriteDecimal(output, d); break;
+            case bool b: WriteByte(output, b ? (byte)0xc3 : (byte)0xc2); break;
+            case long l: WriteInteger(output, l); break;
+            case int i: WriteInteger(output, i); break;
+            case double f: WriteDouble(output, f); break;
+            case DateTimeOffset t: WriteTimestamp(output, t); break;
+            case Enum e: WriteEnum(output, e); break;
+            case byte[] bytes: WriteBinary(output, bytes); break;
+            case object[] array:
+                WriteHeader(output, array.Length, 0x90, 0xdc);
+                foreach (var item in array)
+                    WriteValue(output, item, options);
+                break;
+            case IList list:
+                WriteHeader(output, list.Count, 0x90, 0xdc);
+                for (int i = 0; i < list.Count; i++)
+                    WriteValue(output, list[i], options);
+                break;
+            default:
+                WriteObject(output, value, GetMembers(value.GetType(), options));
+                break;
+        }
+    }
+
+    private void WriteObject(IBufferWriter<byte> output, object value, Member[] members)
+    {
+        var values = ArrayPool<object?>.Shared.Rent(members.Length);
+        try
+        {
+            // Nulls are skipped like the JSON output does, so values are read before the header
+            var count = 0;
+            for (int i = 0; i < members.Length; i++)
+            {
+                var property = members[i].Property;
+                var v = property.Get!(value);
+                if (v is null || property.ShouldSerialize?.Invoke(value, v) == false)
+                    v = null;
+                else
+                    count++;
+                values[i] = v;
+            }
+
+            WriteHeader(output, count, 0x80, 0xde);
+            for (int i = 0; i < members.Length; i++)
+            {
+                if (values[i] is not { } v) continue;
+                WriteRaw(output, members[i].Key);
+                WriteValue(output, v, members[i].Property.Options);
+            }
+        }
+        finally
+        {
+            Array.Clear(values, 0, members.Length);
+            ArrayPool<object?>.Shared.Return(values);
+        }
+    }
+
+    private Member[] GetMembers(Type type, JsonSerializerOptions options)
+    {
+        if (_members.TryGetValue(type, out var members))
+            return members;
+
+        var typeInfo = options.GetTypeInfo(type);
+        if (typeInfo.Kind != JsonTypeInfoKind.Object)
+            throw new NotSupportedException($"{type.Name} has no MessagePack encoding");
+
+        members = typeInfo.Properties
+            .Where(p => p.Get is not null)
+            .Select(p => new Member(p, EncodeString(p.Name)))
+            .ToArray();
+        _members[type] = members;
+        return members;
+    }
+
+    private void WriteEnum(IBufferWriter<byte> output, Enum value)
+    {
+        if (!_enumNames.TryGetValue(value, out var name))
+        {
+            name = EncodeString(JsonNamingPolicy.CamelCase.ConvertName(value.ToString()));
+            _enumNames[value] = name;
+        }
+        WriteRaw(output, name);
+    }
+
+    private static byte[] EncodeString(string value)
+    {
+        var buffer = new ArrayBufferWriter<byte>(value.Length + 5);
+        WriteString(buffer, value);
+        return buffer.WrittenSpan.ToArray();
+    }
+
+    private static void WriteString(IBufferWriter<byte> output, string value)
+    {
+        var length = Encoding.UTF8.GetByteCount(value);
+        var span = output.GetSpan(5 + length);
+        var header = WriteStringHeader(span, length);
+        Encoding.UTF8.GetBytes(value, span[header..]);
+        output.Advance(header + length);
+    }
+
+    /// <summary>Same digits as the JSON output, but as a string so no precision is lost.</summary>
+    private static void WriteDecimal(IBufferWriter<byte> output, decimal value)
+    {
+        Span<byte> digits = stackalloc byte[64];
+        value.TryFormat(digits, out var length, default, CultureInfo.InvariantCulture);
+        var span = output.GetSpan(5 + length);
+        var header = WriteStringHeader(span, length);
+        digits[..length].CopyTo(span[header..]);
+        output.Advance(header + length);
+    }
+
+    private static int WriteStringHeader(Span<byte> span, int length)
+    {
+        if (length < 32) { span[0] = (byte)(0xa0 | length); return 1; }
+        if (length <= byte.MaxValue) { span[0] = 0xd9; span[1] = (byte)length; return 2; }
+        if (length <= ushort.MaxValue) { span[0] = 0xda; BinaryPrimitives.WriteUInt16BigEndian(span[1..], (ushort)length); return 3; }
+        span[0] = 0xdb;
+        BinaryPrimitives.WriteUInt32BigEndian(span[1..], (uint)length);
+        return 5;
+    }
+
+    private static void WriteBinary(IBufferWriter<byte> output, byte[] value)
+    {
+        var span = output.GetSpan(5 + value.Length);
+        int header;
+        if (value.Length <= byte.MaxValue) { span[0] = 0xc4; span[1] = (byte)value.Length; header = 2; }
+        else if (value.Length <= ushort.MaxValue) { span[0] = 0xc5; BinaryPrimitives.WriteUInt16BigEndian(span[1..], (ushort)value.Length); header = 3; }
+        else { span[0] = 0xc6; BinaryPrimitives.WriteUInt32BigEndian(span[1..], (uint)value.Length); header = 5; }
+
+        value.CopyTo(span[header..]);
+        output.Advance(header + value.Length);
+    }
+
+    /// <summary>Timestamp extension (type -1): 64-bit form when it fits, else the 96-bit form.</summary>
+    private static void WriteTimestamp(IBufferWriter<byte> output, DateTimeOffset value)
+    {
+        var ticks = value.UtcTicks - DateTimeOffset.UnixEpoch.UtcTicks;
+        var seconds = Math.DivRem(ticks, TimeSpan.TicksPerSecond, out var remainder);
+        if (remainder < 0) { seconds--; remainder += TimeSpan.TicksPerSecond; }
+        var nanoseconds = (uint)(remainder * 100);
+
+        var span = output.GetSpan(15);
+        if (seconds is >= 0 and < 1L << 34)
+        {
+            span[0] = 0xd7;
+            span[1] = 0xff;
+            BinaryPrimitives.WriteUInt64BigEndian(span[2..], ((ulong)nanoseconds << 34) | (ulong)seconds);
+            output.Advance(10);
+        }
+        else
+        {
+            span[0] = 0xc7;
+            span[1] = 12;
+            span[2] = 0xff;
+            BinaryPrimitives.WriteUInt32BigEndian(span[3..], nanoseconds);
+            BinaryPrimitives.WriteInt64BigEndian(span[7..], seconds);
+            output.Advance(15);
+        }
+    }
+
+    private static void WriteHeader(IBufferWriter<byte> output, int count, byte fix, byte wide16)
+    {
+        var span = output.GetSpan(5);
+        if (count < 16)
+        {
+            span[0] = (byte)(fix | count);
+            output.Advance(1);
+        }
+        else if (count <= ushort.MaxValue)
+        {
+            span[0] = wide16;
+            BinaryPrimitives.WriteUInt16BigEndian(span[1..], (ushort)count);
+            output.Advance(3);
+        }
+        else
+        {
+            span[0] = (byte)(wide16 + 1);
+            BinaryPrimitives.WriteUInt32BigEndian(span[1..], (uint)count);
+            output.Advance(5);
+        }
+    }
+
+    private static void WriteInteger(IBufferWriter<byte> output, long value)
+    {
+        var span = output.GetSpan(9);
+        int written;
+        if (value is >= 0 and <= 0x7f) { span[0] = (byte)value; written = 1; }
+        else if (value is >= -32 and < 0) { span[0] = (byte)(sbyte)value; written = 1; }
+        else if (value is >= sbyte.MinValue and <= sbyte.MaxValue) { span[0] = 0xd0; span[1] = (byte)(sbyte)value; written = 2; }
+        else if (value is >= short.MinValue and <= short.MaxValue) { span[0] = 0xd1; BinaryPrimitives.WriteInt16BigEndian(span[1..], (short)value); written = 3; }
+        else if (value is >= int.MinValue and <= int.MaxValue) { span[0] = 0xd2; BinaryPrimitives.WriteInt32BigEndian(span[1..], (int)value); written = 5; }
+        else { span[0] = 0xd3; BinaryPrimitives.WriteInt64BigEndian(span[1..], value); written = 9; }
+        output.Advance(written);
+    }
+
+    private static void WriteDouble(IBufferWriter<byte> output, double value)
+    {
+        var span = output.GetSpan(9);
+        span[0] = 0xcb;
+        BinaryPrimitives.WriteDoubleBigEndian(span[1..], value);
+        output.Advance(9);
+    }
+
+    private static void WriteByte(IBufferWriter<byte> output, byte value)
+    {
+        output.GetSpan(1)[0] = value;
+        output.Advance(1);
+    }
+
+    private static void WriteRaw(IBufferWriter<byte> output, byte[] bytes)
+    {
+        bytes.CopyTo(output.GetSpan(bytes.Length));
+        output.Advance(bytes.Length);
+    }
+
+    private readonly record struct Member(JsonPropertyInfo Property, byte[] Key);
+}
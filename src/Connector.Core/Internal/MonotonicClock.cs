@@ -0,0 +1,37 @@
+using System.Diagnostics;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Wall-clock times derived from <see cref="Stopwatch.GetTimestamp"/> stamps, so a frame is
+/// stamped once and both its <c>ReceivedAt</c> and its latency measurements come from the
+/// same reading. The anchor to the system clock is refreshed every second, which keeps
+/// drift between the two clocks well under a millisecond.
+/// </summary>
+internal static class MonotonicClock
+{
+    private static Anchor _anchor = Anchor.Now();
+
+    public static DateTimeOffset ToUtc(long timestamp)
+    {
+        var anchor = Volatile.Read(ref _anchor);
+        var elapsed = timestamp - anchor.Timestamp;
+        if (elapsed > Stopwatch.Frequency || elapsed < -Stopwatch.Frequency)
+        {
+            anchor = Anchor.Now();
+            Volatile.Write(ref _anchor, anchor);
+            elapsed = timestamp - anchor.Timestamp;
+        }
+
+        return new DateTimeOffset(anchor.UtcTicks + elapsed * TimeSpan.TicksPerSecond / Stopwatch.Frequency, TimeSpan.Zero);
+    }
+
+    private sealed record Anchor(long Timestamp, long UtcTicks)
+    {
+        public static Anchor Now()
+        {
+            var timestamp = Stopwatch.GetTimestamp();
+            return new Anchor(timestamp, DateTime.UtcNow.Ticks);
+        }
+    }
+}
@@ -0,0 +1,29 @@
+using System.Buffers;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Exposes caller-owned unmanaged memory (e.g. a NumPy array's data pointer) as
+/// <see cref="Memory{T}"/>. The owner must keep the memory alive and in place while in use.
+/// </summary>
+internal sealed unsafe class NativeMemoryManager<T> : MemoryManager<T> where T : unmanaged
+{
+    private readonly T* _pointer;
+    private readonly int _length;
+
+    public NativeMemoryManager(nint pointer, int length)
+    {
+        if (pointer == 0 && length > 0) throw new ArgumentNullException(nameof(pointer));
+        ArgumentOutOfRangeException.ThrowIfNegative(length);
+        _pointer = (T*)pointer;
+        _length = length;
+    }
+
+    public override Span<T> GetSpan() => new(_pointer, _length);
+
+    public override MemoryHandle Pin(int elementIndex = 0) => new(_pointer + elementIndex);
+
+    public override void Unpin() { }
+
+    protected override void Dispose(bool disposing) { }
+}
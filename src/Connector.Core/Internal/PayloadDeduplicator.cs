@@ -0,0 +1,57 @@
+using System.Numerics;
+using System.Runtime.InteropServices;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Remembers 64-bit hashes of recently seen payloads for a time window so the second copy
+/// of a message arriving over a redundant connection can be discarded.
+/// </summary>
+internal sealed class PayloadDeduplicator
+{
+    private readonly TimeSpan _window;
+    private readonly int _capacity;
+    private readonly HashSet<ulong> _seen = [];
+    private readonly Queue<(ulong Hash, DateTimeOffset Expires)> _order = new();
+
+    public PayloadDeduplicator(TimeSpan window, int capacity)
+    {
+        _window = window;
+        _capacity = capacity;
+    }
+
+    /// <summary>Returns <c>true</c> the first time a payload is seen within the window.</summary>
+    public bool TryAccept(ReadOnlySpan<byte> payload, DateTimeOffset now)
+    {
+        var hash = Hash(payload);
+        lock (_seen)
+        {
+            while (_order.Count > 0 && (_order.Count >= _capacity || _order.Peek().Expires <= now))
+                _seen.Remove(_order.Dequeue().Hash);
+
+            if (!_seen.Add(hash)) return false;
+            _order.Enqueue((hash, now + _window));
+            return true;
+        }
+    }
+
+    internal static ulong Hash(ReadOnlySpan<byte> data)
+    {
+        const ulong prime = 0x100000001b3;
+        var h = 0xcbf29ce484222325UL ^ (ulong)data.Length;
+
+        var words = MemoryMarshal.Cast<byte, ulong>(data);
+        foreach (var w in words)
+            h = BitOperations.RotateLeft((h ^ w) * prime, 29);
+        foreach (var b in data[(words.Length * sizeof(ulong))..])
+            h = (h ^ b) * prime;
+
+        // fmix64 finaliser so every input bit reaches every output bit
+        h ^= h >> 33;
+        h *= 0xff51afd7ed558ccd;
+        h ^= h >> 33;
+        h *= 0xc4ceb9fe1a85ec53;
+        h ^= h >> 33;
+        return h;
+    }
+}
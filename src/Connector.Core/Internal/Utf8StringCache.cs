@@ -0,0 +1,55 @@
+using System.Numerics;
+using System.Text;
+
+namespace Connector.Core.Internal;
+
+/// <summary>
+/// Lossy cache that maps short UTF-8 byte sequences (coin names, sides) to string instances
+/// so hot parsers don't allocate a new string for every repeated symbol.
+/// Lock-free: each slot holds one string and is overwritten on collision.
+/// </summary>
+internal sealed class Utf8StringCache
+{
+    private const int MaxCachedLength = 32;
+
+    private readonly string?[] _slots;
+    private readonly int _mask;
+
+    public Utf8StringCache(int capacity = 1024)
+    {
+        var size = (int)BitOperations.RoundUpToPowerOf2((uint)Math.Max(capacity, 16));
+        _slots = new string?[size];
+        _mask = size - 1;
+    }
+
+    public string Get(ReadOnlySpan<byte> utf8)
+    {
+        if (utf8.Length > MaxCachedLength)
+            return Encoding.UTF8.GetString(utf8);
+
+        // FNV-1a
+        var hash = 2166136261u;
+        foreach (var b in utf8)
+            hash = (hash ^ b) * 16777619u;
+
+        ref var slot = ref _slots[hash & _mask];
+        var cached = Volatile.Read(ref slot);
+        if (cached is not null && AsciiEquals(cached, utf8))
+            return cached;
+
+        var value = Encoding.UTF8.GetString(utf8);
+        Volatile.Write(ref slot, value);
+        return value;
+    }
+
+    private static bool AsciiEquals(string value, ReadOnlySpan<byte> utf8)
+    {
+        if (value.Length != utf8.Length) return false;
+        for (var i = 0; i < utf8.Length; i++)
+        {
+            if (utf8[i] >= 0x80 || value[i] != utf8[i])
+                return false;
+        }
+        return true;
+    }
+}
@@ -0,0 +1,185 @@
+using System.Threading.Channels;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Managers;
+
+/// <summary>
+/// Blocking bulk read of events into column buffers. An event whose rows do not fit is
+/// kept and resumed by the next call, so no rows are lost at buffer boundaries.
+/// </summary>
+internal abstract class ColumnarDrain<TColumns>
+{
+    private readonly ChannelReader<UnifiedWsEvent>[] _readers;
+    private readonly object _gate = new();
+    private UnifiedWsEvent? _pending;
+    private int _pendingOffset;
+    private int _nextReader;
+
+    protected ColumnarDrain(ChannelReader<UnifiedWsEvent>[] readers, SymbolRegistry symbols)
+    {
+        _readers = readers;
+        Symbols = symbols;
+    }
+
+    protected SymbolRegistry Symbols { get; }
+
+    protected abstract int Capacity(TColumns columns);
+
+    /// <summary>Number of rows <paramref name="evt"/> expands to; 0 to skip it.</summary>
+    protected abstract int RowCount(UnifiedWsEvent evt);
+
+    /// <summary>
+    /// Writes rows <paramref name="first"/>..<paramref name="first"/>+<paramref name="count"/>
+    /// of <paramref name="evt"/> starting at column index <paramref name="row"/>.
+    /// </summary>
+    protected abstract void WriteRows(TColumns columns, UnifiedWsEvent evt, int first, int row, int count);
+
+    /// <summary>
+    /// Waits up to <paramref name="timeout"/> for the first event, then fills
+    /// <paramref name="columns"/> with whatever is already queued, up to
+    /// <paramref name="maxRows"/>. Returns the number of rows written.
+    /// </summary>
+    public int Drain(TColumns columns, int maxRows, TimeSpan timeout)
+    {
+        lock (_gate)
+        {
+            maxRows = Math.Min(maxRows, Capacity(columns));
+            if (maxRows <= 0) return 0;
+
+            if (_pending is null && !TryReadNext() && (!WaitForData(timeout) || !TryReadNext()))
+                return 0;
+
+            var rows = 0;
+            while (rows < maxRows && (_pending is not null || TryReadNext()))
+            {
+                var total = RowCount(_pending!);
+                var count = Math.Min(total - _pendingOffset, maxRows - rows);
+                if (count > 0)
+                {
+                    WriteRows(columns, _pending!, _pendingOffset, rows, count);
+                    rows += count;
+                    _pendingOffset += count;
+                }
+
+                if (_pendingOffset >= total)
+                {
+                    _pending = null;
+                    _pendingOffset = 0;
+                }
+            }
+            return rows;
+        }
+    }
+
+    private bool TryReadNext()
+    {
+        for (int i = 0; i < _readers.Length; i++)
+        {
+            var reader = _readers[(_nextReader + i) % _readers.Length];
+            if (reader.TryRead(out var evt))
+            {
+                _nextReader = (_nextReader + i + 1) % _readers.Length;
+                _pending = evt;
+                _pendingOffset = 0;
+                return true;
+            }
+        }
+        return false;
+    }
+
+    private bool WaitForData(TimeSpan timeout)
+    {
+        if (timeout <= TimeSpan.Zero) return false;
+
+        using var cts = new CancellationTokenSource(timeout);
+        try
+        {
+            var waits = _readers.Select(r => r.WaitToReadAsync(cts.Token).AsTask()).ToArray();
+            var first = Task.WhenAny(waits).GetAwaiter().GetResult();
+            return first.IsCompletedSuccessfully && first.Result;
+        }
+        finally
+        {
+            cts.Cancel();
+        }
+    }
+
+    protected static sbyte SideSign(string side) =>
+        side.Length > 0 && (side[0] is 'b' or 'B') ? (sbyte)1 : (sbyte)-1;
+}
+
+internal sealed class TradeDrain : ColumnarDrain<TradeColumns>
+{
+    public TradeDrain(ChannelReader<UnifiedWsEvent> trades, SymbolRegistry symbols)
+        : base([trades], symbols) { }
+
+    protected override int Capacity(TradeColumns columns) => columns.Capacity;
+
+    protected override int RowCount(UnifiedWsEvent evt) => evt is TradesEvent t ? t.Trades.Length : 0;
+
+    protected override void WriteRows(TradeColumns columns, UnifiedWsEvent evt, int first, int row, int count)
+    {
+        var trades = ((TradesEvent)evt).Trades.AsSpan(first, count);
+        var symbolId = Symbols.GetId(evt.Symbol);
+        var ts = columns.TimestampMs.Span.Slice(row, count);
+        var sym = columns.SymbolId.Span.Slice(row, count);
+        var side = columns.Side.Span.Slice(row, count);
+        var price = columns.Price.Span.Slice(row, count);
+        var size = columns.Size.Span.Slice(row, count);
+
+        for (int i = 0; i < trades.Length; i++)
+        {
+            var t = trades[i];
+            ts[i] = t.Timestamp.ToUnixTimeMilliseconds();
+            sym[i] = symbolId;
+            side[i] = SideSign(t.Side);
+            price[i] = (double)t.Price;
+            size[i] = (double)t.Size;
+        }
+    }
+}
+
+internal sealed class BookDrain : ColumnarDrain<BookColumns>
+{
+    public BookDrain(ChannelReader<UnifiedWsEvent> l1, ChannelReader<UnifiedWsEvent> l2, SymbolRegistry symbols)
+        : base([l1, l2], symbols) { }
+
+    protected override int Capacity(BookColumns columns) => columns.Capacity;
+
+    protected override int RowCount(UnifiedWsEvent evt) => evt switch
+    {
+        OrderBookL1Event => 2,
+        OrderBookL2Event b => b.Bids.Length + b.Asks.Length,
+        OrderBookL2DeltaEvent d => d.Bids.Length + d.Asks.Length,
+        _ => 0
+    };
+
+    protected override void WriteRows(BookColumns columns, UnifiedWsEvent evt, int first, int row, int count)
+    {
+        var (kind, bids, asks) = evt switch
+        {
+            OrderBookL1Event l1 => (BookRowKind.TopOfBook, new[] { l1.BestBid }, new[] { l1.BestAsk }),
+            OrderBookL2Event b => (BookRowKind.Snapshot, b.Bids, b.Asks),
+            OrderBookL2DeltaEvent d => (BookRowKind.Delta, d.Bids, d.Asks),
+            _ => throw new InvalidOperationException($"Unexpected book event {evt.GetType().Name}")
+        };
+
+        columns.Sequence.Span.Slice(row, count).Fill(evt.Sequence ?? 0);
+        columns.ReceivedAtMs.Span.Slice(row, count).Fill(evt.ReceivedAt.ToUnixTimeMilliseconds());
+        columns.SymbolId.Span.Slice(row, count).Fill(Symbols.GetId(evt.Symbol));
+        columns.Kind.Span.Slice(row, count).Fill((sbyte)kind);
+
+        var side = columns.Side.Span.Slice(row, count);
+        var price = columns.Price.Span.Slice(row, count);
+        var size = columns.Size.Span.Slice(row, count);
+        for (int i = 0; i < count; i++)
+        {
+            var index = first + i;
+            var isBid = index < bids.Length;
+            var level = isBid ? bids[index] : asks[index - bids.Length];
+            side[i] = isBid ? (sbyte)1 : (sbyte)-1;
+            price[i] = (double)level.Price;
+            size[i] = (double)level.Size;
+        }
+    }
+}
@@ -0,0 +1,139 @@
+using System.Collections.Concurrent;
+using Connector.Core.Internal;
+
+namespace Connector.Core.Managers;
+
+/// <summary>
+/// Caller-owned column buffers filled by <see cref="WebSocketManager.DrainTrades"/>.
+/// One row per trade. Build from managed arrays or, for NumPy, from raw data pointers
+/// with <see cref="FromPointers"/> so rows land in the arrays without a copy.
+/// </summary>
+public sealed class TradeColumns
+{
+    public TradeColumns(Memory<long> timestampMs, Memory<int> symbolId, Memory<sbyte> side, Memory<double> price, Memory<double> size)
+    {
+        TimestampMs = timestampMs;
+        SymbolId = symbolId;
+        Side = side;
+        Price = price;
+        Size = size;
+        Capacity = Min(timestampMs.Length, symbolId.Length, side.Length, price.Length, size.Length);
+    }
+
+    /// <summary>
+    /// Wraps unmanaged buffers of <paramref name="capacity"/> elements each. The caller keeps
+    /// them alive and unmoved for the lifetime of this instance.
+    /// </summary>
+    public static TradeColumns FromPointers(nint timestampMs, nint symbolId, nint side, nint price, nint size, int capacity) => new(
+        new NativeMemoryManager<long>(timestampMs, capacity).Memory,
+        new NativeMemoryManager<int>(symbolId, capacity).Memory,
+        new NativeMemoryManager<sbyte>(side, capacity).Memory,
+        new NativeMemoryManager<double>(price, capacity).Memory,
+        new NativeMemoryManager<double>(size, capacity).Memory);
+
+    public int Capacity { get; }
+
+    /// <summary>Exchange trade time, Unix milliseconds.</summary>
+    public Memory<long> TimestampMs { get; }
+
+    /// <summary>Id from <see cref="WebSocketManager.Symbols"/>.</summary>
+    public Memory<int> SymbolId { get; }
+
+    /// <summary>+1 buy, -1 sell.</summary>
+    public Memory<sbyte> Side { get; }
+
+    public Memory<double> Price { get; }
+    public Memory<double> Size { get; }
+
+    internal static int Min(params int[] lengths) => lengths.Min();
+}
+
+/// <summary>
+/// Caller-owned column buffers filled by <see cref="WebSocketManager.DrainBooks"/>.
+/// One row per price level; rows of one event share <see cref="Sequence"/>. An event may
+/// be split across two drains.
+/// </summary>
+public sealed class BookColumns
+{
+    public BookColumns(Memory<long> sequence, Memory<long> receivedAtMs, Memory<int> symbolId, Memory<sbyte> kind, Memory<sbyte> side, Memory<double> price, Memory<double> size)
+    {
+        Sequence = sequence;
+        ReceivedAtMs = receivedAtMs;
+        SymbolId = symbolId;
+        Kind = kind;
+        Side = side;
+        Price = price;
+        Size = size;
+        Capacity = TradeColumns.Min(sequence.Length, receivedAtMs.Length, symbolId.Length, kind.Length, side.Length, price.Length, size.Length);
+    }
+
+    /// <inheritdoc cref="TradeColumns.FromPointers"/>
+    public static BookColumns FromPointers(nint sequence, nint receivedAtMs, nint symbolId, nint kind, nint side, nint price, nint size, int capacity) => new(
+        new NativeMemoryManager<long>(sequence, capacity).Memory,
+        new NativeMemoryManager<long>(receivedAtMs, capacity).Memory,
+        new NativeMemoryManager<int>(symbolId, capacity).Memory,
+        new NativeMemoryManager<sbyte>(kind, capacity).Memory,
+        new NativeMemoryManager<sbyte>(side, capacity).Memory,
+        new NativeMemoryManager<double>(price, capacity).Memory,
+        new NativeMemoryManager<double>(size, capacity).Memory);
+
+    public int Capacity { get; }
+
+    /// <summary>Event sequence (per-symbol book sequence when an order book store is attached).</summary>
+    public Memory<long> Sequence { get; }
+
+    /// <summary>Local receive time, Unix milliseconds.</summary>
+    public Memory<long> ReceivedAtMs { get; }
+
+    public Memory<int> SymbolId { get; }
+
+    /// <summary>A <see cref="BookRowKind"/> value.</summary>
+    public Memory<sbyte> Kind { get; }
+
+    /// <summary>+1 bid, -1 ask.</summary>
+    public Memory<sbyte> Side { get; }
+
+    public Memory<double> Price { get; }
+
+    /// <summary>Level size; 0 in a delta row means the level was removed.</summary>
+    public Memory<double> Size { get; }
+}
+
+public enum BookRowKind : sbyte
+{
+    TopOfBook = 0,
+    Snapshot = 1,
+    Delta = 2
+}
+
+/// <summary>
+/// Stable small-integer ids for symbols, so columnar consumers can carry an int column
+/// instead of strings.
+/// </summary>
+public sealed class SymbolRegistry
+{
+    private readonly ConcurrentDictionary<string, int> _ids = new(StringComparer.Ordinal);
+    private readonly object _gate = new();
+    private string[] _names = [];
+
+    public int Count => Volatile.Read(ref _names).Length;
+
+    public int GetId(string symbol)
+    {
+        if (_ids.TryGetValue(symbol, out var id)) return id;
+
+        lock (_gate)
+        {
+            if (_ids.TryGetValue(symbol, out id)) return id;
+            id = _names.Length;
+            Volatile.Write(ref _names, [.. _names, symbol]);
+            _ids[symbol] = id;
+            return id;
+        }
+    }
+
+    public string GetName(int id) => Volatile.Read(ref _names)[id];
+
+    /// <summary>All names indexed by id.</summary>
+    public string[] GetNames() => Volatile.Read(ref _names);
+}
@@ -0,0 +1,225 @@
+using System.Diagnostics;
+using Connector.Core.Abstractions;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging;
+
+namespace Connector.Core.Managers;
+
+public sealed class RestBatchingOptions
+{
+    /// <summary>How long the first request of a batch waits for others to join.</summary>
+    public TimeSpan Window { get; init; } = TimeSpan.FromMilliseconds(2);
+
+    /// <summary>A batch is sent as soon as it reaches this size.</summary>
+    public int MaxBatchSize { get; init; } = 40;
+}
+
+/// <summary>
+/// Point-in-time counters for <see cref="RestManager"/> batching. Queue delay is the time
+/// from a request joining a batch to that batch being sent.
+/// </summary>
+public sealed class RestBatchStats
+{
+    public required long Batches { get; init; }
+    public required long Requests { get; init; }
+    public required int LargestBatch { get; init; }
+    public required TimeSpan AverageQueueDelay { get; init; }
+    public required TimeSpan MaxQueueDelay { get; init; }
+
+    /// <summary>Batch count by size; index is the size, up to MaxBatchSize.</summary>
+    public required long[] SizeHistogram { get; init; }
+
+    public double AverageBatchSize => Batches == 0 ? 0 : (double)Requests / Batches;
+}
+
+/// <summary>
+/// Collects batchable trading requests per batch key and sends each group as one exchange
+/// request once the window closes or the batch is full. Results are fanned back out to the
+/// callers in order.
+/// </summary>
+internal sealed class RestBatcher
+{
+    private readonly RestBatchingOptions _options;
+    private readonly IRestBatchTranslator _translator;
+    private readonly Func<TransportRestRequest, bool, CancellationToken, Task<TransportRestResponse>> _send;
+    private readonly ILogger _logger;
+    private readonly Dictionary<string, Batch> _open = new(StringComparer.Ordinal);
+    private readonly object _lock = new();
+    private readonly long[] _sizes;
+    private long _batches;
+    private long _requests;
+    private long _delayTicks;
+    private long _maxDelayTicks;
+
+    /// <param name="send">Sends one exchange request; the flag says whether it needs auth.</param>
+    public RestBatcher(
+        RestBatchingOptions options,
+        IRestBatchTranslator translator,
+        Func<TransportRestRequest, bool, CancellationToken, Task<TransportRestResponse>> send,
+        ILogger logger)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(options.MaxBatchSize);
+        _options = options;
+        _translator = translator;
+        _send = send;
+        _logger = logger;
+        _sizes = new long[options.MaxBatchSize + 1];
+    }
+
+    /// <summary>
+    /// Cancelling <paramref name="ct"/> withdraws the request while its batch is still open;
+    /// once the batch is sent the call waits for the exchange's answer, so a cancelled call
+    /// always means nothing was sent.
+    /// </summary>
+    public async Task<object> EnqueueAsync(string batchKey, object request, bool authRequired, CancellationToken ct)
+    {
+        ct.ThrowIfCancellationRequested();
+        var item = new Item(request, Stopwatch.GetTimestamp());
+        Batch? full = null;
+        Batch? opened = null;
+
+        lock (_lock)
+        {
+            if (!_open.TryGetValue(batchKey, out var batch))
+                _open[batchKey] = opened = batch = new Batch(batchKey);
+
+            batch.Items.Add(item);
+            batch.AuthRequired |= authRequired;
+            if (batch.Items.Count >= _options.MaxBatchSize)
+            {
+                _open.Remove(batchKey);
+                full = batch;
+            }
+        }
+
+        if (full is not null)
+            _ = SendAsync(full);
+        else if (opened is not null)
+            _ = SendAfterWindowAsync(opened);
+
+        using (ct.Register(() => Withdraw(batchKey, item, ct)))
+            return await item.Completion.Task;
+    }
+
+    public RestBatchStats GetStats()
+    {
+        var batches = Interlocked.Read(ref _batches);
+        var requests = Interlocked.Read(ref _requests);
+        var sizes = new long[_sizes.Length];
+        for (int i = 0; i < sizes.Length; i++)
+            sizes[i] = Interlocked.Read(ref _sizes[i]);
+
+        return new RestBatchStats
+        {
+            Batches = batches,
+            Requests = requests,
+            LargestBatch = Math.Max(0, Array.FindLastIndex(sizes, n => n > 0)),
+            AverageQueueDelay = requests == 0
+                ? TimeSpan.Zero
+                : Stopwatch.GetElapsedTime(0, Interlocked.Read(ref _delayTicks) / requests),
+            MaxQueueDelay = Stopwatch.GetElapsedTime(0, Interlocked.Read(ref _maxDelayTicks)),
+            SizeHistogram = sizes
+        };
+    }
+
+    private void Withdraw(string batchKey, Item item, CancellationToken ct)
+    {
+        lock (_lock)
+        {
+            // Too late once the batch has left the open set
+            if (!_open.TryGetValue(batchKey, out var batch) || !batch.Items.Remove(item))
+                return;
+            if (batch.Items.Count == 0)
+                _open.Remove(batchKey);
+        }
+
+        item.Completion.TrySetCanceled(ct);
+    }
+
+    private async Task SendAfterWindowAsync(Batch batch)
+    {
+        await Task.Delay(_options.Window).ConfigureAwait(false);
+        lock (_lock)
+        {
+            // Already sent because it filled up, or every caller withdrew
+            if (!_open.TryGetValue(batch.Key, out var current) || current != batch)
+                return;
+            _open.Remove(batch.Key);
+        }
+
+        await SendAsync(batch).ConfigureAwait(false);
+    }
+
+    private async Task SendAsync(Batch batch)
+    {
+        var items = batch.Items;
+        var sentAt = Stopwatch.GetTimestamp();
+        Record(batch.Key, items, sentAt);
+
+        try
+        {
+            var requests = items.Select(i => i.Request).ToArray();
+            var transportRequest = _translator.ToExchangeBatchRequest(batch.Key, requests);
+            var response = await _send(transportRequest, batch.AuthRequired, CancellationToken.None).ConfigureAwait(false);
+
+            if (response.StatusCode >= 400)
+                throw new ConnectorException(
+                    $"REST batch {batch.Key} failed with status {response.StatusCode}",
+                    response.StatusCode,
+                    response.Body);
+
+            var results = _translator.FromExchangeBatchResponse(batch.Key, requests, response);
+            for (int i = 0; i < items.Count; i++)
+            {
+                if (results[i] is Exception error)
+                    items[i].Completion.TrySetException(error);
+                else
+                    items[i].Completion.TrySetResult(results[i]);
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "REST batch {Key} of {Count} failed", batch.Key, items.Count);
+            foreach (var item in items)
+                item.Completion.TrySetException(ex);
+        }
+    }
+
+    private void Record(string key, List<Item> items, long sentAt)
+    {
+        Interlocked.Increment(ref _batches);
+        Interlocked.Add(ref _requests, items.Count);
+        Interlocked.Increment(ref _sizes[Math.Min(items.Count, _sizes.Length - 1)]);
+
+        long maxDelay = 0;
+        foreach (var item in items)
+        {
+            var delay = sentAt - item.EnqueuedAt;
+            Interlocked.Add(ref _delayTicks, delay);
+            maxDelay = Math.Max(maxDelay, delay);
+        }
+
+        long seen;
+        while (maxDelay > (seen = Interlocked.Read(ref _maxDelayTicks))
+               && Interlocked.CompareExchange(ref _maxDelayTicks, maxDelay, seen) != seen)
+        {
+        }
+
+        _logger.LogDebug("REST batch {Key}: {Count} requests, oldest queued {Delay}",
+            key, items.Count, Stopwatch.GetElapsedTime(0, maxDelay));
+    }
+
+    private sealed class Batch(string key)
+    {
+        public string Key { get; } = key;
+        public List<Item> Items { get; } = [];
+        public bool AuthRequired { get; set; }
+    }
+
+    private sealed class Item(object request, long enqueuedAt)
+    {
+        public object Request { get; } = request;
+        public long EnqueuedAt { get; } = enqueuedAt;
+        public TaskCompletionSource<object> Completion { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+    }
+}
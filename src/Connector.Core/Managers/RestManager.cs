@@ -1,11 +1,13 @@
 using Connector.Core.Abstractions;
 using Connector.Core.Contracts;
+using Connector.Core.Transport;
 using Microsoft.Extensions.Logging;
 
 namespace Connector.Core.Managers;
 
 /// <summary>
 /// Manages REST request execution with translation, auth, and rate limiting.
+/// Idempotent requests are coalesced and, when the translator sets a TTL, cached.
 /// </summary>
 public sealed class RestManager
 {
@@ -14,42 +16,63 @@ public sealed class RestManager
     private readonly IAuthProvider _authProvider;
     private readonly IRateLimiter? _rateLimiter;
     private readonly ILogger<RestManager> _logger;
+    private readonly RestResponseCache _cache = new();
+    private readonly RestBatcher? _batcher;
 
+    /// <param name="batching">
+    /// Opt-in micro-batching of orders, cancels and modifies into one exchange action per
+    /// window. Requires a translator that implements <see cref="IRestBatchTranslator"/>.
+    /// </param>
     public RestManager(
         IRestTransport transport,
         IRestTranslator translator,
         IAuthProvider authProvider,
         ILogger<RestManager> logger,
-        IRateLimiter? rateLimiter = null)
+        IRateLimiter? rateLimiter = null,
+        RestBatchingOptions? batching = null)
     {
         _transport = transport;
         _translator = translator;
         _authProvider = authProvider;
         _rateLimiter = rateLimiter;
         _logger = logger;
+
+        if (batching is not null)
+        {
+            if (translator is not IRestBatchTranslator batchTranslator)
+                throw new ArgumentException($"{translator.GetType().Name} does not support batching", nameof(batching));
+            _batcher = new RestBatcher(batching, batchTranslator, SendBatchAsync, logger);
+        }
     }
 
+    /// <summary>Batching counters, or <c>null</c> when batching is off.</summary>
+    public RestBatchStats? GetBatchStats() => _batcher?.GetStats();
+
     public async Task<TResponse> ExecuteAsync<TResponse>(
         UnifiedRestRequest<TResponse> request,
         CancellationToken ct)
     {
-        if (_rateLimiter is not null)
-            await _rateLimiter.WaitAsync(ct);
+        if (request.AuthRequired && !_authProvider.IsAuthenticated)
+            throw new InvalidOperationException(
+                $"Auth required for {request.Operation} but no auth provider configured");
+
+        // Validated alone so one bad item can't sink a batch; the batch body is built once on send
+        if (_batcher is not null && _translator is IRestBatchTranslator batchTranslator
+            && batchTranslator.GetBatchKey(request) is { } batchKey)
+        {
+            batchTranslator.Validate(request);
+            return (TResponse)await _batcher.EnqueueAsync(batchKey, request, request.AuthRequired, ct);
+        }
 
         var transportRequest = _translator.ToExchangeRequest(request);
 
         if (request.AuthRequired)
-        {
-            if (!_authProvider.IsAuthenticated)
-                throw new InvalidOperationException(
-                    $"Auth required for {request.Operation} but no auth provider configured");
-
             _authProvider.ApplyRestAuth(transportRequest);
-        }
 
-        _logger.LogDebug("REST {Method} {Path}", transportRequest.Method, transportRequest.Path);
-
-        var response = await _transport.SendAsync(transportRequest, ct);
+        // Identical reads share one send; cached ones skip the rate limiter entirely
+        var response = transportRequest.IsIdempotent
+            ? await _cache.GetOrSendAsync(transportRequest, SendAsync, ct)
+            : await SendAsync(transportRequest, ct);
 
         if (response.StatusCode >= 400)
         {
@@ -60,6 +83,34 @@ public sealed class RestManager
                 response.Body);
         }
 
-        return _translator.FromExchangeResponse(request, response);
+        var result = _translator.FromExchangeResponse(request, response);
+
+        // Keep the per-user budget in line with what the exchange reports
+        if (result is GetUserRateLimitResponse limit
+            && _rateLimiter is HierarchicalRateLimiter hierarchical
+            && request.Params?.GetValueOrDefault("user") is { } user)
+        {
+            hierarchical.UpdateUserLimit(user, limit);
+        }
+
+        return result;
+    }
+
+    /// <summary>Auth is applied once for the whole batch.</summary>
+    private Task<TransportRestResponse> SendBatchAsync(TransportRestRequest transportRequest, bool authRequired, CancellationToken ct)
+    {
+        if (authRequired)
+            _authProvider.ApplyRestAuth(transportRequest);
+        return SendAsync(transportRequest, ct);
+    }
+
+    private async Task<TransportRestResponse> SendAsync(TransportRestRequest transportRequest, CancellationToken ct)
+    {
+        if (_rateLimiter is not null)
+            await _rateLimiter.WaitAsync(transportRequest.Cost, ct);
+
+        _logger.LogDebug("REST {Method} {Path}", transportRequest.Method, transportRequest.Path);
+
+        return await _transport.SendAsync(transportRequest, ct);
     }
 }
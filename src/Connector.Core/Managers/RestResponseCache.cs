@@ -0,0 +1,179 @@
+using System.Diagnostics;
+using Connector.Core.Transport;
+
+namespace Connector.Core.Managers;
+
+/// <summary>
+/// Single-flight and TTL cache for idempotent REST requests, keyed on the exchange-native
+/// request. Concurrent identical requests share one send. Responses with a
+/// <see cref="TransportRestRequest.CacheTtl"/> are reused until they expire and refreshed in
+/// the background once <see cref="RefreshAfter"/> of the TTL has passed, so steady callers
+/// never wait on the network. Expired entries are swept out as requests come in, so
+/// per-user keys do not accumulate.
+/// </summary>
+internal sealed class RestResponseCache
+{
+    /// <summary>Fraction of the TTL after which a hit starts a background refresh.</summary>
+    public const double RefreshAfter = 0.75;
+
+    /// <summary>Minimum time between sweeps of expired entries.</summary>
+    public static readonly TimeSpan SweepInterval = TimeSpan.FromSeconds(10);
+
+    private readonly Dictionary<RequestKey, Entry> _entries = [];
+    private readonly object _lock = new();
+    private long _nextSweep = Stopwatch.GetTimestamp();
+
+    public async Task<TransportRestResponse> GetOrSendAsync(
+        TransportRestRequest request,
+        Func<TransportRestRequest, CancellationToken, Task<TransportRestResponse>> send,
+        CancellationToken ct)
+    {
+        var key = new RequestKey(request);
+        var now = Stopwatch.GetTimestamp();
+        TransportRestResponse? cached = null;
+        TaskCompletionSource<TransportRestResponse>? started = null;
+        Task<TransportRestResponse>? pending = null;
+        Entry entry;
+
+        lock (_lock)
+        {
+            if (now >= _nextSweep)
+                Sweep(now);
+
+            if (!_entries.TryGetValue(key, out entry!))
+                _entries[key] = entry = new Entry();
+
+            if (entry.Value is not null && now < entry.ExpiresAt)
+            {
+                cached = entry.Value;
+                if (now >= entry.RefreshAt && entry.InFlight is null)
+                    started = entry.InFlight = NewCompletion();
+            }
+            else
+            {
+                if (entry.InFlight is null)
+                    started = entry.InFlight = NewCompletion();
+                pending = entry.InFlight.Task;
+            }
+        }
+
+        // The shared send must outlive any one caller; each caller only stops waiting
+        if (started is not null)
+            _ = RunAsync(key, entry, started, request, send);
+
+        if (cached is not null)
+        {
+            // Nobody awaits a background refresh; keep its failure from going unobserved
+            started?.Task.ContinueWith(static t => _ = t.Exception,
+                TaskContinuationOptions.OnlyOnFaulted | TaskContinuationOptions.ExecuteSynchronously);
+            return cached;
+        }
+
+        return await pending!.WaitAsync(ct);
+    }
+
+    private async Task RunAsync(
+        RequestKey key,
+        Entry entry,
+        TaskCompletionSource<TransportRestResponse> completion,
+        TransportRestRequest request,
+        Func<TransportRestRequest, CancellationToken, Task<TransportRestResponse>> send)
+    {
+        TransportRestResponse? response = null;
+        Exception? error = null;
+        try
+        {
+            response = await send(request, CancellationToken.None);
+        }
+        catch (Exception ex)
+        {
+            error = ex;
+        }
+
+        lock (_lock)
+        {
+            entry.InFlight = null;
+            if (response is { StatusCode: < 400 } && request.CacheTtl > TimeSpan.Zero)
+            {
+                var now = Stopwatch.GetTimestamp();
+                var ttlTicks = (long)(request.CacheTtl.TotalSeconds * Stopwatch.Frequency);
+                entry.Value = response;
+                entry.RefreshAt = now + (long)(ttlTicks * RefreshAfter);
+                entry.ExpiresAt = now + ttlTicks;
+            }
+            else if (entry.Value is null)
+            {
+                // Failed refreshes keep serving the previous response until it expires
+                _entries.Remove(key);
+            }
+        }
+
+        if (error is not null)
+            completion.TrySetException(error);
+        else
+            completion.TrySetResult(response!);
+    }
+
+    /// <summary>Drops expired entries nobody is refreshing; caller holds the lock.</summary>
+    private void Sweep(long now)
+    {
+        _nextSweep = now + (long)(SweepInterval.TotalSeconds * Stopwatch.Frequency);
+        foreach (var (key, entry) in _entries)
+        {
+            if (entry.InFlight is null && now >= entry.ExpiresAt)
+                _entries.Remove(key);
+        }
+    }
+
+    private static TaskCompletionSource<TransportRestResponse> NewCompletion() =>
+        new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+    /// <summary>
+    /// Method, path, sorted query and the UTF-8 body as sent. The body bytes are hashed once
+    /// and compared byte for byte, so no key string is built per request.
+    /// </summary>
+    private readonly struct RequestKey : IEquatable<RequestKey>
+    {
+        private readonly HttpMethod _method;
+        private readonly string _path;
+        private readonly string? _query;
+        private readonly ReadOnlyMemory<byte> _body;
+        private readonly int _hash;
+
+        public RequestKey(TransportRestRequest request)
+        {
+            _method = request.Method;
+            _path = request.Path;
+            _query = request.QueryParams is { Count: > 0 } q
+                ? string.Join("&", q.OrderBy(kv => kv.Key, StringComparer.Ordinal).Select(kv => $"{kv.Key}={kv.Value}"))
+                : null;
+            _body = request.Utf8Body ?? ReadOnlyMemory<byte>.Empty;
+
+            var hash = new HashCode();
+            hash.Add(_method);
+            hash.Add(_path, StringComparer.Ordinal);
+            hash.Add(_query, StringComparer.Ordinal);
+            hash.AddBytes(_body.Span);
+            _hash = hash.ToHashCode();
+        }
+
+        public bool Equals(RequestKey other) =>
+            _hash == other._hash
+            && _method == other._method
+            && string.Equals(_path, other._path, StringComparison.Ordinal)
+            && string.Equals(_query, other._query, StringComparison.Ordinal)
+            && _body.Span.SequenceEqual(other._body.Span);
+
+        public override bool Equals(object? obj) => obj is RequestKey other && Equals(other);
+
+        public override int GetHashCode() => _hash;
+    }
+
+    private sealed class Entry
+    {
+        public TransportRestResponse? Value;
+        public long RefreshAt;
+        public long ExpiresAt;
+        public TaskCompletionSource<TransportRestResponse>? InFlight;
+    }
+}
@@ -1,25 +1,38 @@
+using System.Diagnostics;
 using System.Threading.Channels;
 using Connector.Core.Abstractions;
+using Connector.Core.Books;
 using Connector.Core.Contracts;
+using Connector.Core.Diagnostics;
 using Microsoft.Extensions.Logging;
 
 namespace Connector.Core.Managers;
 
 /// <summary>
 /// Manages WebSocket lifecycle: connect, subscribe, translate, fanout events.
-/// Per-subscription ordering via Channel&lt;T&gt; per subscription key.
+/// Per-subscription ordering via Channel&lt;T&gt; per (channel, symbol) key, each with its
+/// own capacity and overflow policy (see <see cref="WsFanoutOptions"/>). Stage latencies and
+/// per-key counters are reported to <see cref="Metrics"/>.
 /// </summary>
 public sealed class WebSocketManager : IAsyncDisposable
 {
+    private static readonly TimeSpan ParseLogInterval = TimeSpan.FromSeconds(10);
+
     private readonly IWsTransport _transport;
     private readonly IWsTranslator _translator;
     private readonly IAuthProvider _authProvider;
     private readonly IRateLimiter? _rateLimiter;
     private readonly ILogger<WebSocketManager> _logger;
-    private readonly Channel<UnifiedWsEvent> _outputChannel;
+    private readonly OrderBookStore? _orderBooks;
+    private readonly WsEventRouter _router;
+    private readonly Func<IReadOnlyList<WsRouteStats>> _routeStats;
     private readonly CancellationTokenSource _cts = new();
     private Task? _receiveLoop;
     private bool _started;
+    private TradeDrain? _tradeDrain;
+    private BookDrain? _bookDrain;
+    private long _parseFailuresSuppressed;
+    private long _lastParseLogAt;
 
     public WebSocketManager(
         IWsTransport transport,
@@ -27,22 +40,27 @@ public sealed class WebSocketManager : IAsyncDisposable
         IAuthProvider authProvider,
         ILogger<WebSocketManager> logger,
         IRateLimiter? rateLimiter = null,
-        int channelCapacity = 10_000)
+        int channelCapacity = 10_000,
+        OrderBookStore? orderBooks = null,
+        WsFanoutOptions? fanout = null,
+        ConnectorMetrics? metrics = null)
     {
         _transport = transport;
         _translator = translator;
         _authProvider = authProvider;
         _rateLimiter = rateLimiter;
         _logger = logger;
-        _outputChannel = Channel.CreateBounded<UnifiedWsEvent>(
-            new BoundedChannelOptions(channelCapacity)
-            {
-                FullMode = BoundedChannelFullMode.DropOldest,
-                SingleReader = false,
-                SingleWriter = false
-            });
+        _orderBooks = orderBooks;
+        Metrics = metrics ?? ConnectorMetrics.Shared;
+        fanout ??= new WsFanoutOptions { DefaultCapacity = channelCapacity };
+        _router = new WsEventRouter(orderBooks is null ? fanout : fanout.WithBookDeltas(),
+            OnEventDropped, Metrics.RecordDequeued);
+        _routeStats = _router.GetStats;
     }
 
+    /// <summary>Where this manager reports latencies and counters; <see cref="ConnectorMetrics.Shared"/> by default.</summary>
+    public ConnectorMetrics Metrics { get; }
+
     public async Task StartAsync(Uri wsUri, CancellationToken ct)
     {
         if (_started) return;
@@ -61,6 +79,7 @@ public sealed class WebSocketManager : IAsyncDisposable
             }
         }
 
+        Metrics.Register(_routeStats);
         _receiveLoop = Task.Run(() => ReceiveLoopAsync(_cts.Token), _cts.Token);
         _logger.LogInformation("WebSocket manager started");
     }
@@ -85,7 +104,7 @@ public sealed class WebSocketManager : IAsyncDisposable
             catch (OperationCanceledException) { }
         }
 
-        _outputChannel.Writer.TryComplete();
+        _router.Complete();
         _logger.LogInformation("WebSocket manager stopped");
     }
 
@@ -95,7 +114,7 @@ public sealed class WebSocketManager : IAsyncDisposable
         foreach (var msg in messages)
         {
             if (_rateLimiter is not null)
-                await _rateLimiter.WaitAsync(ct);
+                await _rateLimiter.WaitAsync(msg.Cost, ct);
 
             await _transport.SendAsync(msg, ct);
             _logger.LogDebug("Sent subscribe for {Channel} {Symbols}", request.Channel, request.Symbols);
@@ -108,13 +127,72 @@ public sealed class WebSocketManager : IAsyncDisposable
         foreach (var msg in messages)
         {
             if (_rateLimiter is not null)
-                await _rateLimiter.WaitAsync(ct);
+                await _rateLimiter.WaitAsync(msg.Cost, ct);
 
             await _transport.SendAsync(msg, ct);
         }
+
+        if (_orderBooks is not null && request.Channel == UnifiedWsChannel.OrderBookL2)
+        {
+            foreach (var symbol in request.Symbols)
+                _orderBooks.Remove(symbol);
+        }
     }
 
-    public ChannelReader<UnifiedWsEvent> GetEventReader() => _outputChannel.Reader;
+    /// <summary>
+    /// Events for every key without a dedicated reader, taken round-robin across keys.
+    /// </summary>
+    public ChannelReader<UnifiedWsEvent> GetEventReader() => _router.Shared;
+
+    /// <summary>
+    /// Dedicated, ordered reader for one (channel, symbol) key. The key is removed from
+    /// <see cref="GetEventReader()"/>. Private channels are keyed by channel only, so
+    /// <paramref name="symbol"/> is ignored for them.
+    /// </summary>
+    public ChannelReader<UnifiedWsEvent> GetEventReader(UnifiedWsChannel channel, string symbol) =>
+        _router.Dedicate(WsEventKey.For(channel, symbol));
+
+    /// <summary>
+    /// Merged reader for every symbol of <paramref name="channel"/> that has no key-dedicated
+    /// reader. The channel is removed from <see cref="GetEventReader()"/>.
+    /// </summary>
+    public ChannelReader<UnifiedWsEvent> GetEventReader(UnifiedWsChannel channel) =>
+        _router.Dedicate(channel);
+
+    /// <summary>Published/dropped/conflated counters and queue depth per key.</summary>
+    public IReadOnlyList<WsRouteStats> GetRouteStats() => _router.GetStats();
+
+    // ─── Columnar drain ─────────────────────────────────
+
+    /// <summary>Ids used by the <c>SymbolId</c> column of drained rows.</summary>
+    public SymbolRegistry Symbols { get; } = new();
+
+    /// <summary>
+    /// Blocks up to <paramref name="timeout"/> for trades, then writes up to
+    /// <paramref name="maxCount"/> trade rows into <paramref name="columns"/> and returns the
+    /// row count. The first call takes the trades channel out of <see cref="GetEventReader()"/>.
+    /// </summary>
+    public int DrainTrades(TradeColumns columns, int maxCount, TimeSpan timeout)
+    {
+        var drain = LazyInitializer.EnsureInitialized(ref _tradeDrain,
+            () => new TradeDrain(GetEventReader(UnifiedWsChannel.Trades), Symbols));
+        return drain.Drain(columns, maxCount, timeout);
+    }
+
+    /// <summary>
+    /// Like <see cref="DrainTrades"/> for L1 and L2 book events, one row per price level.
+    /// </summary>
+    public int DrainBooks(BookColumns columns, int maxCount, TimeSpan timeout)
+    {
+        var drain = LazyInitializer.EnsureInitialized(ref _bookDrain,
+            () => new BookDrain(GetEventReader(UnifiedWsChannel.OrderBookL1), GetEventReader(UnifiedWsChannel.OrderBookL2), Symbols));
+        return drain.Drain(columns, maxCount, timeout);
+    }
+
+    /// <summary>
+    /// Local books maintained from L2 traffic, or <c>null</c> when L2 events are passed through as-is.
+    /// </summary>
+    public OrderBookStore? OrderBooks => _orderBooks;
 
     private async Task ReceiveLoopAsync(CancellationToken ct)
     {
@@ -122,6 +200,7 @@ public sealed class WebSocketManager : IAsyncDisposable
         {
             await foreach (var inbound in _transport.ReceiveAsync(ct))
             {
+                var receivedAt = inbound.ReceivedTimestamp != 0 ? inbound.ReceivedTimestamp : Stopwatch.GetTimestamp();
                 List<UnifiedWsEvent> events;
                 try
                 {
@@ -130,16 +209,35 @@ public sealed class WebSocketManager : IAsyncDisposable
                 }
                 catch (Exception ex)
                 {
-                    _logger.LogWarning(ex, "Failed to translate inbound message");
+                    OnParseFailure(ex);
+                    continue;
+                }
+
+                if (events.Count == 0)
+                {
+                    Metrics.RecordUnrouted();
                     continue;
                 }
 
-                foreach (var evt in events)
+                var translatedAt = Stopwatch.GetTimestamp();
+                var first = events[0];
+                Metrics.RecordTranslate(first.Channel, translatedAt - receivedAt);
+                if (ConnectorMetrics.ExchangeTime(first) is { } exchangeTime)
+                    Metrics.RecordWire(first.Channel, inbound.ReceivedAt - exchangeTime);
+
+                var messageBytes = inbound.Utf8Payload.Length;
+                foreach (var translated in events)
                 {
-                    if (!_outputChannel.Writer.TryWrite(evt))
+                    var evt = translated;
+                    if (_orderBooks is not null && evt is OrderBookL2Event book)
                     {
-                        _logger.LogWarning("Output channel full, dropping oldest event");
+                        evt = _orderBooks.Apply(book);
+                        if (evt is null) continue;
                     }
+
+                    evt.TranslatedTimestamp = translatedAt;
+                    _router.Publish(evt, messageBytes);
+                    messageBytes = 0;
                 }
             }
         }
@@ -150,13 +248,41 @@ public sealed class WebSocketManager : IAsyncDisposable
         }
         finally
         {
-            _outputChannel.Writer.TryComplete();
+            _router.Complete();
+        }
+    }
+
+    /// <summary>
+    /// Counts every failure but logs at most one warning per interval, so a burst of bad
+    /// frames does not turn logging into the bottleneck.
+    /// </summary>
+    private void OnParseFailure(Exception ex)
+    {
+        Metrics.RecordParseFailure();
+        var now = Stopwatch.GetTimestamp();
+        if (_lastParseLogAt != 0 && Stopwatch.GetElapsedTime(_lastParseLogAt, now) < ParseLogInterval)
+        {
+            _parseFailuresSuppressed++;
+            return;
         }
+
+        _logger.LogWarning(ex, "Failed to translate inbound message ({Suppressed} similar failures suppressed)",
+            _parseFailuresSuppressed);
+        _lastParseLogAt = now;
+        _parseFailuresSuppressed = 0;
+    }
+
+    private void OnEventDropped(UnifiedWsEvent evt)
+    {
+        // A consumer that missed a book update can't apply later deltas; resync it.
+        if (_orderBooks is not null && evt is OrderBookL2Event or OrderBookL2DeltaEvent)
+            _orderBooks.RequestSnapshot(evt.Symbol);
     }
 
     public async ValueTask DisposeAsync()
     {
         await StopAsync();
+        Metrics.Unregister(_routeStats);
         _cts.Dispose();
         await _transport.DisposeAsync();
     }
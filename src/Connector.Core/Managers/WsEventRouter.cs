@@ -0,0 +1,284 @@
+using System.Collections.Concurrent;
+using System.Threading.Channels;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Managers;
+
+/// <summary>
+/// Fans translated events out to one queue per <see cref="WsEventKey"/>, each with its own
+/// overflow policy. Every key is owned by exactly one reader: a key-dedicated reader
+/// (<see cref="Dedicate(WsEventKey)"/>), a channel reader (<see cref="Dedicate(UnifiedWsChannel)"/>)
+/// or the <see cref="Shared"/> reader. Merged readers drain their keys round-robin, so a busy
+/// book stream cannot evict or starve fills and order updates. Every reader reports each event
+/// it hands out to the dequeue callback.
+/// </summary>
+internal sealed class WsEventRouter
+{
+    private readonly WsFanoutOptions _options;
+    private readonly Action<UnifiedWsEvent>? _onDropped;
+    private readonly Action<UnifiedWsEvent>? _onDequeued;
+    private readonly ConcurrentDictionary<WsEventKey, Route> _routes = new();
+    private readonly Dictionary<UnifiedWsChannel, MergedReader> _channelReaders = [];
+    private readonly MergedReader _shared;
+    private readonly object _gate = new();
+    private bool _completed;
+
+    public WsEventRouter(
+        WsFanoutOptions options,
+        Action<UnifiedWsEvent>? onDropped = null,
+        Action<UnifiedWsEvent>? onDequeued = null)
+    {
+        _options = options;
+        _onDropped = onDropped;
+        _onDequeued = onDequeued;
+        _shared = new MergedReader(onDequeued);
+    }
+
+    public ChannelReader<UnifiedWsEvent> Shared => _shared;
+
+    /// <param name="messageBytes">
+    /// Payload size of the inbound message when <paramref name="evt"/> is its first event;
+    /// zero for the rest, so each message is counted once.
+    /// </param>
+    public void Publish(UnifiedWsEvent evt, int messageBytes = 0)
+    {
+        var route = GetRoute(WsEventKey.For(evt.Channel, evt.Symbol));
+        if (messageBytes > 0)
+        {
+            Interlocked.Increment(ref route.Messages);
+            Interlocked.Add(ref route.Bytes, messageBytes);
+        }
+
+        if (!route.Writer.TryWrite(evt)) return;
+
+        Interlocked.Increment(ref route.Published);
+        route.Owner?.Signal();
+    }
+
+    /// <summary>
+    /// Gives <paramref name="key"/> its own reader. Events already queued for the key stay with it.
+    /// </summary>
+    public ChannelReader<UnifiedWsEvent> Dedicate(WsEventKey key)
+    {
+        var route = GetRoute(key);
+        lock (_gate)
+        {
+            route.Owner?.Remove(route);
+            route.Owner = null;
+        }
+        return route.Consumer;
+    }
+
+    /// <summary>
+    /// Moves every key of <paramref name="channel"/> that is not individually dedicated,
+    /// including keys seen later, from the shared reader to one merged channel reader.
+    /// </summary>
+    public ChannelReader<UnifiedWsEvent> Dedicate(UnifiedWsChannel channel)
+    {
+        lock (_gate)
+        {
+            if (_channelReaders.TryGetValue(channel, out var reader)) return reader;
+
+            reader = new MergedReader(_onDequeued);
+            foreach (var route in _routes.Values)
+            {
+                if (route.Key.Channel != channel || route.Owner != _shared) continue;
+                _shared.Remove(route);
+                reader.Add(route);
+                route.Owner = reader;
+            }
+            if (_completed) reader.Complete();
+            _channelReaders[channel] = reader;
+            return reader;
+        }
+    }
+
+    public IReadOnlyList<WsRouteStats> GetStats() =>
+        _routes.Values.Select(r => new WsRouteStats
+        {
+            Key = r.Key,
+            Policy = r.Policy,
+            Messages = Interlocked.Read(ref r.Messages),
+            Bytes = Interlocked.Read(ref r.Bytes),
+            Published = Interlocked.Read(ref r.Published),
+            Dropped = Interlocked.Read(ref r.Dropped),
+            Conflated = Interlocked.Read(ref r.Conflated),
+            Depth = r.Reader.Count,
+            Dedicated = r.Owner != _shared
+        }).ToArray();
+
+    public void Complete()
+    {
+        lock (_gate)
+        {
+            if (_completed) return;
+            _completed = true;
+
+            foreach (var route in _routes.Values)
+                route.Writer.TryComplete();
+            _shared.Complete();
+            foreach (var reader in _channelReaders.Values)
+                reader.Complete();
+        }
+    }
+
+    private Route GetRoute(WsEventKey key)
+    {
+        if (_routes.TryGetValue(key, out var route)) return route;
+
+        lock (_gate)
+        {
+            if (_routes.TryGetValue(key, out route)) return route;
+
+            route = new Route(key, _options.Resolve(key), _onDropped, _onDequeued);
+            if (_completed) route.Writer.TryComplete();
+            route.Owner = _channelReaders.GetValueOrDefault(key.Channel) ?? _shared;
+            route.Owner.Add(route);
+            _routes[key] = route;
+            return route;
+        }
+    }
+
+    private sealed class Route
+    {
+        private readonly Channel<UnifiedWsEvent> _channel;
+        public long Messages;
+        public long Bytes;
+        public long Published;
+        public long Dropped;
+        public long Conflated;
+        public volatile MergedReader? Owner;
+
+        public Route(WsEventKey key, WsRouteOptions options, Action<UnifiedWsEvent>? onDropped, Action<UnifiedWsEvent>? onDequeued)
+        {
+            Key = key;
+            Policy = options.Policy;
+            _channel = options.Policy switch
+            {
+                WsOverflowPolicy.NeverDrop => Channel.CreateUnbounded<UnifiedWsEvent>(
+                    new UnboundedChannelOptions { SingleWriter = true }),
+                WsOverflowPolicy.Conflate => Channel.CreateBounded<UnifiedWsEvent>(
+                    new BoundedChannelOptions(1) { FullMode = BoundedChannelFullMode.DropOldest, SingleWriter = true },
+                    evicted =>
+                    {
+                        Interlocked.Increment(ref Conflated);
+                        onDropped?.Invoke(evicted);
+                    }),
+                _ => Channel.CreateBounded<UnifiedWsEvent>(
+                    new BoundedChannelOptions(Math.Max(1, options.Capacity)) { FullMode = BoundedChannelFullMode.DropOldest, SingleWriter = true },
+                    evicted =>
+                    {
+                        Interlocked.Increment(ref Dropped);
+                        onDropped?.Invoke(evicted);
+                    })
+            };
+            Consumer = onDequeued is null ? _channel.Reader : new ObservedReader(_channel.Reader, onDequeued);
+        }
+
+        public WsEventKey Key { get; }
+        public WsOverflowPolicy Policy { get; }
+        public ChannelWriter<UnifiedWsEvent> Writer => _channel.Writer;
+        public ChannelReader<UnifiedWsEvent> Reader => _channel.Reader;
+
+        /// <summary>What a key-dedicated consumer reads from.</summary>
+        public ChannelReader<UnifiedWsEvent> Consumer { get; }
+    }
+
+    /// <summary>Reports every event read from a dedicated key to the dequeue callback.</summary>
+    private sealed class ObservedReader(ChannelReader<UnifiedWsEvent> inner, Action<UnifiedWsEvent> onDequeued)
+        : ChannelReader<UnifiedWsEvent>
+    {
+        public override Task Completion => inner.Completion;
+
+        public override bool CanCount => inner.CanCount;
+
+        public override int Count => inner.Count;
+
+        public override bool TryRead(out UnifiedWsEvent item)
+        {
+            if (!inner.TryRead(out item!)) return false;
+            onDequeued(item);
+            return true;
+        }
+
+        public override ValueTask<bool> WaitToReadAsync(CancellationToken cancellationToken = default) =>
+            inner.WaitToReadAsync(cancellationToken);
+    }
+
+    /// <summary>
+    /// Merged view over a set of keys. Reads rotate across keys so one hot key cannot
+    /// monopolise the consumer; order within a key is preserved. Safe for several consumers:
+    /// the one-slot wake-up signal is passed on while events remain queued.
+    /// </summary>
+    private sealed class MergedReader(Action<UnifiedWsEvent>? onDequeued) : ChannelReader<UnifiedWsEvent>
+    {
+        private readonly Channel<byte> _signal = Channel.CreateBounded<byte>(
+            new BoundedChannelOptions(1) { FullMode = BoundedChannelFullMode.DropWrite });
+        private readonly TaskCompletionSource _completion = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        private Route[] _routes = [];
+        private int _cursor;
+
+        public override Task Completion => _completion.Task;
+
+        public override bool CanCount => true;
+
+        public override int Count => Volatile.Read(ref _routes).Sum(r => r.Reader.Count);
+
+        public void Add(Route route)
+        {
+            Volatile.Write(ref _routes, [.. _routes, route]);
+            Signal();
+        }
+
+        public void Remove(Route route) =>
+            Volatile.Write(ref _routes, _routes.Where(r => r != route).ToArray());
+
+        public void Signal() => _signal.Writer.TryWrite(0);
+
+        public void Complete()
+        {
+            _signal.Writer.TryComplete();
+            Task.WhenAll(_routes.Select(r => r.Reader.Completion))
+                .ContinueWith(_ => _completion.TrySetResult(), TaskScheduler.Default);
+        }
+
+        public override bool TryRead(out UnifiedWsEvent item)
+        {
+            var routes = Volatile.Read(ref _routes);
+            var start = (uint)Interlocked.Increment(ref _cursor);
+            for (int i = 0; i < routes.Length; i++)
+            {
+                if (routes[(start + i) % routes.Length].Reader.TryRead(out item!))
+                {
+                    onDequeued?.Invoke(item);
+                    return true;
+                }
+            }
+            item = null!;
+            return false;
+        }
+
+        public override async ValueTask<bool> WaitToReadAsync(CancellationToken cancellationToken = default)
+        {
+            while (true)
+            {
+                if (HasItems()) return true;
+                if (!await _signal.Reader.WaitToReadAsync(cancellationToken))
+                    return HasItems();
+
+                // Writes into a full signal are dropped, so hand the wake-up on to the next waiter
+                if (_signal.Reader.TryRead(out _) && HasItems())
+                    Signal();
+            }
+        }
+
+        private bool HasItems()
+        {
+            foreach (var route in Volatile.Read(ref _routes))
+            {
+                if (route.Reader.Count > 0) return true;
+            }
+            return false;
+        }
+    }
+}
@@ -0,0 +1,112 @@
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Managers;
+
+/// <summary>
+/// What a per-key event queue does when its consumer falls behind.
+/// </summary>
+public enum WsOverflowPolicy
+{
+    /// <summary>Unbounded; every event is kept. Used for private account streams.</summary>
+    NeverDrop,
+
+    /// <summary>Bounded; the oldest queued event is evicted to make room.</summary>
+    DropOldest,
+
+    /// <summary>Keeps only the latest event per key. Used for state-like market data.</summary>
+    Conflate
+}
+
+/// <summary>
+/// Fan-out key for one ordered event stream. Private channels are keyed by channel only
+/// (<see cref="AllSymbols"/>) so account events keep their relative order across coins.
+/// </summary>
+public readonly record struct WsEventKey(UnifiedWsChannel Channel, string Symbol)
+{
+    public const string AllSymbols = "*";
+
+    public static WsEventKey For(UnifiedWsChannel channel, string symbol) =>
+        IsPrivate(channel) ? new(channel, AllSymbols) : new(channel, symbol);
+
+    public static bool IsPrivate(UnifiedWsChannel channel) => channel >= UnifiedWsChannel.UserOrders;
+
+    public override string ToString() => $"{Channel}:{Symbol}";
+}
+
+public sealed class WsRouteOptions
+{
+    public required WsOverflowPolicy Policy { get; init; }
+
+    /// <summary>Queue bound for <see cref="WsOverflowPolicy.DropOldest"/>; ignored by the other policies.</summary>
+    public int Capacity { get; init; } = 10_000;
+}
+
+/// <summary>
+/// Per-key queue configuration for <see cref="WebSocketManager"/>. Lookup order is
+/// <see cref="Keys"/>, then <see cref="Channels"/>, then the built-in defaults:
+/// never drop for private channels, conflate for L1/L2/allMids/assetCtx,
+/// drop-oldest at <see cref="DefaultCapacity"/> for trades and candles.
+/// </summary>
+public sealed class WsFanoutOptions
+{
+    public int DefaultCapacity { get; init; } = 10_000;
+    public Dictionary<UnifiedWsChannel, WsRouteOptions> Channels { get; init; } = [];
+    public Dictionary<WsEventKey, WsRouteOptions> Keys { get; init; } = [];
+
+    /// <summary>
+    /// L2 carries deltas from an <see cref="Books.OrderBookStore"/>. Each delta depends on the
+    /// one before, so L2 then defaults to drop-oldest instead of conflate; a drop triggers a
+    /// fresh snapshot. Set by <see cref="WebSocketManager"/> when it is given a store.
+    /// </summary>
+    public bool BookDeltas { get; init; }
+
+    /// <summary>
+    /// Every channel never drops. For replays and tests, where the source can outrun any
+    /// consumer and each recorded event matters.
+    /// </summary>
+    public static WsFanoutOptions Lossless() => new()
+    {
+        Channels = Enum.GetValues<UnifiedWsChannel>()
+            .ToDictionary(c => c, _ => new WsRouteOptions { Policy = WsOverflowPolicy.NeverDrop })
+    };
+
+    internal WsFanoutOptions WithBookDeltas() => BookDeltas
+        ? this
+        : new() { DefaultCapacity = DefaultCapacity, Channels = Channels, Keys = Keys, BookDeltas = true };
+
+    public WsRouteOptions Resolve(WsEventKey key)
+    {
+        if (Keys.TryGetValue(key, out var options)) return options;
+        if (Channels.TryGetValue(key.Channel, out options)) return options;
+
+        return key.Channel switch
+        {
+            _ when WsEventKey.IsPrivate(key.Channel) => new WsRouteOptions { Policy = WsOverflowPolicy.NeverDrop },
+            UnifiedWsChannel.OrderBookL2 when BookDeltas
+                => new WsRouteOptions { Policy = WsOverflowPolicy.DropOldest, Capacity = DefaultCapacity },
+            UnifiedWsChannel.OrderBookL1 or UnifiedWsChannel.OrderBookL2
+                or UnifiedWsChannel.AllMids or UnifiedWsChannel.ActiveAssetCtx
+                => new WsRouteOptions { Policy = WsOverflowPolicy.Conflate, Capacity = 1 },
+            _ => new WsRouteOptions { Policy = WsOverflowPolicy.DropOldest, Capacity = DefaultCapacity }
+        };
+    }
+}
+
+/// <summary>
+/// Point-in-time counters for one fan-out key.
+/// </summary>
+public sealed class WsRouteStats
+{
+    public required WsEventKey Key { get; init; }
+    public required WsOverflowPolicy Policy { get; init; }
+
+    /// <summary>Inbound messages whose first event went to this key, and their payload bytes.</summary>
+    public required long Messages { get; init; }
+
+    public required long Bytes { get; init; }
+    public required long Published { get; init; }
+    public required long Dropped { get; init; }
+    public required long Conflated { get; init; }
+    public required int Depth { get; init; }
+    public required bool Dedicated { get; init; }
+}
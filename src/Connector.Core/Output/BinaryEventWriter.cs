@@ -0,0 +1,37 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Text.Json.Serialization.Metadata;
+using Connector.Core.Contracts;
+using Connector.Core.Internal;
+
+namespace Connector.Core.Output;
+
+/// <summary>
+/// Length-prefixed MessagePack: each event is a little-endian <c>uint32</c> byte count
+/// followed by one MessagePack map with the same keys and nesting as the JSON output.
+/// Decimals are exact strings, timestamps use the MessagePack timestamp extension, and
+/// other numbers are integers.
+/// </summary>
+public sealed class BinaryEventWriter : EventStreamWriter
+{
+    private readonly ArrayBufferWriter<byte> _packBuffer = new(4096);
+    private readonly MessagePackContractWriter _pack = new();
+
+    public BinaryEventWriter(Stream output, int flushThreshold = DefaultFlushThreshold)
+        : base(output, flushThreshold)
+    {
+    }
+
+    protected override int WriteEvent(UnifiedWsEvent evt, JsonTypeInfo typeInfo)
+    {
+        _packBuffer.ResetWrittenCount();
+        _pack.Write(_packBuffer, evt, typeInfo);
+
+        var length = _packBuffer.WrittenCount;
+        var span = Output.GetSpan(sizeof(uint) + length);
+        BinaryPrimitives.WriteUInt32LittleEndian(span, (uint)length);
+        _packBuffer.WrittenSpan.CopyTo(span[sizeof(uint)..]);
+        Output.Advance(sizeof(uint) + length);
+        return sizeof(uint) + length;
+    }
+}
@@ -0,0 +1,92 @@
+using System.IO.Pipelines;
+using System.Text.Json.Serialization.Metadata;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Output;
+
+public enum EventOutputFormat
+{
+    /// <summary>One JSON object per line.</summary>
+    Jsonl,
+
+    /// <summary>Each event as a 4-byte little-endian length followed by a MessagePack map.</summary>
+    Binary
+}
+
+/// <summary>
+/// Serializes events with <see cref="ContractJsonContext"/> straight into a pooled
+/// <see cref="PipeWriter"/> over an output stream. Nothing reaches the stream until
+/// <see cref="FlushThreshold"/> bytes are pending or <see cref="FlushAsync"/> is called, so
+/// callers should flush whenever their input runs dry. Not thread-safe.
+/// </summary>
+public abstract class EventStreamWriter : IAsyncDisposable
+{
+    public const int DefaultFlushThreshold = 64 * 1024;
+
+    private readonly Dictionary<Type, JsonTypeInfo> _typeInfos = [];
+    private long _pending;
+    private long _events;
+    private bool _disposed;
+
+    protected EventStreamWriter(Stream output, int flushThreshold)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(flushThreshold);
+        FlushThreshold = flushThreshold;
+        Output = PipeWriter.Create(output, new StreamPipeWriterOptions(
+            minimumBufferSize: Math.Min(flushThreshold, DefaultFlushThreshold), leaveOpen: true));
+    }
+
+    public static EventStreamWriter Create(Stream output, EventOutputFormat format, int flushThreshold = DefaultFlushThreshold) =>
+        format switch
+        {
+            EventOutputFormat.Jsonl => new JsonlEventWriter(output, flushThreshold),
+            EventOutputFormat.Binary => new BinaryEventWriter(output, flushThreshold),
+            _ => throw new ArgumentOutOfRangeException(nameof(format), format, null)
+        };
+
+    public int FlushThreshold { get; }
+
+    public long EventsWritten => _events;
+
+    protected PipeWriter Output { get; }
+
+    /// <summary>Buffers <paramref name="evt"/>; flushes only once the threshold is reached.</summary>
+    public ValueTask WriteAsync(UnifiedWsEvent evt, CancellationToken ct = default)
+    {
+        _pending += WriteEvent(evt, GetTypeInfo(evt.GetType()));
+        _events++;
+        return _pending >= FlushThreshold ? FlushAsync(ct) : ValueTask.CompletedTask;
+    }
+
+    public async ValueTask FlushAsync(CancellationToken ct = default)
+    {
+        if (_pending == 0) return;
+        _pending = 0;
+        await Output.FlushAsync(ct);
+    }
+
+    /// <summary>Writes one event into <see cref="Output"/> and returns the bytes written.</summary>
+    protected abstract int WriteEvent(UnifiedWsEvent evt, JsonTypeInfo typeInfo);
+
+    private JsonTypeInfo GetTypeInfo(Type type)
+    {
+        if (!_typeInfos.TryGetValue(type, out var info))
+        {
+            info = ContractJsonContext.Default.GetTypeInfo(type)
+                ?? throw new NotSupportedException($"{type.Name} is not registered in {nameof(ContractJsonContext)}");
+            _typeInfos[type] = info;
+        }
+        return info;
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        if (_disposed) return;
+        _disposed = true;
+        await FlushAsync();
+        await Output.CompleteAsync();
+        DisposeCore();
+    }
+
+    protected virtual void DisposeCore() { }
+}
@@ -0,0 +1,33 @@
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Output;
+
+/// <summary>
+/// Newline-delimited JSON, byte-for-byte what
+/// <c>JsonSerializer.Serialize(evt, evt.GetType(), JsonOptions.Default)</c> produces.
+/// </summary>
+public sealed class JsonlEventWriter : EventStreamWriter
+{
+    private readonly Utf8JsonWriter _json;
+
+    public JsonlEventWriter(Stream output, int flushThreshold = DefaultFlushThreshold)
+        : base(output, flushThreshold)
+    {
+        _json = new Utf8JsonWriter(Output, new JsonWriterOptions { SkipValidation = true });
+    }
+
+    protected override int WriteEvent(UnifiedWsEvent evt, JsonTypeInfo typeInfo)
+    {
+        _json.Reset();
+        JsonSerializer.Serialize(_json, evt, typeInfo);
+        _json.Flush();
+
+        Output.GetSpan(1)[0] = (byte)'\n';
+        Output.Advance(1);
+        return (int)_json.BytesCommitted + 1;
+    }
+
+    protected override void DisposeCore() => _json.Dispose();
+}
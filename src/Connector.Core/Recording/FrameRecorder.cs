@@ -0,0 +1,165 @@
+using System.Buffers.Binary;
+using System.IO.MemoryMappedFiles;
+using Connector.Core.Transport;
+
+namespace Connector.Core.Recording;
+
+public sealed class FrameRecorderOptions
+{
+    /// <summary>Size a segment is preallocated and mapped at; a new segment starts when it is full.</summary>
+    public int SegmentSize { get; init; } = 256 * 1024 * 1024;
+
+    /// <summary>Minimum recorded time between two time-index entries.</summary>
+    public TimeSpan IndexInterval { get; init; } = TimeSpan.FromSeconds(1);
+}
+
+/// <summary>
+/// Appends raw inbound frames to segmented, memory-mapped recording files (see
+/// <see cref="RecordingFormat"/>). Each record is the frame's payload bytes as received,
+/// prefixed with its length, receive timestamp and text/binary flag. Recording into a
+/// directory that already holds segments continues after the last one.
+/// </summary>
+public sealed unsafe class FrameRecorder : IDisposable
+{
+    private readonly string _directory;
+    private readonly FrameRecorderOptions _options;
+    private readonly long _indexIntervalNs;
+    private readonly object _lock = new();
+
+    private int _segmentNumber;
+    private FileStream? _file;
+    private MemoryMappedFile? _map;
+    private MemoryMappedViewAccessor? _view;
+    private byte* _base;
+    private long _capacity;
+    private long _end;
+    private long _segmentRecords;
+    private FileStream? _index;
+    private long _lastIndexedNs = long.MinValue;
+    private long _records;
+    private long _bytes;
+    private bool _disposed;
+
+    public FrameRecorder(string directory, FrameRecorderOptions? options = null)
+    {
+        _options = options ?? new FrameRecorderOptions();
+        if (_options.SegmentSize < RecordingFormat.HeaderSize + RecordingFormat.RecordHeaderSize)
+            throw new ArgumentOutOfRangeException(nameof(options), "Segment size is too small");
+
+        _directory = directory;
+        _indexIntervalNs = _options.IndexInterval.Ticks * 100;
+        Directory.CreateDirectory(directory);
+        _segmentNumber = RecordingFormat.ListSegments(directory).Select(s => s.Number).DefaultIfEmpty(0).Max();
+    }
+
+    /// <summary>Records written since construction.</summary>
+    public long RecordCount => Interlocked.Read(ref _records);
+
+    /// <summary>Payload bytes written since construction.</summary>
+    public long BytesWritten => Interlocked.Read(ref _bytes);
+
+    public void Append(TransportWsInbound inbound) =>
+        Append(inbound.Utf8Payload.Span, inbound.ReceivedAt, isBinary: inbound.RawBytes is not null);
+
+    public void Append(ReadOnlySpan<byte> payload, DateTimeOffset timestamp, bool isBinary = false)
+    {
+        var timestampNs = RecordingFormat.ToUnixNanoseconds(timestamp);
+        var size = RecordingFormat.RecordSize(payload.Length);
+
+        lock (_lock)
+        {
+            ObjectDisposedException.ThrowIf(_disposed, this);
+
+            if (_base is null || _end + size > _capacity)
+                StartSegment(RecordingFormat.HeaderSize + size);
+
+            var record = new Span<byte>(_base + _end, (int)size);
+            BinaryPrimitives.WriteInt32LittleEndian(record, payload.Length);
+            BinaryPrimitives.WriteInt32LittleEndian(record[4..], isBinary ? RecordingFormat.BinaryFlag : 0);
+            BinaryPrimitives.WriteInt64LittleEndian(record[8..], timestampNs);
+            payload.CopyTo(record[RecordingFormat.RecordHeaderSize..]);
+
+            if (timestampNs - _lastIndexedNs >= _indexIntervalNs || _segmentRecords == 0)
+            {
+                Span<byte> entry = stackalloc byte[RecordingFormat.IndexEntrySize];
+                BinaryPrimitives.WriteInt64LittleEndian(entry, timestampNs);
+                BinaryPrimitives.WriteInt64LittleEndian(entry[8..], _end);
+                _index!.Write(entry);
+                _lastIndexedNs = timestampNs;
+            }
+
+            if (_segmentRecords == 0)
+                *(long*)(_base + RecordingFormat.FirstTimestampOffset) = timestampNs;
+            *(long*)(_base + RecordingFormat.LastTimestampOffset) = timestampNs;
+            *(long*)(_base + RecordingFormat.RecordCountOffset) = ++_segmentRecords;
+
+            // Publish the record last so a concurrent reader never sees a partial one
+            _end += size;
+            Volatile.Write(ref *(long*)(_base + RecordingFormat.EndOffsetOffset), _end);
+
+            _records++;
+            _bytes += payload.Length;
+        }
+    }
+
+    /// <summary>Flushes mapped pages and the time index to disk.</summary>
+    public void Flush()
+    {
+        lock (_lock)
+        {
+            _view?.Flush();
+            _index?.Flush();
+        }
+    }
+
+    private void StartSegment(long minimumSize)
+    {
+        CloseSegment();
+
+        _segmentNumber++;
+        var path = RecordingFormat.SegmentPath(_directory, _segmentNumber);
+        _capacity = Math.Max(_options.SegmentSize, minimumSize);
+
+        _file = new FileStream(path, FileMode.CreateNew, FileAccess.ReadWrite, FileShare.Read);
+        _map = MemoryMappedFile.CreateFromFile(_file, null, _capacity, MemoryMappedFileAccess.ReadWrite,
+            HandleInheritability.None, leaveOpen: true);
+        _view = _map.CreateViewAccessor(0, _capacity);
+
+        byte* pointer = null;
+        _view.SafeMemoryMappedViewHandle.AcquirePointer(ref pointer);
+        _base = pointer + _view.PointerOffset;
+
+        RecordingFormat.WriteHeader(new Span<byte>(_base, RecordingFormat.HeaderSize));
+        _end = RecordingFormat.HeaderSize;
+        _segmentRecords = 0;
+
+        _index = new FileStream(RecordingFormat.IndexPath(path), FileMode.CreateNew, FileAccess.Write, FileShare.Read);
+    }
+
+    /// <summary>Unmaps the current segment and trims it to the bytes actually written.</summary>
+    private void CloseSegment()
+    {
+        if (_view is null) return;
+
+        _view.Flush();
+        _view.SafeMemoryMappedViewHandle.ReleasePointer();
+        _view.Dispose();
+        _map!.Dispose();
+        _file!.SetLength(_end);
+        _file.Dispose();
+        _index!.Dispose();
+
+        (_view, _map, _file, _index) = (null, null, null, null);
+        _base = null;
+    }
+
+    public void Dispose()
+    {
+        lock (_lock)
+        {
+            if (_disposed) return;
+            _disposed = true;
+            CloseSegment();
+        }
+    }
+}
@@ -0,0 +1,76 @@
+using System.Buffers.Binary;
+
+namespace Connector.Core.Recording;
+
+/// <summary>
+/// On-disk layout shared by <see cref="FrameRecorder"/> and <see cref="RecordingReader"/>.
+/// All integers are little-endian; timestamps are Unix nanoseconds.
+/// </summary>
+/// <remarks>
+/// A recording is a directory of numbered segments. <c>NNNNNN.seg</c> starts with a
+/// <see cref="HeaderSize"/>-byte header followed by records:
+/// <code>
+/// header: magic u64 | version u32 | header size u32 | first ts i64 | last ts i64 | record count i64 | end offset i64 | reserved
+/// record: payload length u32 | flags u8 | pad 3 | ts i64 | payload | pad to 8 bytes
+/// </code>
+/// The header's end offset is updated after every record, so a segment that is still
+/// being written can be read up to its last complete record. <c>NNNNNN.idx</c> holds
+/// (ts i64, offset i64) pairs, at most one per <see cref="FrameRecorderOptions.IndexInterval"/>.
+/// </remarks>
+internal static class RecordingFormat
+{
+    public const ulong Magic = 0x3153454D41524643; // "CFRAMES1"
+    public const int Version = 1;
+    public const int HeaderSize = 64;
+    public const int RecordHeaderSize = 16;
+    public const int IndexEntrySize = 16;
+
+    public const int FirstTimestampOffset = 16;
+    public const int LastTimestampOffset = 24;
+    public const int RecordCountOffset = 32;
+    public const int EndOffsetOffset = 40;
+
+    public const byte BinaryFlag = 1;
+
+    public const string SegmentExtension = ".seg";
+    public const string IndexExtension = ".idx";
+
+    public static int Align(int length) => (length + 7) & ~7;
+
+    public static long RecordSize(int payloadLength) => RecordHeaderSize + Align(payloadLength);
+
+    public static string SegmentPath(string directory, int number) =>
+        Path.Combine(directory, number.ToString("D6") + SegmentExtension);
+
+    public static string IndexPath(string segmentPath) => Path.ChangeExtension(segmentPath, IndexExtension);
+
+    /// <summary>Segment files in <paramref name="directory"/> ordered by number.</summary>
+    public static IEnumerable<(int Number, string Path)> ListSegments(string directory) =>
+        Directory.Exists(directory)
+            ? Directory.EnumerateFiles(directory, "*" + SegmentExtension)
+                .Select(p => (Ok: int.TryParse(Path.GetFileNameWithoutExtension(p), out var n), Number: n, Path: p))
+                .Where(s => s.Ok)
+                .Select(s => (s.Number, s.Path))
+                .OrderBy(s => s.Number)
+            : [];
+
+    public static long ToUnixNanoseconds(DateTimeOffset timestamp) =>
+        (timestamp.UtcTicks - DateTimeOffset.UnixEpoch.UtcTicks) * 100;
+
+    public static DateTimeOffset FromUnixNanoseconds(long nanoseconds) =>
+        new(DateTimeOffset.UnixEpoch.UtcTicks + nanoseconds / 100, TimeSpan.Zero);
+
+    public static void WriteHeader(Span<byte> header)
+    {
+        header[..HeaderSize].Clear();
+        BinaryPrimitives.WriteUInt64LittleEndian(header, Magic);
+        BinaryPrimitives.WriteInt32LittleEndian(header[8..], Version);
+        BinaryPrimitives.WriteInt32LittleEndian(header[12..], HeaderSize);
+        BinaryPrimitives.WriteInt64LittleEndian(header[EndOffsetOffset..], HeaderSize);
+    }
+
+    public static bool IsValidHeader(ReadOnlySpan<byte> header) =>
+        header.Length >= HeaderSize
+        && BinaryPrimitives.ReadUInt64LittleEndian(header) == Magic
+        && BinaryPrimitives.ReadInt32LittleEndian(header[8..]) == Version;
+}
@@ -0,0 +1,231 @@
+using System.Buffers.Binary;
+using System.IO.MemoryMappedFiles;
+using Connector.Core.Internal;
+
+namespace Connector.Core.Recording;
+
+/// <summary>
+/// One frame read back from a recording. <see cref="Payload"/> points into the mapped
+/// segment and is valid until the reader moves to another segment or is disposed.
+/// </summary>
+public readonly struct RecordedFrame
+{
+    public RecordedFrame(long timestampNs, bool isBinary, ReadOnlyMemory<byte> payload)
+    {
+        TimestampNs = timestampNs;
+        IsBinary = isBinary;
+        Payload = payload;
+    }
+
+    /// <summary>Receive time in Unix nanoseconds.</summary>
+    public long TimestampNs { get; }
+
+    public DateTimeOffset Timestamp => RecordingFormat.FromUnixNanoseconds(TimestampNs);
+    public bool IsBinary { get; }
+    public ReadOnlyMemory<byte> Payload { get; }
+}
+
+/// <summary>
+/// Sequential reader over a <see cref="FrameRecorder"/> directory. Segments are memory-mapped
+/// one at a time and frames are returned without copying. <see cref="Seek"/> uses the time
+/// index to jump close to a timestamp and scans forward from there. Segments created after
+/// the reader was opened are not picked up.
+/// </summary>
+public sealed unsafe class RecordingReader : IDisposable
+{
+    private readonly Segment[] _segments;
+    private int _current = -1;
+    private MemoryMappedFile? _map;
+    private MemoryMappedViewAccessor? _view;
+    private byte* _base;
+    private ReadOnlyMemory<byte> _memory;
+    private long _position;
+    private bool _disposed;
+
+    public RecordingReader(string directory)
+    {
+        if (!Directory.Exists(directory))
+            throw new DirectoryNotFoundException($"Recording directory not found: {directory}");
+
+        _segments = RecordingFormat.ListSegments(directory)
+            .Select(s => ReadSegmentHeader(s.Path))
+            .OfType<Segment>()
+            .ToArray();
+    }
+
+    public int SegmentCount => _segments.Length;
+
+    /// <summary>Timestamp of the first recorded frame, or <c>null</c> for an empty recording.</summary>
+    public DateTimeOffset? StartTime => _segments.FirstOrDefault(s => s.RecordCount > 0) is { } first
+        ? RecordingFormat.FromUnixNanoseconds(first.FirstTimestampNs)
+        : null;
+
+    /// <summary>Timestamp of the last frame recorded when the reader was opened.</summary>
+    public DateTimeOffset? EndTime => _segments.LastOrDefault(s => s.RecordCount > 0) is { } last
+        ? RecordingFormat.FromUnixNanoseconds(last.LastTimestampNs)
+        : null;
+
+    public bool TryRead(out RecordedFrame frame)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+
+        while (true)
+        {
+            if (_base is not null && TryReadAt(_position, out frame, out var next))
+            {
+                _position = next;
+                return true;
+            }
+
+            if (_current + 1 >= _segments.Length)
+            {
+                frame = default;
+                return false;
+            }
+
+            Open(_current + 1);
+        }
+    }
+
+    /// <summary>
+    /// Positions the reader on the first frame at or after <paramref name="timestamp"/>.
+    /// Seeking before the start rewinds to the first frame; seeking past the end leaves
+    /// nothing to read.
+    /// </summary>
+    public void Seek(DateTimeOffset timestamp)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+        if (_segments.Length == 0) return;
+
+        var target = RecordingFormat.ToUnixNanoseconds(timestamp);
+        var segment = 0;
+        for (int i = 1; i < _segments.Length; i++)
+        {
+            if (_segments[i].RecordCount > 0 && _segments[i].FirstTimestampNs <= target)
+                segment = i;
+        }
+
+        Open(segment);
+        _position = FindIndexedOffset(_segments[segment].Path, target);
+
+        // The index is sparse; walk the remaining records one by one
+        while (TryReadAt(_position, out var frame, out var next) && frame.TimestampNs < target)
+            _position = next;
+    }
+
+    private bool TryReadAt(long position, out RecordedFrame frame, out long next)
+    {
+        var end = Volatile.Read(ref *(long*)(_base + RecordingFormat.EndOffsetOffset));
+        if (position + RecordingFormat.RecordHeaderSize > end)
+        {
+            frame = default;
+            next = position;
+            return false;
+        }
+
+        var header = new ReadOnlySpan<byte>(_base + position, RecordingFormat.RecordHeaderSize);
+        var length = BinaryPrimitives.ReadInt32LittleEndian(header);
+        var flags = header[4];
+        var timestampNs = BinaryPrimitives.ReadInt64LittleEndian(header[8..]);
+
+        frame = new RecordedFrame(timestampNs, (flags & RecordingFormat.BinaryFlag) != 0,
+            _memory.Slice((int)position + RecordingFormat.RecordHeaderSize, length));
+        next = position + RecordingFormat.RecordSize(length);
+        return true;
+    }
+
+    private void Open(int segment)
+    {
+        if (segment == _current && _base is not null)
+            return;
+
+        Close();
+
+        var path = _segments[segment].Path;
+        var file = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
+        var length = file.Length;
+        _map = MemoryMappedFile.CreateFromFile(file, null, 0, MemoryMappedFileAccess.Read,
+            HandleInheritability.None, leaveOpen: false);
+        _view = _map.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+
+        byte* pointer = null;
+        _view.SafeMemoryMappedViewHandle.AcquirePointer(ref pointer);
+        _base = pointer + _view.PointerOffset;
+        _memory = new NativeMemoryManager<byte>((nint)_base, checked((int)length)).Memory;
+
+        _current = segment;
+        _position = RecordingFormat.HeaderSize;
+    }
+
+    private void Close()
+    {
+        if (_view is null) return;
+
+        _view.SafeMemoryMappedViewHandle.ReleasePointer();
+        _view.Dispose();
+        _map!.Dispose();
+        _view = null;
+        _map = null;
+        _base = null;
+        _memory = default;
+    }
+
+    /// <summary>Offset of the last index entry at or before <paramref name="target"/>.</summary>
+    private static long FindIndexedOffset(string segmentPath, long target)
+    {
+        var indexPath = RecordingFormat.IndexPath(segmentPath);
+        if (!File.Exists(indexPath))
+            return RecordingFormat.HeaderSize;
+
+        byte[] index;
+        using (var file = new FileStream(indexPath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete))
+        {
+            index = new byte[file.Length - file.Length % RecordingFormat.IndexEntrySize];
+            file.ReadExactly(index);
+        }
+
+        int lo = 0, hi = index.Length / RecordingFormat.IndexEntrySize - 1;
+        long offset = RecordingFormat.HeaderSize;
+        while (lo <= hi)
+        {
+            var mid = (lo + hi) >>> 1;
+            var entry = index.AsSpan(mid * RecordingFormat.IndexEntrySize, RecordingFormat.IndexEntrySize);
+            if (BinaryPrimitives.ReadInt64LittleEndian(entry) <= target)
+            {
+                offset = BinaryPrimitives.ReadInt64LittleEndian(entry[8..]);
+                lo = mid + 1;
+            }
+            else
+            {
+                hi = mid - 1;
+            }
+        }
+        return offset;
+    }
+
+    private static Segment? ReadSegmentHeader(string path)
+    {
+        Span<byte> header = stackalloc byte[RecordingFormat.HeaderSize];
+        using (var file = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete))
+        {
+            if (file.Length < RecordingFormat.HeaderSize) return null;
+            file.ReadExactly(header);
+        }
+
+        if (!RecordingFormat.IsValidHeader(header)) return null;
+
+        return new Segment(path,
+            BinaryPrimitives.ReadInt64LittleEndian(header[RecordingFormat.FirstTimestampOffset..]),
+            BinaryPrimitives.ReadInt64LittleEndian(header[RecordingFormat.LastTimestampOffset..]),
+            BinaryPrimitives.ReadInt64LittleEndian(header[RecordingFormat.RecordCountOffset..]));
+    }
+
+    public void Dispose()
+    {
+        if (_disposed) return;
+        _disposed = true;
+        Close();
+    }
+
+    private sealed record Segment(string Path, long FirstTimestampNs, long LastTimestampNs, long RecordCount);
+}
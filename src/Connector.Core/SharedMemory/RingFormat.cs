@@ -0,0 +1,224 @@
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.SharedMemory;
+
+/// <summary>
+/// Record layouts of the shared-memory rings; each channel maps to one layout.
+/// </summary>
+public enum RingLayout
+{
+    Trade = 1,
+    BookLevel = 2,
+    Candle = 3,
+    Mid = 4,
+    AssetCtx = 5,
+    Fill = 6,
+    Order = 7
+}
+
+/// <summary>
+/// Memory-mapped layout shared by <see cref="SharedRingWriter"/> and the Python reader
+/// (<c>example/py/connector_ring.py</c>). All integers are little-endian; timestamps are
+/// Unix nanoseconds; missing optional numbers are NaN.
+/// </summary>
+/// <remarks>
+/// One file per channel: a <see cref="HeaderSize"/>-byte header, a symbol table of
+/// <see cref="SymbolCapacity"/> entries and then <c>slot count</c> fixed-size slots:
+/// <code>
+/// header: magic u64 | version u32 | data offset u32 | slot size u32 | slot count u32 | channel u32 | layout u32
+///         | created ns i64 | writer pid u32 | state u32 | symbol capacity u32 | ...
+///         | write sequence i64 @64 | symbol count u32 @128
+/// symbol: name length u8 | UTF-8 name, zero padded to 32 bytes; the id is the entry index
+/// slot:   sequence i64 | received ns i64 | symbol id i32 | side i8 | flags u8 | code u8 | pad u8 | layout fields
+/// </code>
+/// Record <c>n</c> (from 0) lives in slot <c>n % slot count</c>. The writer zeroes the slot
+/// sequence, writes the record, stores <c>n + 1</c> as the slot sequence and then
+/// <c>n + 1</c> as the header write sequence. A reader at <c>n</c> that finds the write
+/// sequence more than a ring ahead, or a slot sequence other than <c>n + 1</c> after
+/// reading, has been overrun. A restarted publisher replaces the file rather than
+/// truncating it, so attached readers see the old file's state turn closed.
+/// </remarks>
+internal static class RingFormat
+{
+    public static readonly ulong Magic = BinaryPrimitives.ReadUInt64LittleEndian("CXRING01"u8);
+    public const int Version = 1;
+    public const int HeaderSize = 4096;
+    public const int SymbolEntrySize = 32;
+    public const int SymbolCapacity = 4096;
+    public const int DataOffset = HeaderSize + SymbolCapacity * SymbolEntrySize;
+
+    public const int VersionOffset = 8;
+    public const int DataOffsetOffset = 12;
+    public const int SlotSizeOffset = 16;
+    public const int SlotCountOffset = 20;
+    public const int ChannelOffset = 24;
+    public const int LayoutOffset = 28;
+    public const int CreatedOffset = 32;
+    public const int WriterPidOffset = 40;
+    public const int StateOffset = 44;
+    public const int SymbolCapacityOffset = 48;
+
+    // Hot fields get a cache line each so readers polling them don't share one with the header
+    public const int WriteSequenceOffset = 64;
+    public const int SymbolCountOffset = 128;
+
+    public const int StateOpen = 1;
+    public const int StateClosed = 2;
+
+    public const string Extension = ".ring";
+
+    public static string PathFor(string directory, UnifiedWsChannel channel) =>
+        Path.Combine(directory, channel.ToString().ToLowerInvariant() + Extension);
+
+    public static long ToUnixNanoseconds(DateTimeOffset timestamp) =>
+        (timestamp.UtcTicks - DateTimeOffset.UnixEpoch.UtcTicks) * 100;
+
+    public static RingLayout? LayoutFor(UnifiedWsChannel channel) => channel switch
+    {
+        UnifiedWsChannel.Trades => RingLayout.Trade,
+        UnifiedWsChannel.OrderBookL1 or UnifiedWsChannel.OrderBookL2 => RingLayout.BookLevel,
+        UnifiedWsChannel.Candles => RingLayout.Candle,
+        UnifiedWsChannel.AllMids => RingLayout.Mid,
+        UnifiedWsChannel.ActiveAssetCtx => RingLayout.AssetCtx,
+        UnifiedWsChannel.Fills => RingLayout.Fill,
+        UnifiedWsChannel.UserOrders or UnifiedWsChannel.OpenOrders => RingLayout.Order,
+        _ => null
+    };
+
+    public static int SlotSize(RingLayout layout) => layout switch
+    {
+        RingLayout.Trade => Marshal.SizeOf<TradeRecord>(),
+        RingLayout.BookLevel => Marshal.SizeOf<BookLevelRecord>(),
+        RingLayout.Candle => Marshal.SizeOf<CandleRecord>(),
+        RingLayout.Mid => Marshal.SizeOf<MidRecord>(),
+        RingLayout.AssetCtx => Marshal.SizeOf<AssetCtxRecord>(),
+        RingLayout.Fill => Marshal.SizeOf<FillRecord>(),
+        RingLayout.Order => Marshal.SizeOf<OrderRecord>(),
+        _ => throw new ArgumentOutOfRangeException(nameof(layout), layout, null)
+    };
+}
+
+/// <summary>Bits of the slot <c>flags</c> byte.</summary>
+[Flags]
+internal enum RingFlags : byte
+{
+    None = 0,
+
+    /// <summary>Last row of its event; rows of one event are contiguous.</summary>
+    Last = 1,
+
+    /// <summary>Row of a snapshot (book, fills history, open orders) rather than an update.</summary>
+    Snapshot = 2,
+
+    ReduceOnly = 4,
+    Trigger = 8
+}
+
+/// <summary>Slot <c>code</c> of <see cref="RingLayout.Order"/> rows.</summary>
+internal enum RingOrderStatus : byte
+{
+    Other = 0,
+    Open = 1,
+    Filled = 2,
+    Canceled = 3,
+    Triggered = 4,
+    Rejected = 5
+}
+
+// ─── Records ────────────────────────────────────────
+// Field offsets are the wire format; keep them in step with connector_ring.py.
+
+[StructLayout(LayoutKind.Explicit, Size = 24)]
+internal struct RingRecordHeader
+{
+    [FieldOffset(0)] public long Sequence;
+    [FieldOffset(8)] public long ReceivedAtNs;
+    [FieldOffset(16)] public int SymbolId;
+    [FieldOffset(20)] public sbyte Side;
+    [FieldOffset(21)] public RingFlags Flags;
+    [FieldOffset(22)] public byte Code;
+}
+
+[StructLayout(LayoutKind.Explicit, Size = 64)]
+internal struct TradeRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public long TimestampNs;
+    [FieldOffset(32)] public double Price;
+    [FieldOffset(40)] public double Size;
+    [FieldOffset(48)] public long TradeId;
+}
+
+/// <summary>Code is a <see cref="Managers.BookRowKind"/>.</summary>
+[StructLayout(LayoutKind.Explicit, Size = 64)]
+internal struct BookLevelRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public long EventSequence;
+    [FieldOffset(32)] public double Price;
+    [FieldOffset(40)] public double Size;
+    [FieldOffset(48)] public int Level;
+}
+
+[StructLayout(LayoutKind.Explicit, Size = 80)]
+internal struct CandleRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public long OpenTimeNs;
+    [FieldOffset(32)] public double Open;
+    [FieldOffset(40)] public double High;
+    [FieldOffset(48)] public double Low;
+    [FieldOffset(56)] public double Close;
+    [FieldOffset(64)] public double Volume;
+}
+
+[StructLayout(LayoutKind.Explicit, Size = 32)]
+internal struct MidRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public double Mid;
+}
+
+[StructLayout(LayoutKind.Explicit, Size = 80)]
+internal struct AssetCtxRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public double MarkPrice;
+    [FieldOffset(32)] public double FundingRate;
+    [FieldOffset(40)] public double OpenInterest;
+    [FieldOffset(48)] public double OraclePrice;
+    [FieldOffset(56)] public double PrevDayPrice;
+    [FieldOffset(64)] public double DayBaseVolume;
+    [FieldOffset(72)] public double DayNotionalVolume;
+}
+
+[StructLayout(LayoutKind.Explicit, Size = 96)]
+internal struct FillRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public long TimestampNs;
+    [FieldOffset(32)] public double Price;
+    [FieldOffset(40)] public double Size;
+    [FieldOffset(48)] public double Fee;
+    [FieldOffset(56)] public double ClosedPnl;
+    [FieldOffset(64)] public double StartPosition;
+    [FieldOffset(72)] public long OrderId;
+    [FieldOffset(80)] public long TradeId;
+}
+
+/// <summary>Code is a <see cref="RingOrderStatus"/>; the client order id is its 16 raw bytes.</summary>
+[StructLayout(LayoutKind.Explicit, Size = 96)]
+internal unsafe struct OrderRecord
+{
+    [FieldOffset(0)] public RingRecordHeader Header;
+    [FieldOffset(24)] public long TimestampNs;
+    [FieldOffset(32)] public double Price;
+    [FieldOffset(40)] public double Size;
+    [FieldOffset(48)] public double FilledSize;
+    [FieldOffset(56)] public double OriginalSize;
+    [FieldOffset(64)] public double TriggerPrice;
+    [FieldOffset(72)] public long OrderId;
+    [FieldOffset(80)] public fixed byte ClientOrderId[16];
+}
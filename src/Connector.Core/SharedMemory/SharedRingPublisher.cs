@@ -0,0 +1,310 @@
+using System.Globalization;
+using Connector.Core.Contracts;
+using Connector.Core.Managers;
+
+namespace Connector.Core.SharedMemory;
+
+/// <summary>
+/// Fans translated events out to other processes through one memory-mapped ring per
+/// channel, named <c>&lt;channel&gt;.ring</c> in <see cref="Directory"/>. Each event becomes
+/// one or more fixed-size rows (one per trade, price level, mid, fill or order) so readers
+/// can map the slots straight onto a NumPy structured array. Readers never block the
+/// publisher: a reader that falls a whole ring behind loses the oldest rows and sees a
+/// sequence gap. Use a tmpfs directory such as <c>/dev/shm</c> to keep pages off disk.
+/// Not thread-safe; call <see cref="Publish"/> from the loop that drains the manager.
+/// </summary>
+public sealed class SharedRingPublisher : IDisposable
+{
+    public const int DefaultSlotCount = 1 << 16;
+
+    private readonly SharedRingWriter?[] _rings = new SharedRingWriter?[Enum.GetValues<UnifiedWsChannel>().Length];
+    private long _rows;
+    private long _skipped;
+
+    /// <param name="slotCount">Slots per ring, a power of two. Readers may lag by up to this many rows.</param>
+    public SharedRingPublisher(string directory, IEnumerable<UnifiedWsChannel> channels, int slotCount = DefaultSlotCount)
+    {
+        Directory = directory;
+        try
+        {
+            foreach (var channel in channels.Distinct())
+            {
+                var layout = RingFormat.LayoutFor(channel)
+                    ?? throw new NotSupportedException($"Channel {channel} has no shared-memory layout");
+                _rings[(int)channel] = new SharedRingWriter(RingFormat.PathFor(directory, channel), channel, layout, slotCount);
+            }
+        }
+        catch
+        {
+            Dispose();
+            throw;
+        }
+    }
+
+    public string Directory { get; }
+
+    /// <summary>Rows written across all rings.</summary>
+    public long RowsWritten => _rows;
+
+    /// <summary>Events of channels without a ring.</summary>
+    public long EventsSkipped => _skipped;
+
+    /// <summary>Whether events of <paramref name="channel"/> have a fixed row layout.</summary>
+    public static bool Supports(UnifiedWsChannel channel) => RingFormat.LayoutFor(channel) is not null;
+
+    /// <summary>File of <paramref name="channel"/>'s ring.</summary>
+    public string GetPath(UnifiedWsChannel channel) => RingFormat.PathFor(Directory, channel);
+
+    /// <summary>Writes <paramref name="evt"/> to its channel's ring and returns the rows written.</summary>
+    public int Publish(UnifiedWsEvent evt)
+    {
+        if (_rings[(int)evt.Channel] is not { } ring)
+        {
+            _skipped++;
+            return 0;
+        }
+
+        var rows = evt switch
+        {
+            TradesEvent e => WriteTrades(ring, e),
+            OrderBookL1Event e => WriteTopOfBook(ring, e),
+            OrderBookL2Event e => WriteLevels(ring, e, e.Bids, e.Asks, BookRowKind.Snapshot),
+            OrderBookL2DeltaEvent e => WriteLevels(ring, e, e.Bids, e.Asks, BookRowKind.Delta),
+            CandleEvent e => WriteCandle(ring, e),
+            AllMidsEvent e => WriteMids(ring, e),
+            ActiveAssetCtxEvent e => WriteAssetCtx(ring, e),
+            FillEvent e => WriteFills(ring, e),
+            UserOrderEvent e => WriteOrders(ring, e, e.Orders, snapshot: false),
+            OpenOrdersEvent e => WriteOrders(ring, e, e.Orders, snapshot: true),
+            _ => 0
+        };
+        _rows += rows;
+        return rows;
+    }
+
+    public void Dispose()
+    {
+        foreach (var ring in _rings)
+            ring?.Dispose();
+    }
+
+    // ─── Encoders ───────────────────────────────────────
+
+    private static int WriteTrades(SharedRingWriter ring, TradesEvent evt)
+    {
+        var header = Header(ring, evt, evt.Symbol);
+        for (int i = 0; i < evt.Trades.Length; i++)
+        {
+            var t = evt.Trades[i];
+            ring.Write(new TradeRecord
+            {
+                Header = header with { Side = SideSign(t.Side), Flags = LastIf(i == evt.Trades.Length - 1) },
+                TimestampNs = RingFormat.ToUnixNanoseconds(t.Timestamp),
+                Price = (double)t.Price,
+                Size = (double)t.Size,
+                TradeId = ParseId(t.TradeId)
+            });
+        }
+        return evt.Trades.Length;
+    }
+
+    private static int WriteTopOfBook(SharedRingWriter ring, OrderBookL1Event evt)
+    {
+        var header = Header(ring, evt, evt.Symbol) with { Code = (byte)BookRowKind.TopOfBook };
+        var sequence = evt.Sequence ?? 0;
+        ring.Write(new BookLevelRecord
+        {
+            Header = header with { Side = 1 },
+            EventSequence = sequence, Price = (double)evt.BestBid.Price, Size = (double)evt.BestBid.Size
+        });
+        ring.Write(new BookLevelRecord
+        {
+            Header = header with { Side = -1, Flags = RingFlags.Last },
+            EventSequence = sequence, Price = (double)evt.BestAsk.Price, Size = (double)evt.BestAsk.Size
+        });
+        return 2;
+    }
+
+    private static int WriteLevels(SharedRingWriter ring, UnifiedWsEvent evt, PriceLevel[] bids, PriceLevel[] asks, BookRowKind kind)
+    {
+        var flags = kind == BookRowKind.Snapshot ? RingFlags.Snapshot : RingFlags.None;
+        var header = Header(ring, evt, evt.Symbol) with { Code = (byte)kind, Flags = flags };
+        var sequence = evt.Sequence ?? 0;
+        var total = bids.Length + asks.Length;
+
+        for (int i = 0; i < total; i++)
+        {
+            var isBid = i < bids.Length;
+            var level = isBid ? i : i - bids.Length;
+            var entry = isBid ? bids[level] : asks[level];
+            ring.Write(new BookLevelRecord
+            {
+                Header = header with { Side = isBid ? (sbyte)1 : (sbyte)-1, Flags = flags | LastIf(i == total - 1) },
+                EventSequence = sequence,
+                Price = (double)entry.Price,
+                Size = (double)entry.Size,
+                Level = level
+            });
+        }
+        return total;
+    }
+
+    private static int WriteCandle(SharedRingWriter ring, CandleEvent evt)
+    {
+        var c = evt.Candle;
+        ring.Write(new CandleRecord
+        {
+            Header = Header(ring, evt, evt.Symbol) with { Flags = RingFlags.Last },
+            OpenTimeNs = RingFormat.ToUnixNanoseconds(c.OpenTime),
+            Open = (double)c.Open,
+            High = (double)c.High,
+            Low = (double)c.Low,
+            Close = (double)c.Close,
+            Volume = (double)c.Volume
+        });
+        return 1;
+    }
+
+    private static int WriteMids(SharedRingWriter ring, AllMidsEvent evt)
+    {
+        var receivedAt = RingFormat.ToUnixNanoseconds(evt.ReceivedAt);
+        for (int i = 0; i < evt.Mids.Length; i++)
+        {
+            var m = evt.Mids[i];
+            ring.Write(new MidRecord
+            {
+                Header = new RingRecordHeader
+                {
+                    ReceivedAtNs = receivedAt,
+                    SymbolId = ring.GetSymbolId(m.Symbol),
+                    Flags = LastIf(i == evt.Mids.Length - 1)
+                },
+                Mid = (double)m.Mid
+            });
+        }
+        return evt.Mids.Length;
+    }
+
+    private static int WriteAssetCtx(SharedRingWriter ring, ActiveAssetCtxEvent evt)
+    {
+        ring.Write(new AssetCtxRecord
+        {
+            Header = Header(ring, evt, evt.Symbol) with { Flags = RingFlags.Last },
+            MarkPrice = (double)evt.MarkPrice,
+            FundingRate = (double)evt.FundingRate,
+            OpenInterest = (double)evt.OpenInterest,
+            OraclePrice = OrNaN(evt.OraclePrice),
+            PrevDayPrice = OrNaN(evt.PrevDayPrice),
+            DayBaseVolume = OrNaN(evt.DayBaseVolume),
+            DayNotionalVolume = OrNaN(evt.DayNotionalVolume)
+        });
+        return 1;
+    }
+
+    private static int WriteFills(SharedRingWriter ring, FillEvent evt)
+    {
+        var receivedAt = RingFormat.ToUnixNanoseconds(evt.ReceivedAt);
+        var flags = evt.IsSnapshot ? RingFlags.Snapshot : RingFlags.None;
+        for (int i = 0; i < evt.Fills.Length; i++)
+        {
+            var f = evt.Fills[i];
+            ring.Write(new FillRecord
+            {
+                Header = new RingRecordHeader
+                {
+                    ReceivedAtNs = receivedAt,
+                    SymbolId = ring.GetSymbolId(f.Symbol),
+                    Side = SideSign(f.Side),
+                    Flags = flags | LastIf(i == evt.Fills.Length - 1)
+                },
+                TimestampNs = RingFormat.ToUnixNanoseconds(f.Timestamp),
+                Price = (double)f.Price,
+                Size = (double)f.Size,
+                Fee = (double)f.Fee,
+                ClosedPnl = OrNaN(f.ClosedPnl),
+                StartPosition = OrNaN(f.StartPosition),
+                OrderId = ParseId(f.OrderId),
+                TradeId = ParseId(f.TradeId)
+            });
+        }
+        return evt.Fills.Length;
+    }
+
+    private static unsafe int WriteOrders(SharedRingWriter ring, UnifiedWsEvent evt, UserOrderEntry[] orders, bool snapshot)
+    {
+        var receivedAt = RingFormat.ToUnixNanoseconds(evt.ReceivedAt);
+        var flags = snapshot ? RingFlags.Snapshot : RingFlags.None;
+
+        // An empty snapshot still has to reach readers: it means no orders are open
+        if (orders.Length == 0)
+        {
+            if (!snapshot) return 0;
+            ring.Write(new OrderRecord
+            {
+                Header = new RingRecordHeader { ReceivedAtNs = receivedAt, SymbolId = -1, Flags = flags | RingFlags.Last },
+                Price = double.NaN, Size = double.NaN, FilledSize = double.NaN, OriginalSize = double.NaN, TriggerPrice = double.NaN
+            });
+            return 1;
+        }
+
+        for (int i = 0; i < orders.Length; i++)
+        {
+            var o = orders[i];
+            var record = new OrderRecord
+            {
+                Header = new RingRecordHeader
+                {
+                    ReceivedAtNs = receivedAt,
+                    SymbolId = ring.GetSymbolId(o.Symbol),
+                    Side = SideSign(o.Side),
+                    Flags = flags | LastIf(i == orders.Length - 1)
+                        | (o.ReduceOnly ? RingFlags.ReduceOnly : RingFlags.None)
+                        | (o.IsTrigger ? RingFlags.Trigger : RingFlags.None),
+                    Code = (byte)Status(o.Status)
+                },
+                TimestampNs = RingFormat.ToUnixNanoseconds(o.Timestamp),
+                Price = (double)o.Price,
+                Size = (double)o.Size,
+                FilledSize = (double)o.FilledSize,
+                OriginalSize = OrNaN(o.OriginalSize),
+                TriggerPrice = OrNaN(o.TriggerPrice),
+                OrderId = ParseId(o.OrderId)
+            };
+            if (o.ClientOrderId is { Length: 34 } cloid && cloid.StartsWith("0x", StringComparison.OrdinalIgnoreCase))
+                Convert.FromHexString(cloid.AsSpan(2)).CopyTo(new Span<byte>(record.ClientOrderId, 16));
+            ring.Write(record);
+        }
+        return orders.Length;
+    }
+
+    // ─── Helpers ────────────────────────────────────────
+
+    private static RingRecordHeader Header(SharedRingWriter ring, UnifiedWsEvent evt, string symbol) => new()
+    {
+        ReceivedAtNs = RingFormat.ToUnixNanoseconds(evt.ReceivedAt),
+        SymbolId = ring.GetSymbolId(symbol)
+    };
+
+    private static RingFlags LastIf(bool last) => last ? RingFlags.Last : RingFlags.None;
+
+    private static sbyte SideSign(string side) =>
+        side.Length > 0 && (side[0] is 'b' or 'B') ? (sbyte)1 : (sbyte)-1;
+
+    private static double OrNaN(decimal? value) => value is { } v ? (double)v : double.NaN;
+
+    /// <summary>Numeric exchange id, or 0 for ids that are not integers.</summary>
+    private static long ParseId(string id) =>
+        long.TryParse(id, NumberStyles.None, CultureInfo.InvariantCulture, out var value) ? value : 0;
+
+    private static RingOrderStatus Status(string status) => status switch
+    {
+        "open" => RingOrderStatus.Open,
+        "filled" => RingOrderStatus.Filled,
+        "canceled" or "scheduledCancel" => RingOrderStatus.Canceled,
+        "triggered" => RingOrderStatus.Triggered,
+        "rejected" => RingOrderStatus.Rejected,
+        _ when status.EndsWith("Canceled", StringComparison.Ordinal) => RingOrderStatus.Canceled,
+        _ when status.EndsWith("Rejected", StringComparison.Ordinal) => RingOrderStatus.Rejected,
+        _ => RingOrderStatus.Other
+    };
+}
@@ -0,0 +1,117 @@
+using System.Buffers.Binary;
+using System.IO.MemoryMappedFiles;
+using System.Runtime.CompilerServices;
+using System.Text;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.SharedMemory;
+
+/// <summary>
+/// Single-producer side of one memory-mapped ring (see <see cref="RingFormat"/>). Records
+/// overwrite the oldest slot; readers attach and detach at will and detect overruns from
+/// the sequence numbers. Not thread-safe.
+/// </summary>
+internal sealed unsafe class SharedRingWriter : IDisposable
+{
+    private readonly MemoryMappedFile _file;
+    private readonly MemoryMappedViewAccessor _view;
+    private readonly byte* _base;
+    private readonly byte* _slots;
+    private readonly int _slotSize;
+    private readonly long _mask;
+    private readonly Dictionary<string, int> _symbols = new(StringComparer.Ordinal);
+    private long _next;
+    private bool _disposed;
+
+    public SharedRingWriter(string path, UnifiedWsChannel channel, RingLayout layout, int slotCount)
+    {
+        if (slotCount < 2 || !int.IsPow2(slotCount))
+            throw new ArgumentOutOfRangeException(nameof(slotCount), slotCount, "Slot count must be a power of two");
+
+        Path = path;
+        _slotSize = RingFormat.SlotSize(layout);
+        _mask = slotCount - 1;
+        var length = RingFormat.DataOffset + (long)_slotSize * slotCount;
+
+        // Unlink rather than truncate: readers still mapping the old file would fault on a shrink
+        Directory.CreateDirectory(System.IO.Path.GetDirectoryName(System.IO.Path.GetFullPath(path))!);
+        File.Delete(path);
+        _file = MemoryMappedFile.CreateFromFile(path, FileMode.CreateNew, null, length, MemoryMappedFileAccess.ReadWrite);
+        _view = _file.CreateViewAccessor(0, length, MemoryMappedFileAccess.ReadWrite);
+
+        byte* pointer = null;
+        _view.SafeMemoryMappedViewHandle.AcquirePointer(ref pointer);
+        _base = pointer + _view.PointerOffset;
+        _slots = _base + RingFormat.DataOffset;
+
+        var header = new Span<byte>(_base, RingFormat.HeaderSize);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.VersionOffset..], RingFormat.Version);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.DataOffsetOffset..], RingFormat.DataOffset);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.SlotSizeOffset..], _slotSize);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.SlotCountOffset..], slotCount);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.ChannelOffset..], (int)channel);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.LayoutOffset..], (int)layout);
+        BinaryPrimitives.WriteInt64LittleEndian(header[RingFormat.CreatedOffset..], RingFormat.ToUnixNanoseconds(DateTimeOffset.UtcNow));
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.WriterPidOffset..], Environment.ProcessId);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.StateOffset..], RingFormat.StateOpen);
+        BinaryPrimitives.WriteInt32LittleEndian(header[RingFormat.SymbolCapacityOffset..], RingFormat.SymbolCapacity);
+
+        // Magic last: a reader that sees it sees a complete header
+        Volatile.Write(ref *(ulong*)_base, RingFormat.Magic);
+    }
+
+    public string Path { get; }
+
+    /// <summary>Records written so far; the next record's sequence.</summary>
+    public long Sequence => _next;
+
+    /// <summary>Id of <paramref name="symbol"/> in the ring's symbol table, adding it if new.</summary>
+    public int GetSymbolId(string symbol)
+    {
+        if (_symbols.TryGetValue(symbol, out var id)) return id;
+
+        id = _symbols.Count;
+        if (id == RingFormat.SymbolCapacity)
+            throw new InvalidOperationException($"Symbol table of {Path} is full ({RingFormat.SymbolCapacity} symbols)");
+
+        var entry = new Span<byte>(_base + RingFormat.HeaderSize + id * RingFormat.SymbolEntrySize, RingFormat.SymbolEntrySize);
+        if (!Encoding.UTF8.TryGetBytes(symbol, entry[1..], out var written))
+            throw new ArgumentException($"Symbol '{symbol}' is longer than {RingFormat.SymbolEntrySize - 1} bytes", nameof(symbol));
+        entry[0] = (byte)written;
+
+        // Publish the entry before any record can refer to it
+        Volatile.Write(ref *(int*)(_base + RingFormat.SymbolCountOffset), id + 1);
+        _symbols[symbol] = id;
+        return id;
+    }
+
+    /// <summary>Writes <paramref name="record"/> into the next slot and publishes it.</summary>
+    public void Write<T>(T record) where T : unmanaged
+    {
+        if (sizeof(T) > _slotSize)
+            throw new ArgumentException($"{typeof(T).Name} does not fit a {_slotSize}-byte slot", nameof(record));
+
+        var sequence = _next;
+        var slot = _slots + (sequence & _mask) * _slotSize;
+
+        // Mark the slot in progress before any of its bytes change, so a lapped reader can tell
+        Volatile.Write(ref *(long*)slot, 0);
+        Interlocked.MemoryBarrier();
+        Unsafe.CopyBlockUnaligned(slot + sizeof(long), (byte*)&record + sizeof(long), (uint)(sizeof(T) - sizeof(long)));
+        Volatile.Write(ref *(long*)slot, sequence + 1);
+
+        _next = sequence + 1;
+        Volatile.Write(ref *(long*)(_base + RingFormat.WriteSequenceOffset), _next);
+    }
+
+    public void Dispose()
+    {
+        if (_disposed) return;
+        _disposed = true;
+
+        Volatile.Write(ref *(int*)(_base + RingFormat.StateOffset), RingFormat.StateClosed);
+        _view.SafeMemoryMappedViewHandle.ReleasePointer();
+        _view.Dispose();
+        _file.Dispose();
+    }
+}
@@ -0,0 +1,158 @@
+using System.Collections.Concurrent;
+using Connector.Core.Abstractions;
+using Connector.Core.Contracts;
+
+namespace Connector.Core.Transport;
+
+/// <summary>Capacity tokens, earned back evenly over Period.</summary>
+public sealed class RateLimitBucketOptions
+{
+    public required int Capacity { get; init; }
+    public required TimeSpan Period { get; init; }
+}
+
+public sealed class HierarchicalRateLimiterOptions
+{
+    /// <summary>Shared weight budget for REST requests (<see cref="RateLimitClass.Info"/> and <see cref="RateLimitClass.Exchange"/>).</summary>
+    public RateLimitBucketOptions? Global { get; init; }
+
+    /// <summary>Additional budget per class, e.g. WebSocket messages.</summary>
+    public Dictionary<RateLimitClass, RateLimitBucketOptions> Classes { get; init; } = [];
+
+    /// <summary>
+    /// Per-user action budget charged by <see cref="RateLimitClass.Exchange"/> requests.
+    /// Capacity is the starting budget for a user with no reported limit; the period is the
+    /// time to earn one action back once it is used up.
+    /// </summary>
+    public RateLimitBucketOptions? PerUser { get; init; }
+
+    /// <summary>User charged when a cost does not name one.</summary>
+    public string? DefaultUser { get; init; }
+}
+
+/// <summary>
+/// Limits against a global bucket, a per-class bucket and a per-user bucket in turn. Each
+/// level is a <see cref="TokenBucket"/>; tokens already taken are refunded if a later level
+/// is cancelled. <see cref="RateLimitPriority.High"/> requests skip the queue at every level
+/// and never wait on the per-user budget, which exchanges typically extend for cancels.
+/// </summary>
+public sealed class HierarchicalRateLimiter : IRateLimiter
+{
+    private readonly HierarchicalRateLimiterOptions _options;
+    private readonly TokenBucket? _global;
+    private readonly Dictionary<RateLimitClass, TokenBucket> _classes;
+    private readonly ConcurrentDictionary<string, TokenBucket> _users = new(StringComparer.OrdinalIgnoreCase);
+
+    public HierarchicalRateLimiter(HierarchicalRateLimiterOptions options)
+    {
+        _options = options;
+        _global = Create(options.Global);
+        _classes = options.Classes.ToDictionary(kv => kv.Key, kv => Create(kv.Value)!);
+    }
+
+    public TokenBucket? GlobalBucket => _global;
+
+    public TokenBucket? ClassBucket(RateLimitClass rateLimitClass) => _classes.GetValueOrDefault(rateLimitClass);
+
+    /// <summary>The user's bucket, or <c>null</c> when no per-user limit is configured.</summary>
+    public TokenBucket? UserBucket(string user) =>
+        _options.PerUser is { } perUser
+            ? _users.GetOrAdd(user, static (_, o) => new TokenBucket(o.Capacity, o.Period), perUser)
+            : null;
+
+    /// <summary>Reseeds <paramref name="user"/>'s budget from what the exchange reported.</summary>
+    public void UpdateUserLimit(string user, GetUserRateLimitResponse limit)
+    {
+        var remaining = Math.Max(limit.RequestsCap - limit.RequestsUsed, 0);
+        UserBucket(user)?.Reset(Math.Max(remaining, 1), remaining);
+    }
+
+    public Task WaitAsync(CancellationToken ct) => WaitAsync(RateLimitCost.Default, ct);
+
+    public Task WaitAsync(RateLimitCost cost, CancellationToken ct)
+    {
+        var global = cost.Class == RateLimitClass.WebSocket ? null : _global;
+        var classBucket = _classes.GetValueOrDefault(cost.Class);
+        var user = cost.Class == RateLimitClass.Exchange && (cost.User ?? _options.DefaultUser) is { } name
+            ? UserBucket(name)
+            : null;
+
+        // Common case: everything available, no allocation
+        if (TryTake(global, cost.Weight, out var globalTaken)
+            && TryTake(classBucket, cost.Weight, out var classTaken))
+        {
+            if (TryTakeUser(user, cost))
+                return Task.CompletedTask;
+            Refund(classBucket, classTaken);
+            Refund(global, globalTaken);
+        }
+        else
+        {
+            Refund(global, globalTaken);
+        }
+
+        return WaitSlowAsync(global, classBucket, user, cost, ct);
+    }
+
+    private static async Task WaitSlowAsync(
+        TokenBucket? global, TokenBucket? classBucket, TokenBucket? user, RateLimitCost cost, CancellationToken ct)
+    {
+        var globalTaken = 0;
+        var classTaken = 0;
+        try
+        {
+            globalTaken = await Take(global, cost.Weight, cost.Priority, ct);
+            classTaken = await Take(classBucket, cost.Weight, cost.Priority, ct);
+            if (cost.Priority != RateLimitPriority.High)
+                await Take(user, cost.Actions, cost.Priority, ct);
+            else
+                user?.TryAcquire(Math.Min(cost.Actions, user.Capacity));
+        }
+        catch (OperationCanceledException)
+        {
+            Refund(classBucket, classTaken);
+            Refund(global, globalTaken);
+            throw;
+        }
+    }
+
+    private static bool TryTakeUser(TokenBucket? user, RateLimitCost cost)
+    {
+        if (user is null) return true;
+        var actions = Math.Min(cost.Actions, user.Capacity);
+        if (cost.Priority == RateLimitPriority.High)
+        {
+            user.TryAcquire(actions);
+            return true;
+        }
+        return user.WaitingCount == 0 && user.TryAcquire(actions);
+    }
+
+    private static bool TryTake(TokenBucket? bucket, int weight, out int taken)
+    {
+        taken = 0;
+        if (bucket is null) return true;
+        if (bucket.WaitingCount > 0) return false;
+        var tokens = Math.Min(weight, bucket.Capacity);
+        if (!bucket.TryAcquire(tokens)) return false;
+        taken = tokens;
+        return true;
+    }
+
+    private static async Task<int> Take(TokenBucket? bucket, int weight, RateLimitPriority priority, CancellationToken ct)
+    {
+        if (bucket is null) return 0;
+        var tokens = Math.Min(weight, bucket.Capacity);
+        await bucket.WaitAsync(tokens, priority, ct);
+        return tokens;
+    }
+
+    private static void Refund(TokenBucket? bucket, int tokens)
+    {
+        if (bucket is not null && tokens > 0)
+            bucket.Refund(tokens);
+    }
+
+    private static TokenBucket? Create(RateLimitBucketOptions? options) =>
+        options is null ? null : TokenBucket.PerPeriod(options.Capacity, options.Period);
+}
@@ -0,0 +1,47 @@
+using System.Runtime.CompilerServices;
+using Connector.Core.Abstractions;
+using Connector.Core.Recording;
+
+namespace Connector.Core.Transport;
+
+/// <summary>
+/// Wraps another <see cref="IWsTransport"/> and appends every inbound frame to a
+/// <see cref="FrameRecorder"/> before passing it on unchanged. Takes ownership of both.
+/// </summary>
+public sealed class RecordingWsTransport : IWsTransport
+{
+    private readonly IWsTransport _inner;
+    private readonly FrameRecorder _recorder;
+
+    public RecordingWsTransport(IWsTransport inner, FrameRecorder recorder)
+    {
+        _inner = inner;
+        _recorder = recorder;
+    }
+
+    public FrameRecorder Recorder => _recorder;
+
+    public bool IsConnected => _inner.IsConnected;
+
+    public Task ConnectAsync(Uri uri, CancellationToken ct) => _inner.ConnectAsync(uri, ct);
+
+    public Task DisconnectAsync(CancellationToken ct) => _inner.DisconnectAsync(ct);
+
+    public Task SendAsync(TransportWsMessage message, CancellationToken ct) => _inner.SendAsync(message, ct);
+
+    public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync(
+        [EnumeratorCancellation] CancellationToken ct)
+    {
+        await foreach (var inbound in _inner.ReceiveAsync(ct))
+        {
+            _recorder.Append(inbound);
+            yield return inbound;
+        }
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        await _inner.DisposeAsync();
+        _recorder.Dispose();
+    }
+}
@@ -0,0 +1,138 @@
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using Connector.Core.Abstractions;
+using Connector.Core.Recording;
+using Microsoft.Extensions.Logging;
+
+namespace Connector.Core.Transport;
+
+public sealed class ReplayOptions
+{
+    /// <summary>
+    /// Playback rate relative to recorded time (2 = twice as fast). Zero or less replays as
+    /// fast as the consumer reads.
+    /// </summary>
+    public double Speed { get; init; }
+
+    /// <summary>Start at the first frame recorded at or after this time.</summary>
+    public DateTimeOffset? From { get; init; }
+
+    /// <summary>Stop after the last frame recorded at or before this time.</summary>
+    public DateTimeOffset? To { get; init; }
+}
+
+/// <summary>
+/// <see cref="IWsTransport"/> that plays back a <see cref="FrameRecorder"/> directory, so the
+/// regular translator and managers can run on recorded traffic. Frames keep their recorded
+/// <see cref="TransportWsInbound.ReceivedAt"/>. Outbound messages are ignored and the
+/// stream ends after the last frame.
+/// </summary>
+public sealed class ReplayWsTransport : IWsTransport
+{
+    private readonly RecordingReader _reader;
+    private readonly ReplayOptions _options;
+    private readonly ILogger<ReplayWsTransport> _logger;
+    private readonly object _lock = new();
+    private DateTimeOffset? _pendingSeek;
+    private bool _connected;
+    private bool _disposed;
+
+    public ReplayWsTransport(string directory, ILogger<ReplayWsTransport> logger, ReplayOptions? options = null)
+    {
+        _reader = new RecordingReader(directory);
+        _options = options ?? new ReplayOptions();
+        _logger = logger;
+        _pendingSeek = _options.From;
+    }
+
+    public bool IsConnected => _connected;
+
+    /// <summary>First and last recorded frame times, or <c>null</c> for an empty recording.</summary>
+    public DateTimeOffset? StartTime => _reader.StartTime;
+    public DateTimeOffset? EndTime => _reader.EndTime;
+
+    public Task ConnectAsync(Uri uri, CancellationToken ct)
+    {
+        _connected = true;
+        _logger.LogInformation("Replaying {Segments} segments ({Start} to {End}) at {Speed}",
+            _reader.SegmentCount, StartTime, EndTime, _options.Speed > 0 ? $"{_options.Speed}x" : "max speed");
+        return Task.CompletedTask;
+    }
+
+    public Task DisconnectAsync(CancellationToken ct)
+    {
+        _connected = false;
+        return Task.CompletedTask;
+    }
+
+    public Task SendAsync(TransportWsMessage message, CancellationToken ct) => Task.CompletedTask;
+
+    /// <summary>
+    /// Continues playback from the first frame at or after <paramref name="timestamp"/>.
+    /// Takes effect before the next frame; with time scaling, pacing restarts from there.
+    /// </summary>
+    public void Seek(DateTimeOffset timestamp)
+    {
+        lock (_lock) _pendingSeek = timestamp;
+    }
+
+    public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync(
+        [EnumeratorCancellation] CancellationToken ct)
+    {
+        var speed = _options.Speed;
+        var toNs = _options.To is { } to ? RecordingFormat.ToUnixNanoseconds(to) : long.MaxValue;
+        long originNs = 0, originTimestamp = 0;
+        var paced = false;
+
+        while (_connected && !ct.IsCancellationRequested)
+        {
+            lock (_lock)
+            {
+                if (_pendingSeek is { } seek)
+                {
+                    _reader.Seek(seek);
+                    _pendingSeek = null;
+                    paced = false;
+                }
+            }
+
+            if (!_reader.TryRead(out var frame) || frame.TimestampNs > toNs)
+                break;
+
+            if (speed > 0)
+            {
+                if (!paced)
+                {
+                    (originNs, originTimestamp, paced) = (frame.TimestampNs, Stopwatch.GetTimestamp(), true);
+                }
+                else
+                {
+                    var due = TimeSpan.FromTicks((long)((frame.TimestampNs - originNs) / 100 / speed));
+                    var wait = due - Stopwatch.GetElapsedTime(originTimestamp);
+                    // Sub-millisecond gaps are not worth a timer; the next frame catches up
+                    if (wait >= TimeSpan.FromMilliseconds(1))
+                        await Task.Delay(wait, ct);
+                }
+            }
+
+            yield return new TransportWsInbound
+            {
+                Utf8Payload = frame.Payload,
+                ReceivedAt = frame.Timestamp,
+                ReceivedTimestamp = Stopwatch.GetTimestamp(),
+                RawBytes = frame.IsBinary ? frame.Payload.ToArray() : null
+            };
+        }
+
+        _logger.LogInformation("Replay finished");
+    }
+
+    public ValueTask DisposeAsync()
+    {
+        if (_disposed) return ValueTask.CompletedTask;
+        _disposed = true;
+        _connected = false;
+        _reader.Dispose();
+        return ValueTask.CompletedTask;
+    }
+}
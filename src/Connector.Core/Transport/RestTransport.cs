@@ -1,44 +1,107 @@
+using System.Net;
+using System.Net.Http.Headers;
+using System.Text;
 using Connector.Core.Abstractions;
 using Microsoft.Extensions.Logging;
 
 namespace Connector.Core.Transport;
 
+public sealed class RestTransportOptions
+{
+    /// <summary>Connections per server. HTTP/2 multiplexes requests, so a few go a long way.</summary>
+    public int MaxConnectionsPerServer { get; init; } = 16;
+
+    /// <summary>Recycle pooled connections so DNS changes are picked up.</summary>
+    public TimeSpan PooledConnectionLifetime { get; init; } = TimeSpan.FromMinutes(10);
+
+    public TimeSpan PooledConnectionIdleTimeout { get; init; } = TimeSpan.FromMinutes(2);
+
+    /// <summary>HTTP/2 PING interval that keeps idle connections warm and detects dead ones.</summary>
+    public TimeSpan KeepAlivePingDelay { get; init; } = TimeSpan.FromSeconds(15);
+
+    public TimeSpan KeepAlivePingTimeout { get; init; } = TimeSpan.FromSeconds(10);
+
+    public TimeSpan ConnectTimeout { get; init; } = TimeSpan.FromSeconds(10);
+
+    public TimeSpan RequestTimeout { get; init; } = TimeSpan.FromSeconds(30);
+
+    /// <summary>Copy response headers into <see cref="TransportRestResponse.Headers"/>.</summary>
+    public bool CaptureHeaders { get; init; }
+}
+
 /// <summary>
-/// REST transport using HttpClient with rate limiting and auth hooks.
+/// REST transport over HttpClient. Request and response bodies stay UTF-8 bytes end to end.
+/// Use <see cref="CreateHttpClient"/> for a pooled HTTP/2 client, or pass your own.
 /// </summary>
 public sealed class RestTransport : IRestTransport
 {
+    private static readonly MediaTypeHeaderValue JsonContentType = new("application/json") { CharSet = "utf-8" };
+
     private readonly HttpClient _httpClient;
     private readonly ILogger _logger;
+    private readonly string _baseUrl;
+    private readonly bool _captureHeaders;
 
     public RestTransport(HttpClient httpClient, ILogger<RestTransport> logger)
+        : this(httpClient, logger, captureHeaders: false)
+    {
+    }
+
+    public RestTransport(Uri baseAddress, ILogger<RestTransport> logger, RestTransportOptions? options = null)
+        : this(CreateHttpClient(baseAddress, options), logger, options?.CaptureHeaders ?? false)
+    {
+    }
+
+    private RestTransport(HttpClient httpClient, ILogger<RestTransport> logger, bool captureHeaders)
     {
         _httpClient = httpClient;
         _logger = logger;
+        _baseUrl = httpClient.BaseAddress!.GetLeftPart(UriPartial.Authority);
+        _captureHeaders = captureHeaders;
     }
 
-    public async Task<TransportRestResponse> SendAsync(TransportRestRequest request, CancellationToken ct)
+    /// <summary>
+    /// HttpClient on a <see cref="SocketsHttpHandler"/> tuned for many concurrent small
+    /// requests: HTTP/2 by default (falling back to 1.1), multiple HTTP/2 connections when
+    /// streams run out, keep-alive pings and compressed responses.
+    /// </summary>
+    public static HttpClient CreateHttpClient(Uri baseAddress, RestTransportOptions? options = null)
     {
-        var uriBuilder = new UriBuilder(_httpClient.BaseAddress!)
+        options ??= new RestTransportOptions();
+        var handler = new SocketsHttpHandler
         {
-            Path = request.Path
+            MaxConnectionsPerServer = options.MaxConnectionsPerServer,
+            PooledConnectionLifetime = options.PooledConnectionLifetime,
+            PooledConnectionIdleTimeout = options.PooledConnectionIdleTimeout,
+            EnableMultipleHttp2Connections = true,
+            KeepAlivePingDelay = options.KeepAlivePingDelay,
+            KeepAlivePingTimeout = options.KeepAlivePingTimeout,
+            KeepAlivePingPolicy = HttpKeepAlivePingPolicy.Always,
+            ConnectTimeout = options.ConnectTimeout,
+            AutomaticDecompression = DecompressionMethods.All,
+            UseCookies = false
         };
 
-        if (request.QueryParams is { Count: > 0 })
+        return new HttpClient(handler)
         {
-            var query = string.Join("&",
-                request.QueryParams.Select(kvp => $"{Uri.EscapeDataString(kvp.Key)}={Uri.EscapeDataString(kvp.Value)}"));
-            uriBuilder.Query = query;
-        }
+            BaseAddress = baseAddress,
+            Timeout = options.RequestTimeout,
+            DefaultRequestVersion = HttpVersion.Version20,
+            DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower
+        };
+    }
 
-        using var httpRequest = new HttpRequestMessage(request.Method, uriBuilder.Uri);
+    public async Task<TransportRestResponse> SendAsync(TransportRestRequest request, CancellationToken ct)
+    {
+        using var httpRequest = new HttpRequestMessage(request.Method, BuildUri(request));
 
-        if (request.Body is not null)
+        if (request.Utf8Body is { } body)
         {
-            httpRequest.Content = new StringContent(
-                request.Body,
-                System.Text.Encoding.UTF8,
-                request.ContentType ?? "application/json");
+            var content = new ReadOnlyMemoryContent(body);
+            content.Headers.ContentType = request.ContentType is null or "application/json"
+                ? JsonContentType
+                : new MediaTypeHeaderValue(request.ContentType);
+            httpRequest.Content = content;
         }
 
         if (request.Headers is not null)
@@ -49,19 +112,33 @@ public sealed class RestTransport : IRestTransport
             }
         }
 
-        _logger.LogDebug("REST {Method} {Uri}", request.Method, uriBuilder.Uri);
+        _logger.LogDebug("REST {Method} {Uri}", request.Method, httpRequest.RequestUri);
 
-        var httpResponse = await _httpClient.SendAsync(httpRequest, ct);
-        var body = await httpResponse.Content.ReadAsStringAsync(ct);
-
-        var responseHeaders = httpResponse.Headers
-            .ToDictionary(h => h.Key, h => string.Join(",", h.Value));
+        using var httpResponse = await _httpClient.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead, ct);
+        var responseBody = await httpResponse.Content.ReadAsByteArrayAsync(ct);
 
         return new TransportRestResponse
         {
             StatusCode = (int)httpResponse.StatusCode,
-            Body = body,
-            Headers = responseHeaders
+            Utf8Body = responseBody,
+            Headers = _captureHeaders
+                ? httpResponse.Headers.ToDictionary(h => h.Key, h => string.Join(",", h.Value))
+                : null
         };
     }
+
+    private Uri BuildUri(TransportRestRequest request)
+    {
+        if (request.QueryParams is not { Count: > 0 })
+            return new Uri(_baseUrl + request.Path, UriKind.Absolute);
+
+        var url = new StringBuilder(_baseUrl).Append(request.Path);
+        var separator = '?';
+        foreach (var (key, value) in request.QueryParams)
+        {
+            url.Append(separator).Append(Uri.EscapeDataString(key)).Append('=').Append(Uri.EscapeDataString(value));
+            separator = '&';
+        }
+        return new Uri(url.ToString(), UriKind.Absolute);
+    }
 }
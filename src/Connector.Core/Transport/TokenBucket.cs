@@ -0,0 +1,229 @@
+using System.Diagnostics;
+using Connector.Core.Abstractions;
+
+namespace Connector.Core.Transport;
+
+/// <summary>
+/// Token bucket kept as a single "theoretical arrival time" (GCRA): the bucket is full when
+/// that time is in the past, and each token pushes it forward by one refill interval. Taking
+/// tokens is one compare-and-swap with no lock or timer. Callers that have to wait queue in
+/// FIFO order (high priority first) and are woken at the exact time their tokens become
+/// available.
+/// </summary>
+public sealed class TokenBucket
+{
+    private readonly object _queueLock = new();
+    private readonly Queue<Waiter> _high = new();
+    private readonly Queue<Waiter> _normal = new();
+    private readonly SemaphoreSlim _wake = new(0);
+    private readonly long _ticksPerToken;
+    private long _burstTicks;
+    private long _tat;
+    private int _waiting;
+    private bool _pumping;
+
+    /// <param name="capacity">Maximum tokens held; the bucket starts full.</param>
+    /// <param name="refillInterval">Time to earn back one token.</param>
+    public TokenBucket(int capacity, TimeSpan refillInterval)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacity);
+        if (refillInterval <= TimeSpan.Zero)
+            throw new ArgumentOutOfRangeException(nameof(refillInterval));
+
+        _ticksPerToken = Math.Max(1, (long)(refillInterval.TotalSeconds * Stopwatch.Frequency));
+        _burstTicks = capacity * _ticksPerToken;
+        _tat = Stopwatch.GetTimestamp();
+    }
+
+    /// <summary><paramref name="capacity"/> tokens earned evenly over <paramref name="period"/>.</summary>
+    public static TokenBucket PerPeriod(int capacity, TimeSpan period) => new(capacity, period / capacity);
+
+    public int Capacity => (int)(Volatile.Read(ref _burstTicks) / _ticksPerToken);
+
+    public TimeSpan RefillInterval => TimeSpan.FromSeconds((double)_ticksPerToken / Stopwatch.Frequency);
+
+    /// <summary>Whole tokens available right now.</summary>
+    public int AvailableTokens
+    {
+        get
+        {
+            var debt = Volatile.Read(ref _tat) - Stopwatch.GetTimestamp();
+            return debt <= 0 ? Capacity : (int)Math.Max(0, (Volatile.Read(ref _burstTicks) - debt) / _ticksPerToken);
+        }
+    }
+
+    /// <summary>Callers currently queued.</summary>
+    public int WaitingCount => Volatile.Read(ref _waiting);
+
+    /// <summary>
+    /// Takes <paramref name="tokens"/> if they are available now. Does not queue, and does
+    /// not respect callers already waiting.
+    /// </summary>
+    public bool TryAcquire(int tokens = 1)
+    {
+        var cost = tokens * _ticksPerToken;
+        while (true)
+        {
+            var now = Stopwatch.GetTimestamp();
+            var tat = Volatile.Read(ref _tat);
+            var next = Math.Max(tat, now) + cost;
+            if (next - Volatile.Read(ref _burstTicks) > now)
+                return false;
+            if (Interlocked.CompareExchange(ref _tat, next, tat) == tat)
+                return true;
+        }
+    }
+
+    /// <summary>
+    /// Completes once <paramref name="tokens"/> have been taken. Returns a completed task
+    /// without allocating when they are available and nobody of equal or higher priority
+    /// is queued.
+    /// </summary>
+    public Task WaitAsync(int tokens, RateLimitPriority priority, CancellationToken ct)
+    {
+        if (tokens > Capacity)
+            throw new ArgumentOutOfRangeException(nameof(tokens), tokens, $"Exceeds bucket capacity {Capacity}");
+        ct.ThrowIfCancellationRequested();
+
+        if (Volatile.Read(ref _waiting) == 0 || (priority == RateLimitPriority.High && HighQueueEmpty()))
+        {
+            if (TryAcquire(tokens))
+                return Task.CompletedTask;
+        }
+
+        return Enqueue(tokens, priority, ct);
+    }
+
+    /// <summary>Returns tokens taken for work that did not go ahead.</summary>
+    public void Refund(int tokens)
+    {
+        Interlocked.Add(ref _tat, -tokens * _ticksPerToken);
+        if (Volatile.Read(ref _waiting) > 0)
+            _wake.Release();
+    }
+
+    /// <summary>
+    /// Replaces the capacity and current fill level, e.g. from a budget the exchange
+    /// reported. Queued callers are re-evaluated against the new state; one asking for more
+    /// than the new capacity is served once the bucket is full.
+    /// </summary>
+    public void Reset(int capacity, int available)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacity);
+        available = Math.Clamp(available, 0, capacity);
+
+        Volatile.Write(ref _burstTicks, capacity * _ticksPerToken);
+        Volatile.Write(ref _tat, Stopwatch.GetTimestamp() + (capacity - available) * _ticksPerToken);
+        if (Volatile.Read(ref _waiting) > 0)
+            _wake.Release();
+    }
+
+    private bool HighQueueEmpty()
+    {
+        lock (_queueLock) return _high.Count == 0;
+    }
+
+    private Task Enqueue(int tokens, RateLimitPriority priority, CancellationToken ct)
+    {
+        var waiter = new Waiter(tokens);
+        bool startPump;
+        lock (_queueLock)
+        {
+            (priority == RateLimitPriority.High ? _high : _normal).Enqueue(waiter);
+            _waiting++;
+            startPump = !_pumping;
+            _pumping = true;
+        }
+
+        if (ct.CanBeCanceled)
+            waiter.Registration = ct.Register(static (state, token) =>
+            {
+                var (bucket, w) = ((TokenBucket, Waiter))state!;
+                if (w.Completion.TrySetCanceled(token))
+                    bucket._wake.Release();
+            }, (this, waiter));
+
+        if (startPump)
+            _ = Task.Run(PumpAsync);
+        else if (priority == RateLimitPriority.High)
+            _wake.Release();
+
+        return waiter.Completion.Task;
+    }
+
+    /// <summary>
+    /// Serves the queue head whenever its tokens become available. Sleeps until exactly that
+    /// moment; new high-priority arrivals, refunds, resets and cancellations wake it early so
+    /// it can re-pick the head.
+    /// </summary>
+    private async Task PumpAsync()
+    {
+        while (true)
+        {
+            Waiter? granted = null;
+            long waitTicks;
+            lock (_queueLock)
+            {
+                var queue = NextQueue();
+                if (queue is null)
+                {
+                    _pumping = false;
+                    return;
+                }
+
+                // Capacity may have shrunk below the request since it queued
+                var head = queue.Peek();
+                head.Tokens = Math.Min(head.Tokens, Capacity);
+                if (TryAcquire(head.Tokens))
+                {
+                    queue.Dequeue();
+                    _waiting--;
+                    granted = head;
+                    waitTicks = 0;
+                }
+                else
+                {
+                    var now = Stopwatch.GetTimestamp();
+                    waitTicks = Math.Max(Volatile.Read(ref _tat), now) + head.Tokens * _ticksPerToken
+                        - Volatile.Read(ref _burstTicks) - now;
+                }
+            }
+
+            if (granted is not null)
+            {
+                granted.Registration.Dispose();
+                if (!granted.Completion.TrySetResult())
+                    Refund(granted.Tokens); // Cancelled between acquire and grant
+                continue;
+            }
+
+            if (waitTicks > 0)
+                await _wake.WaitAsync(Stopwatch.GetElapsedTime(0, waitTicks)).ConfigureAwait(false);
+        }
+    }
+
+    /// <summary>Drops cancelled heads and returns the queue to serve next, if any.</summary>
+    private Queue<Waiter>? NextQueue()
+    {
+        foreach (var queue in (ReadOnlySpan<Queue<Waiter>>)[_high, _normal])
+        {
+            while (queue.TryPeek(out var head) && head.Completion.Task.IsCompleted)
+            {
+                queue.Dequeue();
+                _waiting--;
+            }
+
+            if (queue.Count > 0)
+                return queue;
+        }
+
+        return null;
+    }
+
+    private sealed class Waiter(int tokens)
+    {
+        public int Tokens { get; set; } = tokens;
+        public TaskCompletionSource Completion { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        public CancellationTokenRegistration Registration { get; set; }
+    }
+}
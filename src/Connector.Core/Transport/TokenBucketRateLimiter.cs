@@ -3,58 +3,26 @@ using Connector.Core.Abstractions;
 namespace Connector.Core.Transport;
 
 /// <summary>
-/// Simple token-bucket rate limiter.
+/// Single token-bucket rate limiter. A cost's weight is the number of tokens it takes;
+/// class and user are ignored. See <see cref="HierarchicalRateLimiter"/> for per-class and
+/// per-user limits.
 /// </summary>
 public sealed class TokenBucketRateLimiter : IRateLimiter
 {
-    private readonly SemaphoreSlim _semaphore = new(1, 1);
-    private readonly int _maxTokens;
-    private readonly TimeSpan _refillInterval;
-    private int _tokens;
-    private DateTimeOffset _lastRefill;
+    private readonly TokenBucket _bucket;
 
+    /// <param name="maxTokens">Burst size; the bucket starts full.</param>
+    /// <param name="refillInterval">Time to earn back one token.</param>
     public TokenBucketRateLimiter(int maxTokens, TimeSpan refillInterval)
     {
-        _maxTokens = maxTokens;
-        _refillInterval = refillInterval;
-        _tokens = maxTokens;
-        _lastRefill = DateTimeOffset.UtcNow;
+        _bucket = new TokenBucket(maxTokens, refillInterval);
     }
 
-    public async Task WaitAsync(CancellationToken ct)
-    {
-        while (true)
-        {
-            ct.ThrowIfCancellationRequested();
-            await _semaphore.WaitAsync(ct);
-            try
-            {
-                Refill();
-                if (_tokens > 0)
-                {
-                    _tokens--;
-                    return;
-                }
-            }
-            finally
-            {
-                _semaphore.Release();
-            }
+    public TokenBucket Bucket => _bucket;
 
-            // Wait for next refill opportunity
-            await Task.Delay(50, ct);
-        }
-    }
+    public Task WaitAsync(CancellationToken ct) =>
+        _bucket.WaitAsync(1, RateLimitPriority.Normal, ct);
 
-    private void Refill()
-    {
-        var now = DateTimeOffset.UtcNow;
-        var elapsed = now - _lastRefill;
-        if (elapsed >= _refillInterval)
-        {
-            var refills = (int)(elapsed / _refillInterval);
-            _tokens = Math.Min(_maxTokens, _tokens + refills);
-            _lastRefill = now;
-        }
-    }
+    public Task WaitAsync(RateLimitCost cost, CancellationToken ct) =>
+        _bucket.WaitAsync(Math.Min(cost.Weight, _bucket.Capacity), cost.Priority, ct);
 }
@@ -1,3 +1,6 @@
+using System.Text;
+using Connector.Core.Abstractions;
+
 namespace Connector.Core.Transport;
 
 /// <summary>
@@ -6,38 +9,141 @@ namespace Connector.Core.Transport;
 public sealed class TransportWsMessage
 {
     public required string Payload { get; init; }
+
+    /// <summary>
+    /// Set by translators on subscribe/unsubscribe messages so transports can replay
+    /// subscriptions after a reconnect and shard them across connections.
+    /// </summary>
+    public TransportWsMessageKind Kind { get; init; }
+
+    /// <summary>
+    /// Identity of the subscription a subscribe/unsubscribe message refers to; the same
+    /// value for both directions.
+    /// </summary>
+    public string? SubscriptionKey { get; init; }
+
+    public RateLimitCost Cost { get; init; } = RateLimitCost.WebSocketMessage;
+}
+
+public enum TransportWsMessageKind
+{
+    Other,
+    Subscribe,
+    Unsubscribe
 }
 
 /// <summary>
 /// Inbound WebSocket message (exchange-native format).
+/// <see cref="Utf8Payload"/> is the primary representation; <see cref="Payload"/> is decoded
+/// lazily on first access. Transports hand out pooled buffers, so the bytes are only valid
+/// until the transport yields its next message.
 /// </summary>
 public sealed class TransportWsInbound
 {
-    public required string Payload { get; init; }
+    private string? _payload;
+    private ReadOnlyMemory<byte> _utf8Payload;
+
+    public string Payload
+    {
+        get => _payload ??= Encoding.UTF8.GetString(_utf8Payload.Span);
+        init => _payload = value;
+    }
+
+    public ReadOnlyMemory<byte> Utf8Payload
+    {
+        get
+        {
+            if (_utf8Payload.IsEmpty && _payload is not null)
+                _utf8Payload = Encoding.UTF8.GetBytes(_payload);
+            return _utf8Payload;
+        }
+        init => _utf8Payload = value;
+    }
+
     public required DateTimeOffset ReceivedAt { get; init; }
+
+    /// <summary>
+    /// <see cref="System.Diagnostics.Stopwatch"/> timestamp of the last frame, or zero when the
+    /// transport does not stamp messages. Latency stages are measured from here.
+    /// </summary>
+    public long ReceivedTimestamp { get; init; }
+
     public byte[]? RawBytes { get; init; }
 }
 
 /// <summary>
 /// Outbound REST request (exchange-native format).
+/// Set either <see cref="Body"/> or <see cref="Utf8Body"/>; the other is derived on first access.
 /// </summary>
 public sealed class TransportRestRequest
 {
+    private string? _body;
+    private ReadOnlyMemory<byte>? _utf8Body;
+
     public required HttpMethod Method { get; init; }
     public required string Path { get; init; }
-    public string? Body { get; init; }
+
+    public string? Body
+    {
+        get => _body ??= _utf8Body is { } utf8 ? Encoding.UTF8.GetString(utf8.Span) : null;
+        init => _body = value;
+    }
+
+    public ReadOnlyMemory<byte>? Utf8Body
+    {
+        get => _utf8Body ??= _body is not null ? Encoding.UTF8.GetBytes(_body) : null;
+        init => _utf8Body = value;
+    }
+
     public string? ContentType { get; init; }
     public Dictionary<string, string>? Headers { get; set; }
     public Dictionary<string, string>? QueryParams { get; init; }
+
+    /// <summary>Rate limit weight, class and priority; filled in by the translator.</summary>
+    public RateLimitCost Cost { get; init; } = RateLimitCost.Default;
+
+    /// <summary>
+    /// Read-only request whose response can be shared: identical requests in flight at the
+    /// same time are sent once.
+    /// </summary>
+    public bool IsIdempotent { get; init; }
+
+    /// <summary>
+    /// How long a successful response may be reused for identical idempotent requests.
+    /// Zero disables caching.
+    /// </summary>
+    public TimeSpan CacheTtl { get; init; }
 }
 
 /// <summary>
 /// Inbound REST response (exchange-native format).
+/// <see cref="Utf8Body"/> is the primary representation; <see cref="Body"/> is decoded
+/// lazily on first access.
 /// </summary>
 public sealed class TransportRestResponse
 {
+    private string? _body;
+    private ReadOnlyMemory<byte> _utf8Body;
+
     public required int StatusCode { get; init; }
-    public required string Body { get; init; }
+
+    public string Body
+    {
+        get => _body ??= Encoding.UTF8.GetString(_utf8Body.Span);
+        init => _body = value;
+    }
+
+    public ReadOnlyMemory<byte> Utf8Body
+    {
+        get
+        {
+            if (_utf8Body.IsEmpty && _body is not null)
+                _utf8Body = Encoding.UTF8.GetBytes(_body);
+            return _utf8Body;
+        }
+        init => _utf8Body = value;
+    }
+
     public Dictionary<string, string>? Headers { get; init; }
 }
 
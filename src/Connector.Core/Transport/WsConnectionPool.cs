@@ -0,0 +1,303 @@
+using System.Buffers;
+using System.Runtime.CompilerServices;
+using System.Threading.Channels;
+using Connector.Core.Abstractions;
+using Connector.Core.Diagnostics;
+using Connector.Core.Internal;
+using Microsoft.Extensions.Logging;
+
+namespace Connector.Core.Transport;
+
+public sealed class WsConnectionPoolOptions
+{
+    /// <summary>Number of shards; each owns one socket (two with <see cref="HotStandby"/>).</summary>
+    public int Connections { get; init; } = 2;
+
+    /// <summary>
+    /// Open a duplicate socket per shard with the same subscriptions and keep whichever copy
+    /// of each message arrives first.
+    /// </summary>
+    public bool HotStandby { get; init; }
+
+    /// <summary>How long a delivered payload is remembered for duplicate suppression.</summary>
+    public TimeSpan DedupWindow { get; init; } = TimeSpan.FromSeconds(5);
+
+    public int DedupCapacity { get; init; } = 16_384;
+
+    /// <summary>Bound of the merged inbound queue; receive tasks wait when it is full.</summary>
+    public int QueueCapacity { get; init; } = 8_192;
+}
+
+/// <summary>
+/// Point-in-time health of one pooled connection.
+/// </summary>
+public sealed class WsConnectionHealth
+{
+    public required int Shard { get; init; }
+    public required bool IsStandby { get; init; }
+    public required bool IsConnected { get; init; }
+    public required int Subscriptions { get; init; }
+    public required long Messages { get; init; }
+    public required long Bytes { get; init; }
+
+    /// <summary>Messages from this socket discarded because the shard's other socket delivered them first.</summary>
+    public required long Duplicates { get; init; }
+
+    public required long Reconnects { get; init; }
+    public DateTimeOffset? LastMessageAt { get; init; }
+}
+
+/// <summary>
+/// <see cref="IWsTransport"/> over several <see cref="WsTransport"/> sockets. Subscriptions
+/// are spread across shards (least-loaded first), each socket runs its own receive task and
+/// replays its subscriptions after reconnecting, and all traffic is merged into one stream.
+/// Non-subscription messages (posts, actions, pings) go to a single primary socket, shard 0's
+/// unless it is down, so they run exactly once.
+/// </summary>
+public sealed class WsConnectionPool : IWsTransport
+{
+    private readonly ILogger _logger;
+    private readonly WsConnectionPoolOptions _options;
+    private readonly Shard[] _shards;
+    private readonly Dictionary<string, Shard> _assignments = new(StringComparer.Ordinal);
+    private readonly Channel<PooledInbound> _inbound;
+    private CancellationTokenSource? _receiveCts;
+    private Task[] _receiveTasks = [];
+    private bool _disposed;
+
+    public WsConnectionPool(ILoggerFactory loggerFactory, WsConnectionPoolOptions? options = null, ConnectorMetrics? metrics = null)
+    {
+        _logger = loggerFactory.CreateLogger<WsConnectionPool>();
+        _options = options ?? new WsConnectionPoolOptions();
+        if (_options.Connections < 1)
+            throw new ArgumentOutOfRangeException(nameof(options), "At least one connection is required");
+
+        _shards = Enumerable.Range(0, _options.Connections)
+            .Select(i => new Shard(i, loggerFactory, _options, metrics))
+            .ToArray();
+        _inbound = Channel.CreateBounded<PooledInbound>(new BoundedChannelOptions(_options.QueueCapacity)
+        {
+            FullMode = BoundedChannelFullMode.Wait,
+            SingleReader = true
+        });
+    }
+
+    /// <summary>True when every shard has at least one open socket.</summary>
+    public bool IsConnected => _shards.All(s => s.Connections.Any(c => c.Transport.IsConnected));
+
+    public async Task ConnectAsync(Uri uri, CancellationToken ct)
+    {
+        await Task.WhenAll(AllConnections().Select(c => c.Transport.ConnectAsync(uri, ct)));
+        _logger.LogInformation("Connection pool connected: {Shards} shards, hot standby {HotStandby}",
+            _shards.Length, _options.HotStandby);
+    }
+
+    public async Task DisconnectAsync(CancellationToken ct)
+    {
+        _receiveCts?.Cancel();
+        await Task.WhenAll(AllConnections().Select(c => c.Transport.DisconnectAsync(ct)));
+
+        try { await Task.WhenAll(_receiveTasks); }
+        catch (OperationCanceledException) { }
+
+        lock (_shards)
+        {
+            _receiveCts?.Dispose();
+            _receiveCts = null;
+            _receiveTasks = [];
+        }
+    }
+
+    public Task SendAsync(TransportWsMessage message, CancellationToken ct)
+    {
+        if (message.Kind == TransportWsMessageKind.Other || message.SubscriptionKey is null)
+            return ControlConnection().Transport.SendAsync(message, ct);
+
+        Shard? shard;
+        lock (_assignments)
+        {
+            if (message.Kind == TransportWsMessageKind.Subscribe)
+            {
+                if (!_assignments.TryGetValue(message.SubscriptionKey, out shard))
+                {
+                    shard = _shards.MinBy(s => s.Subscriptions)!;
+                    shard.Subscriptions++;
+                    _assignments[message.SubscriptionKey] = shard;
+                }
+            }
+            else if (_assignments.Remove(message.SubscriptionKey, out shard))
+            {
+                shard.Subscriptions--;
+            }
+        }
+
+        return shard is null
+            ? Task.CompletedTask
+            : Task.WhenAll(shard.Connections.Select(c => c.Transport.SendAsync(message, ct)));
+    }
+
+    /// <summary>
+    /// Merged inbound stream. As with <see cref="WsTransport"/>, each payload buffer is
+    /// recycled when the next message is requested.
+    /// </summary>
+    public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync(
+        [EnumeratorCancellation] CancellationToken ct)
+    {
+        StartReceiving();
+
+        byte[]? lent = null;
+        try
+        {
+            while (await _inbound.Reader.WaitToReadAsync(ct))
+            {
+                while (_inbound.Reader.TryRead(out var item))
+                {
+                    if (lent is not null) ArrayPool<byte>.Shared.Return(lent);
+                    lent = item.Buffer;
+
+                    yield return new TransportWsInbound
+                    {
+                        Utf8Payload = item.Buffer.AsMemory(0, item.Length),
+                        ReceivedAt = item.ReceivedAt,
+                        ReceivedTimestamp = item.ReceivedTimestamp,
+                        RawBytes = item.RawBytes
+                    };
+                }
+            }
+        }
+        finally
+        {
+            if (lent is not null) ArrayPool<byte>.Shared.Return(lent);
+        }
+    }
+
+    public IReadOnlyList<WsConnectionHealth> GetHealth() =>
+        _shards.SelectMany(shard => shard.Connections.Select(c => new WsConnectionHealth
+        {
+            Shard = shard.Index,
+            IsStandby = c.IsStandby,
+            IsConnected = c.Transport.IsConnected,
+            Subscriptions = c.Transport.ActiveSubscriptions.Count,
+            Messages = Interlocked.Read(ref c.Messages),
+            Bytes = Interlocked.Read(ref c.Bytes),
+            Duplicates = Interlocked.Read(ref c.Duplicates),
+            Reconnects = c.Transport.ReconnectCount,
+            LastMessageAt = c.LastMessageAt
+        })).ToArray();
+
+    private void StartReceiving()
+    {
+        lock (_shards)
+        {
+            if (_receiveCts is not null) return;
+            _receiveCts = new CancellationTokenSource();
+            var ct = _receiveCts.Token;
+            _receiveTasks = AllConnections()
+                .Select(c => Task.Run(() => ReceiveLoopAsync(c, ct), ct))
+                .ToArray();
+        }
+    }
+
+    private async Task ReceiveLoopAsync(Connection connection, CancellationToken ct)
+    {
+        var shard = _shards[connection.Shard];
+        try
+        {
+            await foreach (var msg in connection.Transport.ReceiveAsync(ct))
+            {
+                var payload = msg.Utf8Payload;
+                Interlocked.Increment(ref connection.Messages);
+                Interlocked.Add(ref connection.Bytes, payload.Length);
+                Interlocked.Exchange(ref connection.LastMessageTicks, msg.ReceivedAt.UtcTicks);
+
+                if (shard.Dedup is not null && !shard.Dedup.TryAccept(payload.Span, msg.ReceivedAt))
+                {
+                    Interlocked.Increment(ref connection.Duplicates);
+                    continue;
+                }
+
+                // The socket reuses its buffer on the next receive, so take a pooled copy
+                var buffer = ArrayPool<byte>.Shared.Rent(payload.Length);
+                payload.Span.CopyTo(buffer);
+                await _inbound.Writer.WriteAsync(new PooledInbound(buffer, payload.Length, msg.ReceivedAt, msg.ReceivedTimestamp, msg.RawBytes), ct);
+            }
+        }
+        catch (OperationCanceledException) { }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Receive loop failed for shard {Shard} (standby {IsStandby})",
+                connection.Shard, connection.IsStandby);
+        }
+    }
+
+    private IEnumerable<Connection> AllConnections() => _shards.SelectMany(s => s.Connections);
+
+    /// <summary>First connected primary; shard 0's when none is, so the send reports the failure.</summary>
+    private Connection ControlConnection() =>
+        _shards.Select(s => s.Connections[0]).FirstOrDefault(c => c.Transport.IsConnected)
+        ?? _shards[0].Connections[0];
+
+    public async ValueTask DisposeAsync()
+    {
+        if (_disposed) return;
+        _disposed = true;
+
+        await DisconnectAsync(CancellationToken.None);
+        foreach (var connection in AllConnections())
+            await connection.Transport.DisposeAsync();
+
+        _inbound.Writer.TryComplete();
+        while (_inbound.Reader.TryRead(out var item))
+            ArrayPool<byte>.Shared.Return(item.Buffer);
+    }
+
+    private readonly record struct PooledInbound(byte[] Buffer, int Length, DateTimeOffset ReceivedAt, long ReceivedTimestamp, byte[]? RawBytes);
+
+    private sealed class Shard
+    {
+        public Shard(int index, ILoggerFactory loggerFactory, WsConnectionPoolOptions options, ConnectorMetrics? metrics)
+        {
+            Index = index;
+            var primary = new Connection(index, isStandby: false, new WsTransport(loggerFactory.CreateLogger<WsTransport>(), metrics));
+            if (options.HotStandby)
+            {
+                var standby = new Connection(index, isStandby: true, new WsTransport(loggerFactory.CreateLogger<WsTransport>(), metrics));
+                Connections = [primary, standby];
+                Dedup = new PayloadDeduplicator(options.DedupWindow, options.DedupCapacity);
+            }
+            else
+            {
+                Connections = [primary];
+            }
+        }
+
+        public int Index { get; }
+        public Connection[] Connections { get; }
+        public PayloadDeduplicator? Dedup { get; }
+
+        /// <summary>Assigned subscription count; guarded by the pool's assignment lock.</summary>
+        public int Subscriptions { get; set; }
+    }
+
+    private sealed class Connection
+    {
+        public long Messages;
+        public long Bytes;
+        public long Duplicates;
+        public long LastMessageTicks;
+
+        public Connection(int shard, bool isStandby, WsTransport transport)
+        {
+            Shard = shard;
+            IsStandby = isStandby;
+            Transport = transport;
+        }
+
+        public int Shard { get; }
+        public bool IsStandby { get; }
+        public WsTransport Transport { get; }
+
+        public DateTimeOffset? LastMessageAt =>
+            Interlocked.Read(ref LastMessageTicks) is var ticks and > 0 ? new DateTimeOffset(ticks, TimeSpan.Zero) : null;
+    }
+}
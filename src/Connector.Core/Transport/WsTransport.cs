@@ -1,20 +1,29 @@
+using System.Buffers;
+using System.Diagnostics;
 using System.Net.WebSockets;
 using System.Runtime.CompilerServices;
 using System.Text;
 using Connector.Core.Abstractions;
+using Connector.Core.Diagnostics;
+using Connector.Core.Internal;
 using Microsoft.Extensions.Logging;
 
 namespace Connector.Core.Transport;
 
 /// <summary>
-/// WebSocket transport with exponential backoff reconnect.
+/// WebSocket transport with exponential backoff reconnect. Active subscriptions are
+/// recorded from outbound subscribe/unsubscribe messages and replayed after every reconnect.
 /// </summary>
 public sealed class WsTransport : IWsTransport
 {
     private readonly ILogger _logger;
+    private readonly ConnectorMetrics _metrics;
     private ClientWebSocket? _ws;
     private Uri? _uri;
     private bool _disposed;
+    private readonly SemaphoreSlim _sendLock = new(1, 1);
+    private readonly Dictionary<string, TransportWsMessage> _subscriptions = new(StringComparer.Ordinal);
+    private long _reconnects;
 
     // Reconnect policy
     private const int InitialBackoffMs = 500;
@@ -22,11 +31,24 @@ public sealed class WsTransport : IWsTransport
     private const double BackoffMultiplier = 2.0;
     private const double JitterFactor = 0.25;
 
+    // Receive buffer (grows for large messages such as full l2Book snapshots)
+    private const int InitialBufferSize = 16384;
+
     public bool IsConnected => _ws?.State == WebSocketState.Open;
 
-    public WsTransport(ILogger<WsTransport> logger)
+    /// <summary>Successful reconnects since construction.</summary>
+    public long ReconnectCount => Interlocked.Read(ref _reconnects);
+
+    /// <summary>Subscribe messages that will be replayed after a reconnect.</summary>
+    public IReadOnlyList<TransportWsMessage> ActiveSubscriptions
+    {
+        get { lock (_subscriptions) return _subscriptions.Values.ToArray(); }
+    }
+
+    public WsTransport(ILogger<WsTransport> logger, ConnectorMetrics? metrics = null)
     {
         _logger = logger;
+        _metrics = metrics ?? ConnectorMetrics.Shared;
     }
 
     public async Task ConnectAsync(Uri uri, CancellationToken ct)
@@ -35,6 +57,7 @@ public sealed class WsTransport : IWsTransport
         _ws = new ClientWebSocket();
         await _ws.ConnectAsync(uri, ct);
         _logger.LogInformation("WebSocket connected to {Uri}", uri);
+        await ReplaySubscriptionsAsync(_ws, ct);
     }
 
     public async Task DisconnectAsync(CancellationToken ct)
@@ -54,108 +77,147 @@ public sealed class WsTransport : IWsTransport
         _ws = null;
     }
 
+    /// <summary>
+    /// Sends <paramref name="message"/>. Subscribe/unsubscribe messages update the replay set
+    /// first; while disconnected they are not sent and take effect on reconnect.
+    /// </summary>
     public async Task SendAsync(TransportWsMessage message, CancellationToken ct)
     {
-        if (_ws is null || _ws.State != WebSocketState.Open)
+        var isSubscription = TrackSubscription(message);
+
+        var ws = _ws;
+        if (ws is null || ws.State != WebSocketState.Open)
+        {
+            if (isSubscription) return;
             throw new InvalidOperationException("WebSocket not connected");
+        }
+
+        await SendCoreAsync(ws, message, ct);
+    }
+
+    private bool TrackSubscription(TransportWsMessage message)
+    {
+        if (message.Kind == TransportWsMessageKind.Other || message.SubscriptionKey is null)
+            return false;
+
+        lock (_subscriptions)
+        {
+            if (message.Kind == TransportWsMessageKind.Subscribe)
+                _subscriptions[message.SubscriptionKey] = message;
+            else
+                _subscriptions.Remove(message.SubscriptionKey);
+        }
+        return true;
+    }
 
+    private async Task SendCoreAsync(ClientWebSocket ws, TransportWsMessage message, CancellationToken ct)
+    {
         var bytes = Encoding.UTF8.GetBytes(message.Payload);
-        await _ws.SendAsync(bytes, WebSocketMessageType.Text, true, ct);
+        await _sendLock.WaitAsync(ct);
+        try
+        {
+            await ws.SendAsync(bytes, WebSocketMessageType.Text, true, ct);
+        }
+        finally
+        {
+            _sendLock.Release();
+        }
     }
 
     public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync(
         [EnumeratorCancellation] CancellationToken ct)
     {
-        var buffer = new byte[16384];
+        // One pooled buffer per receive loop; frames of a multi-frame message are assembled
+        // in place and handed to the consumer without decoding. The buffer is reused for the
+        // next message, so consumers must finish with Utf8Payload before moving on.
+        var buffer = ArrayPool<byte>.Shared.Rent(InitialBufferSize);
         var backoffMs = InitialBackoffMs;
 
-        while (!ct.IsCancellationRequested)
+        try
         {
-            if (_ws is null || _ws.State != WebSocketState.Open)
+            while (!ct.IsCancellationRequested)
             {
-                if (_uri is not null)
+                if (_ws is null || _ws.State != WebSocketState.Open)
                 {
-                    await ReconnectWithBackoffAsync(backoffMs, ct);
-                    backoffMs = InitialBackoffMs; // reset after successful connect
-                }
-                else
-                {
-                    yield break;
-                }
-            }
-
-            WebSocketReceiveResult result;
-            try
-            {
-                result = await _ws!.ReceiveAsync(buffer, ct);
-                backoffMs = InitialBackoffMs; // reset on successful receive
-            }
-            catch (OperationCanceledException) { yield break; }
-            catch (WebSocketException ex)
-            {
-                _logger.LogWarning(ex, "WebSocket receive error, will reconnect");
-                _ws?.Dispose();
-                _ws = null;
-                backoffMs = Math.Min((int)(backoffMs * BackoffMultiplier), MaxBackoffMs);
-                continue;
-            }
-
-            if (result.MessageType == WebSocketMessageType.Close)
-            {
-                _logger.LogInformation("Server initiated close");
-                _ws?.Dispose();
-                _ws = null;
-                continue;
-            }
+                    if (_uri is null)
+                        yield break;
 
-            if (result.MessageType == WebSocketMessageType.Text)
-            {
-                var payload = Encoding.UTF8.GetString(buffer, 0, result.Count);
+                    try
+                    {
+                        await ReconnectWithBackoffAsync(backoffMs, ct);
+                        backoffMs = InitialBackoffMs; // reset after successful connect
+                    }
+                    catch (OperationCanceledException) { yield break; }
+                    catch (Exception)
+                    {
+                        // Keep retrying; a failed dial must not end the receive stream
+                        backoffMs = Math.Min((int)(backoffMs * BackoffMultiplier), MaxBackoffMs);
+                        continue;
+                    }
+                }
 
-                // Handle multi-frame messages
-                if (!result.EndOfMessage)
+                ValueWebSocketReceiveResult result;
+                var count = 0;
+                long firstFrameAt = 0;
+                try
                 {
-                    var sb = new StringBuilder(payload);
-                    while (!result.EndOfMessage && !ct.IsCancellationRequested)
+                    do
                     {
-                        result = await _ws.ReceiveAsync(buffer, ct);
-                        sb.Append(Encoding.UTF8.GetString(buffer, 0, result.Count));
+                        if (count == buffer.Length)
+                            buffer = GrowBuffer(buffer, count);
+
+                        result = await _ws!.ReceiveAsync(buffer.AsMemory(count), ct);
+                        count += result.Count;
+                        if (firstFrameAt == 0) firstFrameAt = Stopwatch.GetTimestamp();
                     }
-                    payload = sb.ToString();
-                }
+                    while (!result.EndOfMessage && result.MessageType != WebSocketMessageType.Close);
 
-                yield return new TransportWsInbound
+                    backoffMs = InitialBackoffMs; // reset on successful receive
+                }
+                catch (OperationCanceledException) { yield break; }
+                catch (WebSocketException ex)
                 {
-                    Payload = payload,
-                    ReceivedAt = DateTimeOffset.UtcNow
-                };
-            }
-            else if (result.MessageType == WebSocketMessageType.Binary)
-            {
-                // Collect full binary message
-                var data = new byte[result.Count];
-                Array.Copy(buffer, data, result.Count);
+                    _logger.LogWarning(ex, "WebSocket receive error, will reconnect");
+                    _ws?.Dispose();
+                    _ws = null;
+                    backoffMs = Math.Min((int)(backoffMs * BackoffMultiplier), MaxBackoffMs);
+                    continue;
+                }
 
-                if (!result.EndOfMessage)
+                if (result.MessageType == WebSocketMessageType.Close)
                 {
-                    using var ms = new MemoryStream();
-                    ms.Write(data, 0, data.Length);
-                    while (!result.EndOfMessage && !ct.IsCancellationRequested)
-                    {
-                        result = await _ws.ReceiveAsync(buffer, ct);
-                        ms.Write(buffer, 0, result.Count);
-                    }
-                    data = ms.ToArray();
+                    _logger.LogInformation("Server initiated close");
+                    _ws?.Dispose();
+                    _ws = null;
+                    continue;
                 }
 
+                var receivedAt = Stopwatch.GetTimestamp();
+                _metrics.RecordAssembly(receivedAt - firstFrameAt);
+
+                var payload = buffer.AsMemory(0, count);
                 yield return new TransportWsInbound
                 {
-                    Payload = Encoding.UTF8.GetString(data),
-                    ReceivedAt = DateTimeOffset.UtcNow,
-                    RawBytes = data
+                    Utf8Payload = payload,
+                    ReceivedAt = MonotonicClock.ToUtc(receivedAt),
+                    ReceivedTimestamp = receivedAt,
+                    // Binary frames keep their own copy so RawBytes outlives the pooled buffer
+                    RawBytes = result.MessageType == WebSocketMessageType.Binary ? payload.ToArray() : null
                 };
             }
         }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    private static byte[] GrowBuffer(byte[] buffer, int used)
+    {
+        var larger = ArrayPool<byte>.Shared.Rent(buffer.Length * 2);
+        Buffer.BlockCopy(buffer, 0, larger, 0, used);
+        ArrayPool<byte>.Shared.Return(buffer);
+        return larger;
     }
 
     private async Task ReconnectWithBackoffAsync(int backoffMs, CancellationToken ct)
@@ -173,7 +235,10 @@ public sealed class WsTransport : IWsTransport
         try
         {
             await _ws.ConnectAsync(_uri!, ct);
+            Interlocked.Increment(ref _reconnects);
+            _metrics.RecordReconnect();
             _logger.LogInformation("Reconnected to {Uri}", _uri);
+            await ReplaySubscriptionsAsync(_ws, ct);
         }
         catch (Exception ex)
         {
@@ -184,6 +249,16 @@ public sealed class WsTransport : IWsTransport
         }
     }
 
+    private async Task ReplaySubscriptionsAsync(ClientWebSocket ws, CancellationToken ct)
+    {
+        var subscriptions = ActiveSubscriptions;
+        foreach (var sub in subscriptions)
+            await SendCoreAsync(ws, sub, ct);
+
+        if (subscriptions.Count > 0)
+            _logger.LogInformation("Replayed {Count} subscriptions", subscriptions.Count);
+    }
+
     public async ValueTask DisposeAsync()
     {
         if (_disposed) return;
@@ -330,4 +330,34 @@ public class ContractSerializationTests
 
         Assert.True(req.AuthRequired);
     }
+
+    [Fact]
+    public void SourceGeneratedContext_MatchesReflectionOutput()
+    {
+        var at = DateTimeOffset.Parse("2026-01-01T00:00:00Z");
+        object[] contracts =
+        [
+            new OrderBookL2Event
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL2, Symbol = "ETH",
+                ReceivedAt = at, Sequence = 7, IsSnapshot = true,
+                Bids = [new PriceLevel { Price = 3000.1m, Size = 2m }], Asks = []
+            },
+            new ActiveAssetCtxEvent
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.ActiveAssetCtx, Symbol = "BTC",
+                ReceivedAt = at, MarkPrice = 50000m, FundingRate = 0.0001m, OpenInterest = 10m, OraclePrice = 49999.5m,
+                Raw = new RawPayload { RawJson = "{\"x\":\"<é>\"}" }
+            },
+            new GetMetaResponse { Assets = [new AssetMeta { Name = "BTC", SzDecimals = 5, MaxLeverage = 50m }] }
+        ];
+
+        foreach (var contract in contracts)
+        {
+            var type = contract.GetType();
+            Assert.Equal(
+                JsonSerializer.Serialize(contract, type, JsonOptions.Default),
+                JsonSerializer.Serialize(contract, ContractJsonContext.Default.GetTypeInfo(type)!));
+        }
+    }
 }
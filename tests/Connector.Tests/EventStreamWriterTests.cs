@@ -0,0 +1,158 @@
+using System.Buffers.Binary;
+using System.Text;
+using System.Text.Json;
+using Connector.Core.Contracts;
+using Connector.Core.Output;
+
+namespace Connector.Tests;
+
+public class EventStreamWriterTests
+{
+    private static readonly DateTimeOffset At = DateTimeOffset.Parse("2026-01-01T00:00:00Z");
+
+    [Fact]
+    public async Task Jsonl_MatchesJsonOptionsOutput_OneEventPerLine()
+    {
+        var events = new UnifiedWsEvent[] { Trades("BTC", 50000.5m), Trades("ETH", 3000m) };
+        using var stream = new MemoryStream();
+
+        await using (var writer = EventStreamWriter.Create(stream, EventOutputFormat.Jsonl))
+        {
+            foreach (var evt in events)
+                await writer.WriteAsync(evt);
+        }
+
+        var expected = string.Concat(events.Select(e => JsonSerializer.Serialize(e, e.GetType(), JsonOptions.Default) + "\n"));
+        Assert.Equal(expected, Encoding.UTF8.GetString(stream.ToArray()));
+    }
+
+    [Fact]
+    public async Task Writes_AreBatchedUntilThresholdOrFlush()
+    {
+        using var stream = new MemoryStream();
+        await using var writer = new JsonlEventWriter(stream, flushThreshold: 1024);
+
+        await writer.WriteAsync(Trades("BTC", 1m));
+        Assert.Equal(0, stream.Length);
+
+        for (int i = 0; stream.Length == 0 && i < 100; i++)
+            await writer.WriteAsync(Trades("BTC", i));
+        Assert.True(stream.Length >= 1024);
+
+        await writer.WriteAsync(Trades("BTC", 2m));
+        var before = stream.Length;
+        await writer.FlushAsync();
+        Assert.True(stream.Length > before);
+    }
+
+    [Fact]
+    public async Task Binary_WritesLengthPrefixedMessagePackMaps()
+    {
+        using var stream = new MemoryStream();
+        await using (var writer = EventStreamWriter.Create(stream, EventOutputFormat.Binary))
+        {
+            await writer.WriteAsync(Trades("BTC", 50000.5m));
+            await writer.WriteAsync(new NotificationEvent
+            {
+                Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Notifications, Symbol = "*",
+                ReceivedAt = At, Message = new string('x', 40) + "\"é\""
+            });
+        }
+
+        var bytes = stream.ToArray();
+        var records = new List<Dictionary<string, object?>>();
+        for (int offset = 0; offset < bytes.Length;)
+        {
+            var length = (int)BinaryPrimitives.ReadUInt32LittleEndian(bytes.AsSpan(offset));
+            var pos = offset + 4;
+            records.Add((Dictionary<string, object?>)MsgPack.Read(bytes, ref pos)!);
+            Assert.Equal(offset + 4 + length, pos);
+            offset = pos;
+        }
+
+        Assert.Equal(2, records.Count);
+        var trades = records[0];
+        Assert.Equal("hyperliquid", trades["exchange"]);
+        Assert.Equal("trades", trades["channel"]);
+        Assert.Equal(42L, trades["sequence"]);
+        Assert.False(trades.ContainsKey("raw"));
+        var trade = (Dictionary<string, object?>)Assert.Single((List<object?>)trades["trades"]!)!;
+        // Decimals stay exact; timestamps use the MessagePack timestamp extension
+        Assert.Equal("50000.5", trade["price"]);
+        Assert.Equal("2", trade["size"]);
+        Assert.Equal(At, trades["receivedAt"]);
+        Assert.Equal(At, trade["timestamp"]);
+        Assert.Equal(new string('x', 40) + "\"é\"", records[1]["message"]);
+    }
+
+    private static TradesEvent Trades(string symbol, decimal price) => new()
+    {
+        Exchange = UnifiedExchange.Hyperliquid,
+        Channel = UnifiedWsChannel.Trades,
+        Symbol = symbol,
+        ReceivedAt = At,
+        Sequence = 42,
+        Trades = [new TradeEntry { TradeId = "t1", Price = price, Size = 2m, Side = "buy", Timestamp = At }]
+    };
+
+    /// <summary>Decoder for the MessagePack subset the writer emits.</summary>
+    private static class MsgPack
+    {
+        public static object? Read(byte[] b, ref int p)
+        {
+            var t = b[p++];
+            switch (t)
+            {
+                case <= 0x7f: return (long)t;
+                case >= 0xe0: return (long)(sbyte)t;
+                case >= 0x80 and <= 0x8f: return Map(b, ref p, t & 0x0f);
+                case >= 0x90 and <= 0x9f: return Array(b, ref p, t & 0x0f);
+                case >= 0xa0 and <= 0xbf: return Str(b, ref p, t & 0x1f);
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xd7 when b[p] == 0xff:
+                {
+                    var v = BinaryPrimitives.ReadUInt64BigEndian(b.AsSpan(p + 1));
+                    p += 9;
+                    return DateTimeOffset.FromUnixTimeSeconds((long)(v & ((1UL << 34) - 1))).AddTicks((long)(v >> 34) / 100);
+                }
+                case 0xcb: { var v = BinaryPrimitives.ReadDoubleBigEndian(b.AsSpan(p)); p += 8; return v; }
+                case 0xd0: return (long)(sbyte)b[p++];
+                case 0xd1: { var v = BinaryPrimitives.ReadInt16BigEndian(b.AsSpan(p)); p += 2; return (long)v; }
+                case 0xd2: { var v = BinaryPrimitives.ReadInt32BigEndian(b.AsSpan(p)); p += 4; return (long)v; }
+                case 0xd3: { var v = BinaryPrimitives.ReadInt64BigEndian(b.AsSpan(p)); p += 8; return v; }
+                case 0xd9: return Str(b, ref p, b[p++]);
+                case 0xda: { var n = BinaryPrimitives.ReadUInt16BigEndian(b.AsSpan(p)); p += 2; return Str(b, ref p, n); }
+                case 0xdc: { var n = BinaryPrimitives.ReadUInt16BigEndian(b.AsSpan(p)); p += 2; return Array(b, ref p, n); }
+                case 0xde: { var n = BinaryPrimitives.ReadUInt16BigEndian(b.AsSpan(p)); p += 2; return Map(b, ref p, n); }
+                default: throw new InvalidDataException($"Unexpected MessagePack type 0x{t:x2}");
+            }
+        }
+
+        private static string Str(byte[] b, ref int p, int n)
+        {
+            var s = Encoding.UTF8.GetString(b, p, n);
+            p += n;
+            return s;
+        }
+
+        private static List<object?> Array(byte[] b, ref int p, int n)
+        {
+            var list = new List<object?>(n);
+            for (int i = 0; i < n; i++) list.Add(Read(b, ref p));
+            return list;
+        }
+
+        private static Dictionary<string, object?> Map(byte[] b, ref int p, int n)
+        {
+            var map = new Dictionary<string, object?>(n);
+            for (int i = 0; i < n; i++)
+            {
+                var key = (string)Read(b, ref p)!;
+                map[key] = Read(b, ref p);
+            }
+            return map;
+        }
+    }
+}
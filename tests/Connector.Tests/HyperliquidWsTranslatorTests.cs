@@ -335,6 +335,79 @@ public class HyperliquidWsTranslatorTests
         Assert.Contains("trades", events[0].Raw!.RawJson!);
     }
 
+    [Fact]
+    public void Parse_Utf8PayloadOnly_ReturnsTradesEvent()
+    {
+        var bytes = System.Text.Encoding.UTF8.GetBytes("""
+        {"channel":"trades","data":[{"coin":"ETH","side":"A","px":"3000.25","sz":"0.75","hash":"0x","time":1704067200000,"tid":7,"users":["0xa","0xb"]}]}
+        """);
+
+        var inbound = new TransportWsInbound { Utf8Payload = bytes, ReceivedAt = DateTimeOffset.UtcNow };
+        var events = _translator.FromExchangeMessage(inbound).ToList();
+
+        var te = Assert.IsType<TradesEvent>(Assert.Single(events));
+        Assert.Equal("ETH", te.Symbol);
+        Assert.Equal(3000.25m, te.Trades[0].Price);
+        Assert.Equal(0.75m, te.Trades[0].Size);
+        Assert.Equal("a", te.Trades[0].Side);
+        Assert.Equal("7", te.Trades[0].TradeId);
+    }
+
+    [Fact]
+    public void Parse_DataBeforeChannel_ReturnsOrderBookL2Event()
+    {
+        var json = """
+        {
+          "data": {
+            "coin": "BTC",
+            "time": 1704067200000,
+            "levels": [
+              [{"px":"50000","sz":"1.5","n":2}],
+              [{"px":"50001","sz":"0.5","n":1},{"px":"50002","sz":"2","n":3}]
+            ]
+          },
+          "channel": "l2Book"
+        }
+        """;
+
+        var events = Parse(json);
+        var ob = Assert.IsType<OrderBookL2Event>(Assert.Single(events));
+        Assert.Equal("BTC", ob.Symbol);
+        Assert.Single(ob.Bids);
+        Assert.Equal(2, ob.Asks.Length);
+        Assert.Equal(50002m, ob.Asks[1].Price);
+        Assert.Equal(2m, ob.Asks[1].Size);
+    }
+
+    [Fact]
+    public void Parse_AllMids_ReusesSymbolStrings()
+    {
+        var json = """{"channel":"allMids","data":{"mids":{"BTC":"50000.5","ETH":"3000.1"}}}""";
+
+        var first = Assert.IsType<AllMidsEvent>(Assert.Single(Parse(json)));
+        var second = Assert.IsType<AllMidsEvent>(Assert.Single(Parse(json)));
+
+        Assert.Same(first.Mids[0].Symbol, second.Mids[0].Symbol);
+        Assert.Same(first.Mids[1].Symbol, second.Mids[1].Symbol);
+    }
+
+    [Fact]
+    public void Parse_L2Book_WithRawPayload_IncludesRaw()
+    {
+        var json = """{"channel":"l2Book","data":{"coin":"SOL","levels":[[{"px":"100","sz":"1","n":1}],[{"px":"101","sz":"1","n":1}]],"time":1}}""";
+
+        var inbound = new TransportWsInbound
+        {
+            Utf8Payload = System.Text.Encoding.UTF8.GetBytes(json),
+            ReceivedAt = DateTimeOffset.UtcNow
+        };
+        var events = _translatorWithRaw.FromExchangeMessage(inbound).ToList();
+
+        Assert.Single(events);
+        Assert.Equal(json, events[0].Raw!.RawJson);
+        Assert.Equal("l2Book", events[0].Raw!.ExchangeMessageType);
+    }
+
     // --- New channel tests ---
 
     [Fact]
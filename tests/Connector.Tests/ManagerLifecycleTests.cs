@@ -1,6 +1,8 @@
 using System.Runtime.CompilerServices;
+using Connector.Core;
 using Connector.Core.Abstractions;
 using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
 using Connector.Core.Managers;
 using Connector.Core.Transport;
 using Microsoft.Extensions.Logging.Abstractions;
@@ -64,6 +66,115 @@ public class ManagerLifecycleTests
         });
     }
 
+    [Fact]
+    public async Task RestManager_CoalescesIdenticalInFlightInfoRequests()
+    {
+        var transport = new GatedRestTransport("""{"BTC":"100.5","ETH":"3000"}""");
+        var manager = new RestManager(transport, new HyperliquidRestTranslator(), new NoAuthProvider(),
+            NullLogger<RestManager>.Instance);
+
+        var calls = Enumerable.Range(0, 20)
+            .Select(_ => manager.ExecuteAsync(new GetAllMidsRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None))
+            .ToArray();
+        transport.Gate.SetResult();
+        var results = await Task.WhenAll(calls);
+
+        Assert.Equal(1, transport.Calls);
+        Assert.All(results, r => Assert.Equal(100.5m, r.Mids.Single(m => m.Symbol == "BTC").Mid));
+
+        // Nothing is kept once the shared request completes
+        await manager.ExecuteAsync(new GetAllMidsRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+        Assert.Equal(2, transport.Calls);
+    }
+
+    [Fact]
+    public async Task RestManager_CachesStaticInfo_WithoutRateLimiting()
+    {
+        var transport = new GatedRestTransport("""{"universe":[{"name":"BTC","szDecimals":5,"maxLeverage":50}]}""");
+        transport.Gate.SetResult();
+        var limiter = new TokenBucketRateLimiter(1, TimeSpan.FromMinutes(1));
+        var manager = new RestManager(transport, new HyperliquidRestTranslator(), new NoAuthProvider(),
+            NullLogger<RestManager>.Instance, limiter);
+
+        for (int i = 0; i < 5; i++)
+        {
+            var meta = await manager.ExecuteAsync(new GetMetaRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+            Assert.Equal("BTC", Assert.Single(meta.Assets).Name);
+        }
+
+        Assert.Equal(1, transport.Calls);
+        Assert.Equal(0, limiter.Bucket.AvailableTokens);
+    }
+
+    [Fact]
+    public async Task RestManager_Batching_SendsOneSignedActionAndFansOutStatuses()
+    {
+        var transport = new FakeExchangeTransport();
+        var auth = new CountingAuthProvider();
+        var manager = new RestManager(transport, new HyperliquidRestTranslator(), auth,
+            NullLogger<RestManager>.Instance, batching: new RestBatchingOptions { Window = TimeSpan.FromMilliseconds(50) });
+        await manager.ExecuteAsync(new GetMetaRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+
+        var orders = new[] { "BTC", "ETH", "BTC" }.Select((coin, i) => manager.ExecuteAsync(new PlaceOrderRequest
+        {
+            Exchange = UnifiedExchange.Hyperliquid,
+            Symbol = coin,
+            Side = i == 1 ? "sell" : "buy",
+            OrderType = "limit",
+            Size = 0.10m,
+            Price = 100 + i
+        }, CancellationToken.None)).ToArray();
+        var cancel = manager.ExecuteAsync(new CancelOrderRequest
+        {
+            Exchange = UnifiedExchange.Hyperliquid, Symbol = "ETH", OrderId = "42"
+        }, CancellationToken.None);
+
+        Assert.Equal(["1000", "1001"], (await Task.WhenAll(orders[0], orders[1])).Select(r => r.OrderId));
+        var rejected = await Assert.ThrowsAsync<ConnectorException>(() => orders[2]);
+        Assert.Equal("Insufficient margin", rejected.Message);
+        Assert.Equal("success", (await cancel).Status);
+
+        // One order action and one cancel action, each signed once
+        Assert.Equal(2, transport.Actions.Count);
+        Assert.Equal(2, auth.Applied);
+        using var order = System.Text.Json.JsonDocument.Parse(transport.Actions.Single(a => a.Contains("\"order\"")));
+        var wire = order.RootElement.GetProperty("action").GetProperty("orders");
+        Assert.Equal([0, 1, 0], wire.EnumerateArray().Select(o => o.GetProperty("a").GetInt32()));
+        Assert.Equal("0.1", wire[0].GetProperty("s").GetString());
+
+        var stats = manager.GetBatchStats()!;
+        Assert.Equal(2, stats.Batches);
+        Assert.Equal(4, stats.Requests);
+        Assert.Equal(3, stats.LargestBatch);
+        Assert.True(stats.MaxQueueDelay >= TimeSpan.FromMilliseconds(40));
+    }
+
+    [Fact]
+    public async Task RestManager_Batching_CancelledQueuedOrderIsNeverSent()
+    {
+        var transport = new FakeExchangeTransport();
+        var manager = new RestManager(transport, new HyperliquidRestTranslator(), new CountingAuthProvider(),
+            NullLogger<RestManager>.Instance, batching: new RestBatchingOptions { Window = TimeSpan.FromMilliseconds(100) });
+        await manager.ExecuteAsync(new GetMetaRequest { Exchange = UnifiedExchange.Hyperliquid }, CancellationToken.None);
+
+        PlaceOrderRequest Order(string coin) => new()
+        {
+            Exchange = UnifiedExchange.Hyperliquid, Symbol = coin, Side = "buy", OrderType = "limit", Size = 1m, Price = 100m
+        };
+
+        using var cts = new CancellationTokenSource();
+        var kept = manager.ExecuteAsync(Order("BTC"), CancellationToken.None);
+        var cancelled = manager.ExecuteAsync(Order("ETH"), cts.Token);
+        cts.Cancel();
+
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(() => cancelled);
+        Assert.Equal("1000", (await kept).OrderId);
+
+        using var sent = System.Text.Json.JsonDocument.Parse(Assert.Single(transport.Actions));
+        var wire = sent.RootElement.GetProperty("action").GetProperty("orders");
+        Assert.Equal([0], wire.EnumerateArray().Select(o => o.GetProperty("a").GetInt32()));
+    }
+
     // --- Fakes ---
 
     private sealed class NoAuthProvider : IAuthProvider
@@ -129,6 +240,42 @@ public class ManagerLifecycleTests
         }
     }
 
+    private sealed class CountingAuthProvider : IAuthProvider
+    {
+        public int Applied;
+        public bool IsAuthenticated => true;
+        public Task<TransportWsMessage?> GetWsAuthMessageAsync(CancellationToken ct) => Task.FromResult<TransportWsMessage?>(null);
+        public void ApplyRestAuth(TransportRestRequest request) => Interlocked.Increment(ref Applied);
+    }
+
+    /// <summary>
+    /// Answers /info with a two-asset meta and /exchange with one status per item: orders
+    /// rest with increasing ids except the third, which is rejected.
+    /// </summary>
+    private sealed class FakeExchangeTransport : IRestTransport
+    {
+        public List<string> Actions { get; } = [];
+
+        public Task<TransportRestResponse> SendAsync(TransportRestRequest request, CancellationToken ct)
+        {
+            if (request.Path == "/info")
+                return Respond("""{"universe":[{"name":"BTC","szDecimals":5},{"name":"ETH","szDecimals":4}]}""");
+
+            lock (Actions) Actions.Add(request.Body!);
+            using var doc = System.Text.Json.JsonDocument.Parse(request.Body!);
+            var action = doc.RootElement.GetProperty("action");
+            var statuses = action.GetProperty("type").GetString() == "cancel"
+                ? action.GetProperty("cancels").EnumerateArray().Select(_ => "\"success\"")
+                : action.GetProperty("orders").EnumerateArray().Select((_, i) => i == 2
+                    ? """{"error":"Insufficient margin"}"""
+                    : $$$"""{"resting":{"oid":{{{1000 + i}}}}}""");
+            return Respond("""{"status":"ok","response":{"type":"order","data":{"statuses":[""" + string.Join(",", statuses) + "]}}}");
+        }
+
+        private static Task<TransportRestResponse> Respond(string body) =>
+            Task.FromResult(new TransportRestResponse { StatusCode = 200, Body = body });
+    }
+
     private sealed class FakeRestTransport : IRestTransport
     {
         public Task<TransportRestResponse> SendAsync(TransportRestRequest request, CancellationToken ct)
@@ -141,6 +288,21 @@ public class ManagerLifecycleTests
         }
     }
 
+    private sealed class GatedRestTransport(string body) : IRestTransport
+    {
+        private int _calls;
+
+        public TaskCompletionSource Gate { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        public int Calls => Volatile.Read(ref _calls);
+
+        public async Task<TransportRestResponse> SendAsync(TransportRestRequest request, CancellationToken ct)
+        {
+            Interlocked.Increment(ref _calls);
+            await Gate.Task;
+            return new TransportRestResponse { StatusCode = 200, Utf8Body = System.Text.Encoding.UTF8.GetBytes(body) };
+        }
+    }
+
     private sealed class FakeRestTranslator : IRestTranslator
     {
         public TransportRestRequest ToExchangeRequest<TResponse>(UnifiedRestRequest<TResponse> request)
@@ -0,0 +1,128 @@
+using Connector.Core.Books;
+using Connector.Core.Contracts;
+
+namespace Connector.Tests;
+
+public class OrderBookTests
+{
+    private static readonly DateTimeOffset T0 = DateTimeOffset.Parse("2026-01-01T00:00:00Z");
+
+    private static OrderBookL2Event Book(DateTimeOffset at, (decimal, decimal)[] bids, (decimal, decimal)[] asks) => new()
+    {
+        Exchange = UnifiedExchange.Hyperliquid,
+        Channel = UnifiedWsChannel.OrderBookL2,
+        Symbol = "BTC",
+        ReceivedAt = at,
+        IsSnapshot = true,
+        Bids = bids.Select(l => new PriceLevel { Price = l.Item1, Size = l.Item2 }).ToArray(),
+        Asks = asks.Select(l => new PriceLevel { Price = l.Item1, Size = l.Item2 }).ToArray()
+    };
+
+    [Fact]
+    public void Apply_FirstUpdate_EmitsSnapshot()
+    {
+        using var book = new OrderBook("BTC");
+        var update = Book(T0, [(100m, 1m), (99m, 2m)], [(101m, 3m)]);
+
+        var snapshot = Assert.IsType<OrderBookL2Event>(book.Apply(update));
+
+        Assert.True(snapshot.IsSnapshot);
+        Assert.Equal(1L, snapshot.Sequence);
+        Assert.Same(update.Bids, snapshot.Bids);
+    }
+
+    [Fact]
+    public void Apply_ChangedLevels_EmitsDelta()
+    {
+        using var book = new OrderBook("BTC");
+        book.Apply(Book(T0, [(100m, 1m), (99m, 2m)], [(101m, 3m), (102m, 4m)]));
+
+        var delta = Assert.IsType<OrderBookL2DeltaEvent>(book.Apply(Book(T0.AddSeconds(1),
+            [(100m, 1.5m), (98m, 5m)],
+            [(101m, 3m), (102m, 4m), (103m, 1m)])));
+
+        Assert.Equal(2L, delta.Sequence);
+        Assert.Equal([(100m, 1.5m), (99m, 0m), (98m, 5m)], delta.Bids.Select(l => (l.Price, l.Size)).ToArray());
+        Assert.Equal([(103m, 1m)], delta.Asks.Select(l => (l.Price, l.Size)).ToArray());
+    }
+
+    [Fact]
+    public void Apply_Unchanged_ReturnsNull()
+    {
+        using var book = new OrderBook("BTC");
+        book.Apply(Book(T0, [(100m, 1m)], [(101m, 1m)]));
+
+        Assert.Null(book.Apply(Book(T0.AddSeconds(1), [(100m, 1.0m)], [(101m, 1m)])));
+        Assert.Equal(1L, book.Sequence);
+    }
+
+    [Fact]
+    public void Apply_AfterRequestSnapshot_EmitsSnapshot()
+    {
+        using var book = new OrderBook("BTC");
+        book.Apply(Book(T0, [(100m, 1m)], [(101m, 1m)]));
+
+        book.RequestSnapshot();
+        var first = book.Apply(Book(T0.AddSeconds(1), [(100m, 2m)], [(101m, 1m)]));
+        var second = book.Apply(Book(T0.AddSeconds(2), [(100m, 3m)], [(101m, 1m)]));
+
+        Assert.True(Assert.IsType<OrderBookL2Event>(first).IsSnapshot);
+        Assert.IsType<OrderBookL2DeltaEvent>(second);
+    }
+
+    [Fact]
+    public void Apply_SnapshotIntervalElapsed_EmitsSnapshot()
+    {
+        using var book = new OrderBook("BTC", snapshotInterval: TimeSpan.FromSeconds(10));
+        book.Apply(Book(T0, [(100m, 1m)], [(101m, 1m)]));
+
+        Assert.IsType<OrderBookL2DeltaEvent>(book.Apply(Book(T0.AddSeconds(5), [(100m, 2m)], [(101m, 1m)])));
+        Assert.IsType<OrderBookL2Event>(book.Apply(Book(T0.AddSeconds(10), [(100m, 3m)], [(101m, 1m)])));
+    }
+
+    [Fact]
+    public void Queries_ReadBestDepthAndCumulativeSize()
+    {
+        using var book = new OrderBook("BTC");
+        book.Apply(Book(T0, [(100m, 1m), (99m, 2m), (98m, 3m)], [(101m, 4m), (102m, 5m)]));
+
+        Assert.True(book.TryGetBestBid(out var bid));
+        Assert.True(book.TryGetBestAsk(out var ask));
+        Assert.Equal(new BookLevel(100m, 1m), bid);
+        Assert.Equal(new BookLevel(101m, 4m), ask);
+        Assert.Equal(3m, book.CumulativeSize(BookSide.Bid, 2));
+        Assert.Equal(9m, book.CumulativeSize(BookSide.Ask, 10));
+        Assert.Equal(0m, book.CumulativeSize(BookSide.Ask, 0));
+
+        Span<BookLevel> top = stackalloc BookLevel[2];
+        Assert.Equal(2, book.CopyLevels(BookSide.Bid, top));
+        Assert.Equal(new BookLevel(99m, 2m), top[1]);
+
+        using var view = book.Read();
+        Assert.Equal(3, view.Bids.Length);
+        Assert.Equal(1, view.Depth(BookSide.Ask, 1).Length);
+    }
+
+    [Fact]
+    public void Apply_UnsortedLevels_StoresBestFirst()
+    {
+        using var book = new OrderBook("BTC");
+        var snapshot = Assert.IsType<OrderBookL2Event>(book.Apply(Book(T0, [(98m, 1m), (100m, 1m)], [(102m, 1m), (101m, 1m)])));
+
+        Assert.Equal(100m, snapshot.Bids[0].Price);
+        Assert.True(book.TryGetBestAsk(out var ask));
+        Assert.Equal(101m, ask.Price);
+    }
+
+    [Fact]
+    public void Store_KeepsOneBookPerSymbol()
+    {
+        using var store = new OrderBookStore();
+        store.Apply(Book(T0, [(100m, 1m)], [(101m, 1m)]));
+
+        Assert.True(store.TryGet("BTC", out var book));
+        Assert.Equal(1, book.BidDepth);
+        Assert.True(store.Remove("BTC"));
+        Assert.False(store.TryGet("BTC", out _));
+    }
+}
@@ -0,0 +1,172 @@
+using System.Text;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Managers;
+using Connector.Core.Recording;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Tests;
+
+public class RecordingTests : IDisposable
+{
+    private static readonly DateTimeOffset T0 = new(2026, 1, 5, 14, 0, 0, TimeSpan.Zero);
+
+    private readonly string _directory = Path.Combine(Path.GetTempPath(), "connector-rec-" + Guid.NewGuid().ToString("N"));
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_directory))
+            Directory.Delete(_directory, recursive: true);
+    }
+
+    [Fact]
+    public void Recorder_RoundTripsFramesAcrossSegments()
+    {
+        using (var recorder = new FrameRecorder(_directory, new FrameRecorderOptions { SegmentSize = 256 }))
+        {
+            for (int i = 0; i < 20; i++)
+                recorder.Append(Encoding.UTF8.GetBytes($"frame-{i}"), T0.AddMilliseconds(i), isBinary: i % 5 == 0);
+            Assert.Equal(20, recorder.RecordCount);
+        }
+
+        using var reader = new RecordingReader(_directory);
+        Assert.True(reader.SegmentCount > 1);
+        Assert.Equal(T0, reader.StartTime);
+        Assert.Equal(T0.AddMilliseconds(19), reader.EndTime);
+
+        var frames = ReadAll(reader);
+        Assert.Equal(Enumerable.Range(0, 20).Select(i => $"frame-{i}"), frames.Select(f => f.Text));
+        Assert.Equal(Enumerable.Range(0, 20).Select(i => T0.AddMilliseconds(i)), frames.Select(f => f.Timestamp));
+        Assert.Equal(4, frames.Count(f => f.IsBinary));
+    }
+
+    [Fact]
+    public void Recorder_ContinuesAfterExistingSegments()
+    {
+        using (var first = new FrameRecorder(_directory))
+            first.Append("a"u8, T0);
+        using (var second = new FrameRecorder(_directory))
+            second.Append("b"u8, T0.AddSeconds(1));
+
+        using var reader = new RecordingReader(_directory);
+        Assert.Equal(2, reader.SegmentCount);
+        Assert.Equal(["a", "b"], ReadAll(reader).Select(f => f.Text));
+    }
+
+    [Fact]
+    public void Seek_UsesIndexAndLandsOnFirstFrameAtOrAfterTimestamp()
+    {
+        using (var recorder = new FrameRecorder(_directory, new FrameRecorderOptions
+        {
+            SegmentSize = 4096,
+            IndexInterval = TimeSpan.FromSeconds(10)
+        }))
+        {
+            for (int i = 0; i < 300; i++)
+                recorder.Append(Encoding.UTF8.GetBytes($"frame-{i}"), T0.AddSeconds(i));
+        }
+
+        using var reader = new RecordingReader(_directory);
+
+        reader.Seek(T0.AddSeconds(123.5));
+        Assert.True(reader.TryRead(out var frame));
+        Assert.Equal(T0.AddSeconds(124), frame.Timestamp);
+        Assert.Equal("frame-124", Encoding.UTF8.GetString(frame.Payload.Span));
+
+        reader.Seek(T0.AddSeconds(-5));
+        Assert.True(reader.TryRead(out frame));
+        Assert.Equal(T0, frame.Timestamp);
+
+        reader.Seek(T0.AddHours(1));
+        Assert.False(reader.TryRead(out _));
+    }
+
+    [Fact]
+    public async Task Replay_FeedsTranslator_WithinTimeRange()
+    {
+        using (var recorder = new FrameRecorder(_directory))
+        {
+            for (int i = 0; i < 5; i++)
+            {
+                var json = $$"""{"channel":"trades","data":[{"coin":"BTC","side":"B","px":"{{100 + i}}","sz":"1","time":{{i}},"tid":{{i}}}]}""";
+                recorder.Append(Encoding.UTF8.GetBytes(json), T0.AddSeconds(i));
+            }
+        }
+
+        var translator = new HyperliquidWsTranslator(NullLogger.Instance);
+        await using var replay = new ReplayWsTransport(_directory, NullLogger<ReplayWsTransport>.Instance,
+            new ReplayOptions { From = T0.AddSeconds(1), To = T0.AddSeconds(3) });
+        await replay.ConnectAsync(new Uri("wss://replay.invalid"), CancellationToken.None);
+
+        var trades = new List<TradesEvent>();
+        await foreach (var inbound in replay.ReceiveAsync(CancellationToken.None))
+            trades.AddRange(translator.FromExchangeMessage(inbound).OfType<TradesEvent>());
+
+        Assert.Equal([101m, 102m, 103m], trades.Select(t => Assert.Single(t.Trades).Price));
+        Assert.Equal(T0.AddSeconds(1), trades[0].ReceivedAt);
+    }
+
+    [Fact]
+    public async Task Replay_TimeScaled_PacesFrames()
+    {
+        using (var recorder = new FrameRecorder(_directory))
+        {
+            recorder.Append("a"u8, T0);
+            recorder.Append("b"u8, T0.AddSeconds(2));
+        }
+
+        await using var replay = new ReplayWsTransport(_directory, NullLogger<ReplayWsTransport>.Instance,
+            new ReplayOptions { Speed = 10 });
+        await replay.ConnectAsync(new Uri("wss://replay.invalid"), CancellationToken.None);
+
+        var started = System.Diagnostics.Stopwatch.StartNew();
+        var count = 0;
+        await foreach (var _ in replay.ReceiveAsync(CancellationToken.None))
+            count++;
+
+        Assert.Equal(2, count);
+        Assert.InRange(started.Elapsed, TimeSpan.FromMilliseconds(180), TimeSpan.FromSeconds(1.5));
+    }
+
+    [Fact]
+    public async Task Replay_ThroughLosslessFanout_YieldsEveryEvent()
+    {
+        // More trades than the default drop-oldest bound, interleaved with conflatable books
+        const int frames = 12_000;
+        using (var recorder = new FrameRecorder(_directory))
+        {
+            for (int i = 0; i < frames; i++)
+            {
+                var json = i % 10 == 0
+                    ? $$$"""{"channel":"l2Book","data":{"coin":"BTC","time":{{{i}}},"levels":[[{"px":"{{{100 + i}}}","sz":"1","n":1}],[{"px":"{{{101 + i}}}","sz":"1","n":1}]]}}"""
+                    : $$"""{"channel":"trades","data":[{"coin":"BTC","side":"B","px":"100","sz":"1","time":{{i}},"tid":{{i}}}]}""";
+                recorder.Append(Encoding.UTF8.GetBytes(json), T0.AddMilliseconds(i));
+            }
+        }
+
+        var replay = new ReplayWsTransport(_directory, NullLogger<ReplayWsTransport>.Instance);
+        await using var manager = new WebSocketManager(replay, new HyperliquidWsTranslator(NullLogger.Instance),
+            new NoAuthProvider(), NullLogger<WebSocketManager>.Instance, fanout: WsFanoutOptions.Lossless());
+        await manager.StartAsync(new Uri("wss://replay.invalid"), CancellationToken.None);
+
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+        var events = new List<UnifiedWsEvent>();
+        var reader = manager.GetEventReader();
+        while (events.Count < frames)
+            events.Add(await reader.ReadAsync(cts.Token));
+
+        Assert.Equal(frames / 10, events.OfType<OrderBookL2Event>().Count());
+        Assert.Equal(Enumerable.Range(0, frames).Where(i => i % 10 != 0).Select(i => i.ToString()),
+            events.OfType<TradesEvent>().Select(t => Assert.Single(t.Trades).TradeId));
+        Assert.All(manager.GetRouteStats(), s => Assert.Equal(0L, s.Dropped + s.Conflated));
+    }
+
+    private static List<(string Text, DateTimeOffset Timestamp, bool IsBinary)> ReadAll(RecordingReader reader)
+    {
+        var frames = new List<(string, DateTimeOffset, bool)>();
+        while (reader.TryRead(out var frame))
+            frames.Add((Encoding.UTF8.GetString(frame.Payload.Span), frame.Timestamp, frame.IsBinary));
+        return frames;
+    }
+}
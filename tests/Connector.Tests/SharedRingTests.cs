@@ -0,0 +1,118 @@
+using System.Buffers.Binary;
+using System.Text;
+using Connector.Core.Contracts;
+using Connector.Core.SharedMemory;
+
+namespace Connector.Tests;
+
+public class SharedRingTests : IDisposable
+{
+    private static readonly DateTimeOffset T0 = new(2026, 1, 5, 14, 0, 0, TimeSpan.Zero);
+
+    // Offsets from RingFormat; readers in other languages depend on them staying put
+    private const int WriteSequenceOffset = 64;
+    private const int SymbolTableOffset = 4096;
+    private const int DataOffset = 4096 + 4096 * 32;
+    private const int TradeSlotSize = 64;
+
+    private readonly string _directory = Path.Combine(Path.GetTempPath(), "connector-ring-" + Guid.NewGuid().ToString("N"));
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_directory))
+            Directory.Delete(_directory, recursive: true);
+    }
+
+    [Fact]
+    public void Publish_WritesOneRowPerTradeAtFixedOffsets()
+    {
+        string path;
+        using (var publisher = new SharedRingPublisher(_directory, [UnifiedWsChannel.Trades], slotCount: 16))
+        {
+            Assert.Equal(1, publisher.Publish(Trades("BTC", 100m)));
+            Assert.Equal(2, publisher.Publish(Trades("ETH", 200m, 201m)));
+            Assert.Equal(0, publisher.Publish(new AllMidsEvent
+            {
+                Exchange = UnifiedExchange.Hyperliquid,
+                Channel = UnifiedWsChannel.AllMids,
+                Symbol = "*",
+                ReceivedAt = T0,
+                Mids = [new AllMidsEntry { Symbol = "BTC", Mid = 1m }]
+            }));
+            Assert.Equal(3, publisher.RowsWritten);
+            Assert.Equal(1, publisher.EventsSkipped);
+            path = publisher.GetPath(UnifiedWsChannel.Trades);
+        }
+
+        var bytes = File.ReadAllBytes(path);
+        Assert.Equal("CXRING01", Encoding.ASCII.GetString(bytes, 0, 8));
+        Assert.Equal(3, BinaryPrimitives.ReadInt64LittleEndian(bytes.AsSpan(WriteSequenceOffset)));
+        Assert.Equal("BTC", Symbol(bytes, 0));
+        Assert.Equal("ETH", Symbol(bytes, 1));
+
+        var rows = Enumerable.Range(0, 3).Select(i => bytes.AsSpan(DataOffset + i * TradeSlotSize).ToArray()).ToArray();
+        Assert.Equal([1L, 2L, 3L], rows.Select(r => BinaryPrimitives.ReadInt64LittleEndian(r)));
+        Assert.Equal([0, 1, 1], rows.Select(r => BinaryPrimitives.ReadInt32LittleEndian(r.AsSpan(16))));
+        Assert.Equal([100d, 200d, 201d], rows.Select(r => BinaryPrimitives.ReadDoubleLittleEndian(r.AsSpan(32))));
+        // Last flag marks the final row of each event; sells are -1
+        Assert.Equal([1, 0, 1], rows.Select(r => (int)r[21]));
+        Assert.All(rows, r => Assert.Equal(-1, (sbyte)r[20]));
+        Assert.Equal(T0.ToUnixTimeMilliseconds() * 1_000_000, BinaryPrimitives.ReadInt64LittleEndian(rows[0].AsSpan(8)));
+    }
+
+    [Fact]
+    public void Publish_WrapsAndOverwritesOldestSlots()
+    {
+        string path;
+        using (var publisher = new SharedRingPublisher(_directory, [UnifiedWsChannel.Trades], slotCount: 4))
+        {
+            for (int i = 0; i < 10; i++)
+                publisher.Publish(Trades("BTC", i));
+            path = publisher.GetPath(UnifiedWsChannel.Trades);
+        }
+
+        var bytes = File.ReadAllBytes(path);
+        Assert.Equal(10, BinaryPrimitives.ReadInt64LittleEndian(bytes.AsSpan(WriteSequenceOffset)));
+        for (int slot = 0; slot < 4; slot++)
+        {
+            var row = bytes.AsSpan(DataOffset + slot * TradeSlotSize);
+            var sequence = BinaryPrimitives.ReadInt64LittleEndian(row);
+            // Rows 6..9 survive; a row's slot is its index modulo the slot count
+            Assert.Equal(slot, (sequence - 1) % 4);
+            Assert.InRange(sequence, 7, 10);
+            Assert.Equal(sequence - 1, BinaryPrimitives.ReadDoubleLittleEndian(row[32..]));
+        }
+    }
+
+    [Fact]
+    public void Constructor_RejectsChannelsWithoutLayoutAndBadSlotCounts()
+    {
+        Assert.False(SharedRingPublisher.Supports(UnifiedWsChannel.Positions));
+        Assert.Throws<NotSupportedException>(() =>
+            new SharedRingPublisher(_directory, [UnifiedWsChannel.Trades, UnifiedWsChannel.Positions]));
+        Assert.ThrowsAny<ArgumentException>(() =>
+            new SharedRingPublisher(_directory, [UnifiedWsChannel.Trades], slotCount: 100));
+    }
+
+    private static TradesEvent Trades(string symbol, params decimal[] prices) => new()
+    {
+        Exchange = UnifiedExchange.Hyperliquid,
+        Channel = UnifiedWsChannel.Trades,
+        Symbol = symbol,
+        ReceivedAt = T0,
+        Trades = prices.Select(p => new TradeEntry
+        {
+            TradeId = "1",
+            Price = p,
+            Size = 1m,
+            Side = "A",
+            Timestamp = T0
+        }).ToArray()
+    };
+
+    private static string Symbol(byte[] bytes, int id)
+    {
+        var entry = SymbolTableOffset + id * 32;
+        return Encoding.UTF8.GetString(bytes, entry + 1, bytes[entry]);
+    }
+}
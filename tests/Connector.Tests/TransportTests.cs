@@ -1,3 +1,6 @@
+using Connector.Core.Abstractions;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
 using Connector.Core.Transport;
 
 namespace Connector.Tests;
@@ -31,6 +34,120 @@ public class TransportTests
         });
     }
 
+    [Fact]
+    public async Task TokenBucket_WakesWaiterWhenTokenIsEarned()
+    {
+        var bucket = new TokenBucket(1, TimeSpan.FromMilliseconds(200));
+        Assert.True(bucket.TryAcquire());
+        Assert.False(bucket.TryAcquire());
+
+        var started = System.Diagnostics.Stopwatch.StartNew();
+        await bucket.WaitAsync(1, RateLimitPriority.Normal, CancellationToken.None);
+
+        Assert.InRange(started.Elapsed, TimeSpan.FromMilliseconds(150), TimeSpan.FromMilliseconds(600));
+    }
+
+    [Fact]
+    public async Task TokenBucket_ServesWaitersInOrder_HighPriorityFirst()
+    {
+        var bucket = new TokenBucket(1, TimeSpan.FromMilliseconds(30));
+        Assert.True(bucket.TryAcquire());
+
+        var order = new List<string>();
+        Task Wait(string name, RateLimitPriority priority) =>
+            bucket.WaitAsync(1, priority, CancellationToken.None).ContinueWith(_ => { lock (order) order.Add(name); });
+
+        var waits = new[]
+        {
+            Wait("info-1", RateLimitPriority.Normal),
+            Wait("info-2", RateLimitPriority.Normal),
+            Wait("cancel", RateLimitPriority.High),
+            Wait("info-3", RateLimitPriority.Normal)
+        };
+        await Task.WhenAll(waits);
+
+        Assert.Equal(["cancel", "info-1", "info-2", "info-3"], order);
+    }
+
+    [Fact]
+    public async Task TokenBucket_CancelledWaiter_DoesNotConsumeTokens()
+    {
+        var bucket = new TokenBucket(2, TimeSpan.FromMilliseconds(100));
+        Assert.True(bucket.TryAcquire(2));
+
+        using var cts = new CancellationTokenSource(20);
+        var heavy = bucket.WaitAsync(2, RateLimitPriority.Normal, cts.Token);
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(() => heavy);
+
+        await bucket.WaitAsync(1, RateLimitPriority.Normal, CancellationToken.None);
+        await Task.Delay(150);
+        Assert.Equal(1, bucket.AvailableTokens);
+    }
+
+    [Fact]
+    public async Task TokenBucket_ResetBelowQueuedRequest_DoesNotStallQueue()
+    {
+        var bucket = new TokenBucket(10, TimeSpan.FromMilliseconds(20));
+        Assert.True(bucket.TryAcquire(10));
+
+        var heavy = bucket.WaitAsync(5, RateLimitPriority.Normal, CancellationToken.None);
+        bucket.Reset(capacity: 1, available: 0);
+        var light = bucket.WaitAsync(1, RateLimitPriority.Normal, CancellationToken.None);
+
+        // The heavy request is capped at the new capacity rather than blocking everyone behind it
+        await Task.WhenAll(heavy, light).WaitAsync(TimeSpan.FromSeconds(2));
+        Assert.Equal(0, bucket.WaitingCount);
+    }
+
+    [Fact]
+    public async Task HierarchicalRateLimiter_ChargesWeightAndClassSeparately()
+    {
+        var limiter = new HierarchicalRateLimiter(new HierarchicalRateLimiterOptions
+        {
+            Global = new RateLimitBucketOptions { Capacity = 40, Period = TimeSpan.FromMinutes(1) },
+            Classes =
+            {
+                [RateLimitClass.WebSocket] = new RateLimitBucketOptions { Capacity = 5, Period = TimeSpan.FromMinutes(1) }
+            }
+        });
+
+        await limiter.WaitAsync(new RateLimitCost(20), CancellationToken.None);
+        await limiter.WaitAsync(new RateLimitCost(18), CancellationToken.None);
+        Assert.Equal(2, limiter.GlobalBucket!.AvailableTokens);
+
+        // WebSocket messages have their own budget, not REST weight
+        await limiter.WaitAsync(RateLimitCost.WebSocketMessage, CancellationToken.None);
+        Assert.Equal(4, limiter.ClassBucket(RateLimitClass.WebSocket)!.AvailableTokens);
+        Assert.Equal(2, limiter.GlobalBucket.AvailableTokens);
+
+        using var cts = new CancellationTokenSource(100);
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(
+            () => limiter.WaitAsync(new RateLimitCost(20), cts.Token));
+    }
+
+    [Fact]
+    public async Task HierarchicalRateLimiter_UserBudget_FollowsReportedLimit_CancelsBypass()
+    {
+        var limiter = HyperliquidRateLimits.CreateLimiter("0xabc");
+        limiter.UpdateUserLimit("0xabc", new GetUserRateLimitResponse
+        {
+            CumulativeVolume = 0, RequestsUsed = 1000, RequestsCap = 1001
+        });
+
+        await limiter.WaitAsync(HyperliquidRateLimits.ExchangeCost(), CancellationToken.None);
+        Assert.Equal(0, limiter.UserBucket("0xabc")!.AvailableTokens);
+
+        // Budget exhausted: orders wait for the 10s refill, cancels still go through
+        await limiter.WaitAsync(HyperliquidRateLimits.ExchangeCost(isCancel: true), CancellationToken.None);
+        using var cts = new CancellationTokenSource(100);
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(
+            () => limiter.WaitAsync(HyperliquidRateLimits.ExchangeCost(), cts.Token));
+
+        // Other users and info requests are unaffected
+        await limiter.WaitAsync(HyperliquidRateLimits.ExchangeCost(user: "0xdef"), CancellationToken.None);
+        await limiter.WaitAsync(new RateLimitCost(HyperliquidRateLimits.DefaultInfoWeight), CancellationToken.None);
+    }
+
     [Fact]
     public void TransportRestRequest_HasAllProperties()
     {
@@ -64,4 +181,66 @@ public class TransportTests
         Assert.Equal(now, inbound.ReceivedAt);
         Assert.Null(inbound.RawBytes);
     }
+
+    [Fact]
+    public void TransportWsInbound_DecodesPayloadFromUtf8()
+    {
+        var inbound = new TransportWsInbound
+        {
+            Utf8Payload = "{\"channel\":\"trades\"}"u8.ToArray(),
+            ReceivedAt = DateTimeOffset.UtcNow
+        };
+
+        Assert.Equal("{\"channel\":\"trades\"}", inbound.Payload);
+    }
+
+    [Fact]
+    public void TransportWsInbound_EncodesUtf8FromPayload()
+    {
+        var inbound = new TransportWsInbound
+        {
+            Payload = "{\"test\":true}",
+            ReceivedAt = DateTimeOffset.UtcNow
+        };
+
+        Assert.Equal("{\"test\":true}"u8.ToArray(), inbound.Utf8Payload.ToArray());
+    }
+
+    [Fact]
+    public async Task RestTransport_SendsUtf8BodyAndQuery_ReturnsBytes()
+    {
+        var probe = new System.Net.Sockets.TcpListener(System.Net.IPAddress.Loopback, 0);
+        probe.Start();
+        var port = ((System.Net.IPEndPoint)probe.LocalEndpoint).Port;
+        probe.Stop();
+
+        using var listener = new System.Net.HttpListener();
+        listener.Prefixes.Add($"http://127.0.0.1:{port}/");
+        listener.Start();
+        var served = Task.Run(async () =>
+        {
+            var context = await listener.GetContextAsync();
+            using var reader = new StreamReader(context.Request.InputStream);
+            var echo = $"{context.Request.Url!.PathAndQuery}|{context.Request.ContentType}|{await reader.ReadToEndAsync()}";
+            var bytes = System.Text.Encoding.UTF8.GetBytes(echo);
+            await context.Response.OutputStream.WriteAsync(bytes);
+            context.Response.Close();
+        });
+
+        var transport = new RestTransport(new Uri($"http://127.0.0.1:{port}"),
+            Microsoft.Extensions.Logging.Abstractions.NullLogger<RestTransport>.Instance);
+        var response = await transport.SendAsync(new TransportRestRequest
+        {
+            Method = HttpMethod.Post,
+            Path = "/info",
+            Utf8Body = "{\"type\":\"allMids\"}"u8.ToArray(),
+            QueryParams = new() { ["a b"] = "1" }
+        }, CancellationToken.None);
+        await served;
+
+        Assert.Equal(200, response.StatusCode);
+        Assert.Null(response.Headers);
+        Assert.Equal("/info?a%20b=1|application/json; charset=utf-8|{\"type\":\"allMids\"}",
+            System.Text.Encoding.UTF8.GetString(response.Utf8Body.Span));
+    }
 }
@@ -0,0 +1,246 @@
+using System.Net;
+using System.Net.Sockets;
+using System.Net.WebSockets;
+using System.Text;
+using Connector.Core.Contracts;
+using Connector.Core.Exchanges.Hyperliquid;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Tests;
+
+/// <summary>
+/// Runs <see cref="WsConnectionPool"/> against an in-process WebSocket server.
+/// </summary>
+public class WsConnectionPoolTests
+{
+    private static readonly HyperliquidWsTranslator Translator = new(NullLogger.Instance);
+
+    [Fact]
+    public async Task Pool_ShardsSubscriptionsAcrossConnections()
+    {
+        await using var server = new FakeWsServer();
+        await using var pool = new WsConnectionPool(NullLoggerFactory.Instance, new WsConnectionPoolOptions { Connections = 2 });
+        await pool.ConnectAsync(server.Uri, CancellationToken.None);
+
+        await SubscribeAsync(pool, "BTC", "ETH", "SOL", "ARB");
+
+        await WaitUntilAsync(() => server.Connections.Sum(c => c.Subscriptions.Count) == 4);
+        Assert.Equal(2, server.Connections.Count);
+        Assert.All(server.Connections, c => Assert.Equal(2, c.Subscriptions.Count));
+        Assert.All(pool.GetHealth(), h => Assert.Equal(2, h.Subscriptions));
+    }
+
+    [Fact]
+    public async Task Pool_ReplaysSubscriptionsAfterReconnect()
+    {
+        await using var server = new FakeWsServer();
+        await using var pool = new WsConnectionPool(NullLoggerFactory.Instance, new WsConnectionPoolOptions { Connections = 1 });
+        await pool.ConnectAsync(server.Uri, CancellationToken.None);
+        await SubscribeAsync(pool, "BTC");
+
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+        await using var inbound = pool.ReceiveAsync(cts.Token).GetAsyncEnumerator(cts.Token);
+        var next = inbound.MoveNextAsync();
+
+        await WaitUntilAsync(() => server.Connections.Count == 1 && server.Connections[0].Subscriptions.Count == 1);
+        server.DropAll();
+        await WaitUntilAsync(() => server.Connections.Count(c => c.IsOpen) == 1
+            && server.Connections.Single(c => c.IsOpen).Subscriptions.Count == 1);
+
+        await server.BroadcastAsync("""{"channel":"trades","data":[]}""");
+
+        Assert.True(await next);
+        Assert.Equal("""{"channel":"trades","data":[]}""", inbound.Current.Payload);
+        Assert.Equal(1, Assert.Single(pool.GetHealth()).Reconnects);
+    }
+
+    [Fact]
+    public async Task Pool_HotStandby_DeliversEachMessageOnce()
+    {
+        await using var server = new FakeWsServer();
+        await using var pool = new WsConnectionPool(NullLoggerFactory.Instance,
+            new WsConnectionPoolOptions { Connections = 1, HotStandby = true });
+        await pool.ConnectAsync(server.Uri, CancellationToken.None);
+        await SubscribeAsync(pool, "BTC");
+        await WaitUntilAsync(() => server.Connections.Count == 2 && server.Connections.All(c => c.Subscriptions.Count == 1));
+
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+        await using var inbound = pool.ReceiveAsync(cts.Token).GetAsyncEnumerator(cts.Token);
+        for (int i = 0; i < 3; i++)
+            await server.BroadcastAsync($$"""{"channel":"trades","data":[{"tid":{{i}}}]}""");
+
+        var received = new List<string>();
+        for (int i = 0; i < 3; i++)
+        {
+            Assert.True(await inbound.MoveNextAsync());
+            received.Add(inbound.Current.Payload);
+        }
+
+        await WaitUntilAsync(() => pool.GetHealth().Sum(h => h.Messages) == 6);
+        Assert.Equal(3, received.Distinct().Count());
+        Assert.Equal(3L, pool.GetHealth().Sum(h => h.Duplicates));
+    }
+
+    [Fact]
+    public async Task Pool_SendsNonSubscriptionMessagesOnOneConnection()
+    {
+        await using var server = new FakeWsServer();
+        await using var pool = new WsConnectionPool(NullLoggerFactory.Instance,
+            new WsConnectionPoolOptions { Connections = 2, HotStandby = true });
+        await pool.ConnectAsync(server.Uri, CancellationToken.None);
+        await WaitUntilAsync(() => server.Connections.Count == 4);
+
+        var post = """{"method":"post","id":1,"request":{"type":"info","payload":{"type":"allMids"}}}""";
+        await pool.SendAsync(new TransportWsMessage { Payload = post }, CancellationToken.None);
+
+        await WaitUntilAsync(() => server.Connections.Sum(c => c.Others.Count) >= 1);
+        await Task.Delay(100);
+        Assert.Equal(1, server.Connections.Sum(c => c.Others.Count));
+    }
+
+    // --- Helpers ---
+
+    private static async Task SubscribeAsync(WsConnectionPool pool, params string[] symbols)
+    {
+        var request = new UnifiedWsSubscribeRequest
+        {
+            CorrelationId = "pool",
+            Exchange = UnifiedExchange.Hyperliquid,
+            Channel = UnifiedWsChannel.Trades,
+            Symbols = symbols
+        };
+        foreach (var msg in Translator.ToExchangeSubscribe(request))
+            await pool.SendAsync(msg, CancellationToken.None);
+    }
+
+    private static async Task WaitUntilAsync(Func<bool> condition)
+    {
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+        while (!condition())
+            await Task.Delay(20, cts.Token);
+    }
+
+    /// <summary>
+    /// Minimal WebSocket server on a loopback HttpListener. Records subscribe/unsubscribe
+    /// and other messages per connection and can broadcast frames or abort every socket.
+    /// </summary>
+    private sealed class FakeWsServer : IAsyncDisposable
+    {
+        private readonly HttpListener _listener = new();
+        private readonly List<ServerConnection> _connections = [];
+        private readonly Task _acceptLoop;
+
+        public FakeWsServer()
+        {
+            var probe = new TcpListener(IPAddress.Loopback, 0);
+            probe.Start();
+            var port = ((IPEndPoint)probe.LocalEndpoint).Port;
+            probe.Stop();
+
+            _listener.Prefixes.Add($"http://127.0.0.1:{port}/");
+            _listener.Start();
+            Uri = new Uri($"ws://127.0.0.1:{port}/ws");
+            _acceptLoop = Task.Run(AcceptLoopAsync);
+        }
+
+        public Uri Uri { get; }
+
+        public IReadOnlyList<ServerConnection> Connections
+        {
+            get { lock (_connections) return _connections.ToArray(); }
+        }
+
+        public async Task BroadcastAsync(string payload)
+        {
+            var bytes = Encoding.UTF8.GetBytes(payload);
+            foreach (var connection in Connections.Where(c => c.IsOpen))
+                await connection.Socket.SendAsync(bytes, WebSocketMessageType.Text, true, CancellationToken.None);
+        }
+
+        public void DropAll()
+        {
+            foreach (var connection in Connections)
+                connection.Abort();
+        }
+
+        private async Task AcceptLoopAsync()
+        {
+            while (_listener.IsListening)
+            {
+                HttpListenerContext context;
+                try { context = await _listener.GetContextAsync(); }
+                catch (Exception) { return; }
+
+                HttpListenerWebSocketContext ws;
+                try { ws = await context.AcceptWebSocketAsync(subProtocol: null); }
+                catch (Exception) { continue; }
+
+                var connection = new ServerConnection(context, ws.WebSocket);
+                lock (_connections) _connections.Add(connection);
+                _ = Task.Run(connection.ReadLoopAsync);
+            }
+        }
+
+        public async ValueTask DisposeAsync()
+        {
+            DropAll();
+            _listener.Stop();
+            _listener.Close();
+            await _acceptLoop;
+        }
+    }
+
+    private sealed class ServerConnection(HttpListenerContext context, WebSocket socket)
+    {
+        private readonly List<string> _subscriptions = [];
+        private readonly List<string> _others = [];
+
+        public WebSocket Socket { get; } = socket;
+
+        public bool IsOpen => Socket.State == WebSocketState.Open;
+
+        /// <summary>Drops the TCP connection without a close handshake.</summary>
+        public void Abort()
+        {
+            Socket.Abort();
+            context.Response.Abort();
+        }
+
+        public IReadOnlyList<string> Subscriptions
+        {
+            get { lock (_subscriptions) return _subscriptions.ToArray(); }
+        }
+
+        public IReadOnlyList<string> Others
+        {
+            get { lock (_subscriptions) return _others.ToArray(); }
+        }
+
+        public async Task ReadLoopAsync()
+        {
+            var buffer = new byte[4096];
+            try
+            {
+                while (IsOpen)
+                {
+                    var result = await Socket.ReceiveAsync(buffer, CancellationToken.None);
+                    if (result.MessageType == WebSocketMessageType.Close)
+                    {
+                        await Socket.CloseOutputAsync(WebSocketCloseStatus.NormalClosure, null, CancellationToken.None);
+                        return;
+                    }
+
+                    var text = Encoding.UTF8.GetString(buffer, 0, result.Count);
+                    lock (_subscriptions)
+                    {
+                        if (text.Contains("\"method\":\"subscribe\"")) _subscriptions.Add(text);
+                        else if (text.Contains("\"method\":\"unsubscribe\"")) _subscriptions.RemoveAll(s => s.EndsWith(text[text.IndexOf("\"subscription\"")..]));
+                        else _others.Add(text);
+                    }
+                }
+            }
+            catch (Exception) { }
+        }
+    }
+}
@@ -0,0 +1,308 @@
+using System.Diagnostics.Metrics;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using Connector.Core.Abstractions;
+using Connector.Core.Books;
+using Connector.Core.Contracts;
+using Connector.Core.Diagnostics;
+using Connector.Core.Managers;
+using Connector.Core.Transport;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Connector.Tests;
+
+public class WsFanoutTests
+{
+    [Fact]
+    public async Task BookBurst_IsConflated_WithoutEvictingFills()
+    {
+        var inbound = Enumerable.Range(0, 500).Select(i => $"l2:BTC:{i}")
+            .Concat(["fills:BTC:1", "fills:ETH:2"])
+            .Concat(Enumerable.Range(500, 500).Select(i => $"l2:BTC:{i}"));
+
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions { DefaultCapacity = 10 });
+        await WaitForPublishedAsync(manager, 1002);
+
+        var events = Drain(manager.GetEventReader());
+
+        Assert.Equal(2, events.OfType<FillEvent>().Count());
+        var book = Assert.Single(events.OfType<OrderBookL2Event>());
+        Assert.Equal(999L, book.Sequence);
+
+        var stats = manager.GetRouteStats().Single(s => s.Key.Channel == UnifiedWsChannel.OrderBookL2);
+        Assert.Equal(WsOverflowPolicy.Conflate, stats.Policy);
+        Assert.Equal(999L, stats.Conflated);
+    }
+
+    [Fact]
+    public async Task BookDeltas_AreNeverConflated()
+    {
+        var inbound = Enumerable.Range(0, 200).Select(i => $"l2:BTC:{i}");
+
+        using var books = new OrderBookStore();
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions { DefaultCapacity = 1000 }, orderBooks: books);
+        await WaitForPublishedAsync(manager, 200);
+
+        // Every delta arrives, in order, so a consumer can rebuild the book from the snapshot
+        var events = Drain(manager.GetEventReader());
+        Assert.IsType<OrderBookL2Event>(events[0]);
+        Assert.Equal(199, events.OfType<OrderBookL2DeltaEvent>().Count());
+        Assert.Equal(Enumerable.Range(1, 200).Select(i => (long?)i), events.Select(e => e.Sequence));
+
+        var stats = manager.GetRouteStats().Single();
+        Assert.Equal(WsOverflowPolicy.DropOldest, stats.Policy);
+        Assert.Equal(0L, stats.Conflated);
+    }
+
+    [Fact]
+    public async Task SharedReader_WakesEveryWaitingConsumer()
+    {
+        using var gate = new ManualResetEventSlim();
+        await using var manager = await StartAsync(Gated(gate, ["fills:BTC:1", "fills:ETH:2"]), new WsFanoutOptions());
+        var reader = manager.GetEventReader();
+
+        // Each consumer takes one event and stops, so neither can drain the other's
+        async Task<UnifiedWsEvent> TakeOneAsync()
+        {
+            while (await reader.WaitToReadAsync())
+            {
+                if (reader.TryRead(out var evt)) return evt;
+            }
+            throw new InvalidOperationException("Reader completed");
+        }
+
+        var consumers = new[] { Task.Run(TakeOneAsync), Task.Run(TakeOneAsync) };
+        await Task.Delay(50);
+        gate.Set();
+
+        var events = await Task.WhenAll(consumers).WaitAsync(TimeSpan.FromSeconds(5));
+        Assert.Equal([1L, 2L], events.Select(e => e.Sequence!.Value).Order());
+    }
+
+    [Fact]
+    public async Task PrivateChannel_KeyedByChannel_KeepsOrderAcrossSymbols()
+    {
+        var inbound = Enumerable.Range(0, 50).Select(i => $"fills:{(i % 2 == 0 ? "BTC" : "ETH")}:{i}");
+
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions { DefaultCapacity = 10 });
+        await WaitForPublishedAsync(manager, 50);
+
+        var fills = Drain(manager.GetEventReader(UnifiedWsChannel.Fills, "BTC"));
+
+        Assert.Equal(Enumerable.Range(0, 50).Select(i => (long?)i), fills.Select(e => e.Sequence));
+        Assert.Equal(0L, manager.GetRouteStats().Single().Dropped);
+    }
+
+    [Fact]
+    public async Task DedicatedReader_TakesKeyOutOfSharedReader()
+    {
+        var inbound = new[] { "trades:BTC:1", "trades:ETH:2", "trades:BTC:3" };
+
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions());
+        var btc = manager.GetEventReader(UnifiedWsChannel.Trades, "BTC");
+        await WaitForPublishedAsync(manager, 3);
+
+        Assert.Equal([1L, 3L], Drain(btc).Select(e => e.Sequence!.Value));
+        Assert.Equal("ETH", Assert.Single(Drain(manager.GetEventReader())).Symbol);
+    }
+
+    [Fact]
+    public async Task DropOldest_CountsDropsPerKey()
+    {
+        var inbound = Enumerable.Range(0, 20).Select(i => $"trades:BTC:{i}");
+        var fanout = new WsFanoutOptions
+        {
+            Channels = { [UnifiedWsChannel.Trades] = new WsRouteOptions { Policy = WsOverflowPolicy.DropOldest, Capacity = 5 } }
+        };
+
+        await using var manager = await StartAsync(inbound, fanout);
+        await WaitForPublishedAsync(manager, 20);
+
+        Assert.Equal([15L, 16L, 17L, 18L, 19L], Drain(manager.GetEventReader()).Select(e => e.Sequence!.Value));
+        Assert.Equal(15L, manager.GetRouteStats().Single().Dropped);
+    }
+
+    [Fact]
+    public async Task DrainTrades_ResumesAcrossCalls()
+    {
+        var inbound = Enumerable.Range(0, 5).Select(i => $"trades:BTC:{i}");
+
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions());
+        await WaitForPublishedAsync(manager, 5);
+
+        var (ts, sym, side, price, size) = (new long[3], new int[3], new sbyte[3], new double[3], new double[3]);
+        var columns = new TradeColumns(ts, sym, side, price, size);
+
+        Assert.Equal(3, manager.DrainTrades(columns, 100, TimeSpan.FromSeconds(1)));
+        Assert.Equal([0d, 1d, 2d], price);
+        Assert.Equal(new sbyte[] { 1, -1, 1 }, side);
+        Assert.Equal(2, manager.DrainTrades(columns, 100, TimeSpan.FromSeconds(1)));
+        Assert.Equal(3d, price[0]);
+        Assert.Equal("BTC", manager.Symbols.GetName(sym[0]));
+        Assert.Equal(0, manager.DrainTrades(columns, 100, TimeSpan.Zero));
+    }
+
+    [Fact]
+    public async Task DrainBooks_WritesOneRowPerLevel_IntoNativeBuffers()
+    {
+        await using var manager = await StartAsync(["l2:BTC:7"], new WsFanoutOptions());
+        await WaitForPublishedAsync(manager, 1);
+
+        const int capacity = 4;
+        var seq = GC.AllocateArray<long>(capacity, pinned: true);
+        var received = GC.AllocateArray<long>(capacity, pinned: true);
+        var sym = GC.AllocateArray<int>(capacity, pinned: true);
+        var kind = GC.AllocateArray<sbyte>(capacity, pinned: true);
+        var side = GC.AllocateArray<sbyte>(capacity, pinned: true);
+        var price = GC.AllocateArray<double>(capacity, pinned: true);
+        var size = GC.AllocateArray<double>(capacity, pinned: true);
+        var columns = BookColumns.FromPointers(
+            Marshal.UnsafeAddrOfPinnedArrayElement(seq, 0), Marshal.UnsafeAddrOfPinnedArrayElement(received, 0),
+            Marshal.UnsafeAddrOfPinnedArrayElement(sym, 0), Marshal.UnsafeAddrOfPinnedArrayElement(kind, 0),
+            Marshal.UnsafeAddrOfPinnedArrayElement(side, 0), Marshal.UnsafeAddrOfPinnedArrayElement(price, 0),
+            Marshal.UnsafeAddrOfPinnedArrayElement(size, 0), capacity);
+
+        Assert.Equal(2, manager.DrainBooks(columns, capacity, TimeSpan.FromSeconds(1)));
+        Assert.Equal([7L, 7L], seq[..2]);
+        Assert.Equal(new sbyte[] { (sbyte)BookRowKind.Snapshot, (sbyte)BookRowKind.Snapshot }, kind[..2]);
+        Assert.Equal(new sbyte[] { 1, -1 }, side[..2]);
+        Assert.Equal([7d, 8d], price[..2]);
+        Assert.Equal([1d, 2d], size[..2]);
+    }
+
+    [Fact]
+    public async Task Metrics_CountPerKey_AndTimeEachStage()
+    {
+        using var metrics = new ConnectorMetrics();
+
+        // Every ConnectorMetrics publishes on the same meter name, so group by instrument
+        var messages = new Dictionary<Instrument, Dictionary<string, long>>();
+        using var listener = new MeterListener
+        {
+            InstrumentPublished = (instrument, l) =>
+            {
+                if (instrument.Meter.Name == ConnectorMetrics.MeterName && instrument.Name == "connector.ws.messages")
+                    l.EnableMeasurementEvents(instrument);
+            }
+        };
+        listener.SetMeasurementEventCallback<long>((instrument, value, tags, _) =>
+            (messages.TryGetValue(instrument, out var byKey) ? byKey : messages[instrument] = [])[$"{tags[0].Value}:{tags[1].Value}"] = value);
+        listener.Start();
+
+        var inbound = new[] { "trades:BTC:1", "bad", "trades:ETH:2", "trades:BTC:3" };
+        await using var manager = await StartAsync(inbound, new WsFanoutOptions(), metrics);
+        await WaitForPublishedAsync(manager, 3);
+        Assert.Equal(3, Drain(manager.GetEventReader()).Count);
+
+        var snapshot = metrics.GetSnapshot();
+        Assert.Equal(1L, snapshot.ParseFailures);
+        var btc = snapshot.Routes.Single(r => r.Key.Symbol == "BTC");
+        Assert.Equal(2L, btc.Messages);
+        Assert.Equal("trades:BTC:1".Length + "trades:BTC:3".Length, btc.Bytes);
+        Assert.Equal(0, btc.Depth);
+
+        foreach (var stage in new[] { "wire", "translate", "queue" })
+            Assert.Equal(3L, snapshot.Latencies.Single(l => l.Stage == stage && l.Channel == "Trades").Count);
+
+        listener.RecordObservableInstruments();
+        Assert.Contains(messages.Values, byKey =>
+            byKey.GetValueOrDefault("Trades:BTC") == 2 && byKey.GetValueOrDefault("Trades:ETH") == 1);
+    }
+
+    // --- Helpers ---
+
+    private static async Task<WebSocketManager> StartAsync(
+        IEnumerable<string> inbound, WsFanoutOptions fanout, ConnectorMetrics? metrics = null,
+        OrderBookStore? orderBooks = null)
+    {
+        var manager = new WebSocketManager(
+            new ScriptedTransport(inbound), new ScriptedTranslator(), new NoAuthProvider(),
+            NullLogger<WebSocketManager>.Instance, orderBooks: orderBooks, fanout: fanout, metrics: metrics);
+        await manager.StartAsync(new Uri("wss://fake.example.com"), CancellationToken.None);
+        return manager;
+    }
+
+    private static async Task WaitForPublishedAsync(WebSocketManager manager, long expected)
+    {
+        using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(5));
+        while (manager.GetRouteStats().Sum(s => s.Published) < expected)
+            await Task.Delay(10, cts.Token);
+    }
+
+    private static IEnumerable<string> Gated(ManualResetEventSlim gate, IEnumerable<string> inbound)
+    {
+        gate.Wait();
+        foreach (var payload in inbound)
+            yield return payload;
+    }
+
+    private static List<UnifiedWsEvent> Drain(System.Threading.Channels.ChannelReader<UnifiedWsEvent> reader)
+    {
+        var events = new List<UnifiedWsEvent>();
+        while (reader.TryRead(out var evt))
+            events.Add(evt);
+        return events;
+    }
+
+    // --- Fakes ---
+
+    private sealed class NoAuthProvider : IAuthProvider
+    {
+        public bool IsAuthenticated => false;
+        public Task<TransportWsMessage?> GetWsAuthMessageAsync(CancellationToken ct) => Task.FromResult<TransportWsMessage?>(null);
+        public void ApplyRestAuth(TransportRestRequest request) { }
+    }
+
+    private sealed class ScriptedTransport(IEnumerable<string> inbound) : IWsTransport
+    {
+        public bool IsConnected => true;
+        public Task ConnectAsync(Uri uri, CancellationToken ct) => Task.CompletedTask;
+        public Task DisconnectAsync(CancellationToken ct) => Task.CompletedTask;
+        public Task SendAsync(TransportWsMessage message, CancellationToken ct) => Task.CompletedTask;
+
+        public async IAsyncEnumerable<TransportWsInbound> ReceiveAsync([EnumeratorCancellation] CancellationToken ct)
+        {
+            foreach (var payload in inbound)
+                yield return new TransportWsInbound { Payload = payload, ReceivedAt = DateTimeOffset.UtcNow };
+
+            try { await Task.Delay(Timeout.Infinite, ct); }
+            catch (OperationCanceledException) { }
+        }
+
+        public ValueTask DisposeAsync() => ValueTask.CompletedTask;
+    }
+
+    /// <summary>Turns "kind:symbol:seq" payloads into events.</summary>
+    private sealed class ScriptedTranslator : IWsTranslator
+    {
+        public IEnumerable<TransportWsMessage> ToExchangeSubscribe(UnifiedWsSubscribeRequest request) => [];
+        public IEnumerable<TransportWsMessage> ToExchangeUnsubscribe(UnifiedWsUnsubscribeRequest request) => [];
+
+        public IEnumerable<UnifiedWsEvent> FromExchangeMessage(TransportWsInbound inbound)
+        {
+            var parts = inbound.Payload.Split(':');
+            var (symbol, seq, at) = (parts[1], long.Parse(parts[2]), inbound.ReceivedAt);
+            yield return parts[0] switch
+            {
+                "l2" => new OrderBookL2Event
+                {
+                    Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.OrderBookL2,
+                    Symbol = symbol, Sequence = seq, ReceivedAt = at,
+                    Bids = [new PriceLevel { Price = seq, Size = 1m }],
+                    Asks = [new PriceLevel { Price = seq + 1, Size = 2m }]
+                },
+                "fills" => new FillEvent
+                {
+                    Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Fills,
+                    Symbol = symbol, Sequence = seq, ReceivedAt = at, Fills = []
+                },
+                _ => new TradesEvent
+                {
+                    Exchange = UnifiedExchange.Hyperliquid, Channel = UnifiedWsChannel.Trades,
+                    Symbol = symbol, Sequence = seq, ReceivedAt = at,
+                    Trades = [new TradeEntry { TradeId = parts[2], Price = seq, Size = 0.5m, Side = seq % 2 == 0 ? "b" : "a", Timestamp = at }]
+                }
+            };
+        }
+    }
+}